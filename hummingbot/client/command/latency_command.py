@@ -0,0 +1,54 @@
+import threading
+from typing import TYPE_CHECKING, Optional
+
+import pandas as pd
+
+from hummingbot.client.ui.interface_utils import format_df_for_printout
+from hummingbot.core.utils.latency_tracker import LatencyTracker
+
+if TYPE_CHECKING:
+    from hummingbot.client.hummingbot_application import HummingbotApplication  # noqa: F401
+
+
+class LatencyCommand:
+    def latency(self,  # type: HummingbotApplication
+                key_filter: Optional[str] = None,
+                export: bool = False,
+                reset: bool = False):
+        if threading.current_thread() != threading.main_thread():
+            self.ev_loop.call_soon_threadsafe(self.latency, key_filter, export, reset)
+            return
+        latency_tracker = LatencyTracker.get_instance()
+        if export:
+            if latency_tracker.is_metric_log_enabled():
+                exported_lines = latency_tracker.log_stats(key_filter=key_filter)
+                self.notify(f"\n  Exported {exported_lines} latency metric lines to the logs.")
+            else:
+                self.notify(f"\n  The latency statistics were not exported, the {latency_tracker.logger().name} "
+                            f"logger level is above METRIC_LOG in conf/hummingbot_logs.yml.")
+        else:
+            self.notify(self.latency_stats_table(key_filter=key_filter))
+        if reset:
+            latency_tracker.reset()
+            self.notify("\n  Latency statistics have been reset.")
+
+    def latency_stats_table(self,  # type: HummingbotApplication
+                            key_filter: Optional[str] = None) -> str:
+        stats = LatencyTracker.get_instance().stats(key_filter=key_filter)
+        if len(stats) == 0:
+            return "\n  No latency statistics recorded yet."
+        columns = ["Key", "Stage", "Count", "Mean (ms)", "p50 (ms)", "p90 (ms)", "p99 (ms)", "Max (ms)"]
+        data = [[
+            entry["key"],
+            entry["stage"],
+            entry["count"],
+            round(entry["mean_ms"], 3),
+            round(entry["p50_ms"], 3),
+            round(entry["p90_ms"], 3),
+            round(entry["p99_ms"], 3),
+            round(entry["max_ms"], 3),
+        ] for entry in stats]
+        df = pd.DataFrame(data=data, columns=columns)
+        lines = ["    " + line for line in format_df_for_printout(
+            df, table_format=self.client_config_map.tables_format).split("\n")]
+        return "\n" + "\n".join(lines)
@@ -14,7 +14,9 @@ from hummingbot.client.config.config_validators import validate_bool
 from hummingbot.client.config.config_var import ConfigVar
 from hummingbot.client.performance import PerformanceMetrics
 from hummingbot.connector.connector_status import get_connector_status, warning_messages
+from hummingbot.connector.exchange_base import ExchangeBase
 from hummingbot.core.clock import Clock, ClockMode
+from hummingbot.core.event.events import MarketEvent, OrderBookEvent
 from hummingbot.core.rate_oracle.rate_oracle import RateOracle
 from hummingbot.core.utils.async_utils import safe_ensure_future
 from hummingbot.exceptions import OracleRateUnavailable
@@ -27,6 +29,18 @@ if TYPE_CHECKING:
 
 GATEWAY_READY_TIMEOUT = 300  # seconds
 
+# Market events that trigger a tick of the clock in event driven mode
+CLOCK_TICK_TRIGGER_MARKET_EVENTS = [
+    MarketEvent.BuyOrderCreated,
+    MarketEvent.SellOrderCreated,
+    MarketEvent.OrderFilled,
+    MarketEvent.OrderCancelled,
+    MarketEvent.BuyOrderCompleted,
+    MarketEvent.SellOrderCompleted,
+    MarketEvent.OrderFailure,
+    MarketEvent.OrderExpired,
+]
+
 
 class StartCommand(GatewayChainApiManager):
     _in_start_check: bool = False
@@ -208,8 +222,14 @@ class StartCommand(GatewayChainApiManager):
         try:
             self.start_time = time.time() * 1e3  # Time in milliseconds
             tick_size = self.client_config_map.tick_size
-            self.logger().info(f"Creating the clock with tick size: {tick_size}")
-            self.clock = Clock(ClockMode.REALTIME, tick_size=tick_size)
+            min_tick_interval = self.client_config_map.event_driven_min_tick_interval
+            if min_tick_interval is None:
+                self.logger().info(f"Creating the clock with tick size: {tick_size}")
+                self.clock = Clock(ClockMode.REALTIME, tick_size=tick_size)
+            else:
+                self.logger().info(f"Creating the event driven clock with tick size: {tick_size} and minimum tick "
+                                   f"interval: {min_tick_interval}")
+                self.clock = Clock(ClockMode.EVENT_DRIVEN, tick_size=tick_size, min_tick_interval=min_tick_interval)
             for market in self.markets.values():
                 if market is not None:
                     self.clock.add_iterator(market)
@@ -229,6 +249,8 @@ class StartCommand(GatewayChainApiManager):
                 self.clock.add_iterator(self._pmm_script_iterator)
                 self.notify(f"PMM script ({self.client_config_map.pmm_script_mode.pmm_script_file_path}) started.")
             self.strategy_task: asyncio.Task = safe_ensure_future(self._run_clock(), loop=self.ev_loop)
+            if self.clock.clock_mode is ClockMode.EVENT_DRIVEN:
+                safe_ensure_future(self.wait_till_ready(self._add_clock_tick_triggers, self.clock), loop=self.ev_loop)
             self.notify(f"\n'{self.strategy_name}' strategy started.\n"
                         f"Run `status` command to query the progress.")
             self.logger().info("start command initiated.")
@@ -239,6 +261,20 @@ class StartCommand(GatewayChainApiManager):
         except Exception as e:
             self.logger().error(str(e), exc_info=True)
 
+    def _add_clock_tick_triggers(self,  # type: HummingbotApplication
+                                 clock: Clock):
+        if clock is not self.clock:
+            # The strategy was stopped before the markets were ready
+            return
+        for market in self.markets.values():
+            for event_tag in CLOCK_TICK_TRIGGER_MARKET_EVENTS:
+                clock.add_tick_trigger(market, event_tag)
+            if isinstance(market, ExchangeBase):
+                # The order books are only available once the markets are ready
+                for order_book in market.order_books.values():
+                    clock.add_tick_trigger(order_book, OrderBookEvent.TopChangedEvent)
+                    clock.add_tick_trigger(order_book, OrderBookEvent.TradeEvent)
+
     def _initialize_strategy(self, strategy_name: str):
         if self.is_current_strategy_script_strategy():
             self.start_script_strategy()
@@ -0,0 +1,59 @@
+import threading
+from typing import TYPE_CHECKING
+
+import pandas as pd
+
+from hummingbot.client.ui.interface_utils import format_df_for_printout
+from hummingbot.core.utils.tick_profiler import TickProfiler
+
+if TYPE_CHECKING:
+    from hummingbot.client.hummingbot_application import HummingbotApplication  # noqa: F401
+
+
+class TicksCommand:
+    def ticks(self,  # type: HummingbotApplication
+              export: bool = False,
+              reset: bool = False):
+        if threading.current_thread() != threading.main_thread():
+            self.ev_loop.call_soon_threadsafe(self.ticks, export, reset)
+            return
+        if self.clock is None:
+            self.notify("\n  The clock is not running. Start a strategy to collect tick statistics.")
+            return
+        tick_profiler: TickProfiler = self.clock.tick_profiler
+        if export:
+            if tick_profiler.is_metric_log_enabled():
+                exported_lines = tick_profiler.log_stats()
+                self.notify(f"\n  Exported {exported_lines} clock tick metric lines to the logs.")
+            else:
+                self.notify(f"\n  The clock tick statistics were not exported, the {tick_profiler.logger().name} "
+                            f"logger level is above METRIC_LOG in conf/hummingbot_logs.yml.")
+        else:
+            self.notify(self.tick_stats_table(tick_profiler))
+        if reset:
+            tick_profiler.reset()
+            self.notify("\n  Clock tick statistics have been reset.")
+
+    def tick_stats_table(self,  # type: HummingbotApplication
+                         tick_profiler: TickProfiler) -> str:
+        stats = tick_profiler.stats()
+        columns = ["Iterator", "Ticks", "Last (ms)", "Mean (ms)", "p99 (ms)", "Max (ms)", "Overruns"]
+        data = [[
+            entry["iterator"],
+            entry["count"],
+            round(entry["last_ms"], 3),
+            round(entry["mean_ms"], 3),
+            round(entry["p99_ms"], 3),
+            round(entry["max_ms"], 3),
+            entry["overruns"],
+        ] for entry in stats]
+        df = pd.DataFrame(data=data, columns=columns)
+        lines = ["    " + line for line in format_df_for_printout(
+            df, table_format=self.client_config_map.tables_format).split("\n")]
+        clock_entry = stats[-1]
+        lines.extend([
+            "",
+            f"    Event loop lag: mean {clock_entry['loop_lag_mean_ms']:.3f} ms, "
+            f"p99 {clock_entry['loop_lag_p99_ms']:.3f} ms, max {clock_entry['loop_lag_max_ms']:.3f} ms",
+        ])
+        return "\n" + "\n".join(lines)
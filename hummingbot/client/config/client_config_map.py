@@ -953,6 +953,25 @@ class ClientConfigMap(BaseClientModel):
             ),
         ),
     )
+    rate_limits_broker_socket: Optional[str] = Field(
+        default=None,
+        description=("Path of the Unix domain socket of the local rate limit broker, to share the API rate limits with"
+                     "\nthe other bot instances of this host using the same exchange accounts. Start the broker with"
+                     "\n  python -m hummingbot.core.api_throttler.rate_limit_broker --socket-path <path>"
+                     "\nLeave it empty to split the limits with rate_limits_share_pct instead."),
+        client_data=ClientFieldData(
+            prompt=lambda cm: "Enter the path of the rate limit broker socket (leave empty to disable it)",
+        ),
+    )
+    market_data_recorder_dir: Optional[str] = Field(
+        default=None,
+        description=("Directory where the order book snapshots, diffs and trades received from the exchanges are"
+                     "\nrecorded (one compact binary file per trading pair and per hour), to replay them later in"
+                     "\nbacktests. Leave it empty to disable the recording."),
+        client_data=ClientFieldData(
+            prompt=lambda cm: "Enter the market data recording directory (leave empty to disable the recording)",
+        ),
+    )
     commands_timeout: CommandsTimeoutConfigMap = Field(default=CommandsTimeoutConfigMap())
     tables_format: ClientConfigEnum(
         value="TabulateFormats",  # noqa: F821
@@ -982,6 +1001,19 @@ class ClientConfigMap(BaseClientModel):
             ),
         ),
     )
+    event_driven_min_tick_interval: Optional[float] = Field(
+        default=None,
+        ge=0.0,
+        description="When set, the clock runs in event driven mode: it ticks as soon as the top of an order book"
+                    "\nchanges, a public trade happens or an order is updated, but never more often than this"
+                    "\nminimum interval (in seconds). Leave it empty to tick only every tick size seconds.",
+        client_data=ClientFieldData(
+            prompt=lambda cm: (
+                "What minimum interval between event driven ticks (in seconds) do you want to use?"
+                " (Leave empty to disable event driven ticks)"
+            ),
+        ),
+    )
 
     class Config:
         title = "client_config_map"
@@ -31,6 +31,7 @@ from hummingbot.connector.exchange.paper_trade import create_paper_trade_market
 from hummingbot.connector.exchange_base import ExchangeBase
 from hummingbot.connector.markets_recorder import MarketsRecorder
 from hummingbot.core.clock import Clock
+from hummingbot.core.data_type.market_data_recorder import MarketDataRecorder
 from hummingbot.core.gateway.gateway_status_monitor import GatewayStatusMonitor
 from hummingbot.core.utils.kill_switch import KillSwitch
 from hummingbot.core.utils.trading_pair_fetcher import TradingPairFetcher
@@ -104,6 +105,7 @@ class HummingbotApplication(*commands):
 
         self.trade_fill_db: Optional[SQLConnectionManager] = None
         self.markets_recorder: Optional[MarketsRecorder] = None
+        self.market_data_recorder: Optional[MarketDataRecorder] = None
         self._pmm_script_iterator = None
         self._binance_connector = None
         self._shared_client = None
@@ -319,9 +321,21 @@ class HummingbotApplication(*commands):
             self.strategy_name,
         )
         self.markets_recorder.start()
+        self._initialize_market_data_recorder()
         if self._mqtt is not None:
             self._mqtt.start_market_events_fw()
 
+    def _initialize_market_data_recorder(self):
+        market_data_recorder_dir = self.client_config_map.market_data_recorder_dir
+        if not market_data_recorder_dir:
+            return
+        self.market_data_recorder = MarketDataRecorder(data_dir=market_data_recorder_dir)
+        self.market_data_recorder.start()
+        for connector in self.markets.values():
+            order_book_tracker = getattr(connector, "order_book_tracker", None)
+            if order_book_tracker is not None:
+                order_book_tracker.data_source.market_data_recorder = self.market_data_recorder
+
     def _initialize_notifiers(self):
         self.notifiers.extend(
             [
@@ -139,6 +139,22 @@ def load_parser(hummingbot: "HummingbotApplication", command_tabs) -> [ThrowingA
     ticker_parser.add_argument("--market", type=str, dest="market", help="The market (trading pair) of the order book")
     ticker_parser.set_defaults(func=hummingbot.ticker)
 
+    latency_parser = subparsers.add_parser("latency", help="Show REST and websocket latency statistics")
+    latency_parser.add_argument("--filter", type=str, default=None, dest="key_filter",
+                                help="Only show the limit ids or streams containing this text")
+    latency_parser.add_argument("--export", default=False, action="store_true", dest="export",
+                                help="Export the statistics to the logs as structured metric lines")
+    latency_parser.add_argument("--reset", default=False, action="store_true", dest="reset",
+                                help="Clear the collected statistics")
+    latency_parser.set_defaults(func=hummingbot.latency)
+
+    ticks_parser = subparsers.add_parser("ticks", help="Show how long the clock iterators take to tick")
+    ticks_parser.add_argument("--export", default=False, action="store_true", dest="export",
+                              help="Export the statistics to the logs as structured metric lines")
+    ticks_parser.add_argument("--reset", default=False, action="store_true", dest="reset",
+                              help="Clear the collected statistics")
+    ticks_parser.set_defaults(func=hummingbot.ticks)
+
     pmm_script_parser = subparsers.add_parser("pmm_script", help="Send command to running PMM script instance")
     pmm_script_parser.add_argument("cmd", nargs="?", default=None, help="Command")
     pmm_script_parser.add_argument("args", nargs="*", default=None, help="Arguments")
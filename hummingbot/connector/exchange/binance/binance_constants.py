@@ -44,6 +44,11 @@ ORDERS = "ORDERS"
 ORDERS_24HR = "ORDERS_24HR"
 RAW_REQUESTS = "RAW_REQUESTS"
 
+# Response headers with the usage of the rate limits
+USED_WEIGHT_1M_HEADER = "X-MBX-USED-WEIGHT-1M"
+ORDER_COUNT_10S_HEADER = "X-MBX-ORDER-COUNT-10S"
+ORDER_COUNT_1D_HEADER = "X-MBX-ORDER-COUNT-1D"
+
 # Rate Limit time intervals
 ONE_MINUTE = 60
 ONE_SECOND = 1
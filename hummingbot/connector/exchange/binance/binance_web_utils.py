@@ -1,8 +1,12 @@
-from typing import Callable, Optional
+from typing import Callable, List, Optional
 
 import hummingbot.connector.exchange.binance.binance_constants as CONSTANTS
 from hummingbot.connector.time_synchronizer import TimeSynchronizer
-from hummingbot.connector.utils import TimeSynchronizerRESTPreProcessor
+from hummingbot.connector.utils import (
+    RateLimitUsageHeader,
+    RateLimitUsageRESTPostProcessor,
+    TimeSynchronizerRESTPreProcessor,
+)
 from hummingbot.core.api_throttler.async_throttler import AsyncThrottler
 from hummingbot.core.web_assistant.auth import AuthBase
 from hummingbot.core.web_assistant.connections.data_types import RESTMethod
@@ -46,10 +50,21 @@ def build_api_factory(
         auth=auth,
         rest_pre_processors=[
             TimeSynchronizerRESTPreProcessor(synchronizer=time_synchronizer, time_provider=time_provider),
+        ],
+        rest_post_processors=[
+            RateLimitUsageRESTPostProcessor(throttler=throttler, usage_headers=rate_limit_usage_headers()),
         ])
     return api_factory
 
 
+def rate_limit_usage_headers() -> List[RateLimitUsageHeader]:
+    return [
+        RateLimitUsageHeader(header=CONSTANTS.USED_WEIGHT_1M_HEADER, limit_id=CONSTANTS.REQUEST_WEIGHT),
+        RateLimitUsageHeader(header=CONSTANTS.ORDER_COUNT_10S_HEADER, limit_id=CONSTANTS.ORDERS),
+        RateLimitUsageHeader(header=CONSTANTS.ORDER_COUNT_1D_HEADER, limit_id=CONSTANTS.ORDERS_24HR),
+    ]
+
+
 def build_api_factory_without_time_synchronizer_pre_processor(throttler: AsyncThrottler) -> WebAssistantsFactory:
     api_factory = WebAssistantsFactory(throttler=throttler)
     return api_factory
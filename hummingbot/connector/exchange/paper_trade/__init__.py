@@ -4,6 +4,8 @@ from hummingbot.client.config.config_helpers import ClientConfigAdapter, get_con
 from hummingbot.client.settings import AllConnectorSettings
 from hummingbot.connector.exchange.paper_trade.paper_trade_exchange import PaperTradeExchange
 from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
+from hummingbot.core.data_type.replay_order_book_tracker import ReplayOrderBookTracker
+from hummingbot.core.data_type.replay_order_book_tracker_data_source import ReplayOrderBookTrackerDataSource
 
 
 def get_order_book_tracker(connector_name: str, trading_pairs: List[str]) -> OrderBookTracker:
@@ -22,3 +24,19 @@ def create_paper_trade_market(exchange_name: str, client_config_map: ClientConfi
                               tracker,
                               get_connector_class(exchange_name),
                               exchange_name=exchange_name)
+
+
+def create_replay_paper_trade_market(exchange_name: str,
+                                     client_config_map: ClientConfigAdapter,
+                                     trading_pairs: List[str],
+                                     data_dir: str) -> PaperTradeExchange:
+    """
+    Creates a paper trade market whose order books replay the market data recorded in the data directory.
+    The replay iterator of the order book tracker has to be added to the backtest clock before the market.
+    """
+    data_source = ReplayOrderBookTrackerDataSource.from_directory(trading_pairs=trading_pairs, data_dir=data_dir)
+    tracker = ReplayOrderBookTracker(data_source=data_source, trading_pairs=trading_pairs)
+    return PaperTradeExchange(client_config_map,
+                              tracker,
+                              get_connector_class(exchange_name),
+                              exchange_name=exchange_name)
@@ -9,6 +9,7 @@ from typing import Callable, Dict, List, Optional, Tuple, TYPE_CHECKING
 
 from cpython cimport PyObject
 from cython.operator cimport address, dereference as deref, postincrement as inc
+from libc.math cimport isnan
 from libcpp cimport bool as cppbool
 from libcpp.vector cimport vector
 
@@ -842,17 +843,22 @@ cdef class PaperTradeExchange(ExchangeBase):
         """
         cdef:
             str trading_pair = deref(deref(map_it_ptr)).first.decode("utf8")
-            object opposite_order_book_price = self.c_get_price(trading_pair, is_buy)
+            double opposite_order_book_price = float(self.c_get_price(trading_pair, is_buy))
             SingleTradingPairLimitOrders *orders_collection_ptr = address(deref(deref(map_it_ptr)).second)
             SingleTradingPairLimitOrdersIterator orders_it = orders_collection_ptr.begin()
             SingleTradingPairLimitOrdersRIterator orders_rit = orders_collection_ptr.rbegin()
             vector[SingleTradingPairLimitOrdersIterator] process_order_its
             const CPPLimitOrder *cpp_limit_order_ptr = NULL
 
+        # The opposite side of the order book is empty
+        if isnan(opposite_order_book_price):
+            return
+
+        # The scan compares the native prices of the orders, Python objects are only used for the orders to fill
         if is_buy:
             while orders_rit != orders_collection_ptr.rend():
                 cpp_limit_order_ptr = address(deref(orders_rit))
-                if opposite_order_book_price > <object>cpp_limit_order_ptr.getPrice():
+                if opposite_order_book_price > cpp_limit_order_ptr.getDoublePrice():
                     break
                 process_order_its.push_back(getIteratorFromReverseIterator(
                     <reverse_iterator[SingleTradingPairLimitOrdersIterator]>orders_rit))
@@ -860,7 +866,7 @@ cdef class PaperTradeExchange(ExchangeBase):
         else:
             while orders_it != orders_collection_ptr.end():
                 cpp_limit_order_ptr = address(deref(orders_it))
-                if opposite_order_book_price < <object>cpp_limit_order_ptr.getPrice():
+                if opposite_order_book_price < cpp_limit_order_ptr.getDoublePrice():
                     break
                 process_order_its.push_back(orders_it)
                 inc(orders_it)
@@ -896,8 +902,7 @@ cdef class PaperTradeExchange(ExchangeBase):
         cdef:
             string cpp_trading_pair = order_book_trade_event.trading_pair.encode("utf8")
             bint is_maker_buy = order_book_trade_event.type is TradeType.SELL
-            object trade_price = order_book_trade_event.price
-            object trade_quantity = order_book_trade_event.amount
+            double trade_price = float(order_book_trade_event.price)
             LimitOrders *limit_orders_map_ptr = (address(self._bid_limit_orders)
                                                  if is_maker_buy
                                                  else address(self._ask_limit_orders))
@@ -916,7 +921,7 @@ cdef class PaperTradeExchange(ExchangeBase):
             orders_rit = orders_collection_ptr.rbegin()
             while orders_rit != orders_collection_ptr.rend():
                 cpp_limit_order_ptr = address(deref(orders_rit))
-                if <object>cpp_limit_order_ptr.getPrice() <= trade_price:
+                if cpp_limit_order_ptr.getDoublePrice() <= trade_price:
                     break
                 process_order_its.push_back(getIteratorFromReverseIterator(
                     <reverse_iterator[SingleTradingPairLimitOrdersIterator]>orders_rit))
@@ -925,7 +930,7 @@ cdef class PaperTradeExchange(ExchangeBase):
             orders_it = orders_collection_ptr.begin()
             while orders_it != orders_collection_ptr.end():
                 cpp_limit_order_ptr = address(deref(orders_it))
-                if <object>cpp_limit_order_ptr.getPrice() >= trade_price:
+                if cpp_limit_order_ptr.getDoublePrice() >= trade_price:
                     break
                 process_order_its.push_back(orders_it)
                 inc(orders_it)
@@ -14,7 +14,9 @@ from hummingbot.connector.time_synchronizer import TimeSynchronizer
 from hummingbot.connector.trading_rule import TradingRule
 from hummingbot.connector.utils import get_new_client_order_id
 from hummingbot.core.api_throttler.async_throttler import AsyncThrottler
-from hummingbot.core.api_throttler.data_types import RateLimit
+from hummingbot.core.api_throttler.async_throttler_base import AsyncThrottlerBase, request_priority
+from hummingbot.core.api_throttler.brokered_async_throttler import BrokeredAsyncThrottler
+from hummingbot.core.api_throttler.data_types import RateLimit, RequestPriority
 from hummingbot.core.data_type.cancellation_result import CancellationResult
 from hummingbot.core.data_type.common import OrderType, TradeType
 from hummingbot.core.data_type.in_flight_order import InFlightOrder, OrderState, OrderUpdate, TradeUpdate
@@ -61,9 +63,7 @@ class ExchangePyBase(ExchangeBase, ABC):
         self._lost_orders_update_task: Optional[asyncio.Task] = None
 
         self._time_synchronizer = TimeSynchronizer()
-        self._throttler = AsyncThrottler(
-            rate_limits=self.rate_limits_rules,
-            limits_share_percentage=client_config_map.rate_limits_share_pct)
+        self._throttler = self._create_throttler(client_config_map)
         self._poll_notifier = asyncio.Event()
 
         # init Auth and Api factory
@@ -478,15 +478,16 @@ class ExchangePyBase(ExchangeBase, ABC):
             return
 
         try:
-            exchange_order_id, update_timestamp = await self._place_order(
-                order_id=order_id,
-                trading_pair=trading_pair,
-                amount=amount,
-                trade_type=trade_type,
-                order_type=order_type,
-                price=price,
-                **kwargs,
-            )
+            with request_priority(RequestPriority.CREATE):
+                exchange_order_id, update_timestamp = await self._place_order(
+                    order_id=order_id,
+                    trading_pair=trading_pair,
+                    amount=amount,
+                    trade_type=trade_type,
+                    order_type=order_type,
+                    price=price,
+                    **kwargs,
+                )
 
             order_update: OrderUpdate = OrderUpdate(
                 client_order_id=order_id,
@@ -520,7 +521,8 @@ class ExchangePyBase(ExchangeBase, ABC):
 
     async def _execute_order_cancel(self, order: InFlightOrder) -> str:
         try:
-            cancelled = await self._place_cancel(order.client_order_id, order)
+            with request_priority(RequestPriority.CANCEL):
+                cancelled = await self._place_cancel(order.client_order_id, order)
             if cancelled:
                 order_update: OrderUpdate = OrderUpdate(
                     client_order_id=order.client_order_id,
@@ -720,7 +722,8 @@ class ExchangePyBase(ExchangeBase, ABC):
         """
         while True:
             try:
-                await safe_gather(self._update_trading_rules())
+                with request_priority(RequestPriority.BACKGROUND):
+                    await safe_gather(self._update_trading_rules())
                 await self._sleep(self.TRADING_RULES_INTERVAL)
             except NotImplementedError:
                 raise
@@ -740,7 +743,8 @@ class ExchangePyBase(ExchangeBase, ABC):
         """
         while True:
             try:
-                await safe_gather(self._update_trading_fees())
+                with request_priority(RequestPriority.BACKGROUND):
+                    await safe_gather(self._update_trading_fees())
                 await self._sleep(self.TRADING_FEES_INTERVAL)
             except NotImplementedError:
                 raise
@@ -768,7 +772,8 @@ class ExchangePyBase(ExchangeBase, ABC):
                 await self._update_time_synchronizer()
 
                 # the following method is implementation-specific
-                await self._status_polling_loop_fetch_updates()
+                with request_priority(RequestPriority.USER_DATA):
+                    await self._status_polling_loop_fetch_updates()
 
                 self._last_poll_timestamp = self.current_timestamp
                 self._poll_notifier = asyncio.Event()
@@ -807,7 +812,8 @@ class ExchangePyBase(ExchangeBase, ABC):
         while True:
             try:
                 await self._cancel_lost_orders()
-                await self._update_lost_orders_status()
+                with request_priority(RequestPriority.USER_DATA):
+                    await self._update_lost_orders_status()
                 await self._sleep(self.SHORT_POLL_INTERVAL)
             except NotImplementedError:
                 raise
@@ -833,6 +839,17 @@ class ExchangePyBase(ExchangeBase, ABC):
     def _is_user_stream_initialized(self):
         return self._user_stream_tracker.data_source.last_recv_time > 0 or not self.is_trading_required
 
+    def _create_throttler(self, client_config_map: "ClientConfigAdapter") -> AsyncThrottlerBase:
+        if client_config_map.rate_limits_broker_socket:
+            return BrokeredAsyncThrottler(
+                rate_limits=self.rate_limits_rules,
+                namespace=self.name,
+                socket_path=client_config_map.rate_limits_broker_socket,
+                limits_share_percentage=client_config_map.rate_limits_share_pct)
+        return AsyncThrottler(
+            rate_limits=self.rate_limits_rules,
+            limits_share_percentage=client_config_map.rate_limits_share_pct)
+
     def _create_user_stream_tracker(self):
         return UserStreamTracker(data_source=self._create_user_stream_data_source())
 
@@ -883,6 +900,7 @@ class ExchangePyBase(ExchangeBase, ABC):
             is_auth_required: bool = False,
             return_err: bool = False,
             limit_id: Optional[str] = None,
+            priority: Optional[RequestPriority] = None,
             **kwargs,
     ) -> Dict[str, Any]:
 
@@ -901,6 +919,7 @@ class ExchangePyBase(ExchangeBase, ABC):
                     is_auth_required=is_auth_required,
                     return_err=return_err,
                     throttler_limit_id=limit_id if limit_id else path_url,
+                    priority=priority,
                 )
 
                 return request_result
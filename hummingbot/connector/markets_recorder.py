@@ -4,7 +4,7 @@ import threading
 import time
 from decimal import Decimal
 from shutil import move
-from typing import Dict, List, Optional, Tuple, Union
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
 import pandas as pd
 from sqlalchemy.orm import Query, Session
@@ -12,7 +12,7 @@ from sqlalchemy.orm import Query, Session
 from hummingbot import data_path
 from hummingbot.connector.connector_base import ConnectorBase
 from hummingbot.connector.utils import TradeFillOrderDetails
-from hummingbot.core.event.event_forwarder import SourceInfoEventForwarder
+from hummingbot.core.event.event_forwarder import AsyncSourceInfoEventForwarder
 from hummingbot.core.event.events import (
     BuyOrderCompletedEvent,
     BuyOrderCreatedEvent,
@@ -69,33 +69,28 @@ class MarketsRecorder:
             exchange_order_ids = self.get_orders_for_config_and_market(self._config_file_path, market, True, 2000)
             market.add_exchange_order_ids_from_market_recorder({o.exchange_order_id: o.id for o in exchange_order_ids})
 
-        self._create_order_forwarder: SourceInfoEventForwarder = SourceInfoEventForwarder(self._did_create_order)
-        self._fill_order_forwarder: SourceInfoEventForwarder = SourceInfoEventForwarder(self._did_fill_order)
-        self._cancel_order_forwarder: SourceInfoEventForwarder = SourceInfoEventForwarder(self._did_cancel_order)
-        self._fail_order_forwarder: SourceInfoEventForwarder = SourceInfoEventForwarder(self._did_fail_order)
-        self._complete_order_forwarder: SourceInfoEventForwarder = SourceInfoEventForwarder(self._did_complete_order)
-        self._expire_order_forwarder: SourceInfoEventForwarder = SourceInfoEventForwarder(self._did_expire_order)
-        self._funding_payment_forwarder: SourceInfoEventForwarder = SourceInfoEventForwarder(
-            self._did_complete_funding_payment)
-        self._update_range_position_forwarder: SourceInfoEventForwarder = SourceInfoEventForwarder(
-            self._did_update_range_position)
-        self._close_range_position_forwarder: SourceInfoEventForwarder = SourceInfoEventForwarder(
-            self._did_close_position)
-
-        self._event_pairs: List[Tuple[MarketEvent, SourceInfoEventForwarder]] = [
-            (MarketEvent.BuyOrderCreated, self._create_order_forwarder),
-            (MarketEvent.SellOrderCreated, self._create_order_forwarder),
-            (MarketEvent.OrderFilled, self._fill_order_forwarder),
-            (MarketEvent.OrderCancelled, self._cancel_order_forwarder),
-            (MarketEvent.OrderFailure, self._fail_order_forwarder),
-            (MarketEvent.BuyOrderCompleted, self._complete_order_forwarder),
-            (MarketEvent.SellOrderCompleted, self._complete_order_forwarder),
-            (MarketEvent.OrderExpired, self._expire_order_forwarder),
-            (MarketEvent.FundingPaymentCompleted, self._funding_payment_forwarder),
-            (MarketEvent.RangePositionLiquidityAdded, self._update_range_position_forwarder),
-            (MarketEvent.RangePositionLiquidityRemoved, self._update_range_position_forwarder),
-            (MarketEvent.RangePositionFeeCollected, self._update_range_position_forwarder),
-            (MarketEvent.RangePositionClosed, self._close_range_position_forwarder),
+        self._event_handlers: Dict[MarketEvent, Callable[[int, ConnectorBase, Any], None]] = {
+            MarketEvent.BuyOrderCreated: self._did_create_order,
+            MarketEvent.SellOrderCreated: self._did_create_order,
+            MarketEvent.OrderFilled: self._did_fill_order,
+            MarketEvent.OrderCancelled: self._did_cancel_order,
+            MarketEvent.OrderFailure: self._did_fail_order,
+            MarketEvent.BuyOrderCompleted: self._did_complete_order,
+            MarketEvent.SellOrderCompleted: self._did_complete_order,
+            MarketEvent.OrderExpired: self._did_expire_order,
+            MarketEvent.FundingPaymentCompleted: self._did_complete_funding_payment,
+            MarketEvent.RangePositionLiquidityAdded: self._did_update_range_position,
+            MarketEvent.RangePositionLiquidityRemoved: self._did_update_range_position,
+            MarketEvent.RangePositionFeeCollected: self._did_update_range_position,
+            MarketEvent.RangePositionClosed: self._did_close_position,
+        }
+        # The events are recorded outside of the connector code triggering them, so the database writes don't delay
+        # it. A single forwarder keeps the events in the order they were triggered (e.g. order created before filled).
+        self._market_event_forwarder: AsyncSourceInfoEventForwarder = AsyncSourceInfoEventForwarder(
+            self._did_market_event)
+
+        self._event_pairs: List[Tuple[MarketEvent, AsyncSourceInfoEventForwarder]] = [
+            (event, self._market_event_forwarder) for event in self._event_handlers
         ]
 
     @property
@@ -123,6 +118,8 @@ class MarketsRecorder:
         for market in self._markets:
             for event_pair in self._event_pairs:
                 market.remove_listener(event_pair[0], event_pair[1])
+        # Record the events still waiting to be processed
+        self._market_event_forwarder.flush()
 
     def get_orders_for_config_and_market(self, config_file_path: str, market: ConnectorBase,
                                          with_exchange_order_id_present: Optional[bool] = False,
@@ -184,6 +181,9 @@ class MarketsRecorder:
         market_states: Optional[MarketState] = query.one_or_none()
         return market_states
 
+    def _did_market_event(self, event_tag: int, market: ConnectorBase, evt: Any):
+        self._event_handlers[self.market_event_tag_map[event_tag]](event_tag, market, evt)
+
     def _did_create_order(self,
                           event_tag: int,
                           market: ConnectorBase,
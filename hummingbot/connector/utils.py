@@ -5,7 +5,7 @@ import os
 import platform
 from collections import namedtuple
 from hashlib import md5
-from typing import Any, Callable, Dict, Optional, Tuple
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple
 
 from zero_ex.order_utils import Order as ZeroExOrder
 
@@ -13,7 +13,8 @@ from hummingbot.connector.time_synchronizer import TimeSynchronizer
 from hummingbot.core.api_throttler.async_throttler import AsyncThrottler
 from hummingbot.core.api_throttler.async_throttler_base import AsyncThrottlerBase
 from hummingbot.core.utils.tracking_nonce import NonceCreator, get_tracking_nonce
-from hummingbot.core.web_assistant.connections.data_types import RESTRequest, WSResponse
+from hummingbot.core.web_assistant.connections.data_types import RESTRequest, RESTResponse, WSResponse
+from hummingbot.core.web_assistant.rest_post_processors import RESTPostProcessorBase
 from hummingbot.core.web_assistant.rest_pre_processors import RESTPreProcessorBase
 from hummingbot.core.web_assistant.web_assistants_factory import WebAssistantsFactory
 from hummingbot.core.web_assistant.ws_post_processors import WSPostProcessorBase
@@ -137,6 +138,48 @@ class TimeSynchronizerRESTPreProcessor(RESTPreProcessorBase):
         return request
 
 
+class RateLimitUsageHeader(NamedTuple):
+    """
+    Associates a response header reporting the usage of a rate limit with the limit id in the throttler.
+    If `is_remaining` is True the header reports the capacity left instead of the capacity used.
+    """
+    header: str
+    limit_id: str
+    is_remaining: bool = False
+
+
+class RateLimitUsageRESTPostProcessor(RESTPostProcessorBase):
+    """
+    This post processor is intended to be used in those connectors whose exchange reports the usage of the rate limits
+    in the response headers. It feeds the reported usage to the throttler, so that the requests sent by other processes
+    using the same API key are considered when checking the capacity of the limits.
+    """
+
+    def __init__(self, throttler: AsyncThrottlerBase, usage_headers: List[RateLimitUsageHeader]):
+        super().__init__()
+        self._throttler = throttler
+        self._usage_headers = usage_headers
+
+    async def post_process(self, response: RESTResponse) -> RESTResponse:
+        headers = response.headers
+        if headers:
+            for usage_header in self._usage_headers:
+                value = headers.get(usage_header.header)
+                if value is None:
+                    continue
+                try:
+                    reported = int(value)
+                except ValueError:
+                    continue
+                if usage_header.is_remaining:
+                    limit = self._throttler.get_exchange_limit(usage_header.limit_id)
+                    if limit is None:
+                        continue
+                    reported = limit - reported
+                self._throttler.sync_capacity_used(limit_id=usage_header.limit_id, capacity_used=reported)
+        return response
+
+
 class GZipCompressionWSPostProcessor(WSPostProcessorBase):
     """
     Performs the necessary response processing from both public and private websocket streams.
@@ -2,10 +2,16 @@ import asyncio
 import logging
 import time
 from abc import ABC, abstractmethod
-from decimal import Decimal
-from typing import List, Tuple
+from typing import Dict, List, Optional, Set, Tuple
 
-from hummingbot.core.api_throttler.data_types import RateLimit, TaskLog
+from hummingbot.core.api_throttler.data_types import (
+    DEFAULT_REQUEST_PRIORITY,
+    RateLimit,
+    RequestPriority,
+    TaskLog,
+    TaskLogWindow,
+)
+from hummingbot.core.utils.latency_tracker import THROTTLE_WAIT, UNKNOWN_LIMIT_ID, LatencyTracker
 from hummingbot.logger.logger import HummingbotLogger
 
 arc_logger = None
@@ -16,6 +22,13 @@ class AsyncRequestContextBase(ABC):
     """
     An async context class ('async with' syntax) that checks for rate limit and waits for the capacity to be freed.
     It uses an async lock to prevent multiple instances of this class from accessing the `acquire()` function.
+
+    Requests that can not be executed immediately are queued in the shared waiters list. A waiting request is only
+    allowed to take capacity when no request queued before it shares any of its limits (FIFO per limit), and it
+    sleeps until the moment its blocking limits have enough capacity, or until the requests ahead of it are done.
+
+    Each request has a priority. Waiting requests are queued behind the ones with the same or higher priority only,
+    and lower priority requests can not use the headroom percentage of each limit reserved for the higher priorities.
     """
 
     _last_max_cap_warning_ts: float = 0.0
@@ -28,64 +41,174 @@ class AsyncRequestContextBase(ABC):
         return arc_logger
 
     def __init__(self,
-                 task_logs: List[TaskLog],
+                 task_logs: Dict[str, TaskLogWindow],
                  rate_limit: RateLimit,
                  related_limits: List[Tuple[RateLimit, int]],
                  lock: asyncio.Lock,
                  safety_margin_pct: float,
                  retry_interval: float = 0.1,
+                 waiters: Optional[List["AsyncRequestContextBase"]] = None,
+                 priority: RequestPriority = DEFAULT_REQUEST_PRIORITY,
+                 headroom_pct: int = 0,
                  ):
         """
         Asynchronous context associated with each API request.
-        :param task_logs: Shared task logs associated with this API request
+        :param task_logs: Shared task logs, grouped in one sliding window per limit id
         :param rate_limit: The RateLimit associated with this API Request
         :param related_limits: List of linked rate limits with its corresponding weight associated with this API Request
         :param lock: A shared asyncio.Lock used between all instances of APIRequestContextBase
-        :param retry_interval: Time between each limit check
+        :param retry_interval: Time between each limit check, used when the time to wait for capacity is unknown
+        :param waiters: Shared list of the requests waiting for capacity, sorted by priority and arrival order
+        :param priority: The priority class of this API Request
+        :param headroom_pct: Percentage of each limit this API Request can not use (reserved for higher priorities)
         """
-        self._task_logs: List[TaskLog] = task_logs
+        self._task_logs: Dict[str, TaskLogWindow] = task_logs
         self._rate_limit: RateLimit = rate_limit
         self._related_limits: List[Tuple[RateLimit, int]] = related_limits
         self._lock: asyncio.Lock = lock
         self._safety_margin_pct: float = safety_margin_pct
         self._retry_interval: float = retry_interval
+        self._waiters: List[AsyncRequestContextBase] = waiters if waiters is not None else []
+        self._wake_up_future: Optional[asyncio.Future] = None
+        self._priority: RequestPriority = priority
+        self._headroom_pct: int = headroom_pct
+
+        self._limit_ids: Set[str] = {limit.limit_id for limit, _ in related_limits}
+        if rate_limit is not None:
+            self._limit_ids.add(rate_limit.limit_id)
 
     def flush(self):
         """
         Remove task logs that have passed rate limit periods
         :return:
         """
-        now: Decimal = Decimal(str(time.time()))
-        for task in self._task_logs:
-            task_limit: RateLimit = task.rate_limit
-            elapsed: Decimal = now - Decimal(str(task.timestamp))
-            if elapsed > Decimal(str(task_limit.time_interval * (1 + self._safety_margin_pct))):
-                self._task_logs.remove(task)
+        now: float = self._time()
+        for task_log_window in self._task_logs.values():
+            task_log_window.flush(now=now, safety_margin_pct=self._safety_margin_pct)
+
+    def _time(self) -> float:
+        return time.monotonic()
+
+    def _task_log_window(self, limit_id: str) -> TaskLogWindow:
+        task_log_window = self._task_logs.get(limit_id)
+        if task_log_window is None:
+            task_log_window = TaskLogWindow()
+            self._task_logs[limit_id] = task_log_window
+        return task_log_window
+
+    def _usable_limit(self, limit: int, weight: int) -> int:
+        """
+        Returns the part of the limit this request can use, once the headroom of its priority class is reserved.
+        The headroom never prevents a request that fits in the full limit from being executed at all.
+        """
+        usable_limit = limit - limit * self._headroom_pct // 100
+        if usable_limit < weight <= limit:
+            usable_limit = weight
+        return usable_limit
 
     @abstractmethod
     def within_capacity(self) -> bool:
         raise NotImplementedError
 
-    async def acquire(self):
-        while True:
-            async with self._lock:
-                self.flush()
+    def time_until_capacity(self) -> float:
+        """
+        Returns the time (in seconds) after which the request might be within capacity. Implementations able to
+        calculate when the blocking task logs expire should override it. By default the retry interval is used.
+        """
+        return self._retry_interval
 
-                if self.within_capacity():
-                    break
-            await asyncio.sleep(self._retry_interval)
-        async with self._lock:
-            now = time.time()
-            # Each related limit is represented as it own individual TaskLog
+    def _is_first_in_line(self) -> bool:
+        """
+        Checks that no request queued before this one (with the same or higher priority) is waiting for any of the
+        limits used by this request
+        """
+        for waiter in self._waiters:
+            if waiter is self:
+                return True
+            if waiter._priority >= self._priority and not waiter._limit_ids.isdisjoint(self._limit_ids):
+                return False
+        return True
+
+    def _join_waiters(self):
+        # Queue behind the requests with the same or higher priority (FIFO within each priority class)
+        position = len(self._waiters)
+        while position > 0 and self._waiters[position - 1]._priority < self._priority:
+            position -= 1
+        self._waiters.insert(position, self)
+
+    def _register_task_logs(self):
+        now = self._time()
+        # Each related limit is represented as it own individual TaskLog
 
+        if self._rate_limit is not None:
             # Log the acquired rate limit into the tasks log
-            self._task_logs.append(TaskLog(timestamp=now,
-                                           rate_limit=self._rate_limit,
-                                           weight=self._rate_limit.weight))
+            self._task_log_window(self._rate_limit.limit_id).append(
+                TaskLog(timestamp=now, rate_limit=self._rate_limit, weight=self._rate_limit.weight))
+
+        # Log its related limits into the tasks log as individual tasks
+        for limit, weight in self._related_limits:
+            self._task_log_window(limit.limit_id).append(TaskLog(timestamp=now, rate_limit=limit, weight=weight))
+
+    def _leave_waiters(self):
+        if self in self._waiters:
+            position = self._waiters.index(self)
+            del self._waiters[position]
+            # The requests that were queued behind this one might be first in line now
+            self.wake_up_first_in_line(self._waiters, self._limit_ids, start=position)
+
+    @staticmethod
+    def wake_up_first_in_line(waiters: List["AsyncRequestContextBase"], limit_ids: Set[str], start: int = 0):
+        """
+        Wakes up the waiting requests using any of the given limits that are first in line for all their limits. The
+        requests queued behind them keep waiting, each request wakes up the next ones when it leaves the waiters.
+        :param waiters: The list of the requests waiting for capacity, sorted by priority and arrival order
+        :param limit_ids: The ids of the limits that might let the waiting requests proceed
+        :param start: The position in the waiters list of the first request that might be first in line now
+        """
+        # The waiters are sorted by priority, the requests queued before a waiter always have the same or a higher
+        # priority, it is first in line if none of them uses any of its limits
+        queued_limit_ids: Set[str] = set()
+        for position, waiter in enumerate(waiters):
+            if limit_ids <= queued_limit_ids:
+                break
+            if (position >= start
+                    and not waiter._limit_ids.isdisjoint(limit_ids)
+                    and waiter._limit_ids.isdisjoint(queued_limit_ids)):
+                waiter._wake_up()
+            queued_limit_ids.update(waiter._limit_ids)
+
+    def _wake_up(self):
+        if self._wake_up_future is not None and not self._wake_up_future.done():
+            self._wake_up_future.set_result(None)
+
+    async def acquire(self):
+        started_at = LatencyTracker.now()
+        try:
+            while True:
+                async with self._lock:
+                    # within_capacity() flushes the expired logs of the limits involved in this request
+                    if self._is_first_in_line() and self.within_capacity():
+                        self._register_task_logs()
+                        self._leave_waiters()
+                        break
+                    if self not in self._waiters:
+                        self._join_waiters()
+                    self._wake_up_future = asyncio.get_event_loop().create_future()
+                    wake_up_handle = None
+                    if self._is_first_in_line():
+                        wake_up_handle = asyncio.get_event_loop().call_later(
+                            max(0.0, self.time_until_capacity()), self._wake_up)
+                try:
+                    await self._wake_up_future
+                finally:
+                    if wake_up_handle is not None:
+                        wake_up_handle.cancel()
+        except asyncio.CancelledError:
+            self._leave_waiters()
+            raise
 
-            # Log its related limits into the tasks log as individual tasks
-            for limit, weight in self._related_limits:
-                self._task_logs.append(TaskLog(timestamp=now, rate_limit=limit, weight=weight))
+        limit_id = self._rate_limit.limit_id if self._rate_limit is not None else UNKNOWN_LIMIT_ID
+        LatencyTracker.get_instance().record(key=limit_id, stage=THROTTLE_WAIT, started_at=started_at)
 
     async def __aenter__(self):
         await self.acquire()
@@ -1,13 +1,11 @@
-import time
-from decimal import Decimal
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 
 from hummingbot.core.api_throttler.async_request_context_base import (
     MAX_CAPACITY_REACHED_WARNING_INTERVAL,
     AsyncRequestContextBase,
 )
 from hummingbot.core.api_throttler.async_throttler_base import AsyncThrottlerBase
-from hummingbot.core.api_throttler.data_types import RateLimit
+from hummingbot.core.api_throttler.data_types import RateLimit, RequestPriority, TaskLogWindow
 
 
 class AsyncRequestContext(AsyncRequestContextBase):
@@ -27,13 +25,22 @@ class AsyncRequestContext(AsyncRequestContextBase):
                                                             self._rate_limit.weight)] + self._related_limits
             now: float = self._time()
             for rate_limit, weight in list_of_limits:
-                capacity_used: int = sum([task.weight
-                                          for task in self._task_logs
-                                          if rate_limit.limit_id == task.rate_limit.limit_id and
-                                          Decimal(str(now)) - Decimal(str(task.timestamp)) - Decimal(str(task.rate_limit.time_interval * self._safety_margin_pct)) <= task.rate_limit.time_interval])
+                capacity_used: int = 0
+                within_reported_limit: bool = True
+                task_log_window: TaskLogWindow = self._task_logs.get(rate_limit.limit_id)
+                if task_log_window is not None:
+                    task_log_window.flush(now=now, safety_margin_pct=self._safety_margin_pct)
+                    capacity_used = task_log_window.capacity_used
+                    if task_log_window.reported_limit is not None:
+                        # The exchange reported the capacity used by all the processes sharing the limit
+                        within_reported_limit = (
+                            capacity_used + task_log_window.reported_capacity_used + weight
+                            <= self._usable_limit(task_log_window.reported_limit, weight))
 
-                if capacity_used + weight > rate_limit.limit:
+                if not within_reported_limit or capacity_used + weight > self._usable_limit(rate_limit.limit, weight):
                     if self._last_max_cap_warning_ts < now - MAX_CAPACITY_REACHED_WARNING_INTERVAL:
+                        if task_log_window is not None:
+                            capacity_used += task_log_window.reported_capacity_used
                         msg = f"API rate limit on {rate_limit.limit_id} ({rate_limit.limit} calls per " \
                               f"{rate_limit.time_interval}s) has almost reached. Limits used " \
                               f"is {capacity_used} in the last " \
@@ -43,15 +50,39 @@ class AsyncRequestContext(AsyncRequestContextBase):
                     return False
         return True
 
-    def _time(self):
-        return time.time()
+    def time_until_capacity(self) -> float:
+        """
+        Calculates the time until the oldest task logs blocking this request expire, considering all its limits.
+        :return: the time to wait (in seconds) before the request can be within capacity
+        """
+        time_to_wait: float = 0.0
+        if self._rate_limit is not None:
+            list_of_limits: List[Tuple[RateLimit, int]] = [(self._rate_limit,
+                                                            self._rate_limit.weight)] + self._related_limits
+            now: float = self._time()
+            for rate_limit, weight in list_of_limits:
+                task_log_window: TaskLogWindow = self._task_logs.get(rate_limit.limit_id)
+                if task_log_window is not None:
+                    reported_limit = task_log_window.reported_limit
+                    limit_time_to_wait = task_log_window.time_until_available(
+                        weight=weight,
+                        limit=self._usable_limit(rate_limit.limit, weight),
+                        now=now,
+                        safety_margin_pct=self._safety_margin_pct,
+                        reported_limit=None if reported_limit is None else self._usable_limit(reported_limit, weight))
+                    if limit_time_to_wait is None:
+                        # The request can never fit in the limit, fall back to checking periodically
+                        return self._retry_interval
+                    time_to_wait = max(time_to_wait, limit_time_to_wait)
+        return time_to_wait
 
 
 class AsyncThrottler(AsyncThrottlerBase):
     """
     Handles call rate limits by providing async context (async with), it delays as needed to make sure calls stay
     within defined limits.
-    A task can have multiple call rates (weight), though tasks are still ordered in sequence as they come (FIFO).
+    A task can have multiple call rates (weight), though tasks are still ordered in sequence as they come (FIFO) within
+    each priority class. Higher priority tasks are executed before the lower priority tasks waiting for the same limits.
     (i.e)
         Pool 0 - rate limit is 100 calls per second
         Pool 1 - rate limit is 10 calls per second
@@ -59,13 +90,15 @@ class AsyncThrottler(AsyncThrottlerBase):
         this (whether it belongs to Pool 0 or Pool 1) will have to wait for new capacity (some of the Task A flushed out).
     """
 
-    def execute_task(self, limit_id: str) -> AsyncRequestContext:
+    def execute_task(self, limit_id: str, priority: Optional[RequestPriority] = None) -> AsyncRequestContext:
         """
         Creates an async context where code within the context (a task) can be run only when all rate
         limits have capacity for the new task.
         :param limit_id: the limit_id associated with the APi request
+        :param priority: the priority class of the API request (defaults to the priority set with `request_priority`)
         :return: An async context (used with async with syntax)
         """
+        priority = self.task_priority(priority)
         rate_limit, related_rate_limits = self.get_related_limits(limit_id=limit_id)
         return AsyncRequestContext(
             task_logs=self._task_logs,
@@ -74,4 +107,7 @@ class AsyncThrottler(AsyncThrottlerBase):
             lock=self._lock,
             safety_margin_pct=self._safety_margin_pct,
             retry_interval=self._retry_interval,
+            waiters=self._waiters,
+            priority=priority,
+            headroom_pct=self._priority_headroom_pct.get(priority, 0),
         )
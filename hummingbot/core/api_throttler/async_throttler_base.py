@@ -2,14 +2,40 @@ import asyncio
 import copy
 import logging
 import math
+import time
 from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from contextvars import ContextVar
 from decimal import Decimal
 from typing import Dict, List, Optional, Tuple
 
 from hummingbot.core.api_throttler.async_request_context_base import AsyncRequestContextBase
-from hummingbot.core.api_throttler.data_types import RateLimit, TaskLog
+from hummingbot.core.api_throttler.data_types import (
+    DEFAULT_PRIORITY_HEADROOM_PCT,
+    DEFAULT_REQUEST_PRIORITY,
+    RateLimit,
+    RequestPriority,
+    TaskLogWindow,
+)
 from hummingbot.logger.logger import HummingbotLogger
 
+# Priority of the requests executed without an explicit priority. It is bound to the context of the current asyncio
+# task, so that the priority set by a loop applies to all the requests sent by the methods it calls.
+_current_request_priority: ContextVar[RequestPriority] = ContextVar("request_priority", default=DEFAULT_REQUEST_PRIORITY)
+
+
+@contextmanager
+def request_priority(priority: RequestPriority):
+    """
+    Sets the default priority of the throttled requests executed within the context (`with` syntax)
+    :param priority: the priority class for the requests
+    """
+    token = _current_request_priority.set(priority)
+    try:
+        yield
+    finally:
+        _current_request_priority.reset(token)
+
 
 class AsyncThrottlerBase(ABC):
     """
@@ -29,15 +55,18 @@ class AsyncThrottlerBase(ABC):
                  rate_limits: List[RateLimit],
                  retry_interval: float = 0.1,
                  safety_margin_pct: Optional[float] = 0.05,  # An extra safety margin, in percentage.
-                 limits_share_percentage: Optional[Decimal] = None
+                 limits_share_percentage: Optional[Decimal] = None,
+                 priority_headroom_pct: Optional[Dict[RequestPriority, int]] = None,
                  ):
         """
         :param rate_limits: List of RateLimit(s).
-        :param retry_interval: Time between every capacity check.
+        :param retry_interval: Time between capacity checks, used only when the wait time can not be calculated.
         :param safety_margin_pct: Percentage of limit to be added as a safety margin when calculating capacity to ensure
             calls are within the limit.
         :param limits_share_percentage: Percentage of the limits to be used by this instance (important when multiple
             bots operate with the same account)
+        :param priority_headroom_pct: Percentage of each limit that can not be used by each priority class, to keep it
+            available for the higher priority requests
         """
         # If configured, users can define the percentage of rate limits to allocate to the throttler.
         share_percentage = limits_share_percentage or self._client_config_map().rate_limits_share_pct
@@ -45,17 +74,25 @@ class AsyncThrottlerBase(ABC):
 
         self.set_rate_limits(rate_limits)
 
-        # List of TaskLog used to determine the API requests within a set time window.
-        self._task_logs: List[TaskLog] = []
+        # Sliding windows of TaskLog, per limit id, used to determine the API requests within a set time window.
+        self._task_logs: Dict[str, TaskLogWindow] = {}
 
         # Throttler Parameters
         self._retry_interval: float = retry_interval
         self._safety_margin_pct: float = safety_margin_pct
+        self._priority_headroom_pct: Dict[RequestPriority, int] = (
+            DEFAULT_PRIORITY_HEADROOM_PCT if priority_headroom_pct is None else priority_headroom_pct)
+
+        # Requests waiting for capacity, sorted by priority and arrival order
+        self._waiters: List[AsyncRequestContextBase] = []
 
         # Shared asyncio.Lock instance to prevent multiple async ContextManager from accessing the _task_logs variable
         self._lock = asyncio.Lock()
 
     def set_rate_limits(self, rate_limits: List[RateLimit]):
+        # Limits enforced by the exchange, before applying the share percentage of this instance
+        self._exchange_limits: Dict[str, int] = {limit.limit_id: limit.limit for limit in rate_limits}
+
         # Rate Limit Definitions
         self._rate_limits: List[RateLimit] = copy.deepcopy(rate_limits)
 
@@ -84,6 +121,50 @@ class AsyncThrottlerBase(ABC):
 #
         return rate_limit, related_limits
 
+    def get_exchange_limit(self, limit_id: str) -> Optional[int]:
+        """
+        Returns the limit enforced by the exchange for a limit id, without the share percentage of this instance
+        """
+        return self._exchange_limits.get(limit_id)
+
+    def sync_capacity_used(self, limit_id: str, capacity_used: int, limit: Optional[int] = None):
+        """
+        Updates the capacity used of a limit with the usage reported by the exchange, which includes the requests sent
+        by other processes using the same API key. The requests of this instance are limited both by its share of the
+        limit and by the capacity left in the exchange limit.
+        :param limit_id: the id of the rate limit
+        :param capacity_used: the capacity used in the current time interval of the limit, reported by the exchange
+        :param limit: the limit reported by the exchange (defaults to the configured limit)
+        """
+        rate_limit: Optional[RateLimit] = self._id_to_limit_map.get(limit_id)
+        if rate_limit is None:
+            return
+        task_log_window = self._task_logs.get(limit_id)
+        if task_log_window is None:
+            task_log_window = TaskLogWindow()
+            self._task_logs[limit_id] = task_log_window
+        previously_used = task_log_window.reported_capacity_used
+        task_log_window.sync_capacity_used(
+            capacity_used=capacity_used,
+            limit=self.get_exchange_limit(limit_id) if limit is None else limit,
+            time_interval=rate_limit.time_interval,
+            now=self._time(),
+            safety_margin_pct=self._safety_margin_pct,
+        )
+        if task_log_window.reported_capacity_used < previously_used:
+            # Capacity was freed, the first waiting requests might be able to proceed earlier than expected
+            AsyncRequestContextBase.wake_up_first_in_line(self._waiters, {limit_id})
+
+    def _time(self) -> float:
+        return time.monotonic()
+
+    @staticmethod
+    def task_priority(priority: Optional[RequestPriority] = None) -> RequestPriority:
+        """
+        Returns the priority for a new task, which is the one set with `request_priority` if none is specified
+        """
+        return _current_request_priority.get() if priority is None else priority
+
     @abstractmethod
-    def execute_task(self, limit_id: str) -> AsyncRequestContextBase:
+    def execute_task(self, limit_id: str, priority: Optional[RequestPriority] = None) -> AsyncRequestContextBase:
         raise NotImplementedError
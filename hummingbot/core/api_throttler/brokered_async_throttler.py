@@ -0,0 +1,252 @@
+import asyncio
+import json
+import logging
+import time
+from decimal import Decimal
+from typing import Any, Dict, List, Optional
+
+from hummingbot.core.api_throttler.async_throttler import AsyncRequestContext
+from hummingbot.core.api_throttler.async_throttler_base import AsyncThrottlerBase
+from hummingbot.core.api_throttler.data_types import RateLimit, RequestPriority
+from hummingbot.core.api_throttler.rate_limit_broker import (
+    ACQUIRE,
+    CANCEL,
+    GRANTED,
+    REGISTER,
+    SYNC,
+    default_broker_socket_path,
+    rate_limit_to_json,
+)
+from hummingbot.core.utils.latency_tracker import THROTTLE_WAIT, LatencyTracker
+from hummingbot.logger.logger import HummingbotLogger
+
+
+class RateLimitBrokerClient:
+    """
+    Connection of a bot process to the RateLimitBroker. A single connection per socket path is shared by all the
+    throttlers of the process. If the broker is not available the requests fail with ConnectionError, and the connection
+    is retried after RECONNECT_INTERVAL seconds.
+    """
+
+    RECONNECT_INTERVAL = 5.0
+
+    _logger: Optional[HummingbotLogger] = None
+    _clients: Dict[str, "RateLimitBrokerClient"] = {}
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._logger is None:
+            cls._logger = logging.getLogger(__name__)
+        return cls._logger
+
+    @classmethod
+    def get_instance(cls, socket_path: Optional[str] = None) -> "RateLimitBrokerClient":
+        socket_path = socket_path or default_broker_socket_path()
+        if socket_path not in cls._clients:
+            cls._clients[socket_path] = RateLimitBrokerClient(socket_path=socket_path)
+        return cls._clients[socket_path]
+
+    def __init__(self, socket_path: Optional[str] = None):
+        self._socket_path = socket_path or default_broker_socket_path()
+        self._writer: Optional[asyncio.StreamWriter] = None
+        self._listen_task: Optional[asyncio.Task] = None
+        self._connecting: Optional[asyncio.Future] = None
+        self._pending_requests: Dict[int, asyncio.Future] = {}
+        self._registered_limits: Dict[str, List[RateLimit]] = {}
+        self._next_request_id: int = 0
+        self._last_connection_failure_ts: float = -self.RECONNECT_INTERVAL
+
+    @property
+    def is_connected(self) -> bool:
+        return self._writer is not None
+
+    def register(self, namespace: str, rate_limits: List[RateLimit]):
+        """
+        Registers the rate limits of a namespace in the broker (again after each reconnection)
+        """
+        self._registered_limits[namespace] = rate_limits
+        self._send_register(namespace, rate_limits)
+
+    async def acquire(self, namespace: str, limit_id: str, priority: RequestPriority):
+        """
+        Waits until the broker grants the capacity for a request
+        :raises ConnectionError: if the broker is not available
+        """
+        await self._ensure_connected()
+        self._next_request_id += 1
+        request_id = self._next_request_id
+        granted = asyncio.get_event_loop().create_future()
+        self._pending_requests[request_id] = granted
+        self._send({"op": ACQUIRE, "request_id": request_id, "namespace": namespace, "limit_id": limit_id,
+                    "priority": int(priority)})
+        try:
+            await granted
+        except asyncio.CancelledError:
+            if self._pending_requests.pop(request_id, None) is not None:
+                self._send({"op": CANCEL, "request_id": request_id})
+            raise
+
+    def sync_capacity_used(self, namespace: str, limit_id: str, capacity_used: int, limit: Optional[int] = None):
+        self._send({"op": SYNC, "namespace": namespace, "limit_id": limit_id, "capacity_used": capacity_used,
+                    "limit": limit})
+
+    def disconnect(self):
+        if self._listen_task is not None:
+            self._listen_task.cancel()
+            self._listen_task = None
+        self._on_connection_lost()
+
+    async def _ensure_connected(self):
+        if self._connecting is not None:
+            # Another request is already connecting
+            await asyncio.shield(self._connecting)
+        elif self._writer is None and time.monotonic() - self._last_connection_failure_ts >= self.RECONNECT_INTERVAL:
+            self._connecting = asyncio.get_event_loop().create_future()
+            try:
+                reader, writer = await asyncio.open_unix_connection(path=self._socket_path)
+                self._writer = writer
+                self._listen_task = asyncio.ensure_future(self._listen(reader))
+                for namespace, rate_limits in self._registered_limits.items():
+                    self._send_register(namespace, rate_limits)
+                self.logger().info(f"Connected to the rate limit broker at {self._socket_path}")
+            except OSError as exception:
+                self._last_connection_failure_ts = time.monotonic()
+                self.logger().warning(f"Could not connect to the rate limit broker at {self._socket_path} "
+                                      f"({exception}). Using the local rate limits share percentage instead.")
+            finally:
+                connecting, self._connecting = self._connecting, None
+                connecting.set_result(None)
+        if self._writer is None:
+            raise ConnectionError(f"The rate limit broker at {self._socket_path} is not available.")
+
+    async def _listen(self, reader: asyncio.StreamReader):
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                message: Dict[str, Any] = json.loads(line)
+                if message.get("op") == GRANTED:
+                    granted = self._pending_requests.pop(message["request_id"], None)
+                    if granted is not None and not granted.done():
+                        granted.set_result(None)
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            self.logger().exception("Unexpected error reading messages from the rate limit broker.")
+        finally:
+            self._listen_task = None
+            self._on_connection_lost()
+
+    def _on_connection_lost(self):
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+            self._last_connection_failure_ts = time.monotonic()
+            self.logger().warning("The connection with the rate limit broker was lost.")
+        pending_requests, self._pending_requests = self._pending_requests, {}
+        for granted in pending_requests.values():
+            if not granted.done():
+                granted.set_exception(ConnectionError("The connection with the rate limit broker was lost."))
+
+    def _send_register(self, namespace: str, rate_limits: List[RateLimit]):
+        self._send({"op": REGISTER, "namespace": namespace,
+                    "rate_limits": [rate_limit_to_json(rate_limit) for rate_limit in rate_limits]})
+
+    def _send(self, message: Dict[str, Any]):
+        if self._writer is not None:
+            self._writer.write(json.dumps(message).encode() + b"\n")
+
+
+class BrokeredRequestContext(AsyncRequestContext):
+    """
+    An async context that acquires the capacity for the request from the rate limit broker. When the broker is not
+    available it throttles the request locally, as the AsyncRequestContext does.
+    """
+
+    def __init__(self, broker_client: RateLimitBrokerClient, namespace: str, **kwargs):
+        super().__init__(**kwargs)
+        self._broker_client = broker_client
+        self._namespace = namespace
+
+    async def acquire(self):
+        if self._rate_limit is None:
+            return await super().acquire()
+        started_at = LatencyTracker.now()
+        try:
+            await self._broker_client.acquire(namespace=self._namespace,
+                                              limit_id=self._rate_limit.limit_id,
+                                              priority=self._priority)
+        except ConnectionError:
+            return await super().acquire()
+        # The task logs are kept to throttle the requests locally if the connection with the broker is lost
+        async with self._lock:
+            self._register_task_logs()
+        LatencyTracker.get_instance().record(key=self._rate_limit.limit_id, stage=THROTTLE_WAIT, started_at=started_at)
+
+
+class BrokeredAsyncThrottler(AsyncThrottlerBase):
+    """
+    Throttler that shares the rate limits with all the bot processes of the host through the RateLimitBroker, so that
+    the processes using the same exchange account (namespace) share one budget per limit instead of splitting the
+    limits statically. The rate limits share percentage is only applied when the broker is not available.
+    """
+
+    def __init__(self,
+                 rate_limits: List[RateLimit],
+                 namespace: str,
+                 socket_path: Optional[str] = None,
+                 retry_interval: float = 0.1,
+                 safety_margin_pct: Optional[float] = 0.05,
+                 limits_share_percentage: Optional[Decimal] = None,
+                 priority_headroom_pct: Optional[Dict[RequestPriority, int]] = None,
+                 ):
+        """
+        :param namespace: Identifier of the limits in the broker, shared by the processes using the same account
+        :param socket_path: Path of the Unix domain socket of the broker, default_broker_socket_path() by default
+        (see AsyncThrottlerBase for the rest of the parameters)
+        """
+        self._namespace = namespace
+        self._broker_client = RateLimitBrokerClient.get_instance(socket_path=socket_path)
+        super().__init__(rate_limits=rate_limits,
+                         retry_interval=retry_interval,
+                         safety_margin_pct=safety_margin_pct,
+                         limits_share_percentage=limits_share_percentage,
+                         priority_headroom_pct=priority_headroom_pct)
+
+    def set_rate_limits(self, rate_limits: List[RateLimit]):
+        super().set_rate_limits(rate_limits)
+        # The broker tracks the full limits of the exchange
+        self._broker_client.register(namespace=self._namespace, rate_limits=rate_limits)
+
+    def sync_capacity_used(self, limit_id: str, capacity_used: int, limit: Optional[int] = None):
+        super().sync_capacity_used(limit_id=limit_id, capacity_used=capacity_used, limit=limit)
+        if limit_id in self._id_to_limit_map:
+            self._broker_client.sync_capacity_used(namespace=self._namespace,
+                                                   limit_id=limit_id,
+                                                   capacity_used=capacity_used,
+                                                   limit=limit)
+
+    def execute_task(self, limit_id: str, priority: Optional[RequestPriority] = None) -> BrokeredRequestContext:
+        """
+        Creates an async context where code within the context (a task) can be run only when the broker granted the
+        capacity for it in all the rate limits.
+        :param limit_id: the limit_id associated with the APi request
+        :param priority: the priority class of the API request (defaults to the priority set with `request_priority`)
+        :return: An async context (used with async with syntax)
+        """
+        priority = self.task_priority(priority)
+        rate_limit, related_rate_limits = self.get_related_limits(limit_id=limit_id)
+        return BrokeredRequestContext(
+            broker_client=self._broker_client,
+            namespace=self._namespace,
+            task_logs=self._task_logs,
+            rate_limit=rate_limit,
+            related_limits=related_rate_limits,
+            lock=self._lock,
+            safety_margin_pct=self._safety_margin_pct,
+            retry_interval=self._retry_interval,
+            waiters=self._waiters,
+            priority=priority,
+            headroom_pct=self._priority_headroom_pct.get(priority, 0),
+        )
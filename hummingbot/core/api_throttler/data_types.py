@@ -1,5 +1,9 @@
+from collections import deque
 from dataclasses import dataclass
+from enum import IntEnum
 from typing import (
+    Deque,
+    Dict,
     List,
     Optional,
 )
@@ -13,6 +17,30 @@ RequestWeight = int     # Integer representing the request weight of the path ur
 Seconds = float
 
 
+class RequestPriority(IntEnum):
+    """
+    Priority classes of the throttled requests. Requests with higher priority are queued ahead of requests with lower
+    priority waiting for the same limits.
+    """
+    BACKGROUND = 0      # Trading rules, trading fees and other periodic housekeeping requests
+    MARKET_DATA = 1     # Order book snapshots, tickers and other public data
+    USER_DATA = 2       # Status polling of balances, orders and fills
+    CREATE = 3          # Order creation
+    CANCEL = 4          # Order cancellation
+
+
+DEFAULT_REQUEST_PRIORITY = RequestPriority.CREATE
+
+# Percentage of each limit that requests of a priority class can not use, to keep it available for higher priorities
+DEFAULT_PRIORITY_HEADROOM_PCT: Dict[RequestPriority, int] = {
+    RequestPriority.CANCEL: 0,
+    RequestPriority.CREATE: 0,
+    RequestPriority.USER_DATA: 10,
+    RequestPriority.MARKET_DATA: 20,
+    RequestPriority.BACKGROUND: 30,
+}
+
+
 @dataclass
 class LinkedLimitWeightPair:
     limit_id: str
@@ -54,3 +82,116 @@ class TaskLog:
     timestamp: float
     rate_limit: RateLimit
     weight: int
+
+
+class TaskLogWindow:
+    """
+    Sliding window with the TaskLog(s) registered for a single rate limit, ordered by timestamp.
+    The total weight of the tasks in the window is kept updated as tasks are added and flushed, so that checking the
+    used capacity does not require iterating over the logs.
+
+    The window also keeps the capacity used by other processes sharing the same limits, when the exchange reports the
+    usage of the limit (usually in the response headers). That capacity is considered used until it expires like a
+    task registered at the time of the report, or until a new report is received.
+    """
+
+    def __init__(self):
+        self.task_logs: Deque[TaskLog] = deque()
+        self.capacity_used: int = 0
+        self.reported_capacity_used: int = 0
+        self.reported_limit: Optional[int] = None
+        self.reported_expiration_ts: float = 0.0
+
+    def __len__(self):
+        return len(self.task_logs)
+
+    def append(self, task_log: TaskLog):
+        self.task_logs.append(task_log)
+        self.capacity_used += task_log.weight
+
+    def flush(self, now: float, safety_margin_pct: float):
+        """
+        Removes the task logs that have passed their rate limit period (extended by the safety margin), and the
+        reported capacity used once the report expires
+        :param now: the current timestamp
+        :param safety_margin_pct: the safety margin, as a fraction of the rate limit time interval
+        """
+        if self.reported_limit is not None and now > self.reported_expiration_ts:
+            self.reported_capacity_used = 0
+            self.reported_limit = None
+        task_logs = self.task_logs
+        while task_logs:
+            task = task_logs[0]
+            # Compared with the expiration timestamp (not the elapsed time) so that the float rounding of the
+            # timestamp subtraction doesn't flush a task log exactly at the end of its period
+            if now > task.timestamp + task.rate_limit.time_interval * (1 + safety_margin_pct):
+                task_logs.popleft()
+                self.capacity_used -= task.weight
+            else:
+                break
+
+    def sync_capacity_used(self,
+                           capacity_used: int,
+                           limit: int,
+                           time_interval: float,
+                           now: float,
+                           safety_margin_pct: float):
+        """
+        Registers the usage of the limit reported by the exchange. The capacity not explained by the tasks in the
+        window is attributed to other processes using the same limits.
+        :param capacity_used: the capacity used reported by the exchange
+        :param limit: the limit enforced by the exchange (without the share percentage of this process)
+        :param time_interval: the time interval of the limit
+        :param now: the current timestamp
+        :param safety_margin_pct: the safety margin, as a fraction of the rate limit time interval
+        """
+        self.flush(now=now, safety_margin_pct=safety_margin_pct)
+        self.reported_capacity_used = max(0, capacity_used - self.capacity_used)
+        self.reported_limit = limit
+        self.reported_expiration_ts = now + time_interval * (1 + safety_margin_pct)
+
+    def time_until_available(self,
+                             weight: int,
+                             limit: int,
+                             now: float,
+                             safety_margin_pct: float,
+                             reported_limit: Optional[int] = None) -> Optional[float]:
+        """
+        Calculates the time until enough task logs expire to fit a new task in the window
+        :param weight: the weight of the new task
+        :param limit: the maximum capacity of the window
+        :param now: the current timestamp
+        :param safety_margin_pct: the safety margin, as a fraction of the rate limit time interval
+        :param reported_limit: the usable part of the limit reported by the exchange (defaults to the whole limit)
+        :return: the time to wait in seconds (0 if the task fits already), or None if the task can never fit
+        """
+        if weight > limit:
+            return None
+        time_to_wait = self._time_until_freed(self.capacity_used + weight - limit, now, safety_margin_pct)
+        if self.reported_limit is not None:
+            reported_limit = self.reported_limit if reported_limit is None else reported_limit
+            if weight > reported_limit:
+                return None
+            reported_time_to_wait = self._time_until_freed(
+                self.capacity_used + self.reported_capacity_used + weight - reported_limit, now, safety_margin_pct)
+            if reported_time_to_wait is None or reported_time_to_wait > self.reported_expiration_ts - now:
+                # The capacity reported as used by other processes has to expire first
+                reported_time_to_wait = max(
+                    self.reported_expiration_ts - now,
+                    self._time_until_freed(self.capacity_used + weight - reported_limit, now, safety_margin_pct))
+            time_to_wait = max(time_to_wait, reported_time_to_wait)
+        return time_to_wait
+
+    def _time_until_freed(self, capacity_to_free: int, now: float, safety_margin_pct: float) -> Optional[float]:
+        """
+        Calculates the time until the oldest task logs with the required total weight expire
+        :return: the time to wait in seconds, or None if the task logs in the window do not have enough weight
+        """
+        if capacity_to_free <= 0:
+            return 0.0
+        for task in self.task_logs:
+            capacity_to_free -= task.weight
+            if capacity_to_free <= 0:
+                expiration_ts = task.timestamp + task.rate_limit.time_interval * (1 + safety_margin_pct)
+                return max(0.0, expiration_ts - now)
+        return None
@@ -0,0 +1,231 @@
+import argparse
+import asyncio
+import json
+import logging
+import os
+import stat
+import sys
+from decimal import Decimal
+from typing import Any, Dict, List, Optional
+
+from hummingbot import data_path
+from hummingbot.core.api_throttler.async_throttler import AsyncThrottler
+from hummingbot.core.api_throttler.data_types import LinkedLimitWeightPair, RateLimit, RequestPriority
+from hummingbot.logger.logger import HummingbotLogger
+
+BROKER_SOCKET_FILE_NAME = "hummingbot_rate_limits.sock"
+
+# Operations of the broker protocol. Each message is a JSON object in its own line.
+REGISTER = "register"
+ACQUIRE = "acquire"
+CANCEL = "cancel"
+SYNC = "sync"
+GRANTED = "granted"
+
+
+def default_broker_socket_path() -> str:
+    """
+    Returns the socket path in the runtime directory of the user ($XDG_RUNTIME_DIR), or in the data directory when it's
+    not defined, so that other users of the host can't take over or use the broker
+    """
+    return os.path.join(os.environ.get("XDG_RUNTIME_DIR") or data_path(), BROKER_SOCKET_FILE_NAME)
+
+
+def rate_limit_to_json(rate_limit: RateLimit) -> Dict[str, Any]:
+    return {
+        "limit_id": rate_limit.limit_id,
+        "limit": int(rate_limit.limit),
+        "time_interval": rate_limit.time_interval,
+        "weight": rate_limit.weight,
+        "linked_limits": [[pair.limit_id, pair.weight] for pair in rate_limit.linked_limits],
+    }
+
+
+def rate_limit_from_json(data: Dict[str, Any]) -> RateLimit:
+    return RateLimit(
+        limit_id=data["limit_id"],
+        limit=data["limit"],
+        time_interval=data["time_interval"],
+        weight=data["weight"],
+        linked_limits=[LinkedLimitWeightPair(limit_id, weight) for limit_id, weight in data["linked_limits"]],
+    )
+
+
+class RateLimitBroker:
+    """
+    Local service that keeps a single budget per rate limit for all the bot processes of a host using the same
+    exchange account. The processes connect to the broker through a Unix domain socket and acquire the capacity of each
+    request from it, instead of splitting the limits statically with the rate limits share percentage.
+
+    The limits of each namespace (usually the exchange name) are tracked by an AsyncThrottler using the full limits,
+    so the requests of all the processes are queued by priority and arrival order, like in a single process.
+    The broker can be started with `python -m hummingbot.core.api_throttler.rate_limit_broker`.
+    """
+
+    _logger: Optional[HummingbotLogger] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._logger is None:
+            cls._logger = logging.getLogger(__name__)
+        return cls._logger
+
+    def __init__(self, socket_path: Optional[str] = None):
+        """
+        :param socket_path: Path of the Unix domain socket, default_broker_socket_path() by default
+        """
+        self._socket_path = socket_path or default_broker_socket_path()
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._throttlers: Dict[str, AsyncThrottler] = {}
+
+    @property
+    def socket_path(self) -> str:
+        return self._socket_path
+
+    def throttler(self, namespace: str) -> Optional[AsyncThrottler]:
+        return self._throttlers.get(namespace)
+
+    async def start(self):
+        """
+        Starts listening on the socket path, only readable and writable by the user running the broker.
+        Raises EnvironmentError if another broker is listening on the path, or if the path is not a socket. The socket
+        left by a broker that didn't stop properly is replaced.
+        """
+        if os.path.lexists(self._socket_path):
+            if not stat.S_ISSOCK(os.lstat(self._socket_path).st_mode):
+                raise EnvironmentError(f"Can't start the rate limit broker, {self._socket_path} is not a socket.")
+            if await self._is_broker_listening():
+                raise EnvironmentError(f"Another rate limit broker is already listening on {self._socket_path}.")
+            os.remove(self._socket_path)
+        # The permissions are restricted when the socket is created, not after, so no other user can connect meanwhile
+        previous_umask = os.umask(0o177)
+        try:
+            self._server = await asyncio.start_unix_server(self._handle_connection, path=self._socket_path)
+        finally:
+            os.umask(previous_umask)
+        self.logger().info(f"Rate limit broker listening on {self._socket_path}")
+
+    async def stop(self):
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+            # The socket is only removed by the broker that created it
+            if os.path.lexists(self._socket_path):
+                os.remove(self._socket_path)
+
+    async def _is_broker_listening(self) -> bool:
+        try:
+            _, writer = await asyncio.open_unix_connection(path=self._socket_path)
+        except (ConnectionRefusedError, FileNotFoundError):
+            return False
+        writer.close()
+        return True
+
+    def register(self, namespace: str, rate_limits: List[RateLimit]):
+        """
+        Registers the rate limits of a namespace. Limits already registered by other processes are kept, so that the
+        capacity used is not reset when a new process connects.
+        """
+        throttler = self._throttlers.get(namespace)
+        if throttler is None:
+            self._throttlers[namespace] = AsyncThrottler(rate_limits=rate_limits,
+                                                         limits_share_percentage=Decimal("100"))
+        else:
+            new_limits = [rate_limit for rate_limit in rate_limits
+                          if rate_limit.limit_id not in throttler._id_to_limit_map]
+            if len(new_limits) > 0:
+                throttler.set_rate_limits(throttler._rate_limits + new_limits)
+
+    async def _handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        acquire_tasks: Dict[int, asyncio.Task] = {}
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                try:
+                    message = json.loads(line)
+                    self._process_message(message, writer, acquire_tasks)
+                except Exception:
+                    self.logger().exception(f"Error processing rate limit broker message {line}")
+        except (asyncio.CancelledError, ConnectionError):
+            pass
+        finally:
+            # The requests waiting for capacity of a closed connection will never be executed
+            for task in list(acquire_tasks.values()):
+                task.cancel()
+            writer.close()
+
+    def _process_message(self,
+                         message: Dict[str, Any],
+                         writer: asyncio.StreamWriter,
+                         acquire_tasks: Dict[int, asyncio.Task]):
+        operation = message["op"]
+        if operation == REGISTER:
+            self.register(message["namespace"], [rate_limit_from_json(data) for data in message["rate_limits"]])
+        elif operation == ACQUIRE:
+            request_id = message["request_id"]
+            acquire_tasks[request_id] = asyncio.ensure_future(self._acquire(
+                namespace=message["namespace"],
+                limit_id=message["limit_id"],
+                priority=RequestPriority(message["priority"]),
+                request_id=request_id,
+                writer=writer,
+                acquire_tasks=acquire_tasks,
+            ))
+        elif operation == CANCEL:
+            task = acquire_tasks.pop(message["request_id"], None)
+            if task is not None:
+                task.cancel()
+        elif operation == SYNC:
+            throttler = self._throttlers.get(message["namespace"])
+            if throttler is not None:
+                throttler.sync_capacity_used(limit_id=message["limit_id"],
+                                             capacity_used=message["capacity_used"],
+                                             limit=message.get("limit"))
+        else:
+            self.logger().warning(f"Unknown rate limit broker operation {operation}")
+
+    async def _acquire(self,
+                       namespace: str,
+                       limit_id: str,
+                       priority: RequestPriority,
+                       request_id: int,
+                       writer: asyncio.StreamWriter,
+                       acquire_tasks: Dict[int, asyncio.Task]):
+        try:
+            throttler = self._throttlers.get(namespace)
+            if throttler is not None:
+                await throttler.execute_task(limit_id=limit_id, priority=priority).acquire()
+            if not writer.is_closing():
+                writer.write(json.dumps({"op": GRANTED, "request_id": request_id}).encode() + b"\n")
+        finally:
+            acquire_tasks.pop(request_id, None)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Shares the API rate limits between the bots running in this host")
+    parser.add_argument("--socket-path", default=None,
+                        help="Path of the Unix domain socket the bots connect to (by default "
+                             f"{BROKER_SOCKET_FILE_NAME} in $XDG_RUNTIME_DIR, or in the data directory)")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO)
+
+    broker = RateLimitBroker(socket_path=args.socket_path)
+    ev_loop = asyncio.get_event_loop()
+    try:
+        ev_loop.run_until_complete(broker.start())
+    except EnvironmentError as e:
+        logging.error(str(e))
+        sys.exit(1)
+    try:
+        ev_loop.run_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        ev_loop.run_until_complete(broker.stop())
+
+
+if __name__ == "__main__":
+    main()
@@ -10,3 +10,16 @@ cdef class Clock:
         list _current_context
         double _current_tick
         bint _started
+        double _min_tick_interval
+        object _tick_requested
+        list _tick_triggers
+        dict _tick_intervals
+        dict _next_tick_times
+        list _timer_heap
+        long long _timer_sequence
+        object _tick_profiler
+
+    cdef double c_next_tick_time(self, double now, double next_tick_boundary)
+    cdef double c_next_event_time(self)
+    cdef double c_next_backtest_tick_boundary(self)
+    cdef list c_due_iterators(self, list iterators, bint is_tick_boundary)
@@ -1,16 +1,24 @@
 # distutils: language=c++
 
 import asyncio
+import heapq
 import logging
+import math
 import time
-from typing import List
+from enum import Enum
+from time import perf_counter_ns
+from typing import List, Optional
 
+from hummingbot.core.event.event_forwarder import EventForwarder
+from hummingbot.core.pubsub import PubSub
 from hummingbot.core.time_iterator import TimeIterator
 from hummingbot.core.time_iterator cimport TimeIterator
 from hummingbot.core.clock_mode import ClockMode
+from hummingbot.core.utils.tick_profiler import TickProfiler
 from hummingbot.logger import HummingbotLogger
 
 s_logger = None
+NaN = float("nan")
 
 
 cdef class Clock:
@@ -21,21 +29,42 @@ cdef class Clock:
             s_logger = logging.getLogger(__name__)
         return s_logger
 
-    def __init__(self, clock_mode: ClockMode, tick_size: float = 1.0, start_time: float = 0.0, end_time: float = 0.0):
+    def __init__(self,
+                 clock_mode: ClockMode,
+                 tick_size: float = 1.0,
+                 start_time: float = 0.0,
+                 end_time: float = 0.0,
+                 min_tick_interval: float = 0.1):
         """
-        :param clock_mode: either real time mode or back testing mode
-        :param tick_size: time interval of each tick
+        :param clock_mode: either real time mode, event driven (real time) mode, back testing mode or event time back
+            testing mode (where the clock jumps to the next timestamp needed by an iterator instead of ticking every
+            tick size)
+        :param tick_size: time interval of each tick (the maximum interval between ticks in event driven mode)
         :param start_time: (back testing mode only) start of simulation in UNIX timestamp
         :param end_time: (back testing mode only) end of simulation in UNIX timestamp. NaN to simulate to end of data.
+        :param min_tick_interval: (event driven mode only) minimum time between ticks, the tick triggers fired
+            within the interval are coalesced in a single tick
         """
         self._clock_mode = clock_mode
         self._tick_size = tick_size
         self._start_time = start_time
         self._end_time = end_time
-        self._current_tick = start_time if clock_mode is ClockMode.BACKTEST else (time.time() // tick_size) * tick_size
+        self._current_tick = (start_time if clock_mode in (ClockMode.BACKTEST, ClockMode.BACKTEST_EVENT_TIME)
+                              else (time.time() // tick_size) * tick_size)
         self._child_iterators = []
         self._current_context = None
         self._started = False
+        self._min_tick_interval = min_tick_interval
+        self._tick_requested = None
+        self._tick_triggers = []
+        self._tick_intervals = {}
+        self._next_tick_times = {}
+        self._timer_heap = []
+        self._timer_sequence = 0
+        # Profiling is for live trading, the tick durations of a back test are not worth the overhead
+        self._tick_profiler = TickProfiler(
+            tick_size=tick_size,
+            enabled=clock_mode not in (ClockMode.BACKTEST, ClockMode.BACKTEST_EVENT_TIME))
 
     @property
     def clock_mode(self) -> ClockMode:
@@ -49,6 +78,14 @@ cdef class Clock:
     def tick_size(self) -> float:
         return self._tick_size
 
+    @property
+    def min_tick_interval(self) -> float:
+        return self._min_tick_interval
+
+    @property
+    def tick_profiler(self) -> TickProfiler:
+        return self._tick_profiler
+
     @property
     def child_iterators(self) -> List[TimeIterator]:
         return self._child_iterators
@@ -69,7 +106,21 @@ cdef class Clock:
                 (<TimeIterator>iterator).c_stop(self)
         self._current_context = None
 
-    def add_iterator(self, iterator: TimeIterator):
+    def add_iterator(self, iterator: TimeIterator, tick_interval: Optional[float] = None):
+        """
+        :param iterator: the iterator to tick
+        :param tick_interval: time interval between the ticks of the iterator. If not provided the interval declared
+            by the iterator in its `tick_interval` attribute is used, and if it doesn't declare one the iterator ticks
+            in every tick of the clock.
+        """
+        if tick_interval is None:
+            tick_interval = getattr(iterator, "tick_interval", None)
+        if tick_interval is not None:
+            if tick_interval <= 0:
+                raise ValueError(f"The tick interval of {iterator} must be positive (got {tick_interval}).")
+            self._tick_intervals[iterator] = tick_interval
+            # Iterators with their own interval tick in the first tick of the clock, and then every interval
+            self._schedule_iterator(iterator, self._current_tick)
         if self._current_context is not None:
             self._current_context.append(iterator)
         if self._started:
@@ -81,6 +132,144 @@ cdef class Clock:
             (<TimeIterator>iterator).c_stop(self)
             self._current_context.remove(iterator)
         self._child_iterators.remove(iterator)
+        # The entry in the timer heap is discarded when it's due
+        self._tick_intervals.pop(iterator, None)
+        self._next_tick_times.pop(iterator, None)
+
+    def get_tick_interval(self, iterator: TimeIterator) -> float:
+        """
+        :return: the time interval between the ticks of the iterator
+        """
+        return self._tick_intervals.get(iterator, self._tick_size)
+
+    def _schedule_iterator(self, iterator: TimeIterator, double tick_time):
+        self._next_tick_times[iterator] = tick_time
+        self._timer_sequence += 1
+        heapq.heappush(self._timer_heap, (tick_time, self._timer_sequence, iterator))
+
+    cdef double c_next_tick_time(self, double now, double next_tick_boundary):
+        """
+        Calculates the time of the next tick. The clock ticks at the tick size boundaries only while there are
+        iterators ticking in every tick, otherwise it ticks when the next iterator with its own interval is due.
+        """
+        cdef double next_timer_time
+
+        # Discard the entries of removed or rescheduled iterators
+        while (len(self._timer_heap) > 0
+               and self._next_tick_times.get(self._timer_heap[0][2]) != self._timer_heap[0][0]):
+            heapq.heappop(self._timer_heap)
+        if len(self._timer_heap) == 0:
+            return next_tick_boundary
+        next_timer_time = self._timer_heap[0][0]
+        if next_timer_time <= now:
+            # Overdue iterators tick in the next tick
+            next_timer_time = next_tick_boundary
+        if len(self._tick_intervals) < len(self._child_iterators):
+            return min(next_tick_boundary, next_timer_time)
+        return next_timer_time
+
+    cdef double c_next_event_time(self):
+        """
+        Calculates the next timestamp needed by the iterators (see TimeIterator.next_tick_timestamp). The clock
+        advances at least one tick size, when an iterator needs to tick immediately.
+        :return: the next timestamp, or NaN if no iterator needs any
+        """
+        cdef:
+            double next_event_time = NaN
+            double iterator_time
+            double min_event_time = self._current_tick + self._tick_size
+
+        for iterator in self._child_iterators:
+            iterator_time = iterator.next_tick_timestamp(self._current_tick)
+            if math.isnan(iterator_time):
+                continue
+            iterator_time = max(iterator_time, min_event_time)
+            if math.isnan(next_event_time) or iterator_time < next_event_time:
+                next_event_time = iterator_time
+        return next_event_time
+
+    cdef double c_next_backtest_tick_boundary(self):
+        """
+        Calculates the next tick size boundary of the back testing grid, that starts at the start time
+        """
+        cdef double elapsed_ticks = (self._current_tick - self._start_time) / self._tick_size
+
+        # The tolerance prevents returning the current boundary again when the division rounds it down
+        return self._start_time + (math.floor(elapsed_ticks + 1e-9) + 1) * self._tick_size
+
+    cdef list c_due_iterators(self, list iterators, bint is_tick_boundary):
+        """
+        :param is_tick_boundary: whether the current tick falls on a tick size boundary (or is a tick triggered in
+            event driven mode), when the iterators without their own interval tick
+        :return: the iterators to tick in the current tick, in the order they were added to the clock
+        """
+        cdef:
+            set due_iterators = set()
+            double tick_interval
+
+        while len(self._timer_heap) > 0 and self._timer_heap[0][0] <= self._current_tick:
+            tick_time, _, iterator = heapq.heappop(self._timer_heap)
+            if self._next_tick_times.get(iterator) != tick_time:
+                continue
+            due_iterators.add(iterator)
+            tick_interval = self._tick_intervals[iterator]
+            self._schedule_iterator(iterator, ((self._current_tick // tick_interval) + 1) * tick_interval)
+        if len(self._tick_intervals) == 0:
+            return iterators
+        return [iterator for iterator in iterators
+                if iterator in due_iterators or (is_tick_boundary and iterator not in self._tick_intervals)]
+
+    def add_tick_trigger(self, pubsub: PubSub, event_tag: Enum):
+        """
+        Makes the clock tick (in event driven mode) every time the event is triggered by the PubSub, e.g. when the top
+        of an order book changes, a public trade happens or an order is updated.
+        """
+        forwarder = EventForwarder(to_function=self._on_tick_trigger)
+        pubsub.add_listener(event_tag, forwarder)
+        self._tick_triggers.append((pubsub, event_tag, forwarder))
+
+    def remove_tick_triggers(self):
+        for pubsub, event_tag, forwarder in self._tick_triggers:
+            pubsub.remove_listener(event_tag, forwarder)
+        self._tick_triggers.clear()
+
+    def trigger_tick(self):
+        """
+        Requests a tick as soon as possible (in event driven mode). Requests received before the tick is executed are
+        coalesced, and ticks are never closer in time than the minimum tick interval.
+        """
+        if self._tick_requested is not None:
+            self._tick_requested.set()
+
+    def _on_tick_trigger(self, _):
+        self.trigger_tick()
+
+    async def _wait_for_triggered_tick(self, double now, double timestamp) -> float:
+        """
+        Waits until a tick is triggered, or until the next tick size boundary if nothing triggers it before
+        :param timestamp: the end of the run, the wait is interrupted when it's reached
+        :return: the timestamp of the tick, or NaN if the end of the run was reached without ticking
+        """
+        cdef:
+            double next_tick_time = self.c_next_tick_time(now, ((now // self._tick_size) + 1) * self._tick_size)
+            double min_tick_time = self._current_tick + self._min_tick_interval
+
+        try:
+            await asyncio.wait_for(self._tick_requested.wait(), min(next_tick_time, timestamp) - now)
+        except asyncio.TimeoutError:
+            if timestamp < next_tick_time:
+                return NaN
+        now = time.time()
+        if now < min_tick_time:
+            if timestamp <= min_tick_time:
+                # The pending tick is left for the next run
+                await asyncio.sleep(timestamp - now)
+                return NaN
+            # The triggers fired meanwhile are coalesced in this tick
+            await asyncio.sleep(min_tick_time - now)
+            now = time.time()
+        self._tick_requested.clear()
+        return max(now, self._current_tick)
 
     async def run(self):
         await self.run_til(float("nan"))
@@ -90,6 +279,9 @@ cdef class Clock:
             TimeIterator child_iterator
             double now = time.time()
             double next_tick_time
+            double next_tick_boundary
+            bint is_tick_boundary
+            bint profiling
 
         if self._current_context is None:
             raise EnvironmentError("run() and run_til() can only be used within the context of a `with...` statement.")
@@ -101,20 +293,42 @@ cdef class Clock:
                 child_iterator.c_start(self, self._current_tick)
             self._started = True
 
+        if self._clock_mode is ClockMode.EVENT_DRIVEN and self._tick_requested is None:
+            self._tick_requested = asyncio.Event()
+
         try:
             while True:
                 now = time.time()
                 if now >= timestamp:
                     return
 
-                # Sleep until the next tick
-                next_tick_time = ((now // self._tick_size) + 1) * self._tick_size
-                await asyncio.sleep(next_tick_time - now)
-                self._current_tick = next_tick_time
+                if self._clock_mode is ClockMode.EVENT_DRIVEN:
+                    next_tick_time = await self._wait_for_triggered_tick(now, timestamp)
+                    if math.isnan(next_tick_time):
+                        return
+                    self._current_tick = next_tick_time
+                    # Triggered ticks are not scheduled in advance
+                    loop_lag = None
+                    is_tick_boundary = True
+                else:
+                    # Sleep until the next tick
+                    next_tick_boundary = ((now // self._tick_size) + 1) * self._tick_size
+                    next_tick_time = self.c_next_tick_time(now, next_tick_boundary)
+                    if next_tick_time > next_tick_boundary and next_tick_time > timestamp:
+                        # No iterator is due before the end of the run
+                        await asyncio.sleep(timestamp - now)
+                        return
+                    await asyncio.sleep(next_tick_time - now)
+                    self._current_tick = next_tick_time
+                    loop_lag = time.time() - next_tick_time
+                    is_tick_boundary = next_tick_time >= next_tick_boundary
 
-                # Run through all the child iterators.
-                for ci in self._current_context:
+                # Run through all the child iterators due in this tick.
+                profiling = self._tick_profiler.enabled
+                tick_started_ns = perf_counter_ns()
+                for ci in self.c_due_iterators(self._current_context, is_tick_boundary):
                     child_iterator = ci
+                    iterator_started_ns = perf_counter_ns()
                     try:
                         child_iterator.c_tick(self._current_tick)
                     except StopIteration:
@@ -122,13 +336,22 @@ cdef class Clock:
                         return
                     except Exception:
                         self.logger().error("Unexpected error running clock tick.", exc_info=True)
+                    if profiling:
+                        self._tick_profiler.record_iterator_tick(child_iterator, iterator_started_ns)
+                if profiling:
+                    self._tick_profiler.record_tick(tick_started_ns, loop_lag)
         finally:
             for ci in self._current_context:
                 child_iterator = ci
                 child_iterator._clock = None
 
     def backtest_til(self, timestamp: float):
-        cdef TimeIterator child_iterator
+        cdef:
+            TimeIterator child_iterator
+            double next_tick_time
+            double next_tick_boundary
+            bint is_tick_boundary
+            bint profiling
 
         if not self._started:
             for ci in self._child_iterators:
@@ -138,15 +361,43 @@ cdef class Clock:
 
         try:
             while not (self._current_tick >= timestamp):
-                self._current_tick += self._tick_size
-                for ci in self._child_iterators:
+                if self._clock_mode is ClockMode.BACKTEST_EVENT_TIME:
+                    next_tick_boundary = self.c_next_event_time()
+                    if math.isnan(next_tick_boundary):
+                        # No iterator needs any other tick before the end of the simulation
+                        if math.isnan(timestamp):
+                            return
+                        next_tick_boundary = timestamp
+                else:
+                    # The iterators ticking at other intervals don't move the tick size grid
+                    next_tick_boundary = self.c_next_backtest_tick_boundary()
+                next_tick_time = self.c_next_tick_time(self._current_tick, next_tick_boundary)
+                if next_tick_time > timestamp:
+                    if self._clock_mode is ClockMode.BACKTEST_EVENT_TIME:
+                        # The next event is after the end of the run, the clock stops at the end
+                        next_tick_time = timestamp
+                    else:
+                        # Don't go past the end of the simulation if no iterator is due before it
+                        next_tick_time = max(timestamp, next_tick_boundary)
+                # In event time mode every tick is needed by some iterator, all of them tick
+                is_tick_boundary = (self._clock_mode is ClockMode.BACKTEST_EVENT_TIME
+                                    or next_tick_time >= next_tick_boundary)
+                self._current_tick = next_tick_time
+                profiling = self._tick_profiler.enabled
+                tick_started_ns = perf_counter_ns()
+                for ci in self.c_due_iterators(self._child_iterators, is_tick_boundary):
                     child_iterator = ci
+                    iterator_started_ns = perf_counter_ns()
                     try:
                         child_iterator.c_tick(self._current_tick)
                     except StopIteration:
                         raise
                     except Exception:
                         self.logger().error("Unexpected error running clock tick.", exc_info=True)
+                    if profiling:
+                        self._tick_profiler.record_iterator_tick(child_iterator, iterator_started_ns)
+                if profiling:
+                    self._tick_profiler.record_tick(tick_started_ns)
         except StopIteration:
             return
         finally:
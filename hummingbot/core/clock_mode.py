@@ -6,3 +6,5 @@ from enum import Enum
 class ClockMode(Enum):
     REALTIME = 1
     BACKTEST = 2
+    EVENT_DRIVEN = 3    # Real time, ticking as soon as a tick trigger fires (and at least every tick size)
+    BACKTEST_EVENT_TIME = 4     # Back testing, jumping to the next timestamp needed by an iterator
@@ -1,4 +1,18 @@
 #include "LimitOrder.h"
+#include <cmath>
+
+// Native copy of the price, so that the orders can be sorted and matched without Python comparisons
+static double toDoublePrice(PyObject *price) {
+    if (price == NULL) {
+        return NAN;
+    }
+    double result = PyFloat_AsDouble(price);
+    if (result == -1.0 && PyErr_Occurred()) {
+        PyErr_Clear();
+        return NAN;
+    }
+    return result;
+}
 
 LimitOrder::LimitOrder() {
     this->clientOrderID = "";
@@ -7,6 +21,7 @@ LimitOrder::LimitOrder() {
     this->baseCurrency = "";
     this->quoteCurrency = "";
     this->price = NULL;
+    this->doublePrice = NAN;
     this->quantity = NULL;
     this->filledQuantity = NULL;
     this->creationTimestamp = 0.0;
@@ -27,6 +42,7 @@ LimitOrder::LimitOrder(std::string clientOrderID,
     this->baseCurrency = baseCurrency;
     this->quoteCurrency = quoteCurrency;
     this->price = price;
+    this->doublePrice = toDoublePrice(price);
     this->quantity = quantity;
     this->filledQuantity = NULL;
     this->creationTimestamp = 0.0;
@@ -52,6 +68,7 @@ LimitOrder::LimitOrder(std::string clientOrderID,
     this->baseCurrency = baseCurrency;
     this->quoteCurrency = quoteCurrency;
     this->price = price;
+    this->doublePrice = toDoublePrice(price);
     this->quantity = quantity;
     this->filledQuantity = filledQuantity;
     this->creationTimestamp = creationTimestamp;
@@ -68,6 +85,7 @@ LimitOrder::LimitOrder(const LimitOrder &other) {
     this->baseCurrency = other.baseCurrency;
     this->quoteCurrency = other.quoteCurrency;
     this->price = other.price;
+    this->doublePrice = other.doublePrice;
     this->quantity = other.quantity;
     this->filledQuantity = other.filledQuantity;
     this->creationTimestamp = other.creationTimestamp;
@@ -93,6 +111,7 @@ LimitOrder &LimitOrder::operator=(const LimitOrder &other) {
     this->baseCurrency = other.baseCurrency;
     this->quoteCurrency = other.quoteCurrency;
     this->price = other.price;
+    this->doublePrice = other.doublePrice;
     this->quantity = other.quantity;
     this->filledQuantity = other.filledQuantity;
     this->creationTimestamp = other.creationTimestamp;
@@ -105,11 +124,10 @@ LimitOrder &LimitOrder::operator=(const LimitOrder &other) {
 }
 
 bool operator<(LimitOrder const &a, LimitOrder const &b) {
-    if ((bool)(PyObject_RichCompareBool(a.price, b.price, Py_EQ))) {
-        // return (bool)(PyObject_RichCompareBool(a.quantity, b.quantity, Py_LT));
+    if (a.doublePrice == b.doublePrice) {
         return (bool)(a.clientOrderID < b.clientOrderID);
     } else {
-        return (bool)(PyObject_RichCompareBool(a.price, b.price, Py_LT));
+        return a.doublePrice < b.doublePrice;
     }
 }
 
@@ -137,6 +155,10 @@ PyObject *LimitOrder::getPrice() const {
     return this->price;
 }
 
+double LimitOrder::getDoublePrice() const {
+    return this->doublePrice;
+}
+
 PyObject *LimitOrder::getQuantity() const {
     return this->quantity;
 }
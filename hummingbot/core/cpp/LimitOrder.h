@@ -11,6 +11,7 @@ class LimitOrder {
     std::string baseCurrency;
     std::string quoteCurrency;
     PyObject *price;
+    double doublePrice;
     PyObject *quantity;
     PyObject *filledQuantity;
     long creationTimestamp;
@@ -46,6 +47,7 @@ class LimitOrder {
         std::string getBaseCurrency() const;
         std::string getQuoteCurrency() const;
         PyObject *getPrice() const;
+        double getDoublePrice() const;
         PyObject *getQuantity() const;
         PyObject *getFilledQuantity() const;
         long getCreationTimestamp() const;
@@ -33,6 +33,7 @@ cdef extern from "../cpp/LimitOrder.h":
         string getBaseCurrency()
         string getQuoteCurrency()
         PyObject *getPrice()
+        double getDoublePrice()
         PyObject *getQuantity()
         PyObject *getFilledQuantity()
         long long getCreationTimestamp()
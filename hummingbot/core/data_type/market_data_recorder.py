@@ -0,0 +1,350 @@
+import asyncio
+import logging
+import os
+import threading
+from collections import deque
+from datetime import datetime, timezone
+from typing import Any, Deque, Dict, Iterator, Optional, Tuple
+
+from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
+from hummingbot.logger import HummingbotLogger
+
+MARKET_DATA_FILE_EXTENSION = ".hbmd"
+MARKET_DATA_FILE_MAGIC = b"HBMD\x01"
+
+# Record types of the market data files. Each record starts with its type byte.
+HEADER_RECORD = 0
+SNAPSHOT_RECORD = 1
+DIFF_RECORD = 2
+TRADE_RECORD = 3
+TRADE_WITH_TEXT_ID_RECORD = 4
+
+
+def _write_varint(buffer: bytearray, value: int):
+    # Zigzag encoding, so that small negative deltas also take few bytes
+    value = (value << 1) if value >= 0 else ((-value << 1) - 1)
+    while value > 0x7f:
+        buffer.append((value & 0x7f) | 0x80)
+        value >>= 7
+    buffer.append(value)
+
+
+def _read_varint(data: bytes, position: int) -> Tuple[int, int]:
+    value = 0
+    shift = 0
+    while True:
+        byte = data[position]
+        position += 1
+        value |= (byte & 0x7f) << shift
+        if byte < 0x80:
+            break
+        shift += 7
+    value = (value >> 1) if not value & 1 else -((value + 1) >> 1)
+    return value, position
+
+
+def market_data_file_name(trading_pair: str, timestamp: float) -> str:
+    hour = datetime.fromtimestamp(timestamp, tz=timezone.utc).strftime("%Y%m%d%H")
+    return f"{trading_pair}_{hour}{MARKET_DATA_FILE_EXTENSION}"
+
+
+class MarketDataFileWriter:
+    """
+    Writes the order book messages of one trading pair to a compact binary file. Timestamps (in microseconds), update
+    ids, trade ids and prices are delta encoded against the previous record, and all the integers are stored as zigzag
+    varints, so a typical diff level takes a few bytes instead of the tens of bytes of the JSON messages.
+    Prices and amounts are stored as integers with a fixed number of decimals, set in the header record.
+
+    A header record is written every time the file is opened, so that data appended after a restart resets the delta
+    encoding state of the reader.
+    """
+
+    def __init__(self, file_path: str, price_decimals: int = 8, amount_decimals: int = 8):
+        self._price_scale: int = 10 ** price_decimals
+        self._amount_scale: int = 10 ** amount_decimals
+        is_new_file = not os.path.exists(file_path) or os.path.getsize(file_path) == 0
+        self._file = open(file_path, "ab")
+        header = bytearray(MARKET_DATA_FILE_MAGIC if is_new_file else b"")
+        header.append(HEADER_RECORD)
+        _write_varint(header, price_decimals)
+        _write_varint(header, amount_decimals)
+        self._file.write(header)
+        self._last_timestamp: int = 0
+        self._last_update_id: int = 0
+        self._last_trade_id: int = 0
+        self._last_price: int = 0
+
+    def write(self, message: OrderBookMessage):
+        buffer = bytearray()
+        content: Dict[str, Any] = message.content
+        timestamp = round(message.timestamp * 1e6)
+        if message.type is OrderBookMessageType.TRADE:
+            trade_id = content.get("trade_id")
+            has_int_trade_id = isinstance(trade_id, int) or (isinstance(trade_id, str) and trade_id.isdigit())
+            buffer.append(TRADE_RECORD if has_int_trade_id else TRADE_WITH_TEXT_ID_RECORD)
+            _write_varint(buffer, timestamp - self._last_timestamp)
+            if has_int_trade_id:
+                _write_varint(buffer, int(trade_id) - self._last_trade_id)
+                self._last_trade_id = int(trade_id)
+            else:
+                text_id = str(trade_id).encode()
+                _write_varint(buffer, len(text_id))
+                buffer.extend(text_id)
+            _write_varint(buffer, int(float(content["trade_type"])))
+            self._write_level(buffer, content["price"], content["amount"])
+        else:
+            buffer.append(SNAPSHOT_RECORD if message.type is OrderBookMessageType.SNAPSHOT else DIFF_RECORD)
+            _write_varint(buffer, timestamp - self._last_timestamp)
+            update_id = int(float(content["update_id"]))
+            _write_varint(buffer, update_id - self._last_update_id)
+            self._last_update_id = update_id
+            bids, asks = content["bids"], content["asks"]
+            _write_varint(buffer, len(bids))
+            _write_varint(buffer, len(asks))
+            for price, amount, *_ in bids:
+                self._write_level(buffer, price, amount)
+            for price, amount, *_ in asks:
+                self._write_level(buffer, price, amount)
+        self._last_timestamp = timestamp
+        self._file.write(buffer)
+
+    def flush(self):
+        self._file.flush()
+
+    def close(self):
+        self._file.close()
+
+    def _write_level(self, buffer: bytearray, price: Any, amount: Any):
+        price = round(float(price) * self._price_scale)
+        _write_varint(buffer, price - self._last_price)
+        _write_varint(buffer, round(float(amount) * self._amount_scale))
+        self._last_price = price
+
+
+def read_market_data_file(file_path: str, trading_pair: str) -> Iterator[OrderBookMessage]:
+    """
+    Reads the order book messages of a file written by the MarketDataRecorder
+    """
+    with open(file_path, "rb") as data_file:
+        data = data_file.read()
+    if not data.startswith(MARKET_DATA_FILE_MAGIC):
+        raise ValueError(f"{file_path} is not a market data file.")
+    position = len(MARKET_DATA_FILE_MAGIC)
+    price_scale = amount_scale = 1
+    last_timestamp = last_update_id = last_trade_id = last_price = 0
+
+    def read_level(position: int) -> Tuple[float, float, int]:
+        nonlocal last_price
+        price_delta, position = _read_varint(data, position)
+        amount, position = _read_varint(data, position)
+        last_price += price_delta
+        return last_price / price_scale, amount / amount_scale, position
+
+    while position < len(data):
+        record_type = data[position]
+        position += 1
+        if record_type == HEADER_RECORD:
+            price_decimals, position = _read_varint(data, position)
+            amount_decimals, position = _read_varint(data, position)
+            price_scale, amount_scale = 10 ** price_decimals, 10 ** amount_decimals
+            last_timestamp = last_update_id = last_trade_id = last_price = 0
+            continue
+        timestamp_delta, position = _read_varint(data, position)
+        last_timestamp += timestamp_delta
+        if record_type in (TRADE_RECORD, TRADE_WITH_TEXT_ID_RECORD):
+            if record_type == TRADE_RECORD:
+                trade_id_delta, position = _read_varint(data, position)
+                last_trade_id += trade_id_delta
+                trade_id = last_trade_id
+            else:
+                length, position = _read_varint(data, position)
+                trade_id = data[position:position + length].decode()
+                position += length
+            trade_type, position = _read_varint(data, position)
+            price, amount, position = read_level(position)
+            yield OrderBookMessage(OrderBookMessageType.TRADE, {
+                "trading_pair": trading_pair,
+                "trade_id": trade_id,
+                "trade_type": float(trade_type),
+                "price": price,
+                "amount": amount,
+            }, timestamp=last_timestamp / 1e6)
+        elif record_type in (SNAPSHOT_RECORD, DIFF_RECORD):
+            update_id_delta, position = _read_varint(data, position)
+            last_update_id += update_id_delta
+            bids_count, position = _read_varint(data, position)
+            asks_count, position = _read_varint(data, position)
+            levels = []
+            for _ in range(bids_count + asks_count):
+                price, amount, position = read_level(position)
+                levels.append([price, amount])
+            yield OrderBookMessage(
+                OrderBookMessageType.SNAPSHOT if record_type == SNAPSHOT_RECORD else OrderBookMessageType.DIFF,
+                {
+                    "trading_pair": trading_pair,
+                    "update_id": last_update_id,
+                    "bids": levels[:bids_count],
+                    "asks": levels[bids_count:],
+                },
+                timestamp=last_timestamp / 1e6)
+        else:
+            raise ValueError(f"Invalid record type {record_type} in {file_path}.")
+
+
+class MarketDataRecorder:
+    """
+    Records the order book snapshots, diffs and trades parsed by the order book data sources, to be analysed or
+    replayed later (see ReplayOrderBookTrackerDataSource). The messages are written in one file per trading pair and
+    per hour (see MarketDataFileWriter) by a background thread, so recording only costs a deque append in the market
+    data ingestion path. The messages received while `max_pending_messages` are waiting to be written are dropped
+    (and counted) to keep the memory bounded.
+    """
+
+    _logger: Optional[HummingbotLogger] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._logger is None:
+            cls._logger = logging.getLogger(__name__)
+        return cls._logger
+
+    def __init__(self,
+                 data_dir: str,
+                 max_pending_messages: int = 100000,
+                 flush_interval: float = 1.0,
+                 price_decimals: int = 8,
+                 amount_decimals: int = 8):
+        """
+        :param data_dir: directory of the market data files
+        :param max_pending_messages: maximum number of messages waiting to be written
+        :param flush_interval: time interval (in seconds) between the writes of the pending messages
+        :param price_decimals: number of decimals of the recorded prices
+        :param amount_decimals: number of decimals of the recorded amounts
+        """
+        self._data_dir = data_dir
+        self._max_pending_messages = max_pending_messages
+        self._flush_interval = flush_interval
+        self._price_decimals = price_decimals
+        self._amount_decimals = amount_decimals
+        self._pending_messages: Deque[OrderBookMessage] = deque()
+        self._writers: Dict[str, Tuple[str, MarketDataFileWriter]] = {}
+        self._recorded_messages_count: int = 0
+        self._dropped_messages_count: int = 0
+        self._reported_dropped_messages_count: int = 0
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def data_dir(self) -> str:
+        return self._data_dir
+
+    @property
+    def started(self) -> bool:
+        return self._thread is not None
+
+    @property
+    def pending_messages_count(self) -> int:
+        return len(self._pending_messages)
+
+    @property
+    def recorded_messages_count(self) -> int:
+        return self._recorded_messages_count
+
+    @property
+    def dropped_messages_count(self) -> int:
+        return self._dropped_messages_count
+
+    def start(self):
+        if self._thread is None:
+            os.makedirs(self._data_dir, exist_ok=True)
+            self._stop_event.clear()
+            self._thread = threading.Thread(target=self._run, name="MarketDataRecorder", daemon=True)
+            self._thread.start()
+
+    def stop(self):
+        """
+        Stops the background thread after writing all the pending messages
+        """
+        if self._thread is not None:
+            self._stop_event.set()
+            self._thread.join()
+            self._thread = None
+        self.write_pending_messages()
+        self._close_writers()
+
+    def record(self, message: OrderBookMessage):
+        if len(self._pending_messages) >= self._max_pending_messages:
+            self._dropped_messages_count += 1
+            return
+        self._pending_messages.append(message)
+
+    def write_pending_messages(self):
+        """
+        Writes the pending messages, rotating the file of a trading pair when the hour of the messages changes
+        """
+        pending_messages = self._pending_messages
+        touched_writers = set()
+        while len(pending_messages) > 0:
+            message = pending_messages.popleft()
+            try:
+                writer = self._writer_for(message)
+                writer.write(message)
+                touched_writers.add(writer)
+                self._recorded_messages_count += 1
+            except Exception:
+                self.logger().exception(f"Unexpected error recording the market data message {message}.")
+        for _, writer in self._writers.values():
+            # The writers rotated in the meantime have been closed (and flushed) already
+            if writer in touched_writers:
+                writer.flush()
+        if self._dropped_messages_count > self._reported_dropped_messages_count:
+            self.logger().warning(
+                f"The market data recorder dropped "
+                f"{self._dropped_messages_count - self._reported_dropped_messages_count} messages because it could"
+                f" not write them fast enough (max pending messages: {self._max_pending_messages}).")
+            self._reported_dropped_messages_count = self._dropped_messages_count
+
+    def _run(self):
+        while not self._stop_event.wait(self._flush_interval):
+            self.write_pending_messages()
+
+    def _writer_for(self, message: OrderBookMessage) -> MarketDataFileWriter:
+        trading_pair = message.trading_pair
+        file_name = market_data_file_name(trading_pair, message.timestamp)
+        file_name_and_writer = self._writers.get(trading_pair)
+        if file_name_and_writer is None or file_name_and_writer[0] != file_name:
+            if file_name_and_writer is not None:
+                file_name_and_writer[1].close()
+            writer = MarketDataFileWriter(file_path=os.path.join(self._data_dir, file_name),
+                                          price_decimals=self._price_decimals,
+                                          amount_decimals=self._amount_decimals)
+            self._writers[trading_pair] = (file_name, writer)
+            return writer
+        return file_name_and_writer[1]
+
+    def _close_writers(self):
+        for _, writer in self._writers.values():
+            writer.close()
+        self._writers.clear()
+
+
+class MarketDataRecordingQueue:
+    """
+    Proxy of the asyncio.Queue a data source adds the parsed order book messages to, that also passes them to the
+    market data recorder
+    """
+
+    def __init__(self, queue: asyncio.Queue, recorder: MarketDataRecorder):
+        self._queue = queue
+        self._recorder = recorder
+
+    def put_nowait(self, message: OrderBookMessage):
+        self._recorder.record(message)
+        self._queue.put_nowait(message)
+
+    async def put(self, message: OrderBookMessage):
+        self._recorder.record(message)
+        await self._queue.put(message)
+
+    def __getattr__(self, name: str):
+        return getattr(self._queue, name)
@@ -28,6 +28,7 @@ from hummingbot.core.data_type.OrderBookEntry cimport truncateOverlapEntries
 from hummingbot.logger import HummingbotLogger
 from hummingbot.core.event.events import (
     OrderBookEvent,
+    OrderBookTopChangedEvent,
     OrderBookTradeEvent
 )
 
@@ -39,6 +40,7 @@ NaN = float("nan")
 
 cdef class OrderBook(PubSub):
     ORDER_BOOK_TRADE_EVENT_TAG = OrderBookEvent.TradeEvent.value
+    ORDER_BOOK_TOP_CHANGED_EVENT_TAG = OrderBookEvent.TopChangedEvent.value
 
     @classmethod
     def logger(cls) -> HummingbotLogger:
@@ -66,6 +68,8 @@ cdef class OrderBook(PubSub):
             set[OrderBookEntry].iterator result
             OrderBookEntry top_bid
             OrderBookEntry top_ask
+            double previous_best_bid = self._best_bid
+            double previous_best_ask = self._best_ask
 
         # Apply the diffs. Diffs with 0 amounts mean deletion.
         for bid in bids:
@@ -96,11 +100,14 @@ cdef class OrderBook(PubSub):
 
         # Remember the last diff update ID.
         self._last_diff_uid = update_id
+        self.c_notify_top_changes(previous_best_bid, previous_best_ask)
 
     cdef c_apply_snapshot(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id):
         cdef:
             double best_bid_price = float("NaN")
             double best_ask_price = float("NaN")
+            double previous_best_bid
+            double previous_best_ask
             set[OrderBookEntry].reverse_iterator bid_iterator
             set[OrderBookEntry].iterator ask_iterator
             OrderBookEntry top_bid
@@ -131,11 +138,25 @@ cdef class OrderBook(PubSub):
                 best_ask_price = top_ask.getPrice()
 
         # Record the current best prices, for faster c_get_price() calls.
+        previous_best_bid = self._best_bid
+        previous_best_ask = self._best_ask
         self._best_bid = best_bid_price
         self._best_ask = best_ask_price
 
         # Remember the last snapshot update ID.
         self._snapshot_uid = update_id
+        self.c_notify_top_changes(previous_best_bid, previous_best_ask)
+
+    cdef c_notify_top_changes(self, double previous_best_bid, double previous_best_ask):
+        # NaN prices are never equal, they are considered unchanged if both are NaN
+        cdef:
+            bint bid_changed = (self._best_bid != previous_best_bid
+                                and not (self._best_bid != self._best_bid and previous_best_bid != previous_best_bid))
+            bint ask_changed = (self._best_ask != previous_best_ask
+                                and not (self._best_ask != self._best_ask and previous_best_ask != previous_best_ask))
+        if bid_changed or ask_changed:
+            self.c_trigger_event(self.ORDER_BOOK_TOP_CHANGED_EVENT_TAG,
+                                 OrderBookTopChangedEvent(self._best_bid, self._best_ask))
 
     cdef c_apply_trade(self, object trade_event):
         self._last_trade_price = trade_event.price
@@ -84,13 +84,16 @@ class OrderBookTracker:
             self._emit_trade_event_loop()
         )
         self._order_book_diff_listener_task = safe_ensure_future(
-            self._data_source.listen_for_order_book_diffs(self._ev_loop, self._order_book_diff_stream)
+            self._data_source.listen_for_order_book_diffs(
+                self._ev_loop, self._data_source.recorded_output(self._order_book_diff_stream))
         )
         self._order_book_trade_listener_task = safe_ensure_future(
-            self._data_source.listen_for_trades(self._ev_loop, self._order_book_trade_stream)
+            self._data_source.listen_for_trades(
+                self._ev_loop, self._data_source.recorded_output(self._order_book_trade_stream))
         )
         self._order_book_snapshot_listener_task = safe_ensure_future(
-            self._data_source.listen_for_order_book_snapshots(self._ev_loop, self._order_book_snapshot_stream)
+            self._data_source.listen_for_order_book_snapshots(
+                self._ev_loop, self._data_source.recorded_output(self._order_book_snapshot_stream))
         )
         self._order_book_stream_listener_task = safe_ensure_future(
             self._data_source.listen_for_subscriptions()
@@ -293,6 +296,17 @@ class OrderBookTracker:
                 )
                 await asyncio.sleep(5.0)
 
+    @staticmethod
+    def _trade_event_from_message(trade_message: OrderBookMessage) -> OrderBookTradeEvent:
+        return OrderBookTradeEvent(
+            trading_pair=trade_message.trading_pair,
+            timestamp=trade_message.timestamp,
+            price=float(trade_message.content["price"]),
+            amount=float(trade_message.content["amount"]),
+            type=TradeType.SELL if
+            trade_message.content["trade_type"] == float(TradeType.SELL.value) else TradeType.BUY
+        )
+
     async def _emit_trade_event_loop(self):
         last_message_timestamp: float = time.time()
         messages_accepted: int = 0
@@ -308,14 +322,7 @@ class OrderBookTracker:
                     continue
 
                 order_book: OrderBook = self._order_books[trading_pair]
-                order_book.apply_trade(OrderBookTradeEvent(
-                    trading_pair=trade_message.trading_pair,
-                    timestamp=trade_message.timestamp,
-                    price=float(trade_message.content["price"]),
-                    amount=float(trade_message.content["amount"]),
-                    type=TradeType.SELL if
-                    trade_message.content["trade_type"] == float(TradeType.SELL.value) else TradeType.BUY
-                ))
+                order_book.apply_trade(self._trade_event_from_message(trade_message))
 
                 messages_accepted += 1
 
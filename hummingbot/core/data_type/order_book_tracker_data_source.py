@@ -5,6 +5,9 @@ from abc import ABCMeta, abstractmethod
 from collections import defaultdict
 from typing import Any, Callable, Dict, List, Optional
 
+from hummingbot.core.api_throttler.async_throttler_base import request_priority
+from hummingbot.core.api_throttler.data_types import RequestPriority
+from hummingbot.core.data_type.market_data_recorder import MarketDataRecorder, MarketDataRecordingQueue
 from hummingbot.core.data_type.order_book import OrderBook
 from hummingbot.core.data_type.order_book_message import OrderBookMessage
 from hummingbot.core.web_assistant.ws_assistant import WSAssistant
@@ -24,6 +27,7 @@ class OrderBookTrackerDataSource(metaclass=ABCMeta):
         self._trading_pairs: List[str] = trading_pairs
         self._order_book_create_function = lambda: OrderBook()
         self._message_queue: Dict[str, asyncio.Queue] = defaultdict(asyncio.Queue)
+        self._market_data_recorder: Optional[MarketDataRecorder] = None
 
     @classmethod
     def logger(cls) -> HummingbotLogger:
@@ -39,6 +43,25 @@ class OrderBookTrackerDataSource(metaclass=ABCMeta):
     def order_book_create_function(self, func: Callable[[], OrderBook]):
         self._order_book_create_function = func
 
+    @property
+    def market_data_recorder(self) -> Optional[MarketDataRecorder]:
+        return self._market_data_recorder
+
+    @market_data_recorder.setter
+    def market_data_recorder(self, recorder: Optional[MarketDataRecorder]):
+        self._market_data_recorder = recorder
+
+    def recorded_output(self, output: asyncio.Queue) -> asyncio.Queue:
+        """
+        Returns the queue the parsed order book messages have to be added to. When a market data recorder is set, the
+        messages added to the queue are also recorded.
+
+        :param output: the queue of the order book tracker the messages are sent to
+        """
+        if self._market_data_recorder is None:
+            return output
+        return MarketDataRecordingQueue(queue=output, recorder=self._market_data_recorder)
+
     @abstractmethod
     async def get_last_traded_prices(self, trading_pairs: List[str], domain: Optional[str] = None) -> Dict[str, float]:
         """
@@ -62,7 +85,10 @@ class OrderBookTrackerDataSource(metaclass=ABCMeta):
 
         :return: a local copy of the current order book in the exchange
         """
-        snapshot_msg: OrderBookMessage = await self._order_book_snapshot(trading_pair=trading_pair)
+        with request_priority(RequestPriority.MARKET_DATA):
+            snapshot_msg: OrderBookMessage = await self._order_book_snapshot(trading_pair=trading_pair)
+        if self._market_data_recorder is not None:
+            self._market_data_recorder.record(snapshot_msg)
         order_book: OrderBook = self.order_book_create_function()
         order_book.apply_snapshot(snapshot_msg.bids, snapshot_msg.asks, snapshot_msg.update_id)
         return order_book
@@ -155,7 +181,8 @@ class OrderBookTrackerDataSource(metaclass=ABCMeta):
     async def _request_order_book_snapshots(self, output: asyncio.Queue):
         for trading_pair in self._trading_pairs:
             try:
-                snapshot = await self._order_book_snapshot(trading_pair=trading_pair)
+                with request_priority(RequestPriority.MARKET_DATA):
+                    snapshot = await self._order_book_snapshot(trading_pair=trading_pair)
                 output.put_nowait(snapshot)
             except Exception:
                 self.logger().exception(f"Unexpected error fetching order book snapshot for {trading_pair}.")
@@ -0,0 +1,93 @@
+from typing import List, Optional, Set
+
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_message import OrderBookMessageType
+from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
+from hummingbot.core.data_type.replay_order_book_tracker_data_source import ReplayOrderBookTrackerDataSource
+from hummingbot.core.py_time_iterator import PyTimeIterator
+
+
+class OrderBookReplayIterator(PyTimeIterator):
+    """
+    Clock iterator replaying the recorded messages of a ReplayOrderBookTracker up to the clock timestamp. It has to be
+    added to the clock before the connectors and strategies using the order books, so that they see the order books
+    updated at each tick. In event time backtest mode the clock ticks at the timestamps of the recorded messages.
+    """
+
+    def __init__(self, order_book_tracker: "ReplayOrderBookTracker"):
+        super().__init__()
+        self._order_book_tracker = order_book_tracker
+
+    def tick(self, timestamp: float):
+        self._order_book_tracker.replay_until(timestamp)
+
+    def next_tick_timestamp(self, timestamp: float) -> float:
+        return self._order_book_tracker.next_message_timestamp
+
+
+class ReplayOrderBookTracker(OrderBookTracker):
+    """
+    Order book tracker that applies the recorded market data of a ReplayOrderBookTrackerDataSource synchronously,
+    driven by the backtest clock through its `replay_iterator`, instead of the asynchronous message routing of the
+    OrderBookTracker. The order books are the same ones used in live trading, so the connectors (e.g. the paper trade
+    exchange) and the strategies can be evaluated on the recorded data.
+    """
+
+    def __init__(self,
+                 data_source: ReplayOrderBookTrackerDataSource,
+                 trading_pairs: List[str],
+                 domain: Optional[str] = None):
+        super().__init__(data_source=data_source, trading_pairs=trading_pairs, domain=domain)
+        self._replay_iterator = OrderBookReplayIterator(order_book_tracker=self)
+        self._snapshots_received: Set[str] = set()
+
+    @property
+    def data_source(self) -> ReplayOrderBookTrackerDataSource:
+        return self._data_source
+
+    @property
+    def replay_iterator(self) -> OrderBookReplayIterator:
+        return self._replay_iterator
+
+    @property
+    def ready(self) -> bool:
+        # The order books are ready once the first recorded snapshot of each trading pair has been replayed
+        return (self._order_books_initialized.is_set()
+                and all(trading_pair in self._snapshots_received for trading_pair in self._trading_pairs))
+
+    @property
+    def next_message_timestamp(self) -> float:
+        return self._data_source.next_message_timestamp
+
+    def start(self):
+        for trading_pair in self._trading_pairs:
+            if trading_pair not in self._order_books:
+                self._order_books[trading_pair] = self._data_source.order_book_create_function()
+        self._order_books_initialized.set()
+
+    def stop(self):
+        # The order books keep their replayed state, the replay continues where it was if the tracker is restarted
+        self._order_books_initialized.clear()
+
+    def replay_until(self, timestamp: float) -> int:
+        """
+        Applies to the order books all the recorded messages up to the timestamp
+        :return: the number of messages replayed
+        """
+        if not self._order_books_initialized.is_set():
+            self.start()
+        messages = self._data_source.pop_messages_until(timestamp)
+        for message in messages:
+            order_book: Optional[OrderBook] = self._order_books.get(message.trading_pair)
+            if order_book is None:
+                continue
+            if message.type is OrderBookMessageType.DIFF:
+                if order_book.snapshot_uid > message.update_id:
+                    continue
+                order_book.apply_diffs(message.bids, message.asks, message.update_id)
+            elif message.type is OrderBookMessageType.SNAPSHOT:
+                order_book.apply_snapshot(message.bids, message.asks, message.update_id)
+                self._snapshots_received.add(message.trading_pair)
+            elif message.type is OrderBookMessageType.TRADE:
+                order_book.apply_trade(self._trade_event_from_message(message))
+        return len(messages)
@@ -0,0 +1,178 @@
+import asyncio
+import glob
+import gzip
+import heapq
+import json
+import os
+from typing import Any, Dict, Iterator, List, Optional
+
+from hummingbot.core.data_type.market_data_recorder import MARKET_DATA_FILE_EXTENSION, read_market_data_file
+from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
+from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
+
+NaN = float("nan")
+
+REPLAY_FILE_EXTENSIONS = (".jsonl", ".jsonl.gz", MARKET_DATA_FILE_EXTENSION)
+
+
+def order_book_message_to_json(message: OrderBookMessage) -> Dict[str, Any]:
+    return {
+        "type": message.type.name.lower(),
+        "timestamp": message.timestamp,
+        "content": message.content,
+    }
+
+
+def order_book_message_from_json(data: Dict[str, Any], trading_pair: Optional[str] = None) -> OrderBookMessage:
+    content: Dict[str, Any] = data["content"]
+    if trading_pair is not None:
+        content.setdefault("trading_pair", trading_pair)
+    return OrderBookMessage(
+        message_type=OrderBookMessageType[data["type"].upper()],
+        content=content,
+        timestamp=float(data["timestamp"]),
+    )
+
+
+class ReplayOrderBookTrackerDataSource(OrderBookTrackerDataSource):
+    """
+    Order book data source that replays market data recorded in local files instead of connecting to the exchange.
+
+    Each file contains the messages of one trading pair sorted by timestamp, one JSON object per line with the
+    message type (snapshot, diff or trade), its timestamp and its content (the content of the OrderBookMessage, see
+    `order_book_message_to_json`). Files ending with `.gz` are decompressed while they are read. The binary files
+    written by the MarketDataRecorder (`.hbmd`) are replayed too.
+    The messages of all the files are merged lazily in timestamp order, and are consumed synchronously with
+    `pop_messages_until`, so that the replay is driven by the backtest clock (see ReplayOrderBookTracker) and runs as
+    fast as the messages can be applied.
+    """
+
+    def __init__(self, trading_pairs: List[str], data_files: Dict[str, List[str]]):
+        """
+        :param trading_pairs: the trading pairs to replay
+        :param data_files: the recorded data files of each trading pair, replayed in file name order
+        """
+        super().__init__(trading_pairs)
+        self._data_files: Dict[str, List[str]] = {
+            trading_pair: sorted(data_files.get(trading_pair, [])) for trading_pair in trading_pairs
+        }
+        self._messages: Optional[Iterator[OrderBookMessage]] = None
+        self._next_message: Optional[OrderBookMessage] = None
+        self._last_snapshots: Dict[str, OrderBookMessage] = {}
+        self._last_traded_prices: Dict[str, float] = {}
+        self._replayed_messages_count: int = 0
+
+    @classmethod
+    def from_directory(cls, trading_pairs: List[str], data_dir: str) -> "ReplayOrderBookTrackerDataSource":
+        """
+        Creates a data source replaying the files of the directory named after the trading pairs, either
+        `<trading_pair>.jsonl` or `<trading_pair>_<suffix>.jsonl` (e.g. one file per hour), optionally gzip compressed,
+        or the `<trading_pair>_<hour>.hbmd` files of the MarketDataRecorder
+        """
+        data_files: Dict[str, List[str]] = {}
+        for trading_pair in trading_pairs:
+            data_files[trading_pair] = [
+                file_path
+                for pattern in (f"{trading_pair}.*", f"{trading_pair}_*")
+                for file_path in glob.glob(os.path.join(glob.escape(data_dir), pattern))
+                if file_path.endswith(REPLAY_FILE_EXTENSIONS)
+            ]
+        return cls(trading_pairs=trading_pairs, data_files=data_files)
+
+    @property
+    def data_files(self) -> Dict[str, List[str]]:
+        return self._data_files
+
+    @property
+    def replayed_messages_count(self) -> int:
+        return self._replayed_messages_count
+
+    @property
+    def next_message_timestamp(self) -> float:
+        """
+        Returns the timestamp of the next message to replay, or NaN if all the messages have been replayed
+        """
+        next_message = self._peek_message()
+        return next_message.timestamp if next_message is not None else NaN
+
+    @property
+    def exhausted(self) -> bool:
+        return self._peek_message() is None
+
+    def pop_messages_until(self, timestamp: float) -> List[OrderBookMessage]:
+        """
+        Returns the messages not replayed yet with a timestamp lower than or equal to the timestamp, in timestamp order
+        """
+        messages: List[OrderBookMessage] = []
+        next_message = self._peek_message()
+        while next_message is not None and next_message.timestamp <= timestamp:
+            messages.append(next_message)
+            if next_message.type is OrderBookMessageType.SNAPSHOT:
+                self._last_snapshots[next_message.trading_pair] = next_message
+            elif next_message.type is OrderBookMessageType.TRADE:
+                self._last_traded_prices[next_message.trading_pair] = float(next_message.content["price"])
+            self._next_message = None
+            next_message = self._peek_message()
+        self._replayed_messages_count += len(messages)
+        return messages
+
+    def reset(self):
+        """
+        Restarts the replay from the first recorded message
+        """
+        self._messages = None
+        self._next_message = None
+        self._last_snapshots.clear()
+        self._last_traded_prices.clear()
+        self._replayed_messages_count = 0
+
+    async def get_last_traded_prices(self, trading_pairs: List[str], domain: Optional[str] = None) -> Dict[str, float]:
+        return {trading_pair: self._last_traded_prices[trading_pair]
+                for trading_pair in trading_pairs
+                if trading_pair in self._last_traded_prices}
+
+    async def listen_for_subscriptions(self):
+        # There is no exchange connection, the messages are replayed synchronously
+        pass
+
+    async def _order_book_snapshot(self, trading_pair: str) -> OrderBookMessage:
+        snapshot = self._last_snapshots.get(trading_pair)
+        if snapshot is None:
+            snapshot = OrderBookMessage(
+                message_type=OrderBookMessageType.SNAPSHOT,
+                content={"trading_pair": trading_pair, "update_id": 0, "bids": [], "asks": []},
+                timestamp=0.0,
+            )
+        return snapshot
+
+    async def _parse_trade_message(self, raw_message: OrderBookMessage, message_queue: asyncio.Queue):
+        message_queue.put_nowait(raw_message)
+
+    async def _parse_order_book_diff_message(self, raw_message: OrderBookMessage, message_queue: asyncio.Queue):
+        message_queue.put_nowait(raw_message)
+
+    async def _parse_order_book_snapshot_message(self, raw_message: OrderBookMessage, message_queue: asyncio.Queue):
+        message_queue.put_nowait(raw_message)
+
+    def _peek_message(self) -> Optional[OrderBookMessage]:
+        if self._next_message is None:
+            if self._messages is None:
+                self._messages = heapq.merge(
+                    *[self._read_messages(file_path=file_path, trading_pair=trading_pair)
+                      for trading_pair, file_paths in self._data_files.items()
+                      for file_path in file_paths],
+                    key=lambda message: message.timestamp,
+                )
+            self._next_message = next(self._messages, None)
+        return self._next_message
+
+    @staticmethod
+    def _read_messages(file_path: str, trading_pair: str) -> Iterator[OrderBookMessage]:
+        if file_path.endswith(MARKET_DATA_FILE_EXTENSION):
+            yield from read_market_data_file(file_path=file_path, trading_pair=trading_pair)
+            return
+        open_function = gzip.open if file_path.endswith(".gz") else open
+        with open_function(file_path, "rt") as data_file:
+            for line in data_file:
+                if line.strip():
+                    yield order_book_message_from_json(json.loads(line), trading_pair=trading_pair)
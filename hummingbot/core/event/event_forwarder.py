@@ -1,9 +1,14 @@
 #!/usr/bin/env python
 
-from typing import Callable
+import asyncio
+import logging
+import threading
+from collections import deque
+from typing import Any, Callable, Deque, Dict, Optional, Tuple
 
 from hummingbot.core.event.event_listener import EventListener
 from hummingbot.core.pubsub import PubSub
+from hummingbot.logger import HummingbotLogger
 
 
 class EventForwarder(EventListener):
@@ -22,3 +27,122 @@ class SourceInfoEventForwarder(EventListener):
 
     def __call__(self, arg: any):
         self._to_function(self.current_event_tag, self.current_event_caller, arg)
+
+
+class AsyncEventListener(EventListener):
+    """
+    Event listener that processes the events outside of the code triggering them, so that slow consumers (e.g. writing
+    to the database or publishing to MQTT) don't add latency to the order processing.
+
+    The events are stored in a bounded buffer and processed in batches in later iterations of the event loop, in the
+    order they were triggered. If the buffer is full, the oldest buffered event is processed synchronously to make room
+    for the new one, so no event is lost, and the overflow is counted in the listener stats.
+    """
+
+    DEFAULT_MAX_BUFFER_SIZE = 10000
+    DEFAULT_BATCH_SIZE = 100
+
+    _ael_logger: Optional[HummingbotLogger] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._ael_logger is None:
+            cls._ael_logger = logging.getLogger(__name__)
+        return cls._ael_logger
+
+    def __init__(self,
+                 max_buffer_size: int = DEFAULT_MAX_BUFFER_SIZE,
+                 batch_size: int = DEFAULT_BATCH_SIZE,
+                 ev_loop: Optional[asyncio.AbstractEventLoop] = None):
+        """
+        :param max_buffer_size: maximum number of events waiting to be processed
+        :param batch_size: maximum number of events processed in each iteration of the event loop
+        :param ev_loop: the event loop processing the events (defaults to the current event loop)
+        """
+        super().__init__()
+        self._buffer: Deque[Tuple[int, PubSub, Any]] = deque()
+        self._max_buffer_size = max_buffer_size
+        self._batch_size = batch_size
+        self._ev_loop = ev_loop or asyncio.get_event_loop()
+        self._drain_scheduled = False
+        self._events_received = 0
+        self._events_processed = 0
+        self._overflow_count = 0
+        self._max_buffer_usage = 0
+
+    @property
+    def pending_events(self) -> int:
+        return len(self._buffer)
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "events_received": self._events_received,
+            "events_processed": self._events_processed,
+            "pending_events": len(self._buffer),
+            "max_buffer_usage": self._max_buffer_usage,
+            "overflow_count": self._overflow_count,
+        }
+
+    def __call__(self, arg: any):
+        self._enqueue(self.current_event_tag, self.current_event_caller, arg)
+
+    def _enqueue(self, event_tag: int, event_caller: PubSub, arg: Any):
+        if threading.current_thread() != threading.main_thread():
+            self._ev_loop.call_soon_threadsafe(self._enqueue, event_tag, event_caller, arg)
+            return
+        self._events_received += 1
+        if len(self._buffer) >= self._max_buffer_size:
+            if self._overflow_count == 0:
+                self.logger().warning(f"The event buffer of {self} is full ({self._max_buffer_size} events). The events "
+                                      f"will be processed synchronously until it has room again.")
+            self._overflow_count += 1
+            self._process_event(*self._buffer.popleft())
+        self._buffer.append((event_tag, event_caller, arg))
+        self._max_buffer_usage = max(self._max_buffer_usage, len(self._buffer))
+        if not self._drain_scheduled:
+            self._drain_scheduled = True
+            self._ev_loop.call_soon(self._drain)
+
+    def flush(self):
+        """
+        Processes all the pending events synchronously (e.g. before removing the listener)
+        """
+        while len(self._buffer) > 0:
+            self._process_event(*self._buffer.popleft())
+
+    def process_event(self, event_tag: int, event_caller: PubSub, arg: Any):
+        raise NotImplementedError
+
+    def _drain(self):
+        for _ in range(min(self._batch_size, len(self._buffer))):
+            self._process_event(*self._buffer.popleft())
+        if len(self._buffer) > 0:
+            # The rest of the events are processed in the next iteration, after the callbacks already scheduled
+            self._ev_loop.call_soon(self._drain)
+        else:
+            self._drain_scheduled = False
+
+    def _process_event(self, event_tag: int, event_caller: PubSub, arg: Any):
+        self._events_processed += 1
+        try:
+            self.process_event(event_tag, event_caller, arg)
+        except Exception:
+            self.logger().error(f"Unexpected error while processing event {event_tag}.", exc_info=True)
+
+
+class AsyncEventForwarder(AsyncEventListener):
+    def __init__(self, to_function: Callable[[any], None], **kwargs):
+        super().__init__(**kwargs)
+        self._to_function: Callable[[any], None] = to_function
+
+    def process_event(self, event_tag: int, event_caller: PubSub, arg: Any):
+        self._to_function(arg)
+
+
+class AsyncSourceInfoEventForwarder(AsyncEventListener):
+    def __init__(self, to_function: Callable[[int, PubSub, any], None], **kwargs):
+        super().__init__(**kwargs)
+        self._to_function: Callable[[int, PubSub, any], None] = to_function
+
+    def process_event(self, event_tag: int, event_caller: PubSub, arg: Any):
+        self._to_function(event_tag, event_caller, arg)
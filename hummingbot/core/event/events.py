@@ -34,6 +34,7 @@ class MarketEvent(Enum):
 
 class OrderBookEvent(int, Enum):
     TradeEvent = 901
+    TopChangedEvent = 902
 
 
 class TokenApprovalEvent(Enum):
@@ -136,6 +137,11 @@ class OrderBookTradeEvent(NamedTuple):
     amount: Decimal
 
 
+class OrderBookTopChangedEvent(NamedTuple):
+    best_bid: float
+    best_ask: float
+
+
 class OrderFilledEvent(NamedTuple):
     timestamp: float
     order_id: str
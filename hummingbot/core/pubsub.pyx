@@ -1,20 +1,12 @@
 # distutils: language=c++
-# distutils: sources=hummingbot/core/cpp/PyRef.cpp
 
 from cpython cimport(
     PyObject,
     PyWeakref_NewRef,
     PyWeakref_GetObject
 )
-from cython.operator cimport(
-    postincrement as inc,
-    dereference as deref,
-    address
-)
-from libcpp.vector cimport vector
 from enum import Enum
 import logging
-import random
 from typing import List
 
 from hummingbot.logger import HummingbotLogger
@@ -26,25 +18,18 @@ class_logger = None
 
 cdef class PubSub:
     """
-    PubSub with weak references. This avoids the lapsed listener problem by periodically performing GC on dead
-    event listener.
-
-    Dead listener is done by calling c_remove_dead_listeners(), which checks whether the listener weak references are
-    alive or not, and removes the dead ones. Each call to c_remove_dead_listeners() takes O(n).
+    PubSub with weak references. This avoids the lapsed listener problem by performing GC on dead event listeners.
 
-    Here's how the dead listener GC is performed:
+    The listeners of each event are stored as a tuple of weak references, which is replaced by a new tuple (copy on
+    write) every time a listener is added or removed. Triggering an event is a straight iteration over the current
+    tuple, without copying it, and listeners can still add or remove listeners while the event is being dispatched
+    because the iteration keeps the tuple it started with.
 
-    1. c_add_listener():
-       Randomly with ADD_LISTENER_GC_PROBABILITY. This assumes c_add_listener() is called frequently and so it doesn't
-       make sense to do the GC every time.
-    2. c_remove_listener():
-       Every time. This assumes c_remove_listener() is called infrequently.
-    3. c_get_listeners() and c_trigger_event():
-       Every time. Both functions take O(n) already.
+    Dead listener GC is done by c_remove_dead_listeners(), which rebuilds the tuple without the dead weak references in
+    O(n). It's only performed when a dead weak reference is actually found, while triggering an event or getting the
+    listeners, and every time the tuple is rebuilt to add or remove a listener.
     """
 
-    ADD_LISTENER_GC_PROBABILITY = 0.005
-
     @classmethod
     def logger(cls) -> HummingbotLogger:
         global class_logger
@@ -52,8 +37,9 @@ cdef class PubSub:
             class_logger = logging.getLogger(__name__)
         return class_logger
 
-    def __init__(self):
-        self._events = Events()
+    def __cinit__(self, *args, **kwargs):
+        # Initialized before __init__, subclasses can add listeners before (or without) calling PubSub.__init__()
+        self._events = {}
 
     def add_listener(self, event_tag: Enum, listener: EventListener):
         self.c_add_listener(event_tag.value, listener)
@@ -72,94 +58,81 @@ cdef class PubSub:
 
     cdef c_add_listener(self, int64_t event_tag, EventListener listener):
         cdef:
-            EventsIterator it = self._events.find(event_tag)
-            EventListenersCollection new_listeners
-            EventListenersCollection *listeners_ptr
+            # Weak references without callback are shared, so the same listener always has the same weak reference
             object listener_weakref = PyWeakref_NewRef(listener, None)
-            PyRef listener_wrapper = PyRef(<PyObject *>listener_weakref)
-        if it != self._events.end():
-            listeners_ptr = address(deref(it).second)
-            deref(listeners_ptr).insert(listener_wrapper)
-        else:
-            new_listeners.insert(listener_wrapper)
-            self._events.insert(EventsPair(event_tag, new_listeners))
-
-        if random.random() < PubSub.ADD_LISTENER_GC_PROBABILITY:
-            self.c_remove_dead_listeners(event_tag)
+            tuple listeners = self._events.get(event_tag, ())
+        for weakref in listeners:
+            if weakref is listener_weakref:
+                return
+        self._events[event_tag] = tuple(
+            [weakref for weakref in listeners if <object>PyWeakref_GetObject(weakref) is not None]
+        ) + (listener_weakref,)
 
     cdef c_remove_listener(self, int64_t event_tag, EventListener listener):
         cdef:
-            EventsIterator it = self._events.find(event_tag)
-            EventListenersCollection *listeners_ptr
             object listener_weakref = PyWeakref_NewRef(listener, None)
-            PyRef listener_wrapper = PyRef(<PyObject *>listener_weakref)
-            EventListenersIterator lit
-        if it == self._events.end():
+            tuple listeners = self._events.get(event_tag)
+            tuple remaining_listeners
+        if listeners is None:
             return
-        listeners_ptr = address(deref(it).second)
-        lit = deref(listeners_ptr).find(listener_wrapper)
-        if lit != deref(listeners_ptr).end():
-            deref(listeners_ptr).erase(lit)
-        self.c_remove_dead_listeners(event_tag)
+        remaining_listeners = tuple([
+            weakref for weakref in listeners
+            if weakref is not listener_weakref and <object>PyWeakref_GetObject(weakref) is not None
+        ])
+        if len(remaining_listeners) > 0:
+            self._events[event_tag] = remaining_listeners
+        else:
+            del self._events[event_tag]
 
     cdef c_remove_dead_listeners(self, int64_t event_tag):
         cdef:
-            EventsIterator it = self._events.find(event_tag)
-            EventListenersCollection *listeners_ptr
-            object listener_weakref
-            EventListenersIterator lit
-            vector[EventListenersIterator] lit_to_remove
-        if it == self._events.end():
+            tuple listeners = self._events.get(event_tag)
+            tuple live_listeners
+        if listeners is None:
             return
-        listeners_ptr = address(deref(it).second)
-        lit = deref(listeners_ptr).begin()
-        while lit != deref(listeners_ptr).end():
-            listener_weakref = <object>(deref(lit).get())
-            if <object>(PyWeakref_GetObject(listener_weakref)) is None:
-                lit_to_remove.push_back(lit)
-            inc(lit)
-        for lit in lit_to_remove:
-            deref(listeners_ptr).erase(lit)
-        if deref(listeners_ptr).size() < 1:
-            self._events.erase(it)
+        live_listeners = tuple([
+            weakref for weakref in listeners if <object>PyWeakref_GetObject(weakref) is not None
+        ])
+        if len(live_listeners) > 0:
+            self._events[event_tag] = live_listeners
+        else:
+            del self._events[event_tag]
 
     cdef c_get_listeners(self, int64_t event_tag):
-        self.c_remove_dead_listeners(event_tag)
-
         cdef:
-            EventsIterator it = self._events.find(event_tag)
-            EventListenersCollection *listeners_ptr
-            object listener_weafref
-            EventListener typed_listener
-
-        if it == self._events.end():
-            return []
-
-        retval = []
-        listeners_ptr = address(deref(it).second)
-        for pyref in deref(listeners_ptr):
-            listener_weafref = <object>pyref.get()
-            typed_listener = <object>PyWeakref_GetObject(listener_weafref)
-            retval.append(typed_listener)
+            tuple listeners = self._events.get(event_tag)
+            object listener
+            bint found_dead_listener = False
+            list retval = []
+        if listeners is None:
+            return retval
+
+        for listener_weakref in listeners:
+            listener = <object>PyWeakref_GetObject(listener_weakref)
+            if listener is None:
+                found_dead_listener = True
+            else:
+                retval.append(listener)
+        if found_dead_listener:
+            self.c_remove_dead_listeners(event_tag)
         return retval
 
     cdef c_trigger_event(self, int64_t event_tag, object arg):
-        self.c_remove_dead_listeners(event_tag)
-
         cdef:
-            EventsIterator it = self._events.find(event_tag)
-            EventListenersCollection listeners
-            object listener_weafref
+            tuple listeners = self._events.get(event_tag)
+            PyObject *listener_ptr
             EventListener typed_listener
-        if it == self._events.end():
+            bint found_dead_listener = False
+        if listeners is None:
             return
 
-        # It is extremely important that this set of listeners is a C++ copy - because listeners are allowed to call
-        # c_remove_listener(), which breaks the iterator if we're using the underlying set.
-        listeners = deref(it).second
-        for pyref in listeners:
-            listener_weafref = <object>pyref.get()
-            typed_listener = <object>PyWeakref_GetObject(listener_weafref)
+        # The tuple is never modified, listeners calling c_remove_listener() replace it with a new one.
+        for listener_weakref in listeners:
+            listener_ptr = PyWeakref_GetObject(listener_weakref)
+            if <object>listener_ptr is None:
+                found_dead_listener = True
+                continue
+            typed_listener = <EventListener>listener_ptr
             try:
                 typed_listener.c_set_event_info(event_tag, self)
                 typed_listener.c_call(arg)
@@ -167,3 +140,5 @@ cdef class PubSub:
                 self.c_log_exception(event_tag, arg)
             finally:
                 typed_listener.c_set_event_info(0, None)
+        if found_dead_listener:
+            self.c_remove_dead_listeners(event_tag)
@@ -39,6 +39,15 @@ cdef class TimeIterator(PubSub):
     def stop(self, clock: Clock):
         self.c_stop(clock)
 
+    def next_tick_timestamp(self, timestamp: float) -> float:
+        """
+        Used by the clock in event time backtest mode to skip the ticks no iterator needs.
+        :param timestamp: the current timestamp of the clock
+        :return: the next timestamp the iterator needs to tick at (e.g. the timestamp of its next data record), or NaN
+            if it doesn't need any specific tick
+        """
+        return NaN
+
     def _set_current_timestamp(self, timestamp: float):
         """
         Method added to be used only for unit testing purposes
@@ -0,0 +1,172 @@
+import logging
+import time
+from bisect import bisect_left
+from typing import Dict, List, Optional, Tuple
+
+from hummingbot.logger import HummingbotLogger
+from hummingbot.logger.struct_logger import METRICS_LOG_LEVEL
+
+# Histogram bucket upper bounds, in milliseconds. Roughly logarithmic so that sub-millisecond signing and
+# multi-second throttler waits can be told apart with the same fixed set of counters.
+LATENCY_BUCKETS_MS: Tuple[float, ...] = (
+    0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 25.0, 50.0, 100.0, 250.0, 500.0, 1000.0, 2500.0, 5000.0, 10000.0,
+)
+
+THROTTLE_WAIT = "throttle_wait"
+AUTH = "auth"
+RTT = "rtt"
+DECODE = "decode"
+WS_DECODE = "ws_decode"
+WS_INTER_ARRIVAL = "ws_inter_arrival"
+
+UNKNOWN_LIMIT_ID = "unknown"
+
+
+class LatencyHistogram:
+    """
+    Fixed-bucket latency histogram. Recording a sample is a bisect over a small tuple plus a few additions, so it can
+    be called from hot paths without allocating.
+    """
+
+    __slots__ = ("_bucket_counts", "count", "total_ms", "min_ms", "max_ms")
+
+    def __init__(self):
+        # The extra last bucket collects every sample above the largest bound
+        self._bucket_counts: List[int] = [0] * (len(LATENCY_BUCKETS_MS) + 1)
+        self.count: int = 0
+        self.total_ms: float = 0.0
+        self.min_ms: float = 0.0
+        self.max_ms: float = 0.0
+
+    @property
+    def bucket_counts(self) -> List[int]:
+        return list(self._bucket_counts)
+
+    @property
+    def mean_ms(self) -> float:
+        return self.total_ms / self.count if self.count > 0 else 0.0
+
+    def add(self, value_ms: float):
+        self._bucket_counts[bisect_left(LATENCY_BUCKETS_MS, value_ms)] += 1
+        if self.count == 0 or value_ms < self.min_ms:
+            self.min_ms = value_ms
+        if value_ms > self.max_ms:
+            self.max_ms = value_ms
+        self.count += 1
+        self.total_ms += value_ms
+
+    def percentile(self, pct: float) -> float:
+        """
+        Estimates the requested percentile as the upper bound of the bucket that contains it, capped by the
+        maximum value observed.
+        :param pct: the percentile, between 0 and 100
+        """
+        if self.count == 0:
+            return 0.0
+        rank = pct / 100 * self.count
+        accumulated = 0
+        for index, bucket_count in enumerate(self._bucket_counts):
+            accumulated += bucket_count
+            if accumulated >= rank and bucket_count > 0:
+                upper_bound = LATENCY_BUCKETS_MS[index] if index < len(LATENCY_BUCKETS_MS) else self.max_ms
+                return min(upper_bound, self.max_ms)
+        return self.max_ms
+
+    def to_dict(self) -> Dict[str, float]:
+        return {
+            "count": self.count,
+            "mean_ms": self.mean_ms,
+            "min_ms": self.min_ms,
+            "p50_ms": self.percentile(50),
+            "p90_ms": self.percentile(90),
+            "p99_ms": self.percentile(99),
+            "max_ms": self.max_ms,
+        }
+
+
+class LatencyTracker:
+    """
+    Collects per throttler limit id latency histograms for each stage of a REST request (throttler wait,
+    authentication, network round trip and response decoding) and per stream statistics for websocket messages
+    (message inter-arrival time and decoding time).
+
+    A single shared instance is used by the web assistants and the API throttler, the statistics can be displayed with
+    the `latency` command and exported as structured metric logs.
+    """
+
+    _lt_shared_instance: Optional["LatencyTracker"] = None
+    _lt_logger: Optional[HummingbotLogger] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._lt_logger is None:
+            cls._lt_logger = logging.getLogger(__name__)
+        return cls._lt_logger
+
+    @classmethod
+    def get_instance(cls) -> "LatencyTracker":
+        if cls._lt_shared_instance is None:
+            cls._lt_shared_instance = LatencyTracker()
+        return cls._lt_shared_instance
+
+    def __init__(self):
+        self.enabled: bool = True
+        self._histograms: Dict[Tuple[str, str], LatencyHistogram] = {}
+
+    @staticmethod
+    def now() -> float:
+        return time.perf_counter()
+
+    def record(self, key: str, stage: str, started_at: float):
+        """
+        Records the time elapsed since `started_at` (a value previously obtained from `LatencyTracker.now()`).
+        :param key: the throttler limit id (or the stream url for websocket stages)
+        :param stage: the measured stage (i.e. THROTTLE_WAIT, AUTH, RTT, DECODE)
+        :param started_at: the perf counter value taken when the stage started
+        """
+        self.record_duration(key=key, stage=stage, duration_ms=(time.perf_counter() - started_at) * 1e3)
+
+    def record_duration(self, key: str, stage: str, duration_ms: float):
+        if self.enabled:
+            histogram = self._histograms.get((key, stage))
+            if histogram is None:
+                histogram = LatencyHistogram()
+                self._histograms[(key, stage)] = histogram
+            histogram.add(duration_ms)
+
+    def histogram(self, key: str, stage: str) -> Optional[LatencyHistogram]:
+        return self._histograms.get((key, stage))
+
+    def reset(self):
+        self._histograms.clear()
+
+    def stats(self, key_filter: Optional[str] = None) -> List[Dict[str, float]]:
+        """
+        Returns one entry per (key, stage) pair, sorted by key and stage.
+        :param key_filter: if provided, only keys containing this text are returned
+        """
+        result = []
+        for (key, stage), histogram in sorted(self._histograms.items()):
+            if key_filter is None or key_filter in key:
+                entry = {"key": key, "stage": stage}
+                entry.update(histogram.to_dict())
+                result.append(entry)
+        return result
+
+    def is_metric_log_enabled(self) -> bool:
+        """
+        Returns True if the logging configuration lets the metric log lines of the statistics through
+        """
+        return self.logger().isEnabledFor(METRICS_LOG_LEVEL)
+
+    def log_stats(self, key_filter: Optional[str] = None) -> int:
+        """
+        Exports the current statistics as structured metric log lines, one per (key, stage) pair.
+        :return: the number of lines logged, 0 if the metric logs are disabled
+        """
+        if not self.is_metric_log_enabled():
+            return 0
+        entries = self.stats(key_filter=key_filter)
+        for entry in entries:
+            self.logger().metric_log({"metric": "latency", **entry})
+        return len(entries)
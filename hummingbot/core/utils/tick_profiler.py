@@ -0,0 +1,153 @@
+import logging
+import time
+from typing import Any, Dict, List, Optional
+
+from hummingbot.core.utils.latency_tracker import LatencyHistogram
+from hummingbot.logger import HummingbotLogger
+from hummingbot.logger.struct_logger import METRICS_LOG_LEVEL
+
+CLOCK_TICK_KEY = "clock"
+
+
+class TickStats:
+    """
+    Duration statistics of the ticks of a clock iterator (or of the whole clock tick).
+    """
+
+    __slots__ = ("name", "durations", "last_ms", "overruns")
+
+    def __init__(self, name: str):
+        self.name: str = name
+        self.durations: LatencyHistogram = LatencyHistogram()
+        self.last_ms: float = 0.0
+        self.overruns: int = 0
+
+    def add(self, duration_ms: float, overrun_threshold_ms: float):
+        self.durations.add(duration_ms)
+        self.last_ms = duration_ms
+        if duration_ms > overrun_threshold_ms:
+            self.overruns += 1
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "iterator": self.name,
+            "count": self.durations.count,
+            "last_ms": self.last_ms,
+            "mean_ms": self.durations.mean_ms,
+            "p99_ms": self.durations.percentile(99),
+            "max_ms": self.durations.max_ms,
+            "overruns": self.overruns,
+        }
+
+
+class TickProfiler:
+    """
+    Measures how long the clock iterators take to tick, so that a strategy or connector blocking the event loop can be
+    identified. For each iterator it keeps the last, mean and p99 tick durations and the number of ticks that took
+    longer than the clock tick size (overruns). For the clock it also tracks the event loop lag, the delay between the
+    scheduled time of a tick and the time the clock actually woke up to run it.
+
+    The statistics are displayed with the `ticks` command and exported periodically as structured metric logs.
+    """
+
+    _tp_logger: Optional[HummingbotLogger] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._tp_logger is None:
+            cls._tp_logger = logging.getLogger(__name__)
+        return cls._tp_logger
+
+    def __init__(self, tick_size: float, log_interval: float = 60.0, enabled: bool = True):
+        """
+        :param tick_size: the tick size of the clock, ticks taking longer are counted as overruns
+        :param log_interval: time interval (in seconds) between the periodic metric logs, 0 to disable them
+        :param enabled: whether the clock records the tick durations
+        """
+        self.enabled: bool = enabled
+        self._overrun_threshold_ms: float = tick_size * 1e3
+        self._log_interval: float = log_interval
+        self._last_log_time: float = time.monotonic()
+        self._iterator_stats: Dict[int, TickStats] = {}
+        self._clock_stats: TickStats = TickStats(name=CLOCK_TICK_KEY)
+        self._loop_lag: LatencyHistogram = LatencyHistogram()
+
+    @staticmethod
+    def now_ns() -> int:
+        return time.perf_counter_ns()
+
+    @staticmethod
+    def iterator_name(iterator: Any) -> str:
+        name = getattr(iterator, "display_name", None)
+        return name if isinstance(name, str) else type(iterator).__name__
+
+    @property
+    def loop_lag(self) -> LatencyHistogram:
+        return self._loop_lag
+
+    def record_iterator_tick(self, iterator: Any, started_ns: int):
+        """
+        Records the duration of the tick of an iterator
+        :param started_ns: the perf counter value (in nanoseconds) taken before the iterator tick started
+        """
+        duration_ms = (time.perf_counter_ns() - started_ns) / 1e6
+        stats = self._iterator_stats.get(id(iterator))
+        if stats is None:
+            stats = TickStats(name=self.iterator_name(iterator))
+            self._iterator_stats[id(iterator)] = stats
+        stats.add(duration_ms, self._overrun_threshold_ms)
+
+    def record_tick(self, started_ns: int, loop_lag_s: Optional[float] = None):
+        """
+        Records the duration of a whole clock tick, and logs the statistics if the log interval has elapsed
+        :param started_ns: the perf counter value (in nanoseconds) taken before the first iterator tick started
+        :param loop_lag_s: the delay (in seconds) between the scheduled tick time and the actual wake up time
+        """
+        self._clock_stats.add((time.perf_counter_ns() - started_ns) / 1e6, self._overrun_threshold_ms)
+        if loop_lag_s is not None:
+            self._loop_lag.add(max(0.0, loop_lag_s * 1e3))
+        if self._log_interval > 0 and self.is_metric_log_enabled():
+            now = time.monotonic()
+            if now - self._last_log_time >= self._log_interval:
+                self._last_log_time = now
+                self.log_stats()
+
+    def stats(self) -> List[Dict[str, Any]]:
+        """
+        Returns one entry per iterator, sorted by mean tick duration (slowest first), followed by the clock tick entry
+        which also includes the event loop lag.
+        """
+        result = [stats.to_dict() for stats in sorted(self._iterator_stats.values(),
+                                                      key=lambda stats: stats.durations.mean_ms,
+                                                      reverse=True)]
+        clock_entry = self._clock_stats.to_dict()
+        clock_entry.update({
+            "loop_lag_mean_ms": self._loop_lag.mean_ms,
+            "loop_lag_p99_ms": self._loop_lag.percentile(99),
+            "loop_lag_max_ms": self._loop_lag.max_ms,
+        })
+        result.append(clock_entry)
+        return result
+
+    def is_metric_log_enabled(self) -> bool:
+        """
+        Returns True if the logging configuration lets the metric log lines of the statistics through
+        """
+        return self.logger().isEnabledFor(METRICS_LOG_LEVEL)
+
+    def log_stats(self) -> int:
+        """
+        Exports the current statistics as structured metric log lines, one per iterator plus one for the clock.
+        :return: the number of lines logged, 0 if the metric logs are disabled
+        """
+        if not self.is_metric_log_enabled():
+            return 0
+        entries = self.stats()
+        for entry in entries:
+            self.logger().metric_log({"metric": "clock_tick", **entry})
+        return len(entries)
+
+    def reset(self):
+        self._iterator_stats.clear()
+        self._clock_stats = TickStats(name=CLOCK_TICK_KEY)
+        self._loop_lag = LatencyHistogram()
@@ -5,6 +5,7 @@ from typing import Any, Dict, Mapping, Optional
 
 import aiohttp
 
+from hummingbot.core.utils.latency_tracker import WS_DECODE, WS_INTER_ARRIVAL, LatencyTracker
 from hummingbot.core.web_assistant.connections.data_types import WSRequest, WSResponse
 
 
@@ -15,6 +16,8 @@ class WSConnection:
         self._connected = False
         self._message_timeout: Optional[float] = None
         self._last_recv_time = 0
+        self._ws_url: Optional[str] = None
+        self._last_message_perf_counter: Optional[float] = None
 
     @property
     def last_recv_time(self) -> float:
@@ -39,6 +42,8 @@ class WSConnection:
             heartbeat=ping_timeout,
         )
         self._message_timeout = message_timeout
+        self._ws_url = ws_url
+        self._last_message_perf_counter = None
         self._connected = True
 
     async def disconnect(self):
@@ -61,10 +66,23 @@ class WSConnection:
             msg = await self._read_message()
             msg = await self._process_message(msg)
             if msg is not None:
-                response = self._build_resp(msg)
+                response = self._build_resp_with_latency_stats(msg)
                 break
         return response
 
+    def _build_resp_with_latency_stats(self, msg: aiohttp.WSMessage) -> WSResponse:
+        latency_tracker = LatencyTracker.get_instance()
+        started_at = latency_tracker.now()
+        if self._last_message_perf_counter is not None:
+            latency_tracker.record_duration(
+                key=self._ws_url,
+                stage=WS_INTER_ARRIVAL,
+                duration_ms=(started_at - self._last_message_perf_counter) * 1e3)
+        self._last_message_perf_counter = started_at
+        response = self._build_resp(msg)
+        latency_tracker.record(key=self._ws_url, stage=WS_DECODE, started_at=started_at)
+        return response
+
     def _ensure_not_connected(self):
         if self._connected:
             raise RuntimeError("WS is connected.")
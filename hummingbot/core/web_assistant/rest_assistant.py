@@ -4,6 +4,8 @@ from copy import deepcopy
 from typing import Any, Dict, List, Optional, Union
 
 from hummingbot.core.api_throttler.async_throttler_base import AsyncThrottlerBase
+from hummingbot.core.api_throttler.data_types import RequestPriority
+from hummingbot.core.utils.latency_tracker import AUTH, DECODE, RTT, UNKNOWN_LIMIT_ID, LatencyTracker
 from hummingbot.core.web_assistant.auth import AuthBase
 from hummingbot.core.web_assistant.connections.data_types import RESTMethod, RESTRequest, RESTResponse
 from hummingbot.core.web_assistant.connections.rest_connection import RESTConnection
@@ -42,7 +44,8 @@ class RESTAssistant:
             is_auth_required: bool = False,
             return_err: bool = False,
             timeout: Optional[float] = None,
-            headers: Optional[Dict[str, Any]] = None) -> Union[str, Dict[str, Any]]:
+            headers: Optional[Dict[str, Any]] = None,
+            priority: Optional[RequestPriority] = None) -> Union[str, Dict[str, Any]]:
 
         headers = headers or {}
 
@@ -62,7 +65,7 @@ class RESTAssistant:
             throttler_limit_id=throttler_limit_id
         )
 
-        async with self._throttler.execute_task(limit_id=throttler_limit_id):
+        async with self._throttler.execute_task(limit_id=throttler_limit_id, priority=priority):
             response = await self.call(request=request, timeout=timeout)
 
             if 400 <= response.status:
@@ -74,14 +77,18 @@ class RESTAssistant:
                     error_text = "N/A" if "<html" in error_response else error_response
                     raise IOError(f"Error executing request {method.name} {url}. HTTP status is {response.status}. "
                                   f"Error: {error_text}")
+            decode_started_at = LatencyTracker.now()
             result = await response.json()
+            LatencyTracker.get_instance().record(key=throttler_limit_id, stage=DECODE, started_at=decode_started_at)
             return result
 
     async def call(self, request: RESTRequest, timeout: Optional[float] = None) -> RESTResponse:
         request = deepcopy(request)
         request = await self._pre_process_request(request)
         request = await self._authenticate(request)
+        started_at = LatencyTracker.now()
         resp = await wait_for(self._connection.call(request), timeout)
+        LatencyTracker.get_instance().record(key=request.throttler_limit_id or UNKNOWN_LIMIT_ID, stage=RTT, started_at=started_at)
         resp = await self._post_process_response(resp)
         return resp
 
@@ -92,7 +99,9 @@ class RESTAssistant:
 
     async def _authenticate(self, request: RESTRequest):
         if self._auth is not None and request.is_auth_required:
+            started_at = LatencyTracker.now()
             request = await self._auth.rest_authenticate(request)
+            LatencyTracker.get_instance().record(key=request.throttler_limit_id or UNKNOWN_LIMIT_ID, stage=AUTH, started_at=started_at)
         return request
 
     async def _post_process_response(self, response: RESTResponse) -> RESTResponse:
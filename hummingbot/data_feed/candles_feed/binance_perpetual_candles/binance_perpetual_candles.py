@@ -1,14 +1,14 @@
-import asyncio
 import logging
-from typing import Any, Dict, Optional
+from typing import Any, List, Optional, Tuple
 
 import numpy as np
 
 from hummingbot.core.network_iterator import NetworkStatus
 from hummingbot.core.web_assistant.connections.data_types import WSJSONRequest
-from hummingbot.core.web_assistant.ws_assistant import WSAssistant
+from hummingbot.core.web_assistant.web_assistants_factory import WebAssistantsFactory
 from hummingbot.data_feed.candles_feed.binance_perpetual_candles import constants as CONSTANTS
 from hummingbot.data_feed.candles_feed.candles_base import CandlesBase
+from hummingbot.data_feed.candles_feed.candles_store import CandlesStore
 from hummingbot.logger import HummingbotLogger
 
 
@@ -21,8 +21,13 @@ class BinancePerpetualCandles(CandlesBase):
             cls._logger = logging.getLogger(__name__)
         return cls._logger
 
-    def __init__(self, trading_pair: str, interval: str = "1m", max_records: int = 150):
-        super().__init__(trading_pair, interval, max_records)
+    def __init__(self,
+                 trading_pair: str,
+                 interval: str = "1m",
+                 max_records: int = 150,
+                 candles_store: Optional[CandlesStore] = None,
+                 api_factory: Optional[WebAssistantsFactory] = None):
+        super().__init__(trading_pair, interval, max_records, candles_store, api_factory)
 
     @property
     def name(self):
@@ -74,88 +79,26 @@ class BinancePerpetualCandles(CandlesBase):
         candles = await rest_assistant.execute_request(url=self.candles_url,
                                                        throttler_limit_id=CONSTANTS.CANDLES_ENDPOINT,
                                                        params=params)
+        if len(candles) == 0:
+            return np.empty((0, len(self.columns)))
 
         return np.array(candles)[:, [0, 1, 2, 3, 4, 5, 7, 8, 9, 10]].astype(np.float)
 
-    async def fill_historical_candles(self):
-        max_request_needed = (self._candles.maxlen // 1000) + 1
-        requests_executed = 0
-        while not self.is_ready:
-            missing_records = self._candles.maxlen - len(self._candles)
-            end_timestamp = int(self._candles[0][0])
-            try:
-                if requests_executed < max_request_needed:
-                    # we have to add one more since, the last row is not going to be included
-                    candles = await self.fetch_candles(end_time=end_timestamp, limit=min(1000, missing_records + 1))
-                    # we are computing again the quantity of records again since the websocket process is able to
-                    # modify the deque and if we extend it, the new observations are going to be dropped.
-                    missing_records = self._candles.maxlen - len(self._candles)
-                    self._candles.extendleft(candles[-(missing_records + 1):-1][::-1])
-                    requests_executed += 1
-                else:
-                    self.logger().error(f"There is no data available for the quantity of "
-                                        f"candles requested for {self.name}.")
-                    raise
-            except asyncio.CancelledError:
-                raise
-            except Exception:
-                self.logger().exception(
-                    "Unexpected error occurred when getting historical klines. Retrying in 1 seconds...",
-                )
-                await self._sleep(1.0)
-
-    async def _subscribe_channels(self, ws: WSAssistant):
-        """
-        Subscribes to the candles events through the provided websocket connection.
-        :param ws: the websocket assistant used to connect to the exchange
-        """
-        try:
-            candle_params = []
-            candle_params.append(f"{self._ex_trading_pair.lower()}@kline_{self.interval}")
-            payload = {
-                "method": "SUBSCRIBE",
-                "params": candle_params,
-                "id": 1
-            }
-            subscribe_candles_request: WSJSONRequest = WSJSONRequest(payload=payload)
-
-            await ws.send(subscribe_candles_request)
-            self.logger().info("Subscribed to public klines...")
-        except asyncio.CancelledError:
-            raise
-        except Exception:
-            self.logger().error(
-                "Unexpected error occurred subscribing to public klines...",
-                exc_info=True
-            )
-            raise
-
-    async def _process_websocket_messages(self, websocket_assistant: WSAssistant):
-        async for ws_response in websocket_assistant.iter_messages():
-            data: Dict[str, Any] = ws_response.data
-            if data is not None and data.get("e") == "kline":  # data will be None when the websocket is disconnected
-                timestamp = data["k"]["t"]
-                open = data["k"]["o"]
-                low = data["k"]["l"]
-                high = data["k"]["h"]
-                close = data["k"]["c"]
-                volume = data["k"]["v"]
-                quote_asset_volume = data["k"]["q"]
-                n_trades = data["k"]["n"]
-                taker_buy_base_volume = data["k"]["V"]
-                taker_buy_quote_volume = data["k"]["Q"]
-                if len(self._candles) == 0:
-                    self._candles.append(np.array([timestamp, open, high, low, close, volume,
-                                                   quote_asset_volume, n_trades, taker_buy_base_volume,
-                                                   taker_buy_quote_volume]))
-                    await self.fill_historical_candles()
-                elif timestamp > int(self._candles[-1][0]):
-                    # TODO: validate also that the diff of timestamp == interval (issue with 1M interval).
-                    self._candles.append(np.array([timestamp, open, high, low, close, volume,
-                                                   quote_asset_volume, n_trades, taker_buy_base_volume,
-                                                   taker_buy_quote_volume]))
-                elif timestamp == int(self._candles[-1][0]):
-                    self._candles.pop()
-                    self._candles.append(np.array([timestamp, open, high, low, close, volume,
-                                                   quote_asset_volume, n_trades, taker_buy_base_volume,
-                                                   taker_buy_quote_volume]))
+    @property
+    def ws_stream_name(self) -> str:
+        return f"{self._ex_trading_pair.lower()}@kline_{self.interval}"
+
+    def ws_subscription_request(self, stream_names: List[str], request_id: int = 1) -> WSJSONRequest:
+        payload = {
+            "method": "SUBSCRIBE",
+            "params": stream_names,
+            "id": request_id
+        }
+        return WSJSONRequest(payload=payload)
+
+    def parse_websocket_message(self, data: Any) -> Optional[Tuple[str, np.ndarray]]:
+        if data is not None and data.get("e") == "kline":
+            kline = data["k"]
+            candle = np.array([kline["t"], kline["o"], kline["h"], kline["l"], kline["c"], kline["v"], kline["q"],
+                               kline["n"], kline["V"], kline["Q"]], dtype=np.float64)
+            return f"{data['s'].lower()}@kline_{kline['i']}", candle
@@ -1,32 +1,52 @@
 import asyncio
-from collections import deque
-from typing import Optional
+import time
+from typing import Any, Dict, List, Optional, Tuple
 
+import numpy as np
 import pandas as pd
 
 from hummingbot.core.api_throttler.async_throttler import AsyncThrottler
 from hummingbot.core.network_base import NetworkBase
 from hummingbot.core.network_iterator import NetworkStatus
 from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.core.web_assistant.connections.data_types import WSJSONRequest
 from hummingbot.core.web_assistant.web_assistants_factory import WebAssistantsFactory
 from hummingbot.core.web_assistant.ws_assistant import WSAssistant
+from hummingbot.data_feed.candles_feed.candles_buffer import CandlesBuffer
+from hummingbot.data_feed.candles_feed.candles_indicators import CandlesIndicator
+from hummingbot.data_feed.candles_feed.candles_store import CANDLES_COLUMNS, CandlesStore
 
 
 class CandlesBase(NetworkBase):
     """
     This class serves as a base class for fetching and storing candle data from a cryptocurrency exchange.
-    The class uses the Rest and WS Assistants for all the IO operations, and a double-ended queue to store candles.
+    The class uses the Rest and WS Assistants for all the IO operations, and a NumPy ring buffer to store candles.
     Also implements the Throttler module for API rate limiting, but it's not so necessary since the realtime data should
     be updated via websockets mainly.
+    The historical candles can be cached in a CandlesStore, then only the candles missing in the store are requested
+    to the exchange, in pages requested concurrently.
+    Technical indicators can be added to the candles, they are updated incrementally with each new or updated candle.
     """
-    columns = ["timestamp", "open", "high", "low", "close", "volume", "quote_asset_volume",
-               "n_trades", "taker_buy_base_volume", "taker_buy_quote_volume"]
+    columns = CANDLES_COLUMNS
+    # Maximum number of pages of historical candles requested at the same time
+    max_concurrent_requests = 5
 
-    def __init__(self, trading_pair: str, interval: str = "1m", max_records: int = 150):
+    def __init__(self,
+                 trading_pair: str,
+                 interval: str = "1m",
+                 max_records: int = 150,
+                 candles_store: Optional[CandlesStore] = None,
+                 api_factory: Optional[WebAssistantsFactory] = None):
         super().__init__()
-        async_throttler = AsyncThrottler(rate_limits=self.rate_limits)
-        self._api_factory = WebAssistantsFactory(throttler=async_throttler)
-        self._candles = deque(maxlen=max_records)
+        self._candles_store = candles_store
+        if api_factory is None:
+            async_throttler = AsyncThrottler(rate_limits=self.rate_limits)
+            api_factory = WebAssistantsFactory(throttler=async_throttler)
+        self._api_factory = api_factory
+        self._candles = CandlesBuffer(maxlen=max_records, columns_count=len(self.columns))
+        self._candles_df: Optional[pd.DataFrame] = None
+        self._candles_df_version = -1
+        self._indicators: Dict[str, CandlesIndicator] = {}
         self._listen_candles_task: Optional[asyncio.Task] = None
         self._trading_pair = trading_pair
         self._ex_trading_pair = self.get_exchange_trading_pair(trading_pair)
@@ -54,10 +74,33 @@ class CandlesBase(NetworkBase):
     @property
     def is_ready(self):
         """
-        This property returns a boolean indicating whether the _candles deque has reached its maximum length.
+        This property returns a boolean indicating whether the _candles buffer has reached its maximum length.
         """
         return len(self._candles) == self._candles.maxlen
 
+    @property
+    def trading_pair(self) -> str:
+        return self._trading_pair
+
+    @property
+    def candles_store(self) -> Optional[CandlesStore]:
+        return self._candles_store
+
+    @property
+    def interval_in_seconds(self) -> int:
+        return self.intervals[self.interval]
+
+    @property
+    def is_interval_fixed(self) -> bool:
+        """
+        Returns False for the intervals of calendar months, whose candles don't last interval_in_seconds
+        """
+        return not self.interval.endswith("M")
+
+    @property
+    def candles_max_result_per_rest_request(self) -> int:
+        return 1000
+
     @property
     def name(self):
         raise NotImplementedError
@@ -82,6 +125,18 @@ class CandlesBase(NetworkBase):
     def rate_limits(self):
         raise NotImplementedError
 
+    @property
+    def ws_stream_name(self) -> str:
+        """
+        This property returns the name of the websocket stream of the candles, used to subscribe to it and to identify
+        its messages.
+        """
+        raise NotImplementedError
+
+    @property
+    def api_factory(self) -> WebAssistantsFactory:
+        return self._api_factory
+
     @property
     def intervals(self):
         raise NotImplementedError
@@ -89,12 +144,48 @@ class CandlesBase(NetworkBase):
     async def check_network(self) -> NetworkStatus:
         raise NotImplementedError
 
+    @property
+    def candles_array(self) -> np.ndarray:
+        """
+        This property returns a read only view of the candles stored in the _candles buffer (one row per candle, with
+        the values of the columns), without copying them. The view is not updated with the new candles.
+        """
+        return self._candles.array
+
     @property
     def candles_df(self) -> pd.DataFrame:
         """
-        This property returns the candles stored in the _candles deque as a Pandas DataFrame.
+        This property returns the candles stored in the _candles buffer as a Pandas DataFrame.
+        The DataFrame is built only when the candles have changed since the last call, and a copy is returned so that
+        the callers can add columns (e.g. indicators) to it.
+        """
+        if self._candles_df_version != self._candles.version:
+            self._candles_df = pd.DataFrame(self._candles.array.copy(), columns=self.columns)
+            self._candles_df_version = self._candles.version
+        return self._candles_df.copy()
+
+    @property
+    def indicators(self) -> Dict[str, CandlesIndicator]:
+        """
+        This property returns the technical indicators added to the candles by name, with their current values and the
+        history of the last values.
+        """
+        return self._indicators
+
+    def add_indicator(self, name: str, indicator: CandlesIndicator) -> CandlesIndicator:
+        """
+        Adds a technical indicator, computed from the candles already stored and then updated with each new or updated
+        candle.
+        :param name: the name of the indicator, e.g. "RSI_14"
+        :param indicator: the indicator
+        :return: the indicator added
         """
-        return pd.DataFrame(self._candles, columns=self.columns, dtype=float)
+        self._indicators[name] = indicator
+        indicator.sync(self._candles.array)
+        return indicator
+
+    def remove_indicator(self, name: str):
+        self._indicators.pop(name, None)
 
     def get_exchange_trading_pair(self, trading_pair):
         raise NotImplementedError
@@ -112,11 +203,93 @@ class CandlesBase(NetworkBase):
         """
         raise NotImplementedError
 
+    async def get_historical_candles(self, start_time: int, end_time: int) -> np.ndarray:
+        """
+        Returns the candles between the timestamps (milliseconds, both included), whatever the max_records of the feed.
+        Without candles store all the candles are requested to the exchange. With a candles store only the ranges
+        missing in the store are requested, and the closed candles received are saved to the store. The store is not used
+        for the intervals without a fixed duration, where the missing candles can't be found from the stored ones.
+        :param start_time: the timestamp of the first candle
+        :param end_time: the timestamp of the last candle
+        :return: numpy array with the candlesticks sorted by timestamp
+        """
+        interval_ms = self.interval_in_seconds * 1000
+        if self._candles_store is None or not self.is_interval_fixed:
+            return await self._fetch_candles_ranges([(start_time, end_time)])
+        missing_ranges = self._candles_store.missing_ranges(feed=self.name,
+                                                            interval=self.interval,
+                                                            interval_ms=interval_ms,
+                                                            start_time=start_time,
+                                                            end_time=end_time)
+        if missing_ranges:
+            candles = await self._fetch_candles_ranges(missing_ranges)
+            # The candle in progress is not saved, it's going to change
+            closed_candles = candles[candles[:, 0] + interval_ms <= self._time() * 1000]
+            self._candles_store.save_candles(feed=self.name, interval=self.interval, candles=closed_candles)
+            stored_candles = self._candles_store.load_candles(feed=self.name,
+                                                              interval=self.interval,
+                                                              start_time=start_time,
+                                                              end_time=end_time)
+            candles = np.concatenate((stored_candles, candles[len(closed_candles):]))
+            return candles[np.unique(candles[:, 0], return_index=True)[1]]
+        return self._candles_store.load_candles(feed=self.name,
+                                                interval=self.interval,
+                                                start_time=start_time,
+                                                end_time=end_time)
+
     async def fill_historical_candles(self):
         """
-        This is an abstract method that must be implemented by a subclass to fill the _candles deque with historical candles.
+        Fills the _candles buffer with the historical candles preceding the first candle received by the websocket.
         """
-        raise NotImplementedError
+        interval_ms = self.interval_in_seconds * 1000
+        while not self.is_ready:
+            missing_records = self._candles.maxlen - len(self._candles)
+            end_timestamp = int(self._candles[0][0])
+            try:
+                candles = await self.get_historical_candles(
+                    start_time=end_timestamp - missing_records * interval_ms,
+                    end_time=end_timestamp - interval_ms)
+                if len(candles) == 0:
+                    self.logger().error(f"There is no data available for the quantity of "
+                                        f"candles requested for {self.name}.")
+                    return
+                # we are computing again the quantity of records again since the websocket process is able to
+                # modify the buffer and if we extend it, the new observations are going to be dropped.
+                missing_records = self._candles.maxlen - len(self._candles)
+                self._candles.extendleft(candles[-missing_records:][::-1])
+                self._update_indicators()
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                self.logger().exception(
+                    "Unexpected error occurred when getting historical klines. Retrying in 1 seconds...",
+                )
+                await self._sleep(1.0)
+
+    async def _fetch_candles_ranges(self, ranges: List[Tuple[int, int]]) -> np.ndarray:
+        """
+        Requests the candles of the ranges to the exchange, splitting them in pages of the maximum number of candles
+        per request, and requesting up to max_concurrent_requests pages at the same time.
+        """
+        interval_ms = self.interval_in_seconds * 1000
+        page_size = self.candles_max_result_per_rest_request
+        pages = [(page_start, min(page_start + (page_size - 1) * interval_ms, range_end))
+                 for range_start, range_end in ranges
+                 for page_start in range(int(range_start), int(range_end) + 1, page_size * interval_ms)]
+        semaphore = asyncio.Semaphore(self.max_concurrent_requests)
+
+        async def fetch_page(page_start: int, page_end: int) -> np.ndarray:
+            async with semaphore:
+                return await self.fetch_candles(start_time=page_start, end_time=page_end, limit=page_size)
+
+        results = await asyncio.gather(*[fetch_page(page_start, page_end) for page_start, page_end in pages])
+        candles = np.concatenate([np.asarray(result, dtype=np.float64).reshape(-1, len(self.columns))
+                                  for result in results] or [np.empty((0, len(self.columns)))])
+        in_ranges = np.zeros(len(candles), dtype=bool)
+        for range_start, range_end in ranges:
+            in_ranges |= (candles[:, 0] >= range_start) & (candles[:, 0] <= range_end)
+        candles = candles[in_ranges]
+        return candles[np.unique(candles[:, 0], return_index=True)[1]]
 
     async def listen_for_subscriptions(self):
         """
@@ -147,15 +320,71 @@ class CandlesBase(NetworkBase):
                          ping_timeout=30)
         return ws
 
+    def ws_subscription_request(self, stream_names: List[str], request_id: int = 1) -> WSJSONRequest:
+        """
+        Returns the request subscribing to the websocket streams of the candles (one stream per trading pair and
+        interval, see ws_stream_name).
+        """
+        raise NotImplementedError
+
+    def parse_websocket_message(self, data: Any) -> Optional[Tuple[str, np.ndarray]]:
+        """
+        Parses a message received through the websocket.
+        :param data: the message
+        :return: the name of the stream and the candle (values of the columns), None if it's not a candle message
+        """
+        raise NotImplementedError
+
     async def _subscribe_channels(self, ws: WSAssistant):
         """
         Subscribes to the candles events through the provided websocket connection.
         :param ws: the websocket assistant used to connect to the exchange
         """
-        raise NotImplementedError
+        try:
+            await ws.send(self.ws_subscription_request([self.ws_stream_name]))
+            self.logger().info("Subscribed to public klines...")
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            self.logger().error(
+                "Unexpected error occurred subscribing to public klines...",
+                exc_info=True
+            )
+            raise
 
     async def _process_websocket_messages(self, websocket_assistant: WSAssistant):
-        raise NotImplementedError
+        async for ws_response in websocket_assistant.iter_messages():
+            # data will be None when the websocket is disconnected
+            message = self.parse_websocket_message(ws_response.data)
+            if message is not None and self._add_candle(message[1]):
+                await self.fill_historical_candles()
+
+    def _add_candle(self, candle: np.ndarray) -> bool:
+        """
+        Adds a candle newer than the last one, or updates the last one if it has the same timestamp, and updates the
+        indicators.
+        :return: True if the candle is the first one of the buffer, then the historical candles have to be filled
+        """
+        is_first_candle = len(self._candles) == 0
+        if is_first_candle or candle[0] > self._candles[-1][0]:
+            # TODO: validate also that the diff of timestamp == interval (issue with 1M interval).
+            self._candles.append(candle)
+        elif candle[0] == self._candles[-1][0]:
+            self._candles[-1] = candle
+        self._update_indicators()
+        return is_first_candle
+
+    def _update_indicators(self):
+        """
+        Updates the indicators with the candles added or updated since the last update.
+        """
+        if self._indicators:
+            candles = self._candles.array
+            for indicator in self._indicators.values():
+                indicator.sync(candles)
+
+    def _time(self) -> float:
+        return time.time()
 
     async def _sleep(self, delay):
         """
@@ -166,3 +395,6 @@ class CandlesBase(NetworkBase):
     async def _on_order_stream_interruption(self, websocket_assistant: Optional[WSAssistant] = None):
         websocket_assistant and await websocket_assistant.disconnect()
         self._candles.clear()
+        # The candles received after the reconnection don't follow the ones processed by the indicators
+        for indicator in self._indicators.values():
+            indicator.reset()
@@ -0,0 +1,106 @@
+from typing import Iterable, Iterator
+
+import numpy as np
+
+
+class CandlesBuffer:
+    """
+    Fixed size ring buffer of candles stored in a preallocated NumPy array, with the same interface as the bounded
+    deque used before (append, appendleft, extendleft, pop, indexing) plus in place updates of the candles.
+
+    Each candle is written twice, at its position in the ring and at the same position in a mirror half of the array,
+    so the candles are always contiguous in the array and `array` is a view of the buffer, without copying nor
+    reordering them whatever the position of the oldest candle in the ring.
+    """
+
+    def __init__(self, maxlen: int, columns_count: int):
+        self._maxlen = maxlen
+        self._data = np.zeros((2 * maxlen, columns_count), dtype=np.float64)
+        self._start = 0
+        self._length = 0
+        self._version = 0
+
+    @property
+    def maxlen(self) -> int:
+        return self._maxlen
+
+    @property
+    def version(self) -> int:
+        """
+        Counter incremented each time the candles change, to know when the data derived from them is outdated
+        """
+        return self._version
+
+    @property
+    def array(self) -> np.ndarray:
+        """
+        Returns a read only view of the candles, from the oldest to the newest one. The view shares the memory of the
+        buffer and doesn't follow the candles added after it was taken, it has to be copied to be kept.
+        """
+        view = self._data[self._start:self._start + self._length]
+        view.flags.writeable = False
+        return view
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __iter__(self) -> Iterator[np.ndarray]:
+        return iter(self.array)
+
+    def __getitem__(self, index: int) -> np.ndarray:
+        return self.array[index]
+
+    def __setitem__(self, index: int, candle: Iterable):
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError("candles buffer index out of range")
+        self._write(index, candle)
+
+    def append(self, candle: Iterable):
+        """
+        Adds the newest candle, dropping the oldest one if the buffer is full
+        """
+        if self._length == self._maxlen:
+            self._start = (self._start + 1) % self._maxlen
+        else:
+            self._length += 1
+        self._write(self._length - 1, candle)
+
+    def appendleft(self, candle: Iterable):
+        """
+        Adds a candle older than all the others, dropping the newest one if the buffer is full
+        """
+        if self._length == self._maxlen:
+            self._length -= 1
+        self._start = (self._start - 1) % self._maxlen
+        self._length += 1
+        self._write(0, candle)
+
+    def extendleft(self, candles: Iterable[Iterable]):
+        """
+        Adds older candles one by one at the left, like deque.extendleft, so they are expected from the newest to the
+        oldest one
+        """
+        for candle in candles:
+            self.appendleft(candle)
+
+    def pop(self) -> np.ndarray:
+        if self._length == 0:
+            raise IndexError("pop from an empty candles buffer")
+        candle = self[-1].copy()
+        self._length -= 1
+        self._version += 1
+        return candle
+
+    def clear(self):
+        self._start = 0
+        self._length = 0
+        self._version += 1
+
+    def _write(self, index: int, candle: Iterable):
+        position = (self._start + index) % self._maxlen
+        row = np.asarray(candle, dtype=np.float64)
+        self._data[position] = row
+        self._data[position + self._maxlen] = row
+        self._version += 1
@@ -1,5 +1,9 @@
+from typing import Optional
+
+from hummingbot.core.web_assistant.web_assistants_factory import WebAssistantsFactory
 from hummingbot.data_feed.candles_feed.binance_perpetual_candles import BinancePerpetualCandles
 from hummingbot.data_feed.candles_feed.binance_spot_candles import BinanceSpotCandles
+from hummingbot.data_feed.candles_feed.candles_store import CandlesStore
 
 
 class CandlesFactory:
@@ -8,12 +12,20 @@ class CandlesFactory:
     It has a class method, get_candle which takes in a connector, trading pair, interval, and max_records as parameters.
     Based on the connector provided, the method returns either a BinancePerpetualsCandles or a BinanceSpotCandles object.
     If an unsupported connector is provided, it raises an exception.
+    A CandlesStore can be shared by the candles to cache the historical candles locally, and a WebAssistantsFactory to
+    share the connections and the rate limits of the exchange.
     """
     @classmethod
-    def get_candle(cls, connector: str, trading_pair: str, interval: str = "1m", max_records: int = 500):
+    def get_candle(cls,
+                   connector: str,
+                   trading_pair: str,
+                   interval: str = "1m",
+                   max_records: int = 500,
+                   candles_store: Optional[CandlesStore] = None,
+                   api_factory: Optional[WebAssistantsFactory] = None):
         if connector == "binance_perpetual":
-            return BinancePerpetualCandles(trading_pair, interval, max_records)
+            return BinancePerpetualCandles(trading_pair, interval, max_records, candles_store, api_factory)
         elif connector == "binance":
-            return BinanceSpotCandles(trading_pair, interval, max_records)
+            return BinanceSpotCandles(trading_pair, interval, max_records, candles_store, api_factory)
         else:
             raise Exception(f"The connector {connector} is not available. Please select another one.")
@@ -0,0 +1,197 @@
+import asyncio
+import logging
+from typing import Dict, List, Optional, Tuple
+
+from hummingbot.core.network_base import NetworkBase
+from hummingbot.core.network_iterator import NetworkStatus
+from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.core.web_assistant.web_assistants_factory import WebAssistantsFactory
+from hummingbot.core.web_assistant.ws_assistant import WSAssistant
+from hummingbot.data_feed.candles_feed.candles_base import CandlesBase
+from hummingbot.data_feed.candles_feed.candles_factory import CandlesFactory
+from hummingbot.data_feed.candles_feed.candles_store import CandlesStore
+from hummingbot.logger import HummingbotLogger
+
+
+class _CandlesHubShard:
+    """
+    Websocket connection of the hub and the candle streams subscribed through it
+    """
+
+    def __init__(self):
+        self.stream_names: List[str] = []
+        self.websocket_assistant: Optional[WSAssistant] = None
+        self.listen_task: Optional[asyncio.Task] = None
+
+
+class CandlesHub(NetworkBase):
+    """
+    The CandlesHub provides the candles of several trading pairs and intervals of an exchange, receiving all of them
+    through shared websocket connections (up to max_streams_per_connection streams per connection) instead of one
+    connection per candles. The messages are routed to the candles of each trading pair and interval, that fill their
+    historical candles and compute their indicators as when they are used alone.
+    All the candles share the same WebAssistantsFactory, then the same rate limits for the historical candles requests.
+    The candles are created with get_candle and must not be started, the hub is started instead.
+    """
+    _logger: Optional[HummingbotLogger] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._logger is None:
+            cls._logger = logging.getLogger(__name__)
+        return cls._logger
+
+    def __init__(self,
+                 connector: str,
+                 max_streams_per_connection: int = 200,
+                 max_streams_per_subscription: int = 50,
+                 candles_store: Optional[CandlesStore] = None):
+        super().__init__()
+        self._connector = connector
+        self._max_streams_per_connection = max_streams_per_connection
+        self._max_streams_per_subscription = max_streams_per_subscription
+        self._candles_store = candles_store
+        self._api_factory: Optional[WebAssistantsFactory] = None
+        self._candles: Dict[Tuple[str, str], CandlesBase] = {}
+        self._candles_by_stream: Dict[str, CandlesBase] = {}
+        self._shards: List[_CandlesHubShard] = []
+        self._fill_historical_candles_tasks: Dict[str, asyncio.Task] = {}
+        self._subscription_request_id = 0
+        self._network_started = False
+
+    @property
+    def connector(self) -> str:
+        return self._connector
+
+    @property
+    def candles(self) -> Dict[Tuple[str, str], CandlesBase]:
+        """
+        Returns the candles of the hub by trading pair and interval
+        """
+        return self._candles
+
+    @property
+    def connections_count(self) -> int:
+        return len(self._shards)
+
+    @property
+    def is_ready(self) -> bool:
+        return len(self._candles) > 0 and all(candles.is_ready for candles in self._candles.values())
+
+    def get_candle(self, trading_pair: str, interval: str = "1m", max_records: int = 500) -> CandlesBase:
+        """
+        Returns the candles of the trading pair and interval, adding them to the hub if they were not requested before.
+        The candles added while the hub is running are subscribed through the existing connections if they have room.
+        """
+        candles = self._candles.get((trading_pair, interval))
+        if candles is None:
+            candles = CandlesFactory.get_candle(connector=self._connector,
+                                                trading_pair=trading_pair,
+                                                interval=interval,
+                                                max_records=max_records,
+                                                candles_store=self._candles_store,
+                                                api_factory=self._api_factory)
+            self._api_factory = candles.api_factory
+            self._candles[(trading_pair, interval)] = candles
+            self._candles_by_stream[candles.ws_stream_name] = candles
+            if self._network_started:
+                self._add_stream(candles.ws_stream_name)
+        return candles
+
+    async def start_network(self):
+        await self.stop_network()
+        self._network_started = True
+        for stream_name in self._candles_by_stream:
+            self._add_stream(stream_name)
+
+    async def stop_network(self):
+        self._network_started = False
+        for shard in self._shards:
+            if shard.listen_task is not None:
+                shard.listen_task.cancel()
+        self._shards = []
+
+    async def check_network(self) -> NetworkStatus:
+        if len(self._candles) == 0:
+            return NetworkStatus.NOT_CONNECTED
+        return await next(iter(self._candles.values())).check_network()
+
+    def _add_stream(self, stream_name: str):
+        shard = next((shard for shard in self._shards
+                      if len(shard.stream_names) < self._max_streams_per_connection), None)
+        if shard is None:
+            shard = _CandlesHubShard()
+            self._shards.append(shard)
+            shard.listen_task = safe_ensure_future(self._listen_for_subscriptions(shard))
+        shard.stream_names.append(stream_name)
+        if shard.websocket_assistant is not None:
+            safe_ensure_future(self._subscribe_streams(shard.websocket_assistant, [stream_name]))
+
+    async def _listen_for_subscriptions(self, shard: _CandlesHubShard):
+        """
+        Connects to the candlestick websocket endpoint, subscribes to the streams of the shard and routes the messages
+        to their candles.
+        """
+        ws: Optional[WSAssistant] = None
+        while True:
+            try:
+                ws = await next(iter(self._candles.values()))._connected_websocket_assistant()
+                shard.websocket_assistant = ws
+                await self._subscribe_streams(ws, list(shard.stream_names))
+                await self._process_websocket_messages(websocket_assistant=ws)
+            except asyncio.CancelledError:
+                raise
+            except ConnectionError as connection_exception:
+                self.logger().warning(f"The websocket connection was closed ({connection_exception})")
+            except Exception:
+                self.logger().exception(
+                    "Unexpected error occurred when listening to public klines. Retrying in 1 seconds...",
+                )
+                await self._sleep(1.0)
+            finally:
+                shard.websocket_assistant = None
+                await self._on_stream_interruption(shard, ws)
+
+    async def _subscribe_streams(self, ws: WSAssistant, stream_names: List[str]):
+        try:
+            for i in range(0, len(stream_names), self._max_streams_per_subscription):
+                self._subscription_request_id += 1
+                candles = self._candles_by_stream[stream_names[i]]
+                await ws.send(candles.ws_subscription_request(
+                    stream_names[i:i + self._max_streams_per_subscription], self._subscription_request_id))
+            self.logger().info(f"Subscribed to {len(stream_names)} public klines streams...")
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            self.logger().error(
+                "Unexpected error occurred subscribing to public klines...",
+                exc_info=True
+            )
+            raise
+
+    async def _process_websocket_messages(self, websocket_assistant: WSAssistant):
+        parser = next(iter(self._candles.values()))
+        async for ws_response in websocket_assistant.iter_messages():
+            message = parser.parse_websocket_message(ws_response.data)
+            if message is None:
+                continue
+            stream_name, candle = message
+            candles = self._candles_by_stream.get(stream_name)
+            # The historical candles are filled in the background to keep processing the messages of the other streams
+            if candles is not None and candles._add_candle(candle):
+                self._fill_historical_candles_tasks[stream_name] = safe_ensure_future(
+                    candles.fill_historical_candles())
+
+    async def _on_stream_interruption(self, shard: _CandlesHubShard, websocket_assistant: Optional[WSAssistant]):
+        websocket_assistant and await websocket_assistant.disconnect()
+        for stream_name in shard.stream_names:
+            task = self._fill_historical_candles_tasks.pop(stream_name, None)
+            if task is not None:
+                task.cancel()
+            await self._candles_by_stream[stream_name]._on_order_stream_interruption()
+
+    async def _sleep(self, delay):
+        """
+        Function added only to facilitate patching the sleep in unit tests without affecting the asyncio module
+        """
+        await asyncio.sleep(delay)
@@ -0,0 +1,426 @@
+import math
+from collections import deque
+from typing import Dict, Iterable, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from hummingbot.data_feed.candles_feed.candles_buffer import CandlesBuffer
+from hummingbot.data_feed.candles_feed.candles_store import CANDLES_COLUMNS
+
+TIMESTAMP_INDEX = CANDLES_COLUMNS.index("timestamp")
+HIGH_INDEX = CANDLES_COLUMNS.index("high")
+LOW_INDEX = CANDLES_COLUMNS.index("low")
+CLOSE_INDEX = CANDLES_COLUMNS.index("close")
+VOLUME_INDEX = CANDLES_COLUMNS.index("volume")
+
+
+class _RollingWindow:
+    """
+    Sum and sum of squares of the last `length` values of a series. `peek` returns the statistics including a value
+    that is not added yet (the candle in progress), `push` adds it.
+    The sums are computed on the values minus a shift close to them, to keep the variance accurate for prices far
+    from zero.
+    """
+
+    def __init__(self, length: int):
+        self._length = length
+        self._values = deque()
+        self._shift = 0.0
+        self._sum = 0.0
+        self._sum_sq = 0.0
+        self._pushes = 0
+
+    def peek(self, value: float) -> Tuple[float, float]:
+        """
+        Returns the mean and the variance (ddof=0) of the window ending with the value, or NaN if there are not
+        enough values
+        """
+        if len(self._values) + 1 < self._length:
+            return math.nan, math.nan
+        shifted = value - self._shift
+        total = self._sum + shifted
+        total_sq = self._sum_sq + shifted * shifted
+        if len(self._values) == self._length:
+            oldest = self._values[0] - self._shift
+            total -= oldest
+            total_sq -= oldest * oldest
+        mean = total / self._length
+        return self._shift + mean, max(total_sq / self._length - mean * mean, 0.0)
+
+    def push(self, value: float):
+        if self._pushes == 0:
+            self._shift = value
+        self._values.append(value)
+        shifted = value - self._shift
+        self._sum += shifted
+        self._sum_sq += shifted * shifted
+        if len(self._values) > self._length:
+            oldest = self._values.popleft() - self._shift
+            self._sum -= oldest
+            self._sum_sq -= oldest * oldest
+        self._pushes += 1
+        # The running sums accumulate rounding errors, they are recomputed once per window (amortized O(1))
+        if self._pushes % self._length == 0:
+            self._shift = math.fsum(self._values) / len(self._values)
+            self._sum = math.fsum(v - self._shift for v in self._values)
+            self._sum_sq = math.fsum((v - self._shift) ** 2 for v in self._values)
+
+
+class _Ema:
+    """
+    Exponential moving average seeded with the simple average of the first `length` values, like pandas_ta ema
+    """
+
+    def __init__(self, length: int):
+        self._length = length
+        self._alpha = 2 / (length + 1)
+        self._count = 0
+        self._seed_sum = 0.0
+        self._value = math.nan
+
+    def peek(self, value: float) -> float:
+        if self._count + 1 < self._length:
+            return math.nan
+        if self._count + 1 == self._length:
+            return (self._seed_sum + value) / self._length
+        return self._alpha * value + (1 - self._alpha) * self._value
+
+    def push(self, value: float):
+        self._value = self.peek(value)
+        self._count += 1
+        if self._count < self._length:
+            self._seed_sum += value
+
+
+class _Rma:
+    """
+    Wilder's moving average, an adjusted exponential moving average with alpha = 1 / length, like pandas_ta rma
+    """
+
+    def __init__(self, length: int):
+        self._length = length
+        self._decay = 1 - 1 / length
+        self._count = 0
+        self._numerator = 0.0
+        self._denominator = 0.0
+
+    def peek(self, value: float) -> float:
+        if self._count + 1 < self._length:
+            return math.nan
+        return (value + self._decay * self._numerator) / (1 + self._decay * self._denominator)
+
+    def push(self, value: float):
+        self._numerator = value + self._decay * self._numerator
+        self._denominator = 1 + self._decay * self._denominator
+        self._count += 1
+
+
+class CandlesIndicator:
+    """
+    Base class of the technical indicators computed incrementally, in O(1) per new or updated candle.
+
+    The last candle received is the one in progress, it can be updated any number of times: its values are computed
+    from the state of the indicator up to the previous candle, and the state is only updated with the candle when the
+    next one is received. The values of the last `history_length` candles are kept in a NumPy ring buffer.
+    Subclasses define the fields of the indicator, `_compute` that returns their values for the candle in progress,
+    `_commit` that adds a closed candle to the state, and `_reset_state`.
+    """
+    fields: Tuple[str, ...] = ("value",)
+
+    def __init__(self, history_length: int = 100):
+        self._history = CandlesBuffer(maxlen=history_length, columns_count=len(self.fields) + 1)
+        self._first_timestamp: Optional[float] = None
+        self._candle: Optional[np.ndarray] = None
+        self._reset_state()
+
+    @property
+    def columns(self) -> Tuple[str, ...]:
+        return ("timestamp",) + self.fields
+
+    @property
+    def timestamp(self) -> Optional[float]:
+        """
+        Returns the timestamp of the last candle received, None if no candle has been received yet
+        """
+        return None if self._candle is None else self._candle[TIMESTAMP_INDEX]
+
+    @property
+    def value(self) -> float:
+        """
+        Returns the current value of the first field of the indicator (NaN until there are enough candles)
+        """
+        return self._history[-1][1] if len(self._history) > 0 else math.nan
+
+    @property
+    def values(self) -> Dict[str, float]:
+        """
+        Returns the current values of the fields of the indicator
+        """
+        row = self._history[-1][1:] if len(self._history) > 0 else [math.nan] * len(self.fields)
+        return dict(zip(self.fields, row))
+
+    @property
+    def history(self) -> np.ndarray:
+        """
+        Returns a read only view of the values of the last candles, one row per candle with the timestamp and the
+        fields of the indicator (see columns)
+        """
+        return self._history.array
+
+    def update(self, candle: Sequence[float]):
+        """
+        Updates the indicator with a candle (the values of CANDLES_COLUMNS). The candle is added if it's newer than
+        the last one, replaces the last one if it has the same timestamp, and is ignored if it's older.
+        """
+        candle = np.array(candle, dtype=np.float64)
+        timestamp = candle[TIMESTAMP_INDEX]
+        if self._candle is not None and timestamp < self._candle[TIMESTAMP_INDEX]:
+            return
+        row = np.empty(len(self.fields) + 1)
+        row[0] = timestamp
+        if self._candle is None or timestamp > self._candle[TIMESTAMP_INDEX]:
+            if self._candle is None:
+                self._first_timestamp = timestamp
+            else:
+                self._commit(self._candle)
+            self._candle = candle
+            row[1:] = self._compute(candle)
+            self._history.append(row)
+        else:
+            self._candle = candle
+            row[1:] = self._compute(candle)
+            self._history[-1] = row
+
+    def sync(self, candles: np.ndarray):
+        """
+        Updates the indicator with the candles of a feed (sorted by timestamp), only processing the last candle
+        received and the newer ones. If candles older than the first one processed were added (e.g. historical
+        candles), or the last candle processed is not in the feed anymore (e.g. the candles were cleared when the
+        websocket was disconnected) the indicator is computed again from the first candle.
+        """
+        if len(candles) == 0:
+            return
+        timestamps = candles[:, TIMESTAMP_INDEX]
+        start = 0
+        is_recompute_needed = self._first_timestamp is None or timestamps[0] < self._first_timestamp
+        if not is_recompute_needed:
+            start = int(np.searchsorted(timestamps, self._candle[TIMESTAMP_INDEX]))
+            is_recompute_needed = start == len(timestamps) or timestamps[start] != self._candle[TIMESTAMP_INDEX]
+        if is_recompute_needed:
+            self.reset()
+            start = 0
+        for candle in candles[start:]:
+            self.update(candle)
+
+    def reset(self):
+        self._history.clear()
+        self._first_timestamp = None
+        self._candle = None
+        self._reset_state()
+
+    def _reset_state(self):
+        raise NotImplementedError
+
+    def _compute(self, candle: np.ndarray) -> Union[float, Iterable[float]]:
+        raise NotImplementedError
+
+    def _commit(self, candle: np.ndarray):
+        raise NotImplementedError
+
+
+class SMA(CandlesIndicator):
+    """
+    Simple moving average of a column of the candles
+    """
+
+    def __init__(self, length: int = 20, source: str = "close", history_length: int = 100):
+        self._length = length
+        self._source_index = CANDLES_COLUMNS.index(source)
+        super().__init__(history_length)
+
+    def _reset_state(self):
+        self._window = _RollingWindow(self._length)
+
+    def _compute(self, candle: np.ndarray) -> Union[float, Iterable[float]]:
+        return self._window.peek(candle[self._source_index])[0]
+
+    def _commit(self, candle: np.ndarray):
+        self._window.push(candle[self._source_index])
+
+
+class EMA(CandlesIndicator):
+    """
+    Exponential moving average of a column of the candles, seeded with the simple average of the first `length`
+    candles
+    """
+
+    def __init__(self, length: int = 20, source: str = "close", history_length: int = 100):
+        self._length = length
+        self._source_index = CANDLES_COLUMNS.index(source)
+        super().__init__(history_length)
+
+    def _reset_state(self):
+        self._ema = _Ema(self._length)
+
+    def _compute(self, candle: np.ndarray) -> Union[float, Iterable[float]]:
+        return self._ema.peek(candle[self._source_index])
+
+    def _commit(self, candle: np.ndarray):
+        self._ema.push(candle[self._source_index])
+
+
+class RSI(CandlesIndicator):
+    """
+    Relative strength index of the close prices, using Wilder's moving average of the gains and losses
+    """
+
+    def __init__(self, length: int = 14, history_length: int = 100):
+        self._length = length
+        super().__init__(history_length)
+
+    def _reset_state(self):
+        self._gains = _Rma(self._length)
+        self._losses = _Rma(self._length)
+        self._previous_close = math.nan
+
+    def _compute(self, candle: np.ndarray) -> Union[float, Iterable[float]]:
+        change = candle[CLOSE_INDEX] - self._previous_close
+        if math.isnan(change):
+            return math.nan
+        gains = self._gains.peek(max(change, 0.0))
+        losses = self._losses.peek(max(-change, 0.0))
+        if gains + losses == 0:
+            return math.nan
+        return 100 * gains / (gains + losses)
+
+    def _commit(self, candle: np.ndarray):
+        change = candle[CLOSE_INDEX] - self._previous_close
+        if not math.isnan(change):
+            self._gains.push(max(change, 0.0))
+            self._losses.push(max(-change, 0.0))
+        self._previous_close = candle[CLOSE_INDEX]
+
+
+class BollingerBands(CandlesIndicator):
+    """
+    Bollinger bands of the close prices: the simple moving average plus and minus `std` standard deviations, the
+    bandwidth (percentage of the middle band) and the percent (position of the close price between the bands)
+    """
+    fields = ("lower", "middle", "upper", "bandwidth", "percent")
+
+    def __init__(self, length: int = 20, std: float = 2.0, ddof: int = 0, history_length: int = 100):
+        self._length = length
+        self._std = std
+        self._ddof = ddof
+        super().__init__(history_length)
+
+    def _reset_state(self):
+        self._window = _RollingWindow(self._length)
+
+    def _compute(self, candle: np.ndarray) -> Union[float, Iterable[float]]:
+        close = candle[CLOSE_INDEX]
+        middle, variance = self._window.peek(close)
+        deviation = self._std * math.sqrt(variance * self._length / (self._length - self._ddof))
+        lower = middle - deviation
+        upper = middle + deviation
+        bandwidth = 100 * (upper - lower) / middle if middle != 0 else math.nan
+        percent = (close - lower) / (upper - lower) if upper != lower else math.nan
+        return lower, middle, upper, bandwidth, percent
+
+    def _commit(self, candle: np.ndarray):
+        self._window.push(candle[CLOSE_INDEX])
+
+
+class ATR(CandlesIndicator):
+    """
+    Average true range, using Wilder's moving average of the true ranges
+    """
+
+    def __init__(self, length: int = 14, history_length: int = 100):
+        self._length = length
+        super().__init__(history_length)
+
+    def _reset_state(self):
+        self._rma = _Rma(self._length)
+        self._previous_close = math.nan
+
+    def _true_range(self, candle: np.ndarray) -> float:
+        high, low = candle[HIGH_INDEX], candle[LOW_INDEX]
+        return max(high - low, abs(high - self._previous_close), abs(low - self._previous_close))
+
+    def _compute(self, candle: np.ndarray) -> Union[float, Iterable[float]]:
+        if math.isnan(self._previous_close):
+            return math.nan
+        return self._rma.peek(self._true_range(candle))
+
+    def _commit(self, candle: np.ndarray):
+        if not math.isnan(self._previous_close):
+            self._rma.push(self._true_range(candle))
+        self._previous_close = candle[CLOSE_INDEX]
+
+
+class MACD(CandlesIndicator):
+    """
+    Moving average convergence divergence of the close prices: the difference of the fast and slow exponential
+    moving averages, its signal line (exponential moving average of the MACD) and their difference (histogram)
+    """
+    fields = ("macd", "histogram", "signal")
+
+    def __init__(self, fast: int = 12, slow: int = 26, signal: int = 9, history_length: int = 100):
+        self._fast_length = fast
+        self._slow_length = slow
+        self._signal_length = signal
+        super().__init__(history_length)
+
+    def _reset_state(self):
+        self._fast = _Ema(self._fast_length)
+        self._slow = _Ema(self._slow_length)
+        self._signal = _Ema(self._signal_length)
+
+    def _compute(self, candle: np.ndarray) -> Union[float, Iterable[float]]:
+        close = candle[CLOSE_INDEX]
+        macd = self._fast.peek(close) - self._slow.peek(close)
+        if math.isnan(macd):
+            return math.nan, math.nan, math.nan
+        signal = self._signal.peek(macd)
+        return macd, macd - signal, signal
+
+    def _commit(self, candle: np.ndarray):
+        close = candle[CLOSE_INDEX]
+        macd = self._fast.peek(close) - self._slow.peek(close)
+        self._fast.push(close)
+        self._slow.push(close)
+        # The signal line starts with the first MACD value
+        if not math.isnan(macd):
+            self._signal.push(macd)
+
+
+class VWAP(CandlesIndicator):
+    """
+    Volume weighted average of the typical prices (high + low + close) / 3, restarted at the beginning of each
+    anchor period (one day by default)
+    """
+
+    def __init__(self, anchor_seconds: int = 24 * 60 * 60, history_length: int = 100):
+        self._anchor_ms = anchor_seconds * 1000
+        super().__init__(history_length)
+
+    def _reset_state(self):
+        self._period = None
+        self._price_volume = 0.0
+        self._volume = 0.0
+
+    def _sums(self, candle: np.ndarray) -> Tuple[float, float]:
+        volume = candle[VOLUME_INDEX]
+        price_volume = (candle[HIGH_INDEX] + candle[LOW_INDEX] + candle[CLOSE_INDEX]) / 3 * volume
+        if candle[TIMESTAMP_INDEX] // self._anchor_ms != self._period:
+            return price_volume, volume
+        return self._price_volume + price_volume, self._volume + volume
+
+    def _compute(self, candle: np.ndarray) -> Union[float, Iterable[float]]:
+        price_volume, volume = self._sums(candle)
+        return price_volume / volume if volume != 0 else math.nan
+
+    def _commit(self, candle: np.ndarray):
+        self._price_volume, self._volume = self._sums(candle)
+        self._period = candle[TIMESTAMP_INDEX] // self._anchor_ms
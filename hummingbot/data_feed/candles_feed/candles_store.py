@@ -0,0 +1,99 @@
+import sqlite3
+from os.path import join
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+from hummingbot import data_path
+
+CANDLES_STORE_FILE_NAME = "candles.sqlite"
+
+CANDLES_COLUMNS = ["timestamp", "open", "high", "low", "close", "volume", "quote_asset_volume",
+                   "n_trades", "taker_buy_base_volume", "taker_buy_quote_volume"]
+
+
+class CandlesStore:
+    """
+    Local SQLite cache of the closed candles downloaded by the candles feeds, one series per feed (exchange and trading
+    pair, see CandlesBase.name) and interval. The feeds only request to the exchange the ranges of candles missing in
+    the store, and can load lookbacks longer than the candles kept in memory.
+    """
+
+    def __init__(self, db_path: Optional[str] = None):
+        """
+        :param db_path: the SQLite database file, `candles.sqlite` in the data directory by default
+        """
+        self._db_path = db_path or join(data_path(), CANDLES_STORE_FILE_NAME)
+        self._connection = sqlite3.connect(self._db_path)
+        # WAL lets several bots read the store while one of them is writing to it
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        values_columns = ", ".join(f"{column} REAL NOT NULL" for column in CANDLES_COLUMNS[1:])
+        self._connection.execute(
+            f"CREATE TABLE IF NOT EXISTS candles (feed TEXT NOT NULL, interval TEXT NOT NULL, "
+            f"timestamp INTEGER NOT NULL, {values_columns}, PRIMARY KEY (feed, interval, timestamp)) WITHOUT ROWID")
+        self._connection.commit()
+
+    @property
+    def db_path(self) -> str:
+        return self._db_path
+
+    def close(self):
+        self._connection.close()
+
+    def save_candles(self, feed: str, interval: str, candles: np.ndarray):
+        """
+        Stores the candles, replacing the ones already stored with the same timestamps
+        :param feed: the name of the candles feed
+        :param interval: the candles interval
+        :param candles: one row per candle, with the values of CANDLES_COLUMNS (timestamps in milliseconds)
+        """
+        if len(candles) == 0:
+            return
+        placeholders = ", ".join("?" * (len(CANDLES_COLUMNS) + 2))
+        rows = [(feed, interval, int(candle[0]), *map(float, candle[1:])) for candle in candles]
+        with self._connection:
+            self._connection.executemany(f"INSERT OR REPLACE INTO candles VALUES ({placeholders})", rows)
+
+    def load_candles(self,
+                     feed: str,
+                     interval: str,
+                     start_time: Optional[int] = None,
+                     end_time: Optional[int] = None) -> np.ndarray:
+        """
+        Returns the stored candles between the timestamps (milliseconds, both included), sorted by timestamp
+        """
+        query = f"SELECT {', '.join(CANDLES_COLUMNS)} FROM candles WHERE feed = ? AND interval = ?"
+        params: List = [feed, interval]
+        if start_time is not None:
+            query += " AND timestamp >= ?"
+            params.append(int(start_time))
+        if end_time is not None:
+            query += " AND timestamp <= ?"
+            params.append(int(end_time))
+        rows = self._connection.execute(query + " ORDER BY timestamp", params).fetchall()
+        return np.array(rows, dtype=np.float64).reshape(len(rows), len(CANDLES_COLUMNS))
+
+    def missing_ranges(self,
+                       feed: str,
+                       interval: str,
+                       interval_ms: int,
+                       start_time: int,
+                       end_time: int) -> List[Tuple[int, int]]:
+        """
+        Returns the ranges of timestamps between the timestamps (milliseconds, both included) that can contain candles
+        not stored, as (start, end) tuples. The candles are expected every interval_ms from the stored ones, whatever
+        their alignment (e.g. the weekly candles opening on Mondays).
+        """
+        start_time = int(start_time)
+        end_time = int(end_time)
+        if start_time > end_time:
+            return []
+        stored = np.array([row[0] for row in self._connection.execute(
+            "SELECT timestamp FROM candles WHERE feed = ? AND interval = ? AND timestamp >= ? AND timestamp <= ? "
+            "ORDER BY timestamp", (feed, interval, start_time, end_time))], dtype=np.int64)
+        # Adding the timestamps before and after the range as sentinels, the gaps are the steps longer than an interval
+        bounds = np.concatenate(([start_time - interval_ms], stored, [end_time + interval_ms]))
+        gaps = np.flatnonzero(np.diff(bounds) > interval_ms)
+        ranges = [(int(bounds[gap] + interval_ms), int(bounds[gap + 1] - interval_ms)) for gap in gaps]
+        # The steps shorter than two intervals don't leave room for any candle
+        return [(range_start, range_end) for range_start, range_end in ranges if range_start <= range_end]
@@ -0,0 +1,121 @@
+import logging
+import re
+from typing import TYPE_CHECKING, Optional
+
+import numpy as np
+from bidict import bidict
+
+from hummingbot.core.data_type.common import TradeType
+from hummingbot.core.event.event_forwarder import EventForwarder
+from hummingbot.core.event.events import OrderBookEvent, OrderBookTradeEvent
+from hummingbot.core.network_iterator import NetworkStatus
+from hummingbot.data_feed.candles_feed.candles_base import CandlesBase
+from hummingbot.logger import HummingbotLogger
+
+if TYPE_CHECKING:
+    from hummingbot.connector.connector_base import ConnectorBase
+
+INTERVAL_UNITS_SECONDS = {"s": 1, "m": 60, "h": 60 * 60, "d": 24 * 60 * 60, "w": 7 * 24 * 60 * 60}
+
+
+def interval_to_seconds(interval: str) -> int:
+    """
+    Returns the duration of an interval like 5s, 15m, 4h, 1d or 1w in seconds
+    """
+    match = re.fullmatch(r"(\d+)([smhdw])", interval)
+    if match is None or int(match.group(1)) == 0:
+        raise ValueError(f"Invalid candles interval {interval}. The interval has to be a number followed by one of "
+                         f"the units {'|'.join(INTERVAL_UNITS_SECONDS)}.")
+    return int(match.group(1)) * INTERVAL_UNITS_SECONDS[match.group(2)]
+
+
+class TradesCandles(CandlesBase):
+    """
+    Candles built from the public trades received by the order book of a connector, without any request to the
+    exchange, so they are available for every connector and for any interval (including intervals of a few seconds).
+    Each candle has the open, high, low and close prices of the trades, their volume in base and quote assets, the
+    number of trades and the volume of the trades where the taker is the buyer. The intervals without trades get a
+    candle without volume at the close price of the previous one, when the next trade is received.
+    There are no historical candles, the candles are ready when max_records candles have been built since the start.
+    The trades older than the last candle are ignored.
+    """
+    _logger: Optional[HummingbotLogger] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._logger is None:
+            cls._logger = logging.getLogger(__name__)
+        return cls._logger
+
+    def __init__(self, connector: "ConnectorBase", trading_pair: str, interval: str = "1m", max_records: int = 150):
+        self._connector = connector
+        self._intervals = bidict({interval: interval_to_seconds(interval)})
+        self._interval_ms = self._intervals[interval] * 1000
+        self._trades_forwarder = EventForwarder(to_function=self._process_trade)
+        self._order_book = None
+        super().__init__(trading_pair, interval, max_records)
+
+    @property
+    def name(self):
+        return f"{self._connector.name}_trades_{self._trading_pair}"
+
+    @property
+    def rate_limits(self):
+        return []
+
+    @property
+    def intervals(self):
+        return self._intervals
+
+    async def check_network(self) -> NetworkStatus:
+        # The candles can be started as soon as the connector is tracking the order book of the trading pair
+        if self._trading_pair in self._connector.order_books:
+            return NetworkStatus.CONNECTED
+        return NetworkStatus.NOT_CONNECTED
+
+    async def start_network(self):
+        await self.stop_network()
+        self._order_book = self._connector.order_books[self._trading_pair]
+        self._order_book.add_listener(OrderBookEvent.TradeEvent, self._trades_forwarder)
+
+    async def stop_network(self):
+        if self._order_book is not None:
+            self._order_book.remove_listener(OrderBookEvent.TradeEvent, self._trades_forwarder)
+            self._order_book = None
+
+    def get_exchange_trading_pair(self, trading_pair):
+        return trading_pair
+
+    async def fetch_candles(self,
+                            start_time: Optional[int] = None,
+                            end_time: Optional[int] = None,
+                            limit: Optional[int] = 500):
+        return np.empty((0, len(self.columns)))
+
+    async def fill_historical_candles(self):
+        pass
+
+    def _process_trade(self, trade: OrderBookTradeEvent):
+        timestamp = int(trade.timestamp * 1000) // self._interval_ms * self._interval_ms
+        price = float(trade.price)
+        amount = float(trade.amount)
+        taker_buy_amount = amount if trade.type == TradeType.BUY else 0.0
+        if len(self._candles) > 0:
+            last_candle = self._candles[-1]
+            last_timestamp = last_candle[0]
+            if timestamp < last_timestamp:
+                return
+            if timestamp == last_timestamp:
+                self._add_candle(np.array([
+                    timestamp, last_candle[1], max(last_candle[2], price), min(last_candle[3], price), price,
+                    last_candle[5] + amount, last_candle[6] + price * amount, last_candle[7] + 1,
+                    last_candle[8] + taker_buy_amount, last_candle[9] + price * taker_buy_amount]))
+                return
+            # Candles without trades for the intervals since the last candle, only the ones kept in the buffer
+            close = last_candle[4]
+            first_empty_timestamp = max(last_timestamp + self._interval_ms,
+                                        timestamp - self._candles.maxlen * self._interval_ms)
+            for empty_timestamp in range(int(first_empty_timestamp), timestamp, self._interval_ms):
+                self._add_candle(np.array([empty_timestamp, close, close, close, close, 0, 0, 0, 0, 0]))
+        self._add_candle(np.array([timestamp, price, price, price, price, amount, price * amount, 1,
+                                   taker_buy_amount, price * taker_buy_amount]))
@@ -39,3 +39,19 @@ class StructLogger(HummingbotLogger):
                 kwargs["extra"] = extra
 
             self._log(EVENT_LOG_LEVEL, "", args, **kwargs)
+
+    def metric_log(self, dict_msg, *args, **kwargs):
+        if self.isEnabledFor(METRICS_LOG_LEVEL):
+            if not isinstance(dict_msg, dict):
+                self._log(logging.ERROR, "metric_log message must be of type dict.", extra={"do_not_send": True})
+                return
+            extra = {
+                "dict_msg": dict_msg,
+                "message_type": "metric"
+            }
+            if "extra" in kwargs:
+                kwargs["extra"].update(extra)
+            else:
+                kwargs["extra"] = extra
+
+            self._log(METRICS_LOG_LEVEL, "", args, **kwargs)
@@ -20,7 +20,7 @@ from commlib.node import Node, NodeState
 from commlib.transports.mqtt import ConnectionParameters as MQTTConnectionParameters
 
 from hummingbot.core.event import events
-from hummingbot.core.event.event_forwarder import SourceInfoEventForwarder
+from hummingbot.core.event.event_forwarder import AsyncSourceInfoEventForwarder
 from hummingbot.core.pubsub import PubSub
 from hummingbot.core.utils.async_utils import call_sync, safe_ensure_future
 from hummingbot.notifier.notifier_base import NotifierBase
@@ -345,8 +345,9 @@ class MQTTMarketEventForwarder:
         )
         self._topic = f'{topic_prefix}{TopicSpecs.MARKET_EVENTS}'
 
-        self._mqtt_fowarder: SourceInfoEventForwarder = \
-            SourceInfoEventForwarder(self._send_mqtt_event)
+        # The events are published outside of the connector code triggering them
+        self._mqtt_fowarder: AsyncSourceInfoEventForwarder = \
+            AsyncSourceInfoEventForwarder(self._send_mqtt_event, ev_loop=self._ev_loop)
         self._market_event_pairs: List[Tuple[int, EventListener]] = [
             (events.MarketEvent.BuyOrderCreated, self._mqtt_fowarder),
             (events.MarketEvent.BuyOrderCompleted, self._mqtt_fowarder),
@@ -0,0 +1,244 @@
+import heapq
+from typing import Any, Dict, List, Tuple
+
+import numpy as np
+import pandas as pd
+
+from hummingbot.core.data_type.common import PositionSide
+from hummingbot.smart_components.position_executor.data_types import PositionConfig, PositionExecutorStatus
+
+# Maximum number of candles compared at once, bounds the memory used by the barrier masks
+MAX_CHUNK_CELLS = 2_000_000
+
+TRADES_COLUMNS = ["timestamp", "close_timestamp", "side", "entry_price", "close_price", "amount", "pnl", "net_pnl",
+                  "net_pnl_quote", "status", "stop_loss", "take_profit", "time_limit"]
+
+
+class PositionBacktester:
+    """
+    Vectorized backtester of the PositionExecutor triple barrier logic (take profit, stop loss and time limit) over
+    historical candles, e.g. the candles_df of a candles feed with the timestamps in milliseconds.
+
+    The positions are opened at the close price of the candle of their signal (or at the entry price of their
+    position config), and the barriers are checked on the high and low prices of the next candles:
+    - the take profit closes the position at the take profit price (it's a limit order in the PositionExecutor)
+    - the stop loss closes the position at the stop loss price. When both barriers are crossed in the same candle the
+      stop loss is assumed to be hit first, since the order of the prices inside the candle is unknown
+    - the time limit closes the position at the close price of the last candle opened before the time limit
+    The positions whose time limit is after the last candle stay active and are valued at the last close price.
+
+    The barriers of all the positions are evaluated at once with NumPy, so the cost grows with the number of positions
+    times the number of candles of the time limit, instead of running the strategy one tick at a time.
+    """
+
+    def __init__(self, candles_df: pd.DataFrame, trade_cost: float = 0.0):
+        """
+        :param candles_df: the candles, with timestamp (milliseconds), high, low and close columns, sorted by timestamp
+        :param trade_cost: the fee of each order as a fraction of its amount, paid to open and to close the positions
+        """
+        self._timestamps: np.ndarray = candles_df["timestamp"].to_numpy(dtype=np.float64) / 1000
+        self._high: np.ndarray = candles_df["high"].to_numpy(dtype=np.float64)
+        self._low: np.ndarray = candles_df["low"].to_numpy(dtype=np.float64)
+        self._close: np.ndarray = candles_df["close"].to_numpy(dtype=np.float64)
+        self._trade_cost = trade_cost
+
+    def run_signals(self,
+                    signals: np.ndarray,
+                    order_amount_quote: float,
+                    stop_loss: float,
+                    take_profit: float,
+                    time_limit: int,
+                    max_executors: int = 1) -> pd.DataFrame:
+        """
+        Backtests the positions opened by a signal series, like the directional scripts do on each candle.
+        :param signals: one value per candle, a positive value opens a long position and a negative value a short one
+        :param order_amount_quote: the amount of each position in quote asset
+        :param stop_loss: the stop loss, as a fraction of the entry price
+        :param take_profit: the take profit, as a fraction of the entry price
+        :param time_limit: the time limit of the positions in seconds
+        :param max_executors: the maximum number of positions open at the same time, the signals received while the
+            maximum is reached are ignored
+        :return: the backtested positions (see TRADES_COLUMNS)
+        """
+        signals = np.asarray(signals, dtype=np.float64)
+        if len(signals) != len(self._close):
+            raise ValueError(f"The signals length ({len(signals)}) doesn't match the candles length "
+                             f"({len(self._close)}).")
+        entry_indexes = np.flatnonzero(np.nan_to_num(signals) != 0)
+        count = len(entry_indexes)
+        sides = np.sign(signals[entry_indexes])
+        entry_prices = self._close[entry_indexes]
+        positions = self._close_positions(entry_indexes=entry_indexes,
+                                          sides=sides,
+                                          entry_prices=entry_prices,
+                                          stop_losses=np.full(count, stop_loss, dtype=np.float64),
+                                          take_profits=np.full(count, take_profit, dtype=np.float64),
+                                          time_limits=np.full(count, time_limit, dtype=np.float64),
+                                          amounts=order_amount_quote / entry_prices)
+        selected = self._select_positions(entry_indexes, positions["close_index"], max_executors)
+        return self._trades_df({key: values[selected] for key, values in positions.items()})
+
+    def run_position_configs(self, position_configs: List[PositionConfig]) -> pd.DataFrame:
+        """
+        Backtests the positions that PositionExecutors would manage with the configs, each one opened at the candle
+        in progress at the config timestamp.
+        :return: the backtested positions (see TRADES_COLUMNS)
+        """
+        config_timestamps = np.array([config.timestamp for config in position_configs], dtype=np.float64)
+        entry_indexes = np.searchsorted(self._timestamps, config_timestamps, side="right") - 1
+        if np.any(entry_indexes < 0):
+            raise ValueError("The position configs can't start before the first candle.")
+        entry_prices = np.array([float(config.entry_price) if config.entry_price else self._close[entry_index]
+                                 for config, entry_index in zip(position_configs, entry_indexes)], dtype=np.float64)
+        positions = self._close_positions(
+            entry_indexes=entry_indexes,
+            sides=np.array([1.0 if config.side == PositionSide.LONG else -1.0 for config in position_configs]),
+            entry_prices=entry_prices,
+            stop_losses=np.array([float(config.stop_loss) for config in position_configs], dtype=np.float64),
+            take_profits=np.array([float(config.take_profit) for config in position_configs], dtype=np.float64),
+            time_limits=np.array([config.time_limit for config in position_configs], dtype=np.float64),
+            amounts=np.array([float(config.amount) for config in position_configs], dtype=np.float64),
+            entry_timestamps=config_timestamps,
+        )
+        return self._trades_df(positions)
+
+    @staticmethod
+    def summary(trades: pd.DataFrame) -> Dict[str, Any]:
+        """
+        Returns the performance of the backtested positions
+        """
+        net_pnl_quote = trades["net_pnl_quote"].to_numpy(dtype=np.float64)
+        cumulative_pnl = np.cumsum(net_pnl_quote)
+        drawdowns = np.maximum.accumulate(np.concatenate(([0.0], cumulative_pnl)))[1:] - cumulative_pnl
+        statuses = trades["status"]
+        return {
+            "positions": len(trades),
+            "net_pnl_quote": float(cumulative_pnl[-1]) if len(trades) else 0.0,
+            "net_pnl": float(trades["net_pnl"].sum()),
+            "accuracy": float(np.mean(net_pnl_quote > 0)) if len(trades) else 0.0,
+            "max_drawdown_quote": float(drawdowns.max()) if len(trades) else 0.0,
+            "take_profits": int((statuses == PositionExecutorStatus.CLOSED_BY_TAKE_PROFIT).sum()),
+            "stop_losses": int((statuses == PositionExecutorStatus.CLOSED_BY_STOP_LOSS).sum()),
+            "time_limits": int((statuses == PositionExecutorStatus.CLOSED_BY_TIME_LIMIT).sum()),
+        }
+
+    def _close_positions(self,
+                         entry_indexes: np.ndarray,
+                         sides: np.ndarray,
+                         entry_prices: np.ndarray,
+                         stop_losses: np.ndarray,
+                         take_profits: np.ndarray,
+                         time_limits: np.ndarray,
+                         amounts: np.ndarray,
+                         entry_timestamps: np.ndarray = None) -> Dict[str, np.ndarray]:
+        if entry_timestamps is None:
+            entry_timestamps = self._timestamps[entry_indexes]
+        if len(entry_indexes) == 0:
+            return {column: np.empty(0) for column in TRADES_COLUMNS + ["close_index"]}
+        end_timestamps = entry_timestamps + time_limits
+        # Last candle opened before the time limit of each position
+        last_indexes = np.maximum(np.searchsorted(self._timestamps, end_timestamps, side="right") - 1, entry_indexes)
+        take_profit_prices = entry_prices * (1 + sides * take_profits)
+        stop_loss_prices = entry_prices * (1 - sides * stop_losses)
+        is_long = sides > 0
+
+        count = len(entry_indexes)
+        close_indexes = last_indexes.copy()
+        close_prices = self._close[last_indexes]
+        statuses = np.where(end_timestamps <= self._timestamps[-1],
+                            PositionExecutorStatus.CLOSED_BY_TIME_LIMIT.value,
+                            PositionExecutorStatus.ACTIVE_POSITION.value)
+
+        window = int(np.max(last_indexes - entry_indexes))
+        if window > 0:
+            offsets = np.arange(1, window + 1)
+            chunk_size = max(1, MAX_CHUNK_CELLS // window)
+            for start in range(0, count, chunk_size):
+                chunk = slice(start, start + chunk_size)
+                candle_indexes = entry_indexes[chunk, None] + offsets
+                in_window = candle_indexes <= last_indexes[chunk, None]
+                candle_indexes = np.minimum(candle_indexes, len(self._close) - 1)
+                high = self._high[candle_indexes]
+                low = self._low[candle_indexes]
+                long = is_long[chunk, None]
+                take_profit_hits = in_window & np.where(long,
+                                                        high >= take_profit_prices[chunk, None],
+                                                        low <= take_profit_prices[chunk, None])
+                stop_loss_hits = in_window & np.where(long,
+                                                      low <= stop_loss_prices[chunk, None],
+                                                      high >= stop_loss_prices[chunk, None])
+                first_take_profit = np.where(take_profit_hits.any(axis=1), take_profit_hits.argmax(axis=1), window)
+                first_stop_loss = np.where(stop_loss_hits.any(axis=1), stop_loss_hits.argmax(axis=1), window)
+
+                stop_loss_hit = first_stop_loss < window
+                stop_loss_first = stop_loss_hit & (first_stop_loss <= first_take_profit)
+                take_profit_first = ~stop_loss_first & (first_take_profit < window)
+                chunk_entry_indexes = entry_indexes[chunk]
+
+                chunk_close_indexes = close_indexes[chunk]
+                chunk_close_prices = close_prices[chunk]
+                chunk_statuses = statuses[chunk]
+                chunk_close_indexes[stop_loss_first] = chunk_entry_indexes[stop_loss_first] + 1 + \
+                    first_stop_loss[stop_loss_first]
+                chunk_close_prices[stop_loss_first] = stop_loss_prices[chunk][stop_loss_first]
+                chunk_statuses[stop_loss_first] = PositionExecutorStatus.CLOSED_BY_STOP_LOSS.value
+                chunk_close_indexes[take_profit_first] = chunk_entry_indexes[take_profit_first] + 1 + \
+                    first_take_profit[take_profit_first]
+                chunk_close_prices[take_profit_first] = take_profit_prices[chunk][take_profit_first]
+                chunk_statuses[take_profit_first] = PositionExecutorStatus.CLOSED_BY_TAKE_PROFIT.value
+
+        pnl = sides * (close_prices - entry_prices) / entry_prices
+        net_pnl = pnl - 2 * self._trade_cost
+        # The PositionExecutor closes the positions as soon as the time limit is reached, the barriers are hit
+        # sometime during the candle
+        close_timestamps = np.where(statuses == PositionExecutorStatus.CLOSED_BY_TIME_LIMIT.value,
+                                    end_timestamps,
+                                    self._timestamps[close_indexes])
+        return {
+            "timestamp": entry_timestamps,
+            "close_timestamp": np.where(statuses == PositionExecutorStatus.ACTIVE_POSITION.value, np.nan,
+                                        close_timestamps),
+            "side": sides,
+            "entry_price": entry_prices,
+            "close_price": close_prices,
+            "amount": amounts,
+            "pnl": pnl,
+            "net_pnl": net_pnl,
+            "net_pnl_quote": net_pnl * amounts * entry_prices,
+            "status": statuses,
+            "stop_loss": stop_losses,
+            "take_profit": take_profits,
+            "time_limit": time_limits,
+            "close_index": close_indexes,
+        }
+
+    @staticmethod
+    def _select_positions(entry_indexes: np.ndarray, close_indexes: np.ndarray, max_executors: int) -> np.ndarray:
+        # The positions can't be selected independently, a signal only opens a position if there are less than
+        # max_executors positions still open at its candle
+        open_positions: List[int] = []
+        selected: List[int] = []
+        for position, (entry_index, close_index) in enumerate(zip(entry_indexes.tolist(), close_indexes.tolist())):
+            while open_positions and open_positions[0] <= entry_index:
+                heapq.heappop(open_positions)
+            if len(open_positions) < max_executors:
+                selected.append(position)
+                heapq.heappush(open_positions, close_index)
+        return np.array(selected, dtype=np.int64)
+
+    @staticmethod
+    def _trades_df(positions: Dict[str, np.ndarray]) -> pd.DataFrame:
+        trades = pd.DataFrame({column: positions[column] for column in TRADES_COLUMNS})
+        trades["side"] = [PositionSide.LONG if side > 0 else PositionSide.SHORT for side in positions["side"]]
+        trades["status"] = [PositionExecutorStatus(status) for status in positions["status"]]
+        return trades
+
+
+def backtest_signals(candles_df: pd.DataFrame, signals: np.ndarray, trade_cost: float = 0.0,
+                     **position_params) -> Tuple[pd.DataFrame, Dict[str, Any]]:
+    """
+    Shortcut backtesting a signal series with PositionBacktester.run_signals, returns the positions and their summary
+    """
+    backtester = PositionBacktester(candles_df=candles_df, trade_cost=trade_cost)
+    trades = backtester.run_signals(signals=signals, **position_params)
+    return trades, backtester.summary(trades)
@@ -1,11 +1,20 @@
 import numpy as np
 import logging
+from libc.math cimport isnan, sqrt
 cimport numpy as np
 
 
 pmm_logger = None
+# Short buffers would otherwise recompute their statistics very often
+DEF MIN_UPDATES_BETWEEN_RECOMPUTES = 1000
 
 cdef class RingBuffer:
+    """
+    Fixed length buffer of the last values added, with their mean, variance and standard deviation maintained in O(1)
+    per value (Welford's algorithm over the sliding window). The statistics are recomputed from the values when the
+    buffer gets full, then once per buffer length (at least 1000 values) to discard the accumulated rounding errors,
+    and when a NaN value enters or leaves the buffer.
+    """
     @classmethod
     def logger(cls):
         global pmm_logger
@@ -18,19 +27,56 @@ cdef class RingBuffer:
         self._buffer = np.zeros(length, dtype=np.float64)
         self._delimiter = 0
         self._is_full = False
+        self._mean = 0
+        self._m2 = 0
+        self._updates_since_recompute = 0
 
     def __dealloc__(self):
         self._buffer = None
 
     cdef void c_add_value(self, float val):
-        self._buffer[self._delimiter] = val
+        cdef:
+            double new_value = val
+            double old_value
+            double old_mean = self._mean
+            int64_t size
+            bint was_full
+        if self._is_full:
+            old_value = self._buffer[self._delimiter]
+            self._mean += (new_value - old_value) / self._length
+            self._m2 += (new_value - old_value) * (new_value - self._mean + old_value - old_mean)
+        else:
+            old_value = 0
+            size = self._delimiter + 1
+            self._mean += (new_value - old_mean) / size
+            self._m2 += (new_value - old_mean) * (new_value - self._mean)
+        self._buffer[self._delimiter] = new_value
+        was_full = self._is_full
         self.c_increment_delimiter()
+        self._updates_since_recompute += 1
+        if ((self._is_full and not was_full)
+                or self._updates_since_recompute >= max(self._length, MIN_UPDATES_BETWEEN_RECOMPUTES)
+                or isnan(new_value) or isnan(old_value)):
+            self.c_recompute_statistics()
 
     cdef void c_increment_delimiter(self):
         self._delimiter = (self._delimiter + 1) % self._length
         if not self._is_full and self._delimiter == 0:
             self._is_full = True
 
+    cdef void c_recompute_statistics(self):
+        cdef np.ndarray[np.double_t, ndim=1] values = self.c_get_as_numpy_array()
+        self._updates_since_recompute = 0
+        if values.size == 0:
+            self._mean = 0
+            self._m2 = 0
+        else:
+            self._mean = np.mean(values)
+            self._m2 = np.var(values) * values.size
+
+    cdef int64_t c_size(self):
+        return self._length if self._is_full else self._delimiter
+
     cdef bint c_is_empty(self):
         return (not self._is_full) and (0==self._delimiter)
 
@@ -45,36 +91,47 @@ cdef class RingBuffer:
     cdef double c_mean_value(self):
         result = np.nan
         if self._is_full:
-            result=np.mean(self.c_get_as_numpy_array())
+            result = self._mean
         return result
 
     cdef double c_variance(self):
         result = np.nan
         if self._is_full:
-            result = np.var(self.c_get_as_numpy_array())
+            result = max(self._m2 / self._length, 0)
         return result
 
     cdef double c_std_dev(self):
         result = np.nan
         if self._is_full:
-            result = np.std(self.c_get_as_numpy_array())
+            result = sqrt(self.c_variance())
         return result
 
-    cdef np.ndarray[np.double_t, ndim=1] c_get_as_numpy_array(self):
-        cdef np.ndarray[np.int16_t, ndim=1] indexes
-
-        if not self._is_full:
-            indexes = np.arange(0, stop=self._delimiter, dtype=np.int16)
+    cdef tuple c_get_segments(self):
+        cdef np.ndarray buffer = np.asarray(self._buffer)
+        cdef np.ndarray older
+        cdef np.ndarray newer
+        if self._is_full:
+            older = buffer[self._delimiter:]
+            newer = buffer[:self._delimiter]
         else:
-            indexes = np.arange(self._delimiter, stop=self._delimiter + self._length,
-                                dtype=np.int16) % self._length
-        return np.asarray(self._buffer)[indexes]
+            older = buffer[:self._delimiter]
+            newer = buffer[:0]
+        older.flags.writeable = False
+        newer.flags.writeable = False
+        return older, newer
+
+    cdef np.ndarray[np.double_t, ndim=1] c_get_as_numpy_array(self):
+        cdef tuple segments = self.c_get_segments()
+        return np.concatenate(segments)
 
     def __init__(self, length):
         self._length = length
         self._buffer = np.zeros(length, dtype=np.double)
         self._delimiter = 0
         self._is_full = False
+        self._mean = 0
+        self._m2 = 0
+        self._updates_since_recompute = 0
 
     def add_value(self, val):
         self.c_add_value(val)
@@ -82,6 +139,14 @@ cdef class RingBuffer:
     def get_as_numpy_array(self):
         return self.c_get_as_numpy_array()
 
+    def get_segments(self):
+        """
+        Returns the values from the oldest to the newest one as two read only views of the buffer (the older values
+        and the newer ones, the second one is empty until the buffer is full), without copying them. The views are
+        overwritten by the values added afterwards.
+        """
+        return self.c_get_segments()
+
     def get_last_value(self):
         return self.c_get_last_value()
 
@@ -89,6 +154,10 @@ cdef class RingBuffer:
     def is_full(self):
         return self.c_is_full()
 
+    @property
+    def size(self) -> int:
+        return self.c_size()
+
     @property
     def mean_value(self):
         return self.c_mean_value()
@@ -113,6 +182,9 @@ cdef class RingBuffer:
         self._buffer = np.zeros(value, dtype=np.float64)
         self._delimiter = 0
         self._is_full = False
+        self._mean = 0
+        self._m2 = 0
+        self._updates_since_recompute = 0
 
         for val in data[-value:]:
             self.add_value(val)
@@ -49,9 +49,25 @@ class BaseTrailingIndicator(ABC):
     def is_processing_buffer_full(self) -> bool:
         return self._processing_buffer.is_full
 
+    def _oldest_samples(self, count: int) -> np.ndarray:
+        """
+        Returns the `count` oldest values of the sampling buffer (e.g. the ones leaving the buffer when it's full),
+        without copying the buffer.
+        """
+        older, newer = self._sampling_buffer.get_segments()
+        if older.size >= count:
+            return older[:count]
+        return np.concatenate((older, newer[:count - older.size]))
+
+    def _sampling_buffer_resized(self):
+        """
+        Called when the length of the sampling buffer changes, for the indicators keeping a state computed from it
+        """
+        pass
+
     @property
     def is_sampling_buffer_changed(self) -> bool:
-        buffer_len = len(self._sampling_buffer.get_as_numpy_array())
+        buffer_len = self._sampling_buffer.size
         is_changed = self._samples_length != buffer_len
         self._samples_length = buffer_len
         return is_changed
@@ -63,6 +79,7 @@ class BaseTrailingIndicator(ABC):
     @sampling_length.setter
     def sampling_length(self, value):
         self._sampling_buffer.length = value
+        self._sampling_buffer_resized()
 
     @property
     def processing_length(self) -> int:
@@ -1,17 +1,51 @@
-from base_trailing_indicator import BaseTrailingIndicator
-import pandas as pd
+import math
+
+import numpy as np
+
+from .base_trailing_indicator import BaseTrailingIndicator
 
 
 class ExponentialMovingAverageIndicator(BaseTrailingIndicator):
+    """
+    Adjusted exponential moving average of the samples of the sampling buffer, with span = sampling length (as
+    pandas ewm(span=sampling_length, adjust=True) over the buffer). The weighted sum of the samples is updated in
+    O(1) with each sample, and recomputed from the buffer once per sampling length to discard the accumulated
+    rounding errors.
+    """
+
     def __init__(self, sampling_length: int = 30, processing_length: int = 1):
         if processing_length != 1:
             raise Exception("Exponential moving average processing_length should be 1")
         super().__init__(sampling_length, processing_length)
+        self._decay = 1 - 2 / (sampling_length + 1)
+        self._weighted_sum = 0.0
+        self._samples_since_recompute = 0
+        self._removed_sample = 0.0
+
+    def add_sample(self, value: float):
+        self._removed_sample = 0.0
+        if self._sampling_buffer.is_full:
+            self._removed_sample = self._oldest_samples(1)[0]
+        super().add_sample(value)
 
     def _indicator_calculation(self) -> float:
-        ema = pd.Series(self._sampling_buffer.get_as_numpy_array())\
-            .ewm(span=self._sampling_length, adjust=True).mean()
-        return ema[-1]
+        length = self._sampling_buffer.length
+        self._samples_since_recompute += 1
+        self._weighted_sum = (self._sampling_buffer.get_last_value() + self._decay * self._weighted_sum
+                              - self._decay ** length * self._removed_sample)
+        if self._samples_since_recompute >= length or math.isnan(self._weighted_sum):
+            self._recompute_weighted_sum()
+        size = self._sampling_buffer.size
+        return self._weighted_sum * (1 - self._decay) / (1 - self._decay ** size)
 
     def _processing_calculation(self) -> float:
         return self._processing_buffer.get_last_value()
+
+    def _sampling_buffer_resized(self):
+        self._decay = 1 - 2 / (self._sampling_buffer.length + 1)
+        self._recompute_weighted_sum()
+
+    def _recompute_weighted_sum(self):
+        samples = self._sampling_buffer.get_as_numpy_array()
+        self._weighted_sum = float(np.dot(self._decay ** np.arange(samples.size)[::-1], samples))
+        self._samples_since_recompute = 0
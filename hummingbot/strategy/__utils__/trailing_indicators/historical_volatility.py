@@ -1,18 +1,65 @@
-from .base_trailing_indicator import BaseTrailingIndicator
+import math
+
 import numpy as np
 
+from .base_trailing_indicator import BaseTrailingIndicator
+
 
 class HistoricalVolatilityIndicator(BaseTrailingIndicator):
+    """
+    Variance of the log returns of the samples. The sum and the sum of squares of the log returns of the sampling
+    buffer (shifted by their mean at the last recompute, to keep the variance accurate) are updated in O(1) with each
+    sample, and recomputed from the buffer once per sampling length to discard the accumulated rounding errors.
+    """
+
     def __init__(self, sampling_length: int = 30, processing_length: int = 15):
         super().__init__(sampling_length, processing_length)
+        self._shift = 0.0
+        self._returns_sum = 0.0
+        self._returns_sum_sq = 0.0
+        self._samples_since_recompute = 0
+        self._previous_sample = math.nan
+        self._removed_return = 0.0
+
+    def add_sample(self, value: float):
+        self._previous_sample = self._sampling_buffer.get_last_value()
+        self._removed_return = math.nan
+        if self._sampling_buffer.is_full and self._sampling_buffer.length > 1:
+            oldest = self._oldest_samples(2)
+            self._removed_return = float(np.log(oldest[1]) - np.log(oldest[0]))
+        super().add_sample(value)
 
     def _indicator_calculation(self) -> float:
-        prices = self._sampling_buffer.get_as_numpy_array()
-        if prices.size > 0:
-            log_returns = np.diff(np.log(prices))
-            return np.var(log_returns)
+        self._samples_since_recompute += 1
+        if not math.isnan(self._previous_sample):
+            self._add_return(float(np.log(self._sampling_buffer.get_last_value()) - np.log(self._previous_sample)), 1)
+        if not math.isnan(self._removed_return):
+            self._add_return(self._removed_return, -1)
+        if (self._samples_since_recompute >= self._sampling_buffer.length
+                or math.isnan(self._returns_sum) or math.isnan(self._returns_sum_sq)):
+            self._recompute_sums()
+        returns_count = self._sampling_buffer.size - 1
+        if returns_count < 1:
+            return math.nan
+        mean = self._returns_sum / returns_count
+        return max(self._returns_sum_sq / returns_count - mean * mean, 0.0)
 
     def _processing_calculation(self) -> float:
         processing_array = self._processing_buffer.get_as_numpy_array()
         if processing_array.size > 0:
             return np.sqrt(np.mean(np.nan_to_num(processing_array)))
+
+    def _sampling_buffer_resized(self):
+        self._recompute_sums()
+
+    def _add_return(self, log_return: float, sign: int):
+        shifted_return = log_return - self._shift
+        self._returns_sum += sign * shifted_return
+        self._returns_sum_sq += sign * shifted_return * shifted_return
+
+    def _recompute_sums(self):
+        log_returns = np.diff(np.log(self._sampling_buffer.get_as_numpy_array()))
+        self._shift = float(np.mean(log_returns)) if log_returns.size > 0 else 0.0
+        self._returns_sum = float(np.sum(log_returns - self._shift))
+        self._returns_sum_sq = float(np.sum(np.square(log_returns - self._shift)))
+        self._samples_since_recompute = 0
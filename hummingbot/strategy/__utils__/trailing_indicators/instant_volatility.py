@@ -1,19 +1,51 @@
-from .base_trailing_indicator import BaseTrailingIndicator
+import math
+
 import numpy as np
 
+from .base_trailing_indicator import BaseTrailingIndicator
+
 
 class InstantVolatilityIndicator(BaseTrailingIndicator):
+    """
+    Volatility between consecutive samples. The sum of the squared differences between the consecutive samples of the
+    sampling buffer is updated in O(1) with each sample, and recomputed from the buffer once per sampling length to
+    discard the accumulated rounding errors.
+    """
+
     def __init__(self, sampling_length: int = 30, processing_length: int = 15):
         super().__init__(sampling_length, processing_length)
+        self._sum_squared_diffs = 0.0
+        self._samples_since_recompute = 0
+        self._previous_sample = math.nan
+        self._removed_squared_diff = 0.0
+
+    def add_sample(self, value: float):
+        self._previous_sample = self._sampling_buffer.get_last_value()
+        self._removed_squared_diff = 0.0
+        if self._sampling_buffer.is_full and self._sampling_buffer.length > 1:
+            oldest = self._oldest_samples(2)
+            self._removed_squared_diff = (oldest[1] - oldest[0]) ** 2
+        super().add_sample(value)
 
     def _indicator_calculation(self) -> float:
         # The standard deviation should be calculated between ticks and not with a mean of the whole buffer
         # Otherwise if the asset is trending, changing the length of the buffer would result in a greater volatility as more ticks would be further away from the mean
         # which is a nonsense result. If volatility of the underlying doesn't change in fact, changing the length of the buffer shouldn't change the result.
-        np_sampling_buffer = self._sampling_buffer.get_as_numpy_array()
-        vol = np.sqrt(np.sum(np.square(np.diff(np_sampling_buffer))) / np_sampling_buffer.size)
-        return vol
+        self._samples_since_recompute += 1
+        if not math.isnan(self._previous_sample):
+            self._sum_squared_diffs += (self._sampling_buffer.get_last_value() - self._previous_sample) ** 2
+        self._sum_squared_diffs -= self._removed_squared_diff
+        if self._samples_since_recompute >= self._sampling_buffer.length or math.isnan(self._sum_squared_diffs):
+            self._recompute_sum()
+        return np.sqrt(max(self._sum_squared_diffs, 0.0) / self._sampling_buffer.size)
 
     def _processing_calculation(self) -> float:
         # Only the last calculated volatlity, not an average of multiple past volatilities
         return self._processing_buffer.get_last_value()
+
+    def _sampling_buffer_resized(self):
+        self._recompute_sum()
+
+    def _recompute_sum(self):
+        self._sum_squared_diffs = float(np.sum(np.square(np.diff(self._sampling_buffer.get_as_numpy_array()))))
+        self._samples_since_recompute = 0
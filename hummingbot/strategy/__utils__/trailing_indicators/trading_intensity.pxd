@@ -20,10 +20,27 @@ cdef class TradingIntensityIndicator:
         list _last_quotes
         int _sampling_length
         int _samples_length
+        dict _price_levels_amount
+        dict _price_levels_trades_count
+        double _sum_levels
+        double _sum_squared_levels
+        double _sum_log_amounts
+        double _sum_levels_log_amounts
+        int _estimates_since_recompute
+        bint _is_samples_changed
+        bint _is_fitted
+        object _fit_future
+        bint _fit_in_background
 
     cdef c_calculate(self, timestamp)
     cdef c_register_trade(self, object trade)
+    cdef c_update_price_level(self, object price_level, object amount, int trades_count)
+    cdef c_add_log_linear_term(self, double price_level, double amount, int sign)
+    cdef c_recompute_log_linear_sums(self)
+    cdef tuple c_log_linear_estimate(self)
     cdef c_estimate_intensity(self)
+    cdef c_collect_fit(self)
+    cdef c_publish_fit(self, tuple params)
 
 cdef class TradesForwarder(EventListener):
     cdef:
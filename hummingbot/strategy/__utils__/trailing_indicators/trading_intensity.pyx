@@ -2,13 +2,15 @@
 # distutils: sources=hummingbot/core/cpp/OrderBookEntry.cpp
 
 import warnings
-from decimal import Decimal
-from typing import Tuple
+from typing import List, Tuple
+
+from libc.math cimport exp, log
 
 import numpy as np
 from scipy.optimize import curve_fit
 from scipy.optimize import OptimizeWarning
 
+from hummingbot import get_executor
 from hummingbot.core.data_type.common import (
     PriceType,
 )
@@ -17,6 +19,9 @@ from hummingbot.core.event.event_listener cimport EventListener
 from hummingbot.core.event.events import OrderBookEvent
 from hummingbot.strategy.asset_price_delegate import AssetPriceDelegate
 
+# Amount used for the price levels without volume to be able to calculate log
+DEF MIN_AMOUNT = 1e-10
+
 cdef class TradesForwarder(EventListener):
     def __init__(self, indicator: 'TradingIntensityIndicator'):
         self._indicator = indicator
@@ -26,8 +31,25 @@ cdef class TradesForwarder(EventListener):
 
 
 cdef class TradingIntensityIndicator:
-
-    def __init__(self, order_book: OrderBook, price_delegate: AssetPriceDelegate, sampling_length: int = 30):
+    """
+    Estimates the alpha and kappa of the trading intensity alpha * exp(-kappa * price_level), where the price level is
+    the distance of the trades to the mid price, from the amounts traded at each price level in the last
+    sampling_length samples.
+    The amounts per price level are consolidated as the trades are received and removed when their sample leaves the
+    window, together with the sums of a log-linear least squares fit that gives a first estimate right away. The
+    nonlinear fit is warm-started with the last estimate. In live trading it runs in the shared executor and its result
+    is published on the next calculate, so the event loop never waits for it. In back tests it runs in calculate, so
+    that the estimates used at each simulated tick don't depend on the thread scheduling.
+    """
+
+    def __init__(self,
+                 order_book: OrderBook,
+                 price_delegate: AssetPriceDelegate,
+                 sampling_length: int = 30,
+                 fit_in_background: bool = False):
+        """
+        :param fit_in_background: runs the nonlinear fit out of the event loop, only for the clocks in real time
+        """
         self._alpha = 0
         self._kappa = 0
         self._trade_samples = {}
@@ -39,6 +61,17 @@ cdef class TradingIntensityIndicator:
         self._sampling_length = sampling_length
         self._samples_length = 0
         self._last_quotes = []
+        self._price_levels_amount = {}
+        self._price_levels_trades_count = {}
+        self._sum_levels = 0
+        self._sum_squared_levels = 0
+        self._sum_log_amounts = 0
+        self._sum_levels_log_amounts = 0
+        self._estimates_since_recompute = 0
+        self._is_samples_changed = False
+        self._is_fitted = False
+        self._fit_future = None
+        self._fit_in_background = fit_in_background
 
         warnings.simplefilter("ignore", OptimizeWarning)
 
@@ -83,6 +116,9 @@ cdef class TradingIntensityIndicator:
         # Descending order of price-timestamp quotes
         self._last_quotes = [{'timestamp': timestamp, 'price': price}] + self._last_quotes
 
+        # Publish the result of the background fit, if it finished since the last tick
+        self.c_collect_fit()
+
         latest_processed_quote_idx = None
         for trade in self._current_trade_sample:
             for i, quote in enumerate(self._last_quotes):
@@ -95,6 +131,7 @@ cdef class TradingIntensityIndicator:
                         self._trade_samples[quote["timestamp"] + 1] = []
 
                     self._trade_samples[quote["timestamp"] + 1] += [trade]
+                    self.c_update_price_level(trade["price_level"], trade["amount"], 1)
                     break
 
         # THere are no trades left to process
@@ -106,12 +143,11 @@ cdef class TradingIntensityIndicator:
         if len(self._trade_samples.keys()) > self._sampling_length:
             timestamps = list(self._trade_samples.keys())
             timestamps.sort()
-            timestamps = timestamps[-self._sampling_length:]
 
-            trade_samples = {}
-            for timestamp in timestamps:
-                trade_samples[timestamp] = self._trade_samples[timestamp]
-            self._trade_samples = trade_samples
+            # Remove the trades of the samples leaving the window from the consolidated price levels
+            for timestamp in timestamps[:-self._sampling_length]:
+                for trade in self._trade_samples.pop(timestamp):
+                    self.c_update_price_level(trade["price_level"], -trade["amount"], -1)
 
         if self.is_sampling_buffer_full:
             self.c_estimate_intensity()
@@ -120,47 +156,130 @@ cdef class TradingIntensityIndicator:
         """A helper method to be used in unit tests"""
         self.c_register_trade(trade)
 
+    def wait_for_fit(self):
+        """A helper method to be used in unit tests, blocks until the background fit is done and publishes its result"""
+        if self._fit_future is not None:
+            self._fit_future.result()
+            self.c_collect_fit()
+
     cdef c_register_trade(self, object trade):
         self._current_trade_sample.append(trade)
 
+    cdef c_update_price_level(self, object price_level, object amount, int trades_count):
+        """
+        Adds the amount (negative for the trades leaving the window) to the consolidated amount of the price level,
+        keeping the sums of the log-linear regression of the amounts on the price levels up to date
+        """
+        cdef:
+            double level = float(price_level)
+            int new_trades_count = self._price_levels_trades_count.get(price_level, 0) + trades_count
+            double new_amount
+
+        if price_level in self._price_levels_trades_count:
+            self.c_add_log_linear_term(level, self._price_levels_amount[price_level], -1)
+        if new_trades_count == 0:
+            del self._price_levels_trades_count[price_level]
+            del self._price_levels_amount[price_level]
+        else:
+            new_amount = self._price_levels_amount.get(price_level, 0) + float(amount)
+            self._price_levels_trades_count[price_level] = new_trades_count
+            self._price_levels_amount[price_level] = new_amount
+            self.c_add_log_linear_term(level, new_amount, 1)
+        self._is_samples_changed = True
+
+    cdef c_add_log_linear_term(self, double price_level, double amount, int sign):
+        # Adjust to be able to calculate log
+        cdef double log_amount = log(amount if amount > 0 else MIN_AMOUNT)
+
+        self._sum_levels += sign * price_level
+        self._sum_squared_levels += sign * price_level * price_level
+        self._sum_log_amounts += sign * log_amount
+        self._sum_levels_log_amounts += sign * price_level * log_amount
+
+    cdef c_recompute_log_linear_sums(self):
+        self._sum_levels = 0
+        self._sum_squared_levels = 0
+        self._sum_log_amounts = 0
+        self._sum_levels_log_amounts = 0
+        for price_level, amount in self._price_levels_amount.items():
+            self.c_add_log_linear_term(price_level, amount, 1)
+        self._estimates_since_recompute = 0
+
+    cdef tuple c_log_linear_estimate(self):
+        """
+        Returns the (alpha, kappa) of the least squares fit of log(amount) = log(alpha) - kappa * price_level, or None if
+        there are not enough price levels
+        """
+        cdef:
+            int n = len(self._price_levels_amount)
+            double denominator
+            double slope
+
+        if n < 2:
+            return None
+        # Recompute the sums from the price levels once per sampling length to bound the float error accumulation
+        self._estimates_since_recompute += 1
+        if self._estimates_since_recompute >= self._sampling_length:
+            self.c_recompute_log_linear_sums()
+        denominator = n * self._sum_squared_levels - self._sum_levels * self._sum_levels
+        if denominator <= 0:
+            return None
+        slope = (n * self._sum_levels_log_amounts - self._sum_levels * self._sum_log_amounts) / denominator
+        return exp((self._sum_log_amounts - slope * self._sum_levels) / n), max(-slope, 0)
+
     cdef c_estimate_intensity(self):
         cdef:
-            dict trades_consolidated
-            list lambdas
             list price_levels
+            list lambdas
+            tuple initial_estimate
 
-        # Calculate lambdas / trading intensities
-        lambdas = []
-
-        trades_consolidated = {}
-        price_levels = []
-        for timestamp in self._trade_samples.keys():
-            tick = self._trade_samples[timestamp]
-            for trade in tick:
-                if trade['price_level'] not in trades_consolidated.keys():
-                    trades_consolidated[trade['price_level']] = 0
-                    price_levels += [trade['price_level']]
-
-                trades_consolidated[trade['price_level']] += trade['amount']
-
-        price_levels = sorted(price_levels, reverse=True)
+        self.c_collect_fit()
+        if not self._is_samples_changed or self._fit_future is not None:
+            # The trades received while a fit is running are included in the next one
+            return
+        self._is_samples_changed = False
 
-        for price_level in price_levels:
-            lambdas += [trades_consolidated[price_level]]
+        initial_estimate = self.c_log_linear_estimate()
+        if initial_estimate is not None and not self._is_fitted:
+            # The log-linear estimate is available right away, the nonlinear fit refines it when it is done
+            self._alpha, self._kappa = initial_estimate
 
-        # Adjust to be able to calculate log
-        lambdas_adj = [10**-10 if x==0 else x for x in lambdas]
+        price_levels = sorted(self._price_levels_amount.keys(), reverse=True)
+        lambdas = [self._price_levels_amount[price_level] for price_level in price_levels]
 
         # Fit the probability density function; reuse previously calculated parameters as initial values
-        try:
-            params = curve_fit(lambda t, a, b: a*np.exp(-b*t),
-                               price_levels,
-                               lambdas_adj,
-                               p0=(self._alpha, self._kappa),
-                               method='dogbox',
-                               bounds=([0, 0], [np.inf, np.inf]))
-
-            self._kappa = Decimal(str(params[0][1]))
-            self._alpha = Decimal(str(params[0][0]))
-        except (RuntimeError, ValueError) as e:
-            pass
+        if self._fit_in_background:
+            self._fit_future = get_executor().submit(_fit_intensity, price_levels, lambdas, (self._alpha, self._kappa))
+        else:
+            self.c_publish_fit(_fit_intensity(price_levels, lambdas, (self._alpha, self._kappa)))
+
+    cdef c_collect_fit(self):
+        if self._fit_future is None or not self._fit_future.done():
+            return
+        params = self._fit_future.result()
+        self._fit_future = None
+        self.c_publish_fit(params)
+
+    cdef c_publish_fit(self, tuple params):
+        if params is not None:
+            self._alpha, self._kappa = params
+            self._is_fitted = True
+
+
+def _fit_intensity(price_levels: List[float], lambdas: List[float], p0: Tuple[float, float]):
+    """
+    Fits alpha * exp(-kappa * price_level) to the amounts traded at each price level, returns (alpha, kappa) or None if
+    the fit fails
+    """
+    # Adjust to be able to calculate log
+    lambdas_adj = [MIN_AMOUNT if x == 0 else x for x in lambdas]
+    try:
+        params = curve_fit(lambda t, a, b: a*np.exp(-b*t),
+                           price_levels,
+                           lambdas_adj,
+                           p0=p0,
+                           method='dogbox',
+                           bounds=([0, 0], [np.inf, np.inf]))
+        return float(params[0][0]), float(params[0][1])
+    except (RuntimeError, ValueError):
+        return None
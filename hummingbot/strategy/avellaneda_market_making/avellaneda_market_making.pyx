@@ -12,6 +12,7 @@ import pandas as pd
 from hummingbot.connector.exchange_base import ExchangeBase
 from hummingbot.connector.exchange_base cimport ExchangeBase
 from hummingbot.core.clock cimport Clock
+from hummingbot.core.clock_mode import ClockMode
 
 from hummingbot.client.config.config_helpers import ClientConfigAdapter
 from hummingbot.core.data_type.common import (
@@ -429,6 +430,9 @@ cdef class AvellanedaMarketMakingStrategy(StrategyBase):
                 order_book=self.market_info.order_book,
                 price_delegate=self._price_delegate,
                 sampling_length=self._trading_intensity_buffer_size,
+                # The back tests need the same estimates whatever the duration of the fit
+                fit_in_background=(self._clock is not None
+                                   and self._clock.clock_mode in (ClockMode.REALTIME, ClockMode.EVENT_DRIVEN)),
             )
 
         self._ticks_to_be_ready += (ticks_to_be_ready_after - ticks_to_be_ready_before)
@@ -0,0 +1,402 @@
+import argparse
+import asyncio
+import itertools
+import logging
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from decimal import Decimal
+from pathlib import Path
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple, Union
+
+import pandas as pd
+
+from hummingbot.client.config.client_config_map import ClientConfigMap
+from hummingbot.client.config.config_helpers import (
+    ClientConfigAdapter,
+    get_strategy_starter_file,
+    load_strategy_config_map_from_file,
+    parse_cvar_value,
+)
+from hummingbot.client.config.config_var import ConfigVar
+from hummingbot.client.hummingbot_application import HummingbotApplication
+from hummingbot.client.performance import PerformanceMetrics
+from hummingbot.connector.exchange.paper_trade import create_replay_paper_trade_market
+from hummingbot.connector.exchange_base import ExchangeBase
+from hummingbot.core.clock import Clock, ClockMode
+from hummingbot.core.data_type.trade import Trade
+from hummingbot.core.event.event_logger import EventLogger
+from hummingbot.core.event.events import MarketEvent, OrderFilledEvent
+from hummingbot.core.rate_oracle.rate_oracle import RateOracle
+from hummingbot.core.rate_oracle.sources.rate_source_base import RateSourceBase
+from hummingbot.core.utils.trading_pair_fetcher import TradingPairFetcher
+from hummingbot.logger import HummingbotLogger
+from hummingbot.strategy.market_trading_pair_tuple import MarketTradingPairTuple
+from hummingbot.strategy.strategy_base import StrategyBase
+
+PAPER_TRADE_SUFFIX = "_paper_trade"
+
+METRICS_COLUMNS = ["num_trades", "tot_vol_quote", "cur_base_bal", "cur_quote_bal", "trade_pnl", "fee_in_quote",
+                   "total_pnl", "return_pct"]
+
+
+class ParameterSweepJob(NamedTuple):
+    """
+    One parameter combination of a sweep. It is sent to the worker processes, so it only holds picklable values.
+    """
+    job_id: int
+    strategy_file_path: str
+    parameters: Dict[str, Any]
+    data_dir: str
+    start_time: float
+    end_time: float
+    tick_size: float = 1.0
+    initial_balances: Optional[Dict[str, Decimal]] = None
+    event_time: bool = False
+
+
+class ReplayMarketsRateSource(RateSourceBase):
+    """
+    Rate source pricing the trading pairs with the mid prices of the replayed order books, so that the performance
+    metrics of a backtest are calculated without any network request.
+    """
+
+    def __init__(self, markets: List[ExchangeBase]):
+        super().__init__()
+        self._markets = markets
+
+    @property
+    def name(self) -> str:
+        return "replay_markets"
+
+    async def get_prices(self, quote_token: Optional[str] = None) -> Dict[str, Decimal]:
+        prices: Dict[str, Decimal] = {}
+        for market in self._markets:
+            for trading_pair in market.order_books:
+                mid_price = market.get_mid_price(trading_pair)
+                if not mid_price.is_nan():
+                    prices[trading_pair] = mid_price
+        return prices
+
+
+class ReplayTradingPairFetcher(TradingPairFetcher):
+    """
+    Trading pair fetcher of the backtests. The markets are the ones of the recorded data, so the trading pairs of the
+    strategy configs are not validated against the live exchanges (no trading pairs are fetched from the network).
+    """
+
+    def __init__(self):
+        self.ready = True
+        self.trading_pairs: Dict[str, List[str]] = {}
+
+
+class ParameterSweepContext:
+    """
+    Stand-in for the HummingbotApplication used by the strategy start functions. The markets it initializes are paper
+    trade exchanges replaying the market data recorded in the data directory.
+    """
+    _logger: Optional[HummingbotLogger] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._logger is None:
+            cls._logger = logging.getLogger(__name__)
+        return cls._logger
+
+    def __init__(self,
+                 client_config_map: ClientConfigAdapter,
+                 strategy_file_name: str,
+                 strategy_name: str,
+                 strategy_config_map: Union[ClientConfigAdapter, Dict[str, ConfigVar]],
+                 data_dir: str,
+                 initial_balances: Optional[Dict[str, Decimal]] = None):
+        self.client_config_map = client_config_map
+        self.strategy_file_name = strategy_file_name
+        self.strategy_name = strategy_name
+        self.strategy_config_map = strategy_config_map
+        self.markets: Dict[str, ExchangeBase] = {}
+        self.market_trading_pairs_map: Dict[str, List[str]] = {}
+        self.market_trading_pair_tuples: List[MarketTradingPairTuple] = []
+        self.strategy: Optional[StrategyBase] = None
+        self.trade_fill_db = None
+        self.notifications: List[str] = []
+        self._data_dir = data_dir
+        self._initial_balances = initial_balances
+
+    def notify(self, msg: str):
+        self.notifications.append(msg)
+
+    @staticmethod
+    def _initialize_market_assets(market_name: str, trading_pairs: List[str]) -> List[Tuple[str, str]]:
+        return HummingbotApplication._initialize_market_assets(market_name, trading_pairs)
+
+    def _initialize_markets(self, market_names: List[Tuple[str, List[str]]]):
+        for market_name, trading_pairs in market_names:
+            self.market_trading_pairs_map.setdefault(market_name, []).extend(trading_pairs)
+
+        balances = self._initial_balances
+        if balances is None:
+            balances = self.client_config_map.paper_trade.paper_trade_account_balance or {}
+        for connector_name, trading_pairs in self.market_trading_pairs_map.items():
+            exchange_name = connector_name
+            if exchange_name.endswith(PAPER_TRADE_SUFFIX):
+                exchange_name = exchange_name[:-len(PAPER_TRADE_SUFFIX)]
+            connector = create_replay_paper_trade_market(exchange_name=exchange_name,
+                                                         client_config_map=self.client_config_map,
+                                                         trading_pairs=trading_pairs,
+                                                         data_dir=self._data_dir)
+            for asset, balance in balances.items():
+                connector.set_balance(asset, Decimal(str(balance)))
+            self.markets[connector_name] = connector
+
+
+def parameter_grid(grid: Dict[str, List[Any]]) -> List[Dict[str, Any]]:
+    """
+    Returns all the combinations of the parameter values, e.g. {"a": [1, 2], "b": [3]} -> [{"a": 1, "b": 3},
+    {"a": 2, "b": 3}]
+    """
+    keys = list(grid.keys())
+    return [dict(zip(keys, values)) for values in itertools.product(*[grid[key] for key in keys])]
+
+
+def apply_parameters(config_map: Union[ClientConfigAdapter, Dict[str, ConfigVar]], parameters: Dict[str, Any]):
+    """
+    Overrides the values of the strategy config. The values are validated like the ones entered in the client, and
+    the nested values of the pydantic configs are set with dotted keys (e.g. `order_levels_mode.order_levels`).
+    """
+    for key, value in parameters.items():
+        if isinstance(config_map, ClientConfigAdapter):
+            config = config_map
+            *path, attr = key.split(".")
+            for nested_attr in path:
+                config = getattr(config, nested_attr)
+            setattr(config, attr, value)
+        else:
+            cvar = config_map.get(key)
+            if cvar is None:
+                raise KeyError(f"{key} is not a parameter of the strategy.")
+            cvar.value = parse_cvar_value(cvar, value)
+
+
+def market_trades(fill_events: List[OrderFilledEvent], market: ExchangeBase) -> List[Trade]:
+    return [
+        Trade(trading_pair=event.trading_pair,
+              side=event.trade_type,
+              price=float(event.price),
+              amount=float(event.amount),
+              order_type=event.order_type,
+              market=market.display_name,
+              timestamp=event.timestamp,
+              trade_fee=event.trade_fee)
+        for event in fill_events
+    ]
+
+
+async def _performance_rows(markets: Dict[str, ExchangeBase],
+                            fill_loggers: Dict[str, EventLogger]) -> List[Dict[str, Any]]:
+    rows: List[Dict[str, Any]] = []
+    for market_name, market in markets.items():
+        trades = market_trades(fill_loggers[market_name].event_log, market)
+        balances = market.get_all_balances()
+        for trading_pair in sorted(market.order_books):
+            pair_trades = [trade for trade in trades if trade.trading_pair == trading_pair]
+            row: Dict[str, Any] = {"market": market_name, "trading_pair": trading_pair}
+            if pair_trades:
+                metrics = await PerformanceMetrics.create(trading_pair, pair_trades, balances)
+                row.update({column: getattr(metrics, column) for column in METRICS_COLUMNS})
+            else:
+                row.update({column: Decimal("0") for column in METRICS_COLUMNS})
+            rows.append(row)
+    return rows
+
+
+def run_sweep_job(job: ParameterSweepJob) -> List[Dict[str, Any]]:
+    """
+    Backtests the strategy with the parameters of the job on the recorded market data, and returns the performance
+    metrics of each trading pair. It runs in the worker processes of the sweep, and catches the errors so that a
+    failing combination doesn't stop the sweep.
+    """
+    base_row: Dict[str, Any] = {"job_id": job.job_id, **job.parameters}
+    ev_loop = asyncio.get_event_loop()
+    main_app = HummingbotApplication._main_app
+    trading_pair_fetcher = TradingPairFetcher._sf_shared_instance
+    rate_oracle = RateOracle.get_instance()
+    rate_source = rate_oracle.source
+    try:
+        TradingPairFetcher._sf_shared_instance = ReplayTradingPairFetcher()
+        strategy_file_path = Path(job.strategy_file_path)
+        config_map = ev_loop.run_until_complete(load_strategy_config_map_from_file(strategy_file_path))
+        apply_parameters(config_map, job.parameters)
+        if isinstance(config_map, ClientConfigAdapter):
+            strategy_name = config_map.strategy
+        else:
+            strategy_name = config_map["strategy"].value
+        context = ParameterSweepContext(client_config_map=ClientConfigAdapter(ClientConfigMap()),
+                                        strategy_file_name=strategy_file_path.name,
+                                        strategy_name=strategy_name,
+                                        strategy_config_map=config_map,
+                                        data_dir=job.data_dir,
+                                        initial_balances=job.initial_balances)
+        # The strategies notify the main application, route the notifications to the sweep context instead
+        HummingbotApplication._main_app = context
+        get_strategy_starter_file(strategy_name)(context)
+        if context.strategy is None:
+            raise ValueError(" ".join(context.notifications) or f"The {strategy_name} strategy failed to start.")
+
+        clock_mode = ClockMode.BACKTEST_EVENT_TIME if job.event_time else ClockMode.BACKTEST
+        clock = Clock(clock_mode, tick_size=job.tick_size, start_time=job.start_time, end_time=job.end_time)
+        fill_loggers: Dict[str, EventLogger] = {}
+        for market in context.markets.values():
+            # The order books have to be replayed before the markets and the strategy tick
+            clock.add_iterator(market.order_book_tracker.replay_iterator)
+        for market_name, market in context.markets.items():
+            fill_loggers[market_name] = EventLogger()
+            market.add_listener(MarketEvent.OrderFilled, fill_loggers[market_name])
+            clock.add_iterator(market)
+        clock.add_iterator(context.strategy)
+        clock.backtest()
+
+        rate_oracle.source = ReplayMarketsRateSource(list(context.markets.values()))
+        rows = ev_loop.run_until_complete(_performance_rows(context.markets, fill_loggers))
+        return [{**base_row, **row, "error": None} for row in rows]
+    except Exception as e:
+        logging.getLogger(__name__).error(f"Parameter sweep job {job.job_id} failed.", exc_info=True)
+        return [{**base_row, "error": str(e)}]
+    finally:
+        HummingbotApplication._main_app = main_app
+        TradingPairFetcher._sf_shared_instance = trading_pair_fetcher
+        rate_oracle.source = rate_source
+
+
+class ParameterSweep:
+    """
+    Backtests a strategy config with every combination of a parameter grid, against recorded market data replayed by
+    paper trade exchanges on the backtest clock (see create_replay_paper_trade_market).
+    The combinations run in parallel worker processes, one per core by default, so the sweep scales with the cores
+    of the host. The performance metrics of all the runs are aggregated into a single table.
+    """
+    _logger: Optional[HummingbotLogger] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._logger is None:
+            cls._logger = logging.getLogger(__name__)
+        return cls._logger
+
+    def __init__(self,
+                 strategy_file_path: str,
+                 parameter_grid: Dict[str, List[Any]],
+                 data_dir: str,
+                 start_time: float,
+                 end_time: float,
+                 tick_size: float = 1.0,
+                 initial_balances: Optional[Dict[str, Decimal]] = None,
+                 event_time: bool = False,
+                 max_workers: Optional[int] = None):
+        """
+        :param strategy_file_path: the strategy config file used as template
+        :param parameter_grid: the values to test for each strategy config key
+        :param data_dir: the directory of the recorded market data (see ReplayOrderBookTrackerDataSource)
+        :param start_time: the timestamp the backtests start at
+        :param end_time: the timestamp the backtests end at
+        :param tick_size: the backtest clock tick size in seconds
+        :param initial_balances: the paper trade balances, the client config paper trade balances by default
+        :param event_time: whether the clock skips the ticks without market data (ClockMode.BACKTEST_EVENT_TIME)
+        :param max_workers: the number of worker processes, the number of cores by default
+        """
+        self._strategy_file_path = str(strategy_file_path)
+        self._parameter_grid = parameter_grid
+        self._data_dir = data_dir
+        self._start_time = start_time
+        self._end_time = end_time
+        self._tick_size = tick_size
+        self._initial_balances = initial_balances
+        self._event_time = event_time
+        self._max_workers = max_workers or os.cpu_count() or 1
+
+    @property
+    def jobs(self) -> List[ParameterSweepJob]:
+        return [
+            ParameterSweepJob(job_id=job_id,
+                              strategy_file_path=self._strategy_file_path,
+                              parameters=parameters,
+                              data_dir=self._data_dir,
+                              start_time=self._start_time,
+                              end_time=self._end_time,
+                              tick_size=self._tick_size,
+                              initial_balances=self._initial_balances,
+                              event_time=self._event_time)
+            for job_id, parameters in enumerate(parameter_grid(self._parameter_grid))
+        ]
+
+    def run(self) -> pd.DataFrame:
+        """
+        Runs all the combinations and returns one row per combination and trading pair
+        """
+        jobs = self.jobs
+        workers = min(self._max_workers, len(jobs))
+        self.logger().info(f"Running {len(jobs)} backtests in {workers} worker processes.")
+        if workers <= 1:
+            results = [run_sweep_job(job) for job in jobs]
+        else:
+            # Spawned workers don't inherit the event loop and the singletons of the parent process
+            with ProcessPoolExecutor(max_workers=workers,
+                                     mp_context=multiprocessing.get_context("spawn")) as executor:
+                results = list(executor.map(run_sweep_job, jobs))
+        return self.results_table(results)
+
+    @staticmethod
+    def results_table(results: List[List[Dict[str, Any]]]) -> pd.DataFrame:
+        return pd.DataFrame([row for job_rows in results for row in job_rows])
+
+
+def parse_parameter(value: str) -> Tuple[str, List[str]]:
+    key, _, values = value.partition("=")
+    if not key or not values:
+        raise argparse.ArgumentTypeError(f"Invalid parameter {value}, expected key=value1,value2,...")
+    return key.strip(), [v.strip() for v in values.split(",")]
+
+
+def parse_balance(value: str) -> Tuple[str, Decimal]:
+    asset, _, balance = value.partition("=")
+    if not asset or not balance:
+        raise argparse.ArgumentTypeError(f"Invalid balance {value}, expected asset=amount")
+    return asset.strip(), Decimal(balance)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Backtests a strategy config with every combination of parameters "
+                                                 "against recorded market data")
+    parser.add_argument("strategy_file_path", help="The strategy config file used as template")
+    parser.add_argument("--data-dir", required=True, help="The directory of the recorded market data")
+    parser.add_argument("--start-time", type=float, required=True, help="The backtest start timestamp")
+    parser.add_argument("--end-time", type=float, required=True, help="The backtest end timestamp")
+    parser.add_argument("--param", type=parse_parameter, action="append", default=[], dest="parameters",
+                        help="The values to test for a strategy config key, e.g. bid_spread=0.1,0.2,0.5")
+    parser.add_argument("--balance", type=parse_balance, action="append", default=[], dest="balances",
+                        help="A paper trade balance, e.g. USDT=10000")
+    parser.add_argument("--tick-size", type=float, default=1.0, help="The backtest clock tick size in seconds")
+    parser.add_argument("--event-time", action="store_true",
+                        help="Skip the clock ticks without market data")
+    parser.add_argument("--workers", type=int, default=None, help="The number of worker processes")
+    parser.add_argument("--output", default=None, help="The CSV file the results are written to")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO)
+
+    sweep = ParameterSweep(strategy_file_path=args.strategy_file_path,
+                           parameter_grid=dict(args.parameters),
+                           data_dir=args.data_dir,
+                           start_time=args.start_time,
+                           end_time=args.end_time,
+                           tick_size=args.tick_size,
+                           initial_balances=dict(args.balances) or None,
+                           event_time=args.event_time,
+                           max_workers=args.workers)
+    results = sweep.run()
+    if args.output is not None:
+        results.to_csv(args.output, index=False)
+    print(results.to_string(index=False))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,10 +1,10 @@
 from typing import Dict
 
 import pandas as pd
-import pandas_ta as ta  # noqa: F401
 
 from hummingbot.connector.connector_base import ConnectorBase
 from hummingbot.data_feed.candles_feed.candles_factory import CandlesFactory
+from hummingbot.data_feed.candles_feed.candles_indicators import EMA, RSI, BollingerBands
 from hummingbot.strategy.script_strategy_base import ScriptStrategyBase
 
 
@@ -41,9 +41,13 @@ class CandlesExample(ScriptStrategyBase):
     def __init__(self, connectors: Dict[str, ConnectorBase]):
         # Is necessary to start the Candles Feed.
         super().__init__(connectors)
-        self.eth_1m_candles.start()
-        self.eth_1h_candles.start()
-        self.eth_1w_candles.start()
+        for candles in [self.eth_1m_candles, self.eth_1h_candles, self.eth_1w_candles]:
+            # The technical indicators are updated with each candle, instead of being computed again with the
+            # whole DataFrame each time they are used
+            candles.add_indicator("RSI_14", RSI(length=14))
+            candles.add_indicator("BB_20_2", BollingerBands(length=20, std=2))
+            candles.add_indicator("EMA_14", EMA(length=14))
+            candles.start()
 
     @property
     def all_candles_ready(self):
@@ -76,14 +80,15 @@ class CandlesExample(ScriptStrategyBase):
         if self.all_candles_ready:
             lines.extend(["\n############################################ Market Data ############################################\n"])
             for candles in [self.eth_1w_candles, self.eth_1m_candles, self.eth_1h_candles]:
-                candles_df = candles.candles_df
-                # Let's add some technical indicators
-                candles_df.ta.rsi(length=14, append=True)
-                candles_df.ta.bbands(length=20, std=2, append=True)
-                candles_df.ta.ema(length=14, offset=None, append=True)
+                candles_df = candles.candles_df.tail().copy()
+                # Let's add the last values of the technical indicators
+                for name, indicator in candles.indicators.items():
+                    history = indicator.history[-len(candles_df):]
+                    for i, field in enumerate(indicator.fields, start=1):
+                        candles_df[f"{name}_{field}"] = history[:, i]
                 candles_df["timestamp"] = pd.to_datetime(candles_df["timestamp"], unit="ms")
                 lines.extend([f"Candles: {candles.name} | Interval: {candles.interval}"])
-                lines.extend(["    " + line for line in candles_df.tail().to_string(index=False).split("\n")])
+                lines.extend(["    " + line for line in candles_df.to_string(index=False).split("\n")])
                 lines.extend(["\n-----------------------------------------------------------------------------------------------------------\n"])
         else:
             lines.extend(["", "  No data collected."])
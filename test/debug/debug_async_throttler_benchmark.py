@@ -0,0 +1,101 @@
+#!/usr/bin/env python
+"""
+Compares the capacity check of the AsyncThrottler per limit id sliding windows against the previous implementation,
+which scanned a single shared list of TaskLog(s) and converted every timestamp to Decimal.
+
+Usage: python test/debug/debug_async_throttler_benchmark.py [logged_tasks] [checks]
+"""
+import asyncio
+import sys
+import time
+from decimal import Decimal
+from os.path import join, realpath
+from typing import List, Tuple
+
+sys.path.insert(0, realpath(join(__file__, "../../../")))
+
+from hummingbot.core.api_throttler.async_throttler import AsyncRequestContext  # noqa: E402
+from hummingbot.core.api_throttler.data_types import (  # noqa: E402
+    LinkedLimitWeightPair,
+    RateLimit,
+    TaskLog,
+    TaskLogWindow,
+)
+
+SAFETY_MARGIN_PCT = 0.05
+
+# Limits are large enough for the benchmark requests to stay within capacity, so every check inspects all the limits
+RATE_LIMITS = [
+    RateLimit(limit_id="REQUEST_WEIGHT", limit=1000000, time_interval=60),
+    RateLimit(limit_id="ORDERS", limit=1000000, time_interval=60),
+    RateLimit(limit_id="ORDERS_24HR", limit=160000, time_interval=86400),
+    RateLimit(limit_id="/api/v3/order", limit=100000, time_interval=60, linked_limits=[
+        LinkedLimitWeightPair("REQUEST_WEIGHT", 1),
+        LinkedLimitWeightPair("ORDERS", 1),
+        LinkedLimitWeightPair("ORDERS_24HR", 1)]),
+    RateLimit(limit_id="/api/v3/account", limit=100000, time_interval=60, linked_limits=[
+        LinkedLimitWeightPair("REQUEST_WEIGHT", 10)]),
+]
+LIMITS_MAP = {limit.limit_id: limit for limit in RATE_LIMITS}
+
+
+def legacy_within_capacity(task_logs: List[TaskLog], related_limits: List[Tuple[RateLimit, int]], now: float) -> bool:
+    for rate_limit, weight in related_limits:
+        capacity_used: int = sum([task.weight
+                                  for task in task_logs
+                                  if rate_limit.limit_id == task.rate_limit.limit_id and
+                                  Decimal(str(now)) - Decimal(str(task.timestamp)) - Decimal(str(task.rate_limit.time_interval * SAFETY_MARGIN_PCT)) <= task.rate_limit.time_interval])
+        if capacity_used + weight > rate_limit.limit:
+            return False
+    return True
+
+
+def related_limits_for(limit_id: str) -> Tuple[RateLimit, List[Tuple[RateLimit, int]]]:
+    rate_limit = LIMITS_MAP[limit_id]
+    return rate_limit, [(LIMITS_MAP[pair.limit_id], pair.weight) for pair in rate_limit.linked_limits]
+
+
+def populate(logged_tasks: int, now: float) -> Tuple[List[TaskLog], dict]:
+    task_logs_list = []
+    task_logs_windows = {}
+    for i in range(logged_tasks):
+        limit_id = "/api/v3/order" if i % 2 == 0 else "/api/v3/account"
+        rate_limit, related_limits = related_limits_for(limit_id)
+        timestamp = now - 30 + 30 * i / logged_tasks
+        for limit, weight in [(rate_limit, rate_limit.weight)] + related_limits:
+            task_log = TaskLog(timestamp=timestamp, rate_limit=limit, weight=weight)
+            task_logs_list.append(task_log)
+            task_logs_windows.setdefault(limit.limit_id, TaskLogWindow()).append(task_log)
+    return task_logs_list, task_logs_windows
+
+
+def main():
+    logged_tasks = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    checks = int(sys.argv[2]) if len(sys.argv) > 2 else 2000
+    now = time.monotonic()
+    task_logs_list, task_logs_windows = populate(logged_tasks, now)
+    rate_limit, related_limits = related_limits_for("/api/v3/order")
+
+    start = time.perf_counter()
+    for _ in range(checks):
+        legacy_within_capacity(task_logs_list, [(rate_limit, rate_limit.weight)] + related_limits, now)
+    legacy_elapsed = time.perf_counter() - start
+
+    context = AsyncRequestContext(task_logs=task_logs_windows,
+                                  rate_limit=rate_limit,
+                                  related_limits=related_limits,
+                                  lock=asyncio.Lock(),
+                                  safety_margin_pct=SAFETY_MARGIN_PCT)
+    start = time.perf_counter()
+    for _ in range(checks):
+        context.within_capacity()
+    windows_elapsed = time.perf_counter() - start
+
+    print(f"{logged_tasks} logged requests ({len(task_logs_list)} task logs), {checks} capacity checks")
+    print(f"  shared list with Decimal timestamps: {legacy_elapsed * 1e6 / checks:10.2f} us/check")
+    print(f"  per limit id sliding windows:        {windows_elapsed * 1e6 / checks:10.2f} us/check")
+    print(f"  speedup: {legacy_elapsed / windows_elapsed:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
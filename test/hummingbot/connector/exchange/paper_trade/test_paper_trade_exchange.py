@@ -1,11 +1,27 @@
+import json
+import os
+import tempfile
+from decimal import Decimal
+from typing import Tuple
 from unittest import TestCase
 
 from hummingbot.client.config.client_config_map import ClientConfigMap
 from hummingbot.client.config.config_helpers import ClientConfigAdapter
 from hummingbot.connector.exchange.binance.binance_api_order_book_data_source import BinanceAPIOrderBookDataSource
 from hummingbot.connector.exchange.kucoin.kucoin_api_order_book_data_source import KucoinAPIOrderBookDataSource
-from hummingbot.connector.exchange.paper_trade import create_paper_trade_market, get_order_book_tracker
+from hummingbot.connector.exchange.paper_trade import (
+    create_paper_trade_market,
+    create_replay_paper_trade_market,
+    get_order_book_tracker,
+)
+from hummingbot.connector.exchange.paper_trade.paper_trade_exchange import QuantizationParams
+from hummingbot.connector.test_support.mock_paper_exchange import MockPaperExchange
+from hummingbot.core.clock import Clock, ClockMode
+from hummingbot.core.data_type.common import OrderType, TradeType
+from hummingbot.core.data_type.order_book_row import OrderBookRow
 from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
+from hummingbot.core.event.event_logger import EventLogger
+from hummingbot.core.event.events import MarketEvent, OrderBookTradeEvent
 
 
 class PaperTradeExchangeTests(TestCase):
@@ -29,3 +45,79 @@ class PaperTradeExchangeTests(TestCase):
             client_config_map=ClientConfigAdapter(ClientConfigMap()),
             trading_pairs=["COINALPHA-HBOT"])
         self.assertEqual(KucoinAPIOrderBookDataSource, type(paper_exchange.order_book_tracker.data_source))
+
+    def test_replay_paper_trade_market_fills_orders_with_the_recorded_trades(self):
+        trading_pair = "COINALPHA-HBOT"
+        records = [
+            {"type": "snapshot", "timestamp": 1.0,
+             "content": {"update_id": 1, "bids": [[99, 10]], "asks": [[101, 10]]}},
+            {"type": "trade", "timestamp": 5.0,
+             "content": {"trade_id": 1, "price": 98, "amount": 5, "trade_type": float(TradeType.SELL.value)}},
+        ]
+        with tempfile.TemporaryDirectory() as data_dir:
+            with open(os.path.join(data_dir, f"{trading_pair}.jsonl"), "w") as data_file:
+                data_file.writelines(json.dumps(record) + "\n" for record in records)
+            paper_exchange = create_replay_paper_trade_market(
+                exchange_name="binance",
+                client_config_map=ClientConfigAdapter(ClientConfigMap()),
+                trading_pairs=[trading_pair],
+                data_dir=data_dir)
+            paper_exchange.set_balance("HBOT", 1000)
+            fill_logger = EventLogger()
+            paper_exchange.add_listener(MarketEvent.OrderFilled, fill_logger)
+            clock = Clock(ClockMode.BACKTEST_EVENT_TIME, tick_size=1.0, start_time=0.0, end_time=10.0)
+            clock.add_iterator(paper_exchange.order_book_tracker.replay_iterator)
+            clock.add_iterator(paper_exchange)
+
+            clock.backtest_til(2.0)
+            self.assertTrue(paper_exchange.ready)
+            paper_exchange.buy(trading_pair, Decimal("1"), OrderType.LIMIT, Decimal("99"))
+            clock.backtest()
+
+        self.assertEqual(1, len(fill_logger.event_log))
+        self.assertEqual(Decimal("99"), fill_logger.event_log[0].price)
+
+    def _limit_orders_exchange(self) -> Tuple[MockPaperExchange, Clock]:
+        exchange = MockPaperExchange(client_config_map=ClientConfigAdapter(ClientConfigMap()))
+        exchange.set_balanced_order_book("COINALPHA-HBOT", mid_price=100, min_price=50, max_price=150,
+                                         price_step_size=1, volume_step_size=10)
+        exchange.set_balance("COINALPHA", 1000)
+        exchange.set_balance("HBOT", 100000)
+        exchange.set_quantization_param(QuantizationParams("COINALPHA-HBOT", 6, 6, 6, 6))
+        clock = Clock(ClockMode.BACKTEST, tick_size=1.0, start_time=0.0, end_time=100.0)
+        clock.add_iterator(exchange)
+        clock.backtest_til(1.0)
+        return exchange, clock
+
+    def test_trades_fill_only_the_crossed_limit_orders(self):
+        exchange, clock = self._limit_orders_exchange()
+        fill_logger = EventLogger()
+        exchange.add_listener(MarketEvent.OrderFilled, fill_logger)
+        exchange.buy("COINALPHA-HBOT", Decimal("1"), OrderType.LIMIT, Decimal("90"))
+        exchange.buy("COINALPHA-HBOT", Decimal("1"), OrderType.LIMIT, Decimal("95.5"))
+        exchange.sell("COINALPHA-HBOT", Decimal("1"), OrderType.LIMIT, Decimal("110"))
+        order_book = exchange.get_order_book("COINALPHA-HBOT")
+
+        order_book.apply_trade(OrderBookTradeEvent("COINALPHA-HBOT", 2.0, TradeType.SELL, 95.0, 10))
+        # A trade at the limit price does not cross the order
+        order_book.apply_trade(OrderBookTradeEvent("COINALPHA-HBOT", 2.0, TradeType.SELL, 90.0, 10))
+        order_book.apply_trade(OrderBookTradeEvent("COINALPHA-HBOT", 2.0, TradeType.BUY, 110.0, 10))
+
+        self.assertEqual([Decimal("95.5")], [event.price for event in fill_logger.event_log])
+        self.assertEqual([Decimal("90"), Decimal("110")], sorted(order.price for order in exchange.limit_orders))
+
+    def test_crossed_order_book_fills_the_limit_orders_on_tick(self):
+        exchange, clock = self._limit_orders_exchange()
+        fill_logger = EventLogger()
+        exchange.add_listener(MarketEvent.OrderFilled, fill_logger)
+        exchange.buy("COINALPHA-HBOT", Decimal("1"), OrderType.LIMIT, Decimal("90"))
+        exchange.buy("COINALPHA-HBOT", Decimal("1"), OrderType.LIMIT, Decimal("80"))
+        order_book = exchange.get_order_book("COINALPHA-HBOT")
+        update_id = order_book.last_diff_uid + 1
+        order_book.apply_diffs([], [OrderBookRow(price, 0, update_id) for price in range(101, 151)]
+                               + [OrderBookRow(90, 10, update_id)], update_id)
+
+        clock.backtest_til(2.0)
+
+        self.assertEqual([Decimal("90")], [event.price for event in fill_logger.event_log])
+        self.assertEqual([Decimal("80")], [order.price for order in exchange.limit_orders])
@@ -1,12 +1,14 @@
+import asyncio
 import importlib
 import os
 import platform
 import unittest
+from decimal import Decimal
 from hashlib import md5
 from os import DirEntry, scandir
 from os.path import exists, join
 from typing import cast
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 from pydantic import SecretStr
 
@@ -14,7 +16,9 @@ from hummingbot import root_path
 from hummingbot.client.config.config_data_types import BaseConnectorConfigMap
 from hummingbot.client.config.config_helpers import ClientConfigAdapter
 from hummingbot.client.settings import CONNECTOR_SUBMODULES_THAT_ARE_NOT_TYPES
-from hummingbot.connector.utils import get_new_client_order_id
+from hummingbot.connector.utils import RateLimitUsageHeader, RateLimitUsageRESTPostProcessor, get_new_client_order_id
+from hummingbot.core.api_throttler.async_throttler import AsyncThrottler
+from hummingbot.core.api_throttler.data_types import RateLimit
 
 
 class UtilsTest(unittest.TestCase):
@@ -101,3 +105,23 @@ class UtilsTest(unittest.TestCase):
                         self.assertEqual(el.type_, SecretStr)
                     else:
                         self.assertEqual(el.type_, str)
+
+    def test_rate_limit_usage_post_processor_syncs_throttler(self):
+        throttler = AsyncThrottler(rate_limits=[RateLimit(limit_id="WEIGHT", limit=1200, time_interval=60),
+                                                RateLimit(limit_id="ORDERS", limit=50, time_interval=10)],
+                                   limits_share_percentage=Decimal("50"))
+        post_processor = RateLimitUsageRESTPostProcessor(
+            throttler=throttler,
+            usage_headers=[RateLimitUsageHeader(header="X-USED-WEIGHT", limit_id="WEIGHT"),
+                           RateLimitUsageHeader(header="X-ORDERS-LEFT", limit_id="ORDERS", is_remaining=True),
+                           RateLimitUsageHeader(header="X-UNKNOWN", limit_id="UNKNOWN")])
+        response = MagicMock()
+        response.headers = {"X-USED-WEIGHT": "700", "X-ORDERS-LEFT": "45", "X-UNKNOWN": "1"}
+
+        result = asyncio.get_event_loop().run_until_complete(post_processor.post_process(response))
+
+        self.assertIs(response, result)
+        self.assertEqual(700, throttler._task_logs["WEIGHT"].reported_capacity_used)
+        self.assertEqual(1200, throttler._task_logs["WEIGHT"].reported_limit)
+        self.assertEqual(5, throttler._task_logs["ORDERS"].reported_capacity_used)
+        self.assertNotIn("UNKNOWN", throttler._task_logs)
@@ -11,7 +11,14 @@ from unittest.mock import patch
 from hummingbot.client.config.client_config_map import ClientConfigMap
 from hummingbot.client.config.config_helpers import ClientConfigAdapter
 from hummingbot.core.api_throttler.async_throttler import AsyncRequestContext, AsyncThrottler
-from hummingbot.core.api_throttler.data_types import LinkedLimitWeightPair, RateLimit, TaskLog
+from hummingbot.core.api_throttler.async_throttler_base import request_priority
+from hummingbot.core.api_throttler.data_types import (
+    LinkedLimitWeightPair,
+    RateLimit,
+    RequestPriority,
+    TaskLog,
+    TaskLogWindow,
+)
 from hummingbot.logger.struct_logger import METRICS_LOG_LEVEL
 
 TEST_PATH_URL = "/hummingbot"
@@ -50,6 +57,13 @@ class AsyncThrottlerUnitTests(unittest.TestCase):
         self._req_counters: Dict[str, int] = {limit.limit_id: 0 for limit in self.rate_limits}
         self.client_config_map = ClientConfigAdapter(ClientConfigMap())
 
+    def add_task_log(self, timestamp: float, rate_limit: RateLimit, weight: int):
+        task_log_window = self.throttler._task_logs.setdefault(rate_limit.limit_id, TaskLogWindow())
+        task_log_window.append(TaskLog(timestamp=timestamp, rate_limit=rate_limit, weight=weight))
+
+    def task_logs_count(self) -> int:
+        return sum(len(task_log_window) for task_log_window in self.throttler._task_logs.values())
+
     async def execute_requests(self, no_request: int, limit_id: str, throttler: AsyncThrottler):
         for _ in range(no_request):
             async with throttler.execute_task(limit_id=limit_id):
@@ -96,36 +110,34 @@ class AsyncThrottlerUnitTests(unittest.TestCase):
         lock = asyncio.Lock()
 
         rate_limit = self.rate_limits[0]
-        self.assertEqual(0, len(self.throttler._task_logs))
+        self.assertEqual(0, self.task_logs_count())
         context = AsyncRequestContext(task_logs=self.throttler._task_logs,
                                       rate_limit=rate_limit,
                                       related_limits=[(rate_limit, rate_limit.weight)],
                                       lock=lock,
                                       safety_margin_pct=self.throttler._safety_margin_pct)
         context.flush()
-        self.assertEqual(0, len(self.throttler._task_logs))
+        self.assertEqual(0, self.task_logs_count())
 
     def test_flush_only_elapsed_tasks_are_flushed(self):
         lock = asyncio.Lock()
         rate_limit = self.rate_limits[0]
-        self.throttler._task_logs = [
-            TaskLog(timestamp=1.0, rate_limit=rate_limit, weight=rate_limit.weight),
-            TaskLog(timestamp=time.time(), rate_limit=rate_limit, weight=rate_limit.weight)
-        ]
+        self.add_task_log(timestamp=time.monotonic() - 60, rate_limit=rate_limit, weight=rate_limit.weight)
+        self.add_task_log(timestamp=time.monotonic(), rate_limit=rate_limit, weight=rate_limit.weight)
 
-        self.assertEqual(2, len(self.throttler._task_logs))
+        self.assertEqual(2, self.task_logs_count())
         context = AsyncRequestContext(task_logs=self.throttler._task_logs,
                                       rate_limit=rate_limit,
                                       related_limits=[(rate_limit, rate_limit.weight)],
                                       lock=lock,
                                       safety_margin_pct=self.throttler._safety_margin_pct)
         context.flush()
-        self.assertEqual(1, len(self.throttler._task_logs))
+        self.assertEqual(1, self.task_logs_count())
+        self.assertEqual(rate_limit.weight, self.throttler._task_logs[rate_limit.limit_id].capacity_used)
 
     def test_within_capacity_singular_non_weighted_task_returns_false(self):
         rate_limit, _ = self.throttler.get_related_limits(limit_id=TEST_POOL_ID)
-        self.throttler._task_logs.append(
-            TaskLog(timestamp=time.time(), rate_limit=rate_limit, weight=rate_limit.weight))
+        self.add_task_log(timestamp=time.monotonic(), rate_limit=rate_limit, weight=rate_limit.weight)
 
         context = AsyncRequestContext(task_logs=self.throttler._task_logs,
                                       rate_limit=rate_limit,
@@ -147,7 +159,7 @@ class AsyncThrottlerUnitTests(unittest.TestCase):
         rate_limit, related_limits = self.throttler.get_related_limits(limit_id=TEST_PATH_URL)
 
         for linked_limit, weight in related_limits:
-            self.throttler._task_logs.append(TaskLog(timestamp=time.time(), rate_limit=linked_limit, weight=weight))
+            self.add_task_log(timestamp=time.monotonic(), rate_limit=linked_limit, weight=weight)
 
         context = AsyncRequestContext(task_logs=self.throttler._task_logs,
                                       rate_limit=rate_limit,
@@ -171,10 +183,10 @@ class AsyncThrottlerUnitTests(unittest.TestCase):
 
         # Simulate Weighted Task 1 and Task 2 already in task logs, resulting in a used capacity of 6/10
         for linked_limit, weight in task_1_related_limits:
-            self.throttler._task_logs.append(TaskLog(timestamp=time.time(), rate_limit=linked_limit, weight=weight))
+            self.add_task_log(timestamp=time.monotonic(), rate_limit=linked_limit, weight=weight)
         task_2, task_2_related_limits = self.throttler.get_related_limits(limit_id=TEST_WEIGHTED_TASK_2_ID)
         for linked_limit, weight in task_2_related_limits:
-            self.throttler._task_logs.append(TaskLog(timestamp=time.time(), rate_limit=linked_limit, weight=weight))
+            self.add_task_log(timestamp=time.monotonic(), rate_limit=linked_limit, weight=weight)
 
         # Another Task 1(weight=5) will exceed the capacity(11/10)
         context = AsyncRequestContext(task_logs=self.throttler._task_logs,
@@ -212,12 +224,11 @@ class AsyncThrottlerUnitTests(unittest.TestCase):
         self.ev_loop.run_until_complete(context.acquire())
 
         # We acquire()'d just one rate_limit, task log should have only one entry
-        self.assertEqual(1, len(self.throttler._task_logs))
+        self.assertEqual(1, self.task_logs_count())
 
     def test_acquire_awaits_when_exceed_capacity(self):
         rate_limit = self.rate_limits[0]
-        self.throttler._task_logs.append(
-            TaskLog(timestamp=time.time(), rate_limit=rate_limit, weight=rate_limit.weight))
+        self.add_task_log(timestamp=time.monotonic(), rate_limit=rate_limit, weight=rate_limit.weight)
         context = AsyncRequestContext(task_logs=self.throttler._task_logs,
                                       rate_limit=rate_limit,
                                       related_limits=[(rate_limit, rate_limit.weight)],
@@ -243,9 +254,13 @@ class AsyncThrottlerUnitTests(unittest.TestCase):
         ])
 
         # Scenario where one specific task was executed at 0 milliseconds
-        tasks_log = []
-        tasks_log.append(TaskLog(timestamp=1640000000.0000, rate_limit=per_millisecond_limit, weight=1))
-        tasks_log.append(TaskLog(timestamp=1640000000.0000, rate_limit=per_second_limit, weight=1))
+        tasks_log = {
+            per_millisecond_limit.limit_id: TaskLogWindow(),
+            per_second_limit.limit_id: TaskLogWindow(),
+        }
+        tasks_log[per_millisecond_limit.limit_id].append(
+            TaskLog(timestamp=1640000000.0000, rate_limit=per_millisecond_limit, weight=1))
+        tasks_log[per_second_limit.limit_id].append(TaskLog(timestamp=1640000000.0000, rate_limit=per_second_limit, weight=1))
 
         context = AsyncRequestContext(
             task_logs=tasks_log,
@@ -260,8 +275,9 @@ class AsyncThrottlerUnitTests(unittest.TestCase):
         self.assertTrue(result)
 
         # Add one more occurrence of the same task but at millisecond 1
-        tasks_log.append(TaskLog(timestamp=1640000000.1000, rate_limit=per_millisecond_limit, weight=1))
-        tasks_log.append(TaskLog(timestamp=1640000000.1000, rate_limit=per_second_limit, weight=1))
+        tasks_log[per_millisecond_limit.limit_id].append(
+            TaskLog(timestamp=1640000000.1000, rate_limit=per_millisecond_limit, weight=1))
+        tasks_log[per_second_limit.limit_id].append(TaskLog(timestamp=1640000000.1000, rate_limit=per_second_limit, weight=1))
 
         time_mock.return_value = 1640000000.1000
         result = context.within_capacity()
@@ -278,3 +294,248 @@ class AsyncThrottlerUnitTests(unittest.TestCase):
         time_mock.return_value = 1640000000.2100
         result = context.within_capacity()
         self.assertTrue(result)
+
+    def test_task_log_window_keeps_capacity_used(self):
+        rate_limit = RateLimit(limit_id="window_limit", limit=10, time_interval=1)
+        task_log_window = TaskLogWindow()
+        task_log_window.append(TaskLog(timestamp=10.0, rate_limit=rate_limit, weight=2))
+        task_log_window.append(TaskLog(timestamp=10.5, rate_limit=rate_limit, weight=3))
+
+        self.assertEqual(5, task_log_window.capacity_used)
+
+        task_log_window.flush(now=11.0, safety_margin_pct=0)
+        self.assertEqual(2, len(task_log_window))
+        self.assertEqual(5, task_log_window.capacity_used)
+
+        task_log_window.flush(now=11.1, safety_margin_pct=0)
+        self.assertEqual(1, len(task_log_window))
+        self.assertEqual(3, task_log_window.capacity_used)
+
+        task_log_window.flush(now=11.53, safety_margin_pct=0.05)
+        self.assertEqual(1, len(task_log_window))
+
+        task_log_window.flush(now=11.53, safety_margin_pct=0)
+        self.assertEqual(0, len(task_log_window))
+        self.assertEqual(0, task_log_window.capacity_used)
+
+    def test_acquire_with_linked_limits_logs_one_task_per_limit(self):
+        context = self.throttler.execute_task(limit_id=TEST_WEIGHTED_TASK_1_ID)
+        self.ev_loop.run_until_complete(context.acquire())
+
+        self.assertEqual(2, self.task_logs_count())
+        self.assertEqual(1, self.throttler._task_logs[TEST_WEIGHTED_TASK_1_ID].capacity_used)
+        self.assertEqual(5, self.throttler._task_logs[TEST_WEIGHTED_POOL_ID].capacity_used)
+
+    def test_time_until_capacity(self):
+        rate_limit, related_limits = self.throttler.get_related_limits(limit_id=TEST_WEIGHTED_TASK_1_ID)
+        context = self.throttler.execute_task(limit_id=TEST_WEIGHTED_TASK_1_ID)
+        now = context._time()
+
+        self.assertEqual(0, context.time_until_capacity())
+
+        # Pool capacity used is 5 + 4 = 9/10, the new task requires 5 so the first log has to expire
+        pool_limit, _ = related_limits[0]
+        self.add_task_log(timestamp=now - 4, rate_limit=pool_limit, weight=5)
+        self.add_task_log(timestamp=now - 1, rate_limit=pool_limit, weight=4)
+
+        expected_wait = 5.0 * (1 + self.throttler._safety_margin_pct) - 4
+        self.assertAlmostEqual(expected_wait, context.time_until_capacity(), delta=0.01)
+
+    def test_acquire_wakes_up_when_capacity_is_freed(self):
+        rate_limit = RateLimit(limit_id="fast_limit", limit=1, time_interval=0.2)
+        throttler = AsyncThrottler(rate_limits=[rate_limit], retry_interval=10)
+        context = throttler.execute_task(limit_id=rate_limit.limit_id)
+        throttler._task_logs[rate_limit.limit_id] = TaskLogWindow()
+        throttler._task_logs[rate_limit.limit_id].append(
+            TaskLog(timestamp=context._time() - 0.15, rate_limit=rate_limit, weight=1))
+
+        start = time.monotonic()
+        self.ev_loop.run_until_complete(asyncio.wait_for(context.acquire(), 1.0))
+        elapsed = time.monotonic() - start
+
+        # Without a precise wake up the request would wait for the retry interval (10 seconds)
+        self.assertLess(elapsed, 0.5)
+        self.assertEqual(0, len(throttler._waiters))
+
+    def test_waiting_requests_acquire_in_fifo_order(self):
+        rate_limit = RateLimit(limit_id="fifo_limit", limit=1, time_interval=0.05)
+        throttler = AsyncThrottler(rate_limits=[rate_limit])
+        acquired_order = []
+
+        async def request(request_id: int):
+            async with throttler.execute_task(limit_id=rate_limit.limit_id):
+                acquired_order.append(request_id)
+
+        async def run_requests():
+            tasks = []
+            for request_id in range(5):
+                tasks.append(asyncio.ensure_future(request(request_id)))
+                await asyncio.sleep(0)
+            await asyncio.gather(*tasks)
+
+        self.ev_loop.run_until_complete(asyncio.wait_for(run_requests(), 2))
+
+        self.assertEqual(list(range(5)), acquired_order)
+        self.assertEqual(0, len(throttler._waiters))
+
+    def test_waiting_request_does_not_block_requests_for_other_limits(self):
+        context = self.throttler.execute_task(limit_id=TEST_POOL_ID)
+        self.add_task_log(timestamp=context._time(), rate_limit=self.rate_limits[0], weight=1)
+        waiting_task = self.ev_loop.create_task(context.acquire())
+        self.ev_loop.run_until_complete(asyncio.sleep(0.01))
+
+        self.assertEqual(1, len(self.throttler._waiters))
+
+        other_context = self.throttler.execute_task(limit_id=TEST_WEIGHTED_TASK_2_ID)
+        self.ev_loop.run_until_complete(asyncio.wait_for(other_context.acquire(), 0.5))
+
+        self.assertEqual(1, self.throttler._task_logs[TEST_WEIGHTED_POOL_ID].capacity_used)
+
+        waiting_task.cancel()
+        with self.assertRaises(asyncio.CancelledError):
+            self.ev_loop.run_until_complete(waiting_task)
+        self.assertEqual(0, len(self.throttler._waiters))
+
+    def queue_waiting_requests(self, limit_ids: List[str]) -> List[AsyncRequestContext]:
+        contexts = []
+        for limit_id in limit_ids:
+            context = self.throttler.execute_task(limit_id=limit_id)
+            context._join_waiters()
+            context._wake_up_future = self.ev_loop.create_future()
+            contexts.append(context)
+        return contexts
+
+    def test_leaving_request_only_wakes_up_the_requests_queued_behind_it(self):
+        first, second, linked, other = self.queue_waiting_requests(
+            [TEST_POOL_ID, TEST_POOL_ID, TEST_PATH_URL, TEST_WEIGHTED_TASK_2_ID])
+
+        first._leave_waiters()
+
+        self.assertTrue(second._wake_up_future.done())
+        # The request for the linked limit is still queued behind the second one
+        self.assertFalse(linked._wake_up_future.done())
+        # The request for other limits was first in line already, it is waiting for its own capacity
+        self.assertFalse(other._wake_up_future.done())
+
+        second._leave_waiters()
+
+        self.assertTrue(linked._wake_up_future.done())
+        self.assertFalse(other._wake_up_future.done())
+        self.assertEqual([linked, other], self.throttler._waiters)
+
+    def test_sync_capacity_used_only_wakes_up_the_first_waiting_request(self):
+        self.throttler.sync_capacity_used(limit_id=TEST_POOL_ID, capacity_used=1)
+        first, second, other = self.queue_waiting_requests([TEST_POOL_ID, TEST_POOL_ID, TEST_WEIGHTED_TASK_2_ID])
+
+        self.throttler.sync_capacity_used(limit_id=TEST_POOL_ID, capacity_used=0)
+
+        self.assertTrue(first._wake_up_future.done())
+        self.assertFalse(second._wake_up_future.done())
+        self.assertFalse(other._wake_up_future.done())
+
+    def test_execute_task_priority_defaults_to_request_priority_context(self):
+        context = self.throttler.execute_task(limit_id=TEST_POOL_ID)
+        self.assertEqual(RequestPriority.CREATE, context._priority)
+        self.assertEqual(0, context._headroom_pct)
+
+        with request_priority(RequestPriority.BACKGROUND):
+            context = self.throttler.execute_task(limit_id=TEST_POOL_ID)
+            cancel_context = self.throttler.execute_task(limit_id=TEST_POOL_ID, priority=RequestPriority.CANCEL)
+
+        self.assertEqual(RequestPriority.BACKGROUND, context._priority)
+        self.assertEqual(30, context._headroom_pct)
+        self.assertEqual(RequestPriority.CANCEL, cancel_context._priority)
+        self.assertEqual(RequestPriority.CREATE, self.throttler.task_priority())
+
+    def test_within_capacity_keeps_headroom_for_higher_priorities(self):
+        pool_limit = self.rate_limits[2]
+        background_context = self.throttler.execute_task(limit_id=TEST_WEIGHTED_TASK_2_ID,
+                                                         priority=RequestPriority.BACKGROUND)
+        create_context = self.throttler.execute_task(limit_id=TEST_WEIGHTED_TASK_2_ID,
+                                                     priority=RequestPriority.CREATE)
+        # 30% of the pool (3 out of 10) is reserved for priorities higher than BACKGROUND
+        self.add_task_log(timestamp=background_context._time(), rate_limit=pool_limit, weight=7)
+
+        self.assertFalse(background_context.within_capacity())
+        self.assertTrue(create_context.within_capacity())
+
+    def test_headroom_does_not_block_requests_fitting_in_the_full_limit(self):
+        context = self.throttler.execute_task(limit_id=TEST_POOL_ID, priority=RequestPriority.BACKGROUND)
+
+        self.assertEqual(1, context._usable_limit(self.rate_limits[0].limit, 1))
+        self.assertTrue(context.within_capacity())
+
+    def test_higher_priority_waiting_requests_acquire_first(self):
+        rate_limit = RateLimit(limit_id="priority_limit", limit=1, time_interval=0.05)
+        throttler = AsyncThrottler(rate_limits=[rate_limit])
+        acquired_order = []
+
+        async def request(request_id: str, priority: RequestPriority):
+            async with throttler.execute_task(limit_id=rate_limit.limit_id, priority=priority):
+                acquired_order.append(request_id)
+
+        async def run_requests():
+            tasks = []
+            for request_id, priority in [("create_1", RequestPriority.CREATE),
+                                         ("polling", RequestPriority.USER_DATA),
+                                         ("create_2", RequestPriority.CREATE),
+                                         ("cancel", RequestPriority.CANCEL)]:
+                tasks.append(asyncio.ensure_future(request(request_id, priority)))
+                await asyncio.sleep(0)
+            await asyncio.gather(*tasks)
+
+        self.ev_loop.run_until_complete(asyncio.wait_for(run_requests(), 2))
+
+        self.assertEqual(["create_1", "cancel", "create_2", "polling"], acquired_order)
+        self.assertEqual(0, len(throttler._waiters))
+
+    def test_within_capacity_considers_capacity_reported_by_the_exchange(self):
+        throttler = AsyncThrottler(rate_limits=[RateLimit(limit_id="WEIGHT", limit=100, time_interval=60)],
+                                   limits_share_percentage=Decimal("50"))
+        context = throttler.execute_task(limit_id="WEIGHT")
+        for _ in range(20):
+            self.ev_loop.run_until_complete(context.acquire())
+
+        # Another process sharing the limit used 75, this instance still has 30 out of its 50 but only 5 are left
+        throttler.sync_capacity_used(limit_id="WEIGHT", capacity_used=95)
+        self.assertEqual(75, throttler._task_logs["WEIGHT"].reported_capacity_used)
+        for _ in range(5):
+            self.assertTrue(context.within_capacity())
+            self.ev_loop.run_until_complete(context.acquire())
+        self.assertFalse(context.within_capacity())
+
+        # The exchange reports that the other process usage expired
+        throttler.sync_capacity_used(limit_id="WEIGHT", capacity_used=25)
+        self.assertEqual(0, throttler._task_logs["WEIGHT"].reported_capacity_used)
+        self.assertTrue(context.within_capacity())
+
+    def test_reported_capacity_expires_after_the_limit_interval(self):
+        rate_limit = RateLimit(limit_id="WEIGHT", limit=10, time_interval=5)
+        task_log_window = TaskLogWindow()
+        task_log_window.append(TaskLog(timestamp=99, rate_limit=rate_limit, weight=2))
+        task_log_window.sync_capacity_used(capacity_used=9, limit=10, time_interval=5, now=100, safety_margin_pct=0.0)
+
+        self.assertEqual(7, task_log_window.reported_capacity_used)
+        self.assertEqual(0.0, task_log_window.time_until_available(weight=1, limit=10, now=100, safety_margin_pct=0.0))
+        self.assertEqual(4.0, task_log_window.time_until_available(weight=2, limit=10, now=100, safety_margin_pct=0.0))
+        # Freeing the own task log is not enough, the reported capacity has to expire
+        self.assertEqual(5.0, task_log_window.time_until_available(weight=4, limit=10, now=100, safety_margin_pct=0.0))
+
+        task_log_window.flush(now=105.5, safety_margin_pct=0.0)
+
+        self.assertEqual(0, task_log_window.reported_capacity_used)
+        self.assertIsNone(task_log_window.reported_limit)
+
+    def test_sync_capacity_used_wakes_up_waiting_requests(self):
+        rate_limit = RateLimit(limit_id="WEIGHT", limit=10, time_interval=60)
+        throttler = AsyncThrottler(rate_limits=[rate_limit], retry_interval=10)
+        throttler.sync_capacity_used(limit_id="WEIGHT", capacity_used=10)
+        context = throttler.execute_task(limit_id="WEIGHT")
+        waiting_task = self.ev_loop.create_task(context.acquire())
+        self.ev_loop.run_until_complete(asyncio.sleep(0.01))
+        self.assertFalse(waiting_task.done())
+
+        throttler.sync_capacity_used(limit_id="WEIGHT", capacity_used=0)
+        self.ev_loop.run_until_complete(asyncio.wait_for(waiting_task, 0.5))
+
+        self.assertEqual(1, throttler._task_logs["WEIGHT"].capacity_used)
@@ -0,0 +1,187 @@
+import asyncio
+import os
+import socket
+import stat
+import tempfile
+import unittest
+from decimal import Decimal
+from typing import Awaitable, List
+from unittest.mock import patch
+
+from hummingbot.core.api_throttler.brokered_async_throttler import BrokeredAsyncThrottler, RateLimitBrokerClient
+from hummingbot.core.api_throttler.data_types import LinkedLimitWeightPair, RateLimit
+from hummingbot.core.api_throttler.rate_limit_broker import (
+    RateLimitBroker,
+    default_broker_socket_path,
+    rate_limit_from_json,
+    rate_limit_to_json,
+)
+
+TEST_POOL_ID = "TEST"
+TEST_PATH_URL = "/hummingbot"
+TEST_NAMESPACE = "test_exchange"
+
+
+class RateLimitBrokerTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        cls.ev_loop: asyncio.AbstractEventLoop = asyncio.get_event_loop()
+        cls.rate_limits: List[RateLimit] = [
+            RateLimit(limit_id=TEST_POOL_ID, limit=4, time_interval=60),
+            RateLimit(limit_id=TEST_PATH_URL, limit=100, time_interval=60,
+                      linked_limits=[LinkedLimitWeightPair(TEST_POOL_ID, 2)]),
+        ]
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.socket_path = os.path.join(self.temp_dir.name, "rate_limits.sock")
+        self.broker = RateLimitBroker(socket_path=self.socket_path)
+        self.clients: List[RateLimitBrokerClient] = []
+
+    def tearDown(self) -> None:
+        for client in self.clients:
+            client.disconnect()
+        self.async_run_with_timeout(self.broker.stop())
+        self.temp_dir.cleanup()
+        super().tearDown()
+
+    def async_run_with_timeout(self, coroutine: Awaitable, timeout: float = 1):
+        ret = self.ev_loop.run_until_complete(asyncio.wait_for(coroutine, timeout))
+        return ret
+
+    def create_throttler(self) -> BrokeredAsyncThrottler:
+        # Each throttler has its own client, as if it was running in a different process
+        client = RateLimitBrokerClient(socket_path=self.socket_path)
+        self.clients.append(client)
+        RateLimitBrokerClient._clients[self.socket_path] = client
+        throttler = BrokeredAsyncThrottler(rate_limits=self.rate_limits,
+                                           namespace=TEST_NAMESPACE,
+                                           socket_path=self.socket_path,
+                                           limits_share_percentage=Decimal("50"))
+        del RateLimitBrokerClient._clients[self.socket_path]
+        return throttler
+
+    def test_rate_limit_json_round_trip(self):
+        rate_limit = rate_limit_from_json(rate_limit_to_json(self.rate_limits[1]))
+
+        self.assertEqual(TEST_PATH_URL, rate_limit.limit_id)
+        self.assertEqual(100, rate_limit.limit)
+        self.assertEqual(60, rate_limit.time_interval)
+        self.assertEqual(TEST_POOL_ID, rate_limit.linked_limits[0].limit_id)
+        self.assertEqual(2, rate_limit.linked_limits[0].weight)
+
+    def test_register_keeps_limits_already_registered(self):
+        self.broker.register(TEST_NAMESPACE, self.rate_limits[:1])
+        throttler = self.broker.throttler(TEST_NAMESPACE)
+        self.async_run_with_timeout(throttler.execute_task(limit_id=TEST_POOL_ID).acquire())
+
+        self.broker.register(TEST_NAMESPACE, self.rate_limits)
+
+        self.assertIs(throttler, self.broker.throttler(TEST_NAMESPACE))
+        self.assertIn(TEST_PATH_URL, throttler._id_to_limit_map)
+        self.assertEqual(1, throttler._task_logs[TEST_POOL_ID].capacity_used)
+
+    def test_default_socket_path_is_in_the_user_runtime_directory(self):
+        with patch.dict(os.environ, {"XDG_RUNTIME_DIR": self.temp_dir.name}):
+            self.assertEqual(os.path.join(self.temp_dir.name, "hummingbot_rate_limits.sock"),
+                             default_broker_socket_path())
+            self.assertEqual(default_broker_socket_path(), RateLimitBroker().socket_path)
+
+    def test_socket_is_only_accessible_by_the_user(self):
+        self.async_run_with_timeout(self.broker.start())
+
+        self.assertEqual(0o600, stat.S_IMODE(os.stat(self.socket_path).st_mode))
+
+    def test_start_fails_when_another_broker_is_listening(self):
+        self.async_run_with_timeout(self.broker.start())
+        second_broker = RateLimitBroker(socket_path=self.socket_path)
+
+        with self.assertRaises(EnvironmentError):
+            self.async_run_with_timeout(second_broker.start())
+        self.async_run_with_timeout(second_broker.stop())
+
+        # The socket of the first broker is still served
+        self.assertTrue(os.path.exists(self.socket_path))
+        self.assertTrue(self.async_run_with_timeout(RateLimitBroker(socket_path=self.socket_path)._is_broker_listening()))
+
+    def test_start_replaces_the_socket_of_a_stopped_broker(self):
+        stale_socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        stale_socket.bind(self.socket_path)
+        stale_socket.close()
+
+        self.async_run_with_timeout(self.broker.start())
+
+        self.assertTrue(self.async_run_with_timeout(self.broker._is_broker_listening()))
+
+    def test_start_fails_when_the_path_is_not_a_socket(self):
+        with open(self.socket_path, "w") as file:
+            file.write("data")
+
+        with self.assertRaises(EnvironmentError):
+            self.async_run_with_timeout(self.broker.start())
+        self.assertTrue(os.path.isfile(self.socket_path))
+
+    def test_processes_share_the_full_limits_through_the_broker(self):
+        self.async_run_with_timeout(self.broker.start())
+        throttler_1 = self.create_throttler()
+        throttler_2 = self.create_throttler()
+
+        # Each throttler would only be allowed to use 2 of the pool capacity without the broker (50% share)
+        self.async_run_with_timeout(throttler_1.execute_task(limit_id=TEST_PATH_URL).acquire())
+        self.async_run_with_timeout(throttler_1.execute_task(limit_id=TEST_POOL_ID).acquire())
+        self.async_run_with_timeout(throttler_2.execute_task(limit_id=TEST_POOL_ID).acquire())
+
+        self.assertEqual(4, self.broker.throttler(TEST_NAMESPACE)._task_logs[TEST_POOL_ID].capacity_used)
+        self.assertEqual(3, throttler_1._task_logs[TEST_POOL_ID].capacity_used)
+
+        # The pool is exhausted for all the processes
+        waiting_task = self.ev_loop.create_task(throttler_2.execute_task(limit_id=TEST_POOL_ID).acquire())
+        self.ev_loop.run_until_complete(asyncio.sleep(0.1))
+        self.assertFalse(waiting_task.done())
+        self.assertEqual(1, len(self.broker.throttler(TEST_NAMESPACE)._waiters))
+
+        waiting_task.cancel()
+        with self.assertRaises(asyncio.CancelledError):
+            self.ev_loop.run_until_complete(waiting_task)
+        self.ev_loop.run_until_complete(asyncio.sleep(0.1))
+        self.assertEqual(0, len(self.broker.throttler(TEST_NAMESPACE)._waiters))
+
+    def test_sync_capacity_used_is_shared_with_the_broker(self):
+        self.async_run_with_timeout(self.broker.start())
+        throttler = self.create_throttler()
+        self.async_run_with_timeout(throttler.execute_task(limit_id=TEST_POOL_ID).acquire())
+
+        throttler.sync_capacity_used(limit_id=TEST_POOL_ID, capacity_used=3)
+        self.ev_loop.run_until_complete(asyncio.sleep(0.1))
+
+        self.assertEqual(2, self.broker.throttler(TEST_NAMESPACE)._task_logs[TEST_POOL_ID].reported_capacity_used)
+
+    def test_throttles_locally_when_broker_is_not_available(self):
+        throttler = self.create_throttler()
+
+        self.async_run_with_timeout(throttler.execute_task(limit_id=TEST_POOL_ID).acquire())
+        self.async_run_with_timeout(throttler.execute_task(limit_id=TEST_POOL_ID).acquire())
+
+        self.assertFalse(self.clients[0].is_connected)
+        self.assertEqual(2, throttler._task_logs[TEST_POOL_ID].capacity_used)
+        # The share percentage applies when throttling locally
+        self.assertFalse(throttler.execute_task(limit_id=TEST_POOL_ID).within_capacity())
+
+    def test_pending_requests_fall_back_to_local_throttling_when_connection_is_lost(self):
+        self.async_run_with_timeout(self.broker.start())
+        throttler = self.create_throttler()
+        for _ in range(4):
+            self.async_run_with_timeout(throttler.execute_task(limit_id=TEST_POOL_ID).acquire())
+        throttler._task_logs[TEST_POOL_ID].task_logs.clear()
+        throttler._task_logs[TEST_POOL_ID].capacity_used = 0
+
+        waiting_task = self.ev_loop.create_task(throttler.execute_task(limit_id=TEST_POOL_ID).acquire())
+        self.ev_loop.run_until_complete(asyncio.sleep(0.1))
+        self.assertFalse(waiting_task.done())
+
+        self.clients[0].disconnect()
+        self.async_run_with_timeout(waiting_task)
+
+        self.assertEqual(1, throttler._task_logs[TEST_POOL_ID].capacity_used)
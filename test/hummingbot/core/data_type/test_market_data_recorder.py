@@ -0,0 +1,170 @@
+import asyncio
+import os
+import tempfile
+import unittest
+from typing import List
+
+from hummingbot.core.data_type.common import TradeType
+from hummingbot.core.data_type.market_data_recorder import (
+    MarketDataRecorder,
+    MarketDataRecordingQueue,
+    market_data_file_name,
+    read_market_data_file,
+)
+from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
+from hummingbot.core.data_type.replay_order_book_tracker_data_source import ReplayOrderBookTrackerDataSource
+
+
+class MarketDataRecorderTests(unittest.TestCase):
+    trading_pair = "COINALPHA-HBOT"
+    # 2022-01-01 00:00:00 UTC
+    start_timestamp = 1640995200.0
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.ev_loop = asyncio.get_event_loop()
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.recorder = MarketDataRecorder(data_dir=self.temp_dir.name, max_pending_messages=10)
+
+    def tearDown(self) -> None:
+        self.recorder.stop()
+        self.temp_dir.cleanup()
+        super().tearDown()
+
+    def book_message(self, message_type: OrderBookMessageType, timestamp: float, update_id: int,
+                     bids: List, asks: List) -> OrderBookMessage:
+        return OrderBookMessage(message_type, {
+            "trading_pair": self.trading_pair, "update_id": update_id, "bids": bids, "asks": asks
+        }, timestamp=timestamp)
+
+    def trade_message(self, timestamp: float, trade_id, price: float, amount: float) -> OrderBookMessage:
+        return OrderBookMessage(OrderBookMessageType.TRADE, {
+            "trading_pair": self.trading_pair, "trade_id": trade_id, "price": price, "amount": amount,
+            "trade_type": float(TradeType.SELL.value)
+        }, timestamp=timestamp)
+
+    def recorded_messages(self, timestamp: float) -> List[OrderBookMessage]:
+        file_path = os.path.join(self.temp_dir.name, market_data_file_name(self.trading_pair, timestamp))
+        return list(read_market_data_file(file_path, trading_pair=self.trading_pair))
+
+    def test_messages_round_trip(self):
+        messages = [
+            self.book_message(OrderBookMessageType.SNAPSHOT, self.start_timestamp + 0.5, 100,
+                              bids=[["99.5", "1.25"], ["99", "3"]], asks=[["100.5", "2"]]),
+            self.book_message(OrderBookMessageType.DIFF, self.start_timestamp + 1.25, 98,
+                              bids=[], asks=[["100.5", "0"], ["101.123", "0.00000001"]]),
+            self.trade_message(self.start_timestamp + 2, trade_id=12345, price=100.5, amount=0.5),
+            self.trade_message(self.start_timestamp + 3, trade_id="a-b-c", price=99, amount=1),
+        ]
+        for message in messages:
+            self.recorder.record(message)
+
+        self.recorder.write_pending_messages()
+        self.recorder.stop()
+        recorded = self.recorded_messages(self.start_timestamp)
+
+        self.assertEqual([message.type for message in messages], [message.type for message in recorded])
+        self.assertEqual([message.timestamp for message in messages], [message.timestamp for message in recorded])
+        self.assertEqual(100, recorded[0].update_id)
+        self.assertEqual([[99.5, 1.25], [99, 3]], recorded[0].content["bids"])
+        self.assertEqual([[100.5, 2]], recorded[0].content["asks"])
+        self.assertEqual(98, recorded[1].update_id)
+        self.assertEqual([[100.5, 0], [101.123, 0.00000001]], recorded[1].content["asks"])
+        self.assertEqual(12345, recorded[2].trade_id)
+        self.assertEqual(100.5, recorded[2].content["price"])
+        self.assertEqual(float(TradeType.SELL.value), recorded[2].content["trade_type"])
+        self.assertEqual("a-b-c", recorded[3].trade_id)
+        self.assertEqual(4, self.recorder.recorded_messages_count)
+
+    def test_binary_encoding_is_compact(self):
+        bids = [[100 - level * 0.01, 1 + level] for level in range(20)]
+        self.recorder.record(self.book_message(OrderBookMessageType.SNAPSHOT, self.start_timestamp, 1, bids, []))
+
+        self.recorder.stop()
+        file_path = os.path.join(self.temp_dir.name, market_data_file_name(self.trading_pair, self.start_timestamp))
+
+        # Less than 10 bytes per price level
+        self.assertLess(os.path.getsize(file_path), 200)
+
+    def test_files_are_rotated_every_hour(self):
+        self.recorder.record(self.book_message(OrderBookMessageType.SNAPSHOT, self.start_timestamp, 1,
+                                               bids=[[1, 1]], asks=[]))
+        self.recorder.record(self.book_message(OrderBookMessageType.DIFF, self.start_timestamp + 3600, 2,
+                                               bids=[[2, 1]], asks=[]))
+
+        self.recorder.stop()
+
+        self.assertEqual({f"{self.trading_pair}_2022010100.hbmd", f"{self.trading_pair}_2022010101.hbmd"},
+                         set(os.listdir(self.temp_dir.name)))
+        self.assertEqual(1, len(self.recorded_messages(self.start_timestamp)))
+        self.assertEqual(2, self.recorded_messages(self.start_timestamp + 3600)[0].update_id)
+
+    def test_appending_after_restart_resets_the_delta_encoding(self):
+        self.recorder.record(self.book_message(OrderBookMessageType.SNAPSHOT, self.start_timestamp, 10,
+                                               bids=[[5, 1]], asks=[]))
+        self.recorder.stop()
+        self.recorder.record(self.book_message(OrderBookMessageType.DIFF, self.start_timestamp + 1, 11,
+                                               bids=[[6, 1]], asks=[]))
+        self.recorder.stop()
+
+        recorded = self.recorded_messages(self.start_timestamp)
+
+        self.assertEqual([10, 11], [message.update_id for message in recorded])
+        self.assertEqual([[6, 1]], recorded[1].content["bids"])
+
+    def test_messages_are_dropped_when_too_many_are_pending(self):
+        for update_id in range(15):
+            self.recorder.record(self.book_message(OrderBookMessageType.DIFF, self.start_timestamp, update_id,
+                                                   bids=[], asks=[]))
+
+        self.assertEqual(10, self.recorder.pending_messages_count)
+        self.assertEqual(5, self.recorder.dropped_messages_count)
+
+    def test_background_thread_writes_the_pending_messages(self):
+        recorder = MarketDataRecorder(data_dir=self.temp_dir.name, flush_interval=0.01)
+        recorder.start()
+        self.assertTrue(recorder.started)
+        recorder.record(self.trade_message(self.start_timestamp, trade_id=1, price=1, amount=1))
+
+        recorder.stop()
+
+        self.assertFalse(recorder.started)
+        self.assertEqual(1, recorder.recorded_messages_count)
+        self.assertEqual(1, len(self.recorded_messages(self.start_timestamp)))
+
+    def test_recording_queue_records_the_messages_added(self):
+        queue = asyncio.Queue()
+        recording_queue = MarketDataRecordingQueue(queue=queue, recorder=self.recorder)
+        message = self.trade_message(self.start_timestamp, trade_id=1, price=1, amount=1)
+
+        recording_queue.put_nowait(message)
+        self.ev_loop.run_until_complete(recording_queue.put(message))
+
+        self.assertEqual(2, recording_queue.qsize())
+        self.assertEqual(2, self.recorder.pending_messages_count)
+
+    def test_data_source_records_its_output_when_recorder_is_set(self):
+        data_source = ReplayOrderBookTrackerDataSource(trading_pairs=[self.trading_pair], data_files={})
+        queue = asyncio.Queue()
+        self.assertIs(queue, data_source.recorded_output(queue))
+
+        data_source.market_data_recorder = self.recorder
+        self.ev_loop.run_until_complete(data_source.get_new_order_book(self.trading_pair))
+        self.ev_loop.run_until_complete(data_source._parse_trade_message(
+            self.trade_message(self.start_timestamp, trade_id=1, price=1, amount=1),
+            message_queue=data_source.recorded_output(queue)))
+
+        self.assertEqual(1, queue.qsize())
+        self.assertEqual(2, self.recorder.pending_messages_count)
+
+    def test_recorded_files_can_be_replayed(self):
+        self.recorder.record(self.book_message(OrderBookMessageType.SNAPSHOT, self.start_timestamp, 1,
+                                               bids=[[99, 1]], asks=[[101, 1]]))
+        self.recorder.record(self.trade_message(self.start_timestamp + 1, trade_id=1, price=100, amount=1))
+        self.recorder.stop()
+
+        data_source = ReplayOrderBookTrackerDataSource.from_directory([self.trading_pair], self.temp_dir.name)
+        messages = data_source.pop_messages_until(self.start_timestamp + 10)
+
+        self.assertEqual([OrderBookMessageType.SNAPSHOT, OrderBookMessageType.TRADE],
+                         [message.type for message in messages])
@@ -3,6 +3,8 @@
 import logging
 import unittest
 from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.event.event_logger import EventLogger
+from hummingbot.core.event.events import OrderBookEvent
 import numpy as np
 
 
@@ -50,6 +52,28 @@ class OrderBookUnitTest(unittest.TestCase):
         self.assertEqual(best_bid, [50., 0.01, 6.])
         self.assertEqual(best_ask, 0)
 
+    def test_top_changed_event_only_triggered_when_best_prices_change(self):
+        order_book = OrderBook()
+        event_logger = EventLogger()
+        order_book.add_listener(OrderBookEvent.TopChangedEvent, event_logger)
+
+        bids_array = np.array([[1, 1, 1], [2, 1, 2]], dtype=np.float64)
+        asks_array = np.array([[4, 1, 1], [5, 1, 2]], dtype=np.float64)
+        order_book.apply_numpy_snapshot(bids_array, asks_array)
+
+        self.assertEqual(1, len(event_logger.event_log))
+        self.assertEqual(2, event_logger.event_log[0].best_bid)
+        self.assertEqual(4, event_logger.event_log[0].best_ask)
+
+        # Changes below the top of the book
+        order_book.apply_numpy_diffs(np.array([[1, 3, 3]], dtype=np.float64), np.array([[5, 0, 3]], dtype=np.float64))
+        self.assertEqual(1, len(event_logger.event_log))
+
+        order_book.apply_numpy_diffs(np.array([[3, 1, 4]], dtype=np.float64), np.array([], dtype=np.float64).reshape(0, 3))
+        self.assertEqual(2, len(event_logger.event_log))
+        self.assertEqual(3, event_logger.event_log[1].best_bid)
+        self.assertEqual(4, event_logger.event_log[1].best_ask)
+
 
 def main():
     logging.basicConfig(level=logging.INFO)
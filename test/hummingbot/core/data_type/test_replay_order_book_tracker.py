@@ -0,0 +1,176 @@
+import asyncio
+import gzip
+import json
+import math
+import os
+import tempfile
+import unittest
+from typing import Any, Dict, List
+
+from hummingbot.core.clock import Clock, ClockMode
+from hummingbot.core.data_type.common import TradeType
+from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
+from hummingbot.core.data_type.replay_order_book_tracker import ReplayOrderBookTracker
+from hummingbot.core.data_type.replay_order_book_tracker_data_source import (
+    ReplayOrderBookTrackerDataSource,
+    order_book_message_from_json,
+    order_book_message_to_json,
+)
+from hummingbot.core.event.event_logger import EventLogger
+from hummingbot.core.event.events import OrderBookEvent
+
+
+class ReplayOrderBookTrackerTests(unittest.TestCase):
+    trading_pair = "COINALPHA-HBOT"
+    other_trading_pair = "WETH-HBOT"
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.ev_loop = asyncio.get_event_loop()
+        self.temp_dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self) -> None:
+        self.temp_dir.cleanup()
+        super().tearDown()
+
+    @staticmethod
+    def snapshot(timestamp: float, update_id: int, bids: List, asks: List) -> Dict[str, Any]:
+        return {"type": "snapshot", "timestamp": timestamp,
+                "content": {"update_id": update_id, "bids": bids, "asks": asks}}
+
+    @staticmethod
+    def diff(timestamp: float, update_id: int, bids: List, asks: List) -> Dict[str, Any]:
+        return {"type": "diff", "timestamp": timestamp,
+                "content": {"update_id": update_id, "bids": bids, "asks": asks}}
+
+    @staticmethod
+    def trade(timestamp: float, trade_id: int, price: float, amount: float, trade_type: TradeType) -> Dict[str, Any]:
+        return {"type": "trade", "timestamp": timestamp,
+                "content": {"trade_id": trade_id, "price": price, "amount": amount,
+                            "trade_type": float(trade_type.value)}}
+
+    def write_data_file(self, file_name: str, records: List[Dict[str, Any]]) -> str:
+        file_path = os.path.join(self.temp_dir.name, file_name)
+        open_function = gzip.open if file_name.endswith(".gz") else open
+        with open_function(file_path, "wt") as data_file:
+            for record in records:
+                data_file.write(json.dumps(record) + "\n")
+        return file_path
+
+    def write_default_data_files(self):
+        self.write_data_file(f"{self.trading_pair}_00.jsonl", [
+            self.snapshot(10, 1, bids=[[99, 1]], asks=[[101, 1]]),
+            self.diff(12, 2, bids=[[100, 2]], asks=[]),
+            self.trade(15, 1, price=100, amount=0.5, trade_type=TradeType.SELL),
+        ])
+        self.write_data_file(f"{self.trading_pair}_01.jsonl.gz", [
+            self.diff(20, 3, bids=[], asks=[[101, 0], [102, 3]]),
+        ])
+        self.write_data_file(f"{self.other_trading_pair}.jsonl", [
+            self.snapshot(11, 7, bids=[[9, 1]], asks=[[11, 1]]),
+            self.diff(13, 8, bids=[], asks=[[10.5, 1]]),
+        ])
+        self.write_data_file("UNRELATED-PAIR.jsonl", [self.snapshot(1, 1, bids=[[1, 1]], asks=[[2, 1]])])
+
+    def create_tracker(self) -> ReplayOrderBookTracker:
+        trading_pairs = [self.trading_pair, self.other_trading_pair]
+        data_source = ReplayOrderBookTrackerDataSource.from_directory(trading_pairs=trading_pairs,
+                                                                      data_dir=self.temp_dir.name)
+        return ReplayOrderBookTracker(data_source=data_source, trading_pairs=trading_pairs)
+
+    def test_message_json_round_trip(self):
+        message = OrderBookMessage(OrderBookMessageType.DIFF,
+                                   {"trading_pair": self.trading_pair, "update_id": 3, "bids": [[1, 2]], "asks": []},
+                                   timestamp=5.5)
+
+        restored = order_book_message_from_json(json.loads(json.dumps(order_book_message_to_json(message))))
+
+        self.assertEqual(OrderBookMessageType.DIFF, restored.type)
+        self.assertEqual(5.5, restored.timestamp)
+        self.assertEqual(self.trading_pair, restored.trading_pair)
+        self.assertEqual(3, restored.update_id)
+
+    def test_data_source_merges_messages_in_timestamp_order(self):
+        self.write_default_data_files()
+        data_source = self.create_tracker().data_source
+
+        self.assertEqual(2, len(data_source.data_files[self.trading_pair]))
+        self.assertEqual(10, data_source.next_message_timestamp)
+
+        messages = data_source.pop_messages_until(13)
+
+        self.assertEqual([10, 11, 12, 13], [message.timestamp for message in messages])
+        self.assertEqual([self.trading_pair, self.other_trading_pair, self.trading_pair, self.other_trading_pair],
+                         [message.trading_pair for message in messages])
+        self.assertEqual(15, data_source.next_message_timestamp)
+
+        messages = data_source.pop_messages_until(100)
+
+        self.assertEqual([15, 20], [message.timestamp for message in messages])
+        self.assertTrue(data_source.exhausted)
+        self.assertTrue(math.isnan(data_source.next_message_timestamp))
+        self.assertEqual(6, data_source.replayed_messages_count)
+        last_prices = self.ev_loop.run_until_complete(
+            data_source.get_last_traded_prices([self.trading_pair, self.other_trading_pair]))
+        self.assertEqual({self.trading_pair: 100}, last_prices)
+
+    def test_data_source_reset_restarts_the_replay(self):
+        self.write_default_data_files()
+        data_source = self.create_tracker().data_source
+        data_source.pop_messages_until(100)
+
+        data_source.reset()
+
+        self.assertEqual(10, data_source.next_message_timestamp)
+        self.assertEqual(0, data_source.replayed_messages_count)
+
+    def test_replay_applies_messages_to_the_order_books(self):
+        self.write_default_data_files()
+        tracker = self.create_tracker()
+        tracker.start()
+        trade_logger = EventLogger()
+        tracker.order_books[self.trading_pair].add_listener(OrderBookEvent.TradeEvent, trade_logger)
+
+        self.assertEqual(1, tracker.replay_until(10))
+        self.assertFalse(tracker.ready)
+
+        tracker.replay_until(12)
+
+        self.assertTrue(tracker.ready)
+        order_book = tracker.order_books[self.trading_pair]
+        self.assertEqual(100, order_book.get_price(False))
+        self.assertEqual(101, order_book.get_price(True))
+
+        tracker.replay_until(20)
+
+        self.assertEqual(102, order_book.get_price(True))
+        self.assertEqual(10.5, tracker.order_books[self.other_trading_pair].get_price(True))
+        self.assertEqual(1, len(trade_logger.event_log))
+        self.assertEqual(TradeType.SELL, trade_logger.event_log[0].type)
+        self.assertEqual(100, order_book.last_trade_price)
+
+    def test_replay_skips_diffs_older_than_the_snapshot(self):
+        self.write_data_file(f"{self.trading_pair}.jsonl", [
+            self.snapshot(10, 5, bids=[[99, 1]], asks=[[101, 1]]),
+            self.diff(11, 4, bids=[[100, 1]], asks=[]),
+        ])
+        tracker = ReplayOrderBookTracker(
+            data_source=ReplayOrderBookTrackerDataSource.from_directory([self.trading_pair], self.temp_dir.name),
+            trading_pairs=[self.trading_pair])
+
+        tracker.replay_until(11)
+
+        self.assertEqual(99, tracker.order_books[self.trading_pair].get_price(False))
+
+    def test_replay_iterator_ticks_at_the_recorded_messages_timestamps(self):
+        self.write_default_data_files()
+        tracker = self.create_tracker()
+        clock = Clock(ClockMode.BACKTEST_EVENT_TIME, tick_size=1.0, start_time=0.0, end_time=100.0)
+        clock.add_iterator(tracker.replay_iterator)
+
+        clock.backtest()
+
+        self.assertTrue(tracker.data_source.exhausted)
+        self.assertTrue(tracker.ready)
+        self.assertEqual(102, tracker.order_books[self.trading_pair].get_price(True))
+        self.assertEqual(100.0, clock.current_timestamp)
@@ -0,0 +1,128 @@
+import asyncio
+import unittest
+from test.mock.mock_events import MockEvent, MockEventType
+from typing import Any, List, Tuple
+
+from hummingbot.core.event.event_forwarder import (
+    AsyncEventForwarder,
+    AsyncSourceInfoEventForwarder,
+    EventForwarder,
+    SourceInfoEventForwarder,
+)
+from hummingbot.core.pubsub import PubSub
+
+
+class EventForwarderTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        cls.ev_loop = asyncio.get_event_loop()
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.pubsub = PubSub()
+        self.received: List[Any] = []
+        self.received_with_source: List[Tuple[int, PubSub, Any]] = []
+
+    def run_pending_callbacks(self):
+        self.ev_loop.run_until_complete(asyncio.sleep(0.01))
+
+    def test_event_forwarder(self):
+        forwarder = EventForwarder(to_function=self.received.append)
+        self.pubsub.add_listener(MockEventType.EVENT_ZERO, forwarder)
+
+        self.pubsub.trigger_event(MockEventType.EVENT_ZERO, MockEvent(payload=1))
+
+        self.assertEqual([MockEvent(payload=1)], self.received)
+
+    def test_source_info_event_forwarder(self):
+        forwarder = SourceInfoEventForwarder(
+            to_function=lambda tag, caller, arg: self.received_with_source.append((tag, caller, arg)))
+        self.pubsub.add_listener(MockEventType.EVENT_ONE, forwarder)
+
+        self.pubsub.trigger_event(MockEventType.EVENT_ONE, MockEvent(payload=1))
+
+        self.assertEqual([(MockEventType.EVENT_ONE.value, self.pubsub, MockEvent(payload=1))],
+                         self.received_with_source)
+
+    def test_async_event_forwarder_processes_events_later_in_order(self):
+        forwarder = AsyncEventForwarder(to_function=self.received.append)
+        self.pubsub.add_listener(MockEventType.EVENT_ZERO, forwarder)
+
+        for payload in range(3):
+            self.pubsub.trigger_event(MockEventType.EVENT_ZERO, MockEvent(payload=payload))
+
+        self.assertEqual([], self.received)
+        self.assertEqual(3, forwarder.pending_events)
+
+        self.run_pending_callbacks()
+
+        self.assertEqual([MockEvent(payload=payload) for payload in range(3)], self.received)
+        self.assertEqual(0, forwarder.pending_events)
+        self.assertEqual(3, forwarder.stats()["events_processed"])
+
+    def test_async_source_info_event_forwarder_keeps_event_source(self):
+        forwarder = AsyncSourceInfoEventForwarder(
+            to_function=lambda tag, caller, arg: self.received_with_source.append((tag, caller, arg)))
+        self.pubsub.add_listener(MockEventType.EVENT_ONE, forwarder)
+
+        self.pubsub.trigger_event(MockEventType.EVENT_ONE, MockEvent(payload=1))
+        self.run_pending_callbacks()
+
+        self.assertEqual([(MockEventType.EVENT_ONE.value, self.pubsub, MockEvent(payload=1))],
+                         self.received_with_source)
+
+    def test_async_event_forwarder_processes_events_in_batches(self):
+        forwarder = AsyncEventForwarder(to_function=self.received.append, batch_size=2)
+        self.pubsub.add_listener(MockEventType.EVENT_ZERO, forwarder)
+        for payload in range(5):
+            self.pubsub.trigger_event(MockEventType.EVENT_ZERO, MockEvent(payload=payload))
+
+        # A single batch is processed in each iteration of the event loop, the callbacks scheduled meanwhile run between
+        processed_counts = []
+        self.ev_loop.call_soon(lambda: processed_counts.append(len(self.received)))
+
+        self.run_pending_callbacks()
+        self.assertEqual([2], processed_counts)
+        self.assertEqual(5, len(self.received))
+
+    def test_async_event_forwarder_overflow(self):
+        forwarder = AsyncEventForwarder(to_function=self.received.append, max_buffer_size=2)
+        self.pubsub.add_listener(MockEventType.EVENT_ZERO, forwarder)
+
+        with self.assertLogs(logger=AsyncEventForwarder.logger().name, level="WARNING"):
+            for payload in range(4):
+                self.pubsub.trigger_event(MockEventType.EVENT_ZERO, MockEvent(payload=payload))
+
+        # The oldest events were processed synchronously to make room for the new ones
+        self.assertEqual([MockEvent(payload=0), MockEvent(payload=1)], self.received)
+        stats = forwarder.stats()
+        self.assertEqual(4, stats["events_received"])
+        self.assertEqual(2, stats["overflow_count"])
+        self.assertEqual(2, stats["max_buffer_usage"])
+
+        self.run_pending_callbacks()
+        self.assertEqual([MockEvent(payload=payload) for payload in range(4)], self.received)
+
+    def test_async_event_forwarder_flush(self):
+        forwarder = AsyncEventForwarder(to_function=self.received.append)
+        self.pubsub.add_listener(MockEventType.EVENT_ZERO, forwarder)
+        self.pubsub.trigger_event(MockEventType.EVENT_ZERO, MockEvent(payload=1))
+
+        forwarder.flush()
+
+        self.assertEqual([MockEvent(payload=1)], self.received)
+        self.run_pending_callbacks()
+        self.assertEqual(1, len(self.received))
+
+    def test_async_event_forwarder_logs_processing_errors(self):
+        def failing_function(_):
+            raise ValueError("test error")
+
+        forwarder = AsyncEventForwarder(to_function=failing_function)
+        self.pubsub.add_listener(MockEventType.EVENT_ZERO, forwarder)
+        self.pubsub.trigger_event(MockEventType.EVENT_ZERO, MockEvent(payload=1))
+
+        with self.assertLogs(logger=AsyncEventForwarder.logger().name, level="ERROR"):
+            self.run_pending_callbacks()
+        self.assertEqual(1, forwarder.stats()["events_processed"])
@@ -7,9 +7,31 @@ from hummingbot.core.clock import (
     Clock,
     ClockMode
 )
+from hummingbot.core.event.events import OrderBookEvent
+from hummingbot.core.pubsub import PubSub
+from hummingbot.core.py_time_iterator import PyTimeIterator
 from hummingbot.core.time_iterator import TimeIterator
 
 
+class TickCounterIterator(PyTimeIterator):
+    def __init__(self):
+        super().__init__()
+        self.tick_timestamps = []
+
+    def tick(self, timestamp: float):
+        self.tick_timestamps.append(timestamp)
+
+
+class DataReplayIterator(TickCounterIterator):
+    def __init__(self, data_timestamps):
+        super().__init__()
+        self.data_timestamps = data_timestamps
+
+    def next_tick_timestamp(self, timestamp: float) -> float:
+        return next((data_timestamp for data_timestamp in self.data_timestamps if data_timestamp > timestamp),
+                    float("nan"))
+
+
 class ClockUnitTest(unittest.TestCase):
 
     backtest_start_timestamp: float = pd.Timestamp("2021-01-01", tz="UTC").timestamp()
@@ -28,6 +50,16 @@ class ClockUnitTest(unittest.TestCase):
         self.clock_realtime = Clock(ClockMode.REALTIME, self.tick_size, self.realtime_start_timestamp, self.realtime_end_timestamp)
         self.clock_backtest = Clock(ClockMode.BACKTEST, self.tick_size, self.backtest_start_timestamp, self.backtest_end_timestamp)
 
+    @staticmethod
+    def wait_for_run_without_tick_boundary(tick_size: float, duration: float):
+        """
+        Waits until the next `duration` seconds don't include a tick size boundary, where the real time clocks tick
+        regardless of the triggers
+        """
+        time_to_boundary = tick_size - time.time() % tick_size
+        if time_to_boundary < duration + 0.1:
+            time.sleep(time_to_boundary + 0.01)
+
     def test_clock_mode(self):
         self.assertEqual(ClockMode.REALTIME, self.clock_realtime.clock_mode)
         self.assertEqual(ClockMode.BACKTEST, self.clock_backtest.clock_mode)
@@ -124,3 +156,225 @@ class ClockUnitTest(unittest.TestCase):
         self.clock_backtest.backtest_til(self.backtest_start_timestamp + self.tick_size)
         self.assertGreater(self.clock_backtest.current_timestamp, self.clock_backtest.start_time)
         self.assertLess(self.clock_backtest.current_timestamp, self.backtest_end_timestamp)
+
+    def test_event_driven_clock_ticks_when_triggered(self):
+        clock = Clock(ClockMode.EVENT_DRIVEN, tick_size=10, min_tick_interval=0.05)
+        iterator = TickCounterIterator()
+        clock.add_iterator(iterator)
+
+        async def trigger_ticks():
+            await asyncio.sleep(0.1)
+            clock.trigger_tick()
+            await asyncio.sleep(0.1)
+            clock.trigger_tick()
+
+        self.wait_for_run_without_tick_boundary(tick_size=10, duration=0.4)
+        with clock:
+            self.ev_loop.run_until_complete(asyncio.gather(clock.run_til(time.time() + 0.4), trigger_ticks()))
+
+        # The run doesn't include any tick size boundary, the clock only ticks when triggered
+        self.assertEqual(2, len(iterator.tick_timestamps))
+        self.assertLess(iterator.tick_timestamps[0], iterator.tick_timestamps[1])
+
+    def test_event_driven_clock_coalesces_triggers_within_min_interval(self):
+        clock = Clock(ClockMode.EVENT_DRIVEN, tick_size=10, min_tick_interval=0.2)
+        iterator = TickCounterIterator()
+        clock.add_iterator(iterator)
+
+        async def trigger_ticks():
+            for _ in range(10):
+                await asyncio.sleep(0.03)
+                clock.trigger_tick()
+
+        self.wait_for_run_without_tick_boundary(tick_size=10, duration=0.35)
+        with clock:
+            self.ev_loop.run_until_complete(asyncio.gather(clock.run_til(time.time() + 0.35), trigger_ticks()))
+
+        self.assertEqual(2, len(iterator.tick_timestamps))
+        self.assertGreaterEqual(iterator.tick_timestamps[1] - iterator.tick_timestamps[0], 0.2)
+
+    def test_event_driven_clock_tick_triggers(self):
+        clock = Clock(ClockMode.EVENT_DRIVEN, tick_size=10, min_tick_interval=0.01)
+        iterator = TickCounterIterator()
+        clock.add_iterator(iterator)
+        pubsub = PubSub()
+        clock.add_tick_trigger(pubsub, OrderBookEvent.TopChangedEvent)
+
+        async def trigger_event():
+            await asyncio.sleep(0.1)
+            pubsub.trigger_event(OrderBookEvent.TopChangedEvent, None)
+
+        self.wait_for_run_without_tick_boundary(tick_size=10, duration=0.3)
+        with clock:
+            self.ev_loop.run_until_complete(asyncio.gather(clock.run_til(time.time() + 0.3), trigger_event()))
+
+        self.assertEqual(1, len(iterator.tick_timestamps))
+
+        clock.remove_tick_triggers()
+        self.assertEqual(0, len(pubsub.get_listeners(OrderBookEvent.TopChangedEvent)))
+
+    def test_trigger_tick_ignored_in_periodic_mode(self):
+        iterator = TickCounterIterator()
+        self.clock_realtime.add_iterator(iterator)
+
+        self.clock_realtime.trigger_tick()
+
+        with self.clock_realtime:
+            self.ev_loop.run_until_complete(self.clock_realtime.run_til(time.time() + 0.2))
+        self.assertLessEqual(len(iterator.tick_timestamps), 1)
+
+    def test_add_iterator_with_invalid_tick_interval(self):
+        with self.assertRaises(ValueError):
+            self.clock_backtest.add_iterator(TimeIterator(), tick_interval=0)
+
+    def test_backtest_iterators_tick_at_their_own_interval(self):
+        every_tick_iterator = TickCounterIterator()
+        slow_iterator = TickCounterIterator()
+        self.clock_backtest.add_iterator(every_tick_iterator)
+        self.clock_backtest.add_iterator(slow_iterator, tick_interval=5)
+
+        self.clock_backtest.backtest_til(self.backtest_start_timestamp + 20)
+
+        self.assertEqual(5, self.clock_backtest.get_tick_interval(slow_iterator))
+        self.assertEqual(self.tick_size, self.clock_backtest.get_tick_interval(every_tick_iterator))
+        self.assertEqual(20, len(every_tick_iterator.tick_timestamps))
+        self.assertEqual([self.backtest_start_timestamp + offset for offset in (1, 5, 10, 15, 20)],
+                         slow_iterator.tick_timestamps)
+
+    def test_backtest_iterators_with_interval_not_multiple_of_tick_size(self):
+        every_tick_iterator = TickCounterIterator()
+        slow_iterator = TickCounterIterator()
+        self.clock_backtest.add_iterator(every_tick_iterator)
+        self.clock_backtest.add_iterator(slow_iterator, tick_interval=2.5)
+
+        self.clock_backtest.backtest_til(self.backtest_start_timestamp + 10)
+
+        # The ticks of the slow iterator don't move the tick size grid of the other iterators
+        self.assertEqual([self.backtest_start_timestamp + offset for offset in range(1, 11)],
+                         every_tick_iterator.tick_timestamps)
+        self.assertEqual([self.backtest_start_timestamp + offset for offset in (1, 2.5, 5, 7.5, 10)],
+                         slow_iterator.tick_timestamps)
+
+    def test_backtest_iterators_declaring_tick_interval(self):
+        slow_iterator = TickCounterIterator()
+        slow_iterator.tick_interval = 10
+        self.clock_backtest.add_iterator(slow_iterator)
+
+        self.clock_backtest.backtest_til(self.backtest_start_timestamp + 30)
+
+        # The clock only ticks when the iterator is due
+        self.assertEqual([self.backtest_start_timestamp + offset for offset in (1, 10, 20, 30)],
+                         slow_iterator.tick_timestamps)
+        self.assertEqual(self.backtest_start_timestamp + 30, self.clock_backtest.current_timestamp)
+
+    def test_backtest_removed_iterator_with_tick_interval_is_not_ticked(self):
+        slow_iterator = TickCounterIterator()
+        self.clock_backtest.add_iterator(slow_iterator, tick_interval=5)
+        self.clock_backtest.backtest_til(self.backtest_start_timestamp + 5)
+
+        self.clock_backtest.remove_iterator(slow_iterator)
+        self.clock_backtest.backtest_til(self.backtest_start_timestamp + 20)
+
+        self.assertEqual(2, len(slow_iterator.tick_timestamps))
+
+    def test_realtime_iterators_tick_at_their_own_interval(self):
+        clock = Clock(ClockMode.REALTIME, tick_size=0.1)
+        fast_iterator = TickCounterIterator()
+        slow_iterator = TickCounterIterator()
+        clock.add_iterator(fast_iterator)
+        clock.add_iterator(slow_iterator, tick_interval=0.5)
+
+        with clock:
+            self.ev_loop.run_until_complete(clock.run_til(time.time() + 1.2))
+
+        self.assertGreaterEqual(len(fast_iterator.tick_timestamps), 10)
+        self.assertIn(len(slow_iterator.tick_timestamps), (3, 4))
+        for previous_tick, next_tick in zip(slow_iterator.tick_timestamps, slow_iterator.tick_timestamps[1:]):
+            self.assertAlmostEqual(0, next_tick % 0.5, delta=1e-6)
+            self.assertGreater(next_tick, previous_tick)
+
+    def test_tick_profiler_disabled_in_backtest_modes(self):
+        self.assertFalse(self.clock_backtest.tick_profiler.enabled)
+        self.assertFalse(Clock(ClockMode.BACKTEST_EVENT_TIME, 1, self.backtest_start_timestamp,
+                               self.backtest_end_timestamp).tick_profiler.enabled)
+        self.assertTrue(self.clock_realtime.tick_profiler.enabled)
+
+        self.clock_backtest.add_iterator(TickCounterIterator())
+        self.clock_backtest.backtest_til(self.backtest_start_timestamp + 5)
+
+        self.assertEqual(0, self.clock_backtest.tick_profiler.stats()[-1]["count"])
+
+    def test_tick_profiler_records_iterator_ticks(self):
+        iterator = TickCounterIterator()
+        self.clock_backtest.tick_profiler.enabled = True
+        self.clock_backtest.add_iterator(iterator)
+
+        self.clock_backtest.backtest_til(self.backtest_start_timestamp + 5)
+
+        stats = self.clock_backtest.tick_profiler.stats()
+        self.assertEqual(["TickCounterIterator", "clock"], [entry["iterator"] for entry in stats])
+        self.assertEqual(5, stats[0]["count"])
+        self.assertEqual(5, stats[1]["count"])
+        # There is no event loop lag in backtest mode
+        self.assertEqual(0, self.clock_backtest.tick_profiler.loop_lag.count)
+
+    def test_realtime_tick_profiler_records_loop_lag(self):
+        clock = Clock(ClockMode.REALTIME, tick_size=0.1)
+        clock.add_iterator(TickCounterIterator())
+
+        with clock:
+            self.ev_loop.run_until_complete(clock.run_til(time.time() + 0.35))
+
+        self.assertGreater(clock.tick_profiler.loop_lag.count, 0)
+        self.assertEqual(clock.tick_profiler.loop_lag.count, clock.tick_profiler.stats()[-1]["count"])
+
+    def test_event_time_backtest_jumps_to_the_next_needed_timestamp(self):
+        clock = Clock(ClockMode.BACKTEST_EVENT_TIME, 1, self.backtest_start_timestamp, self.backtest_end_timestamp)
+        data_iterator = DataReplayIterator([self.backtest_start_timestamp + offset for offset in (10, 11, 1800)])
+        other_iterator = TickCounterIterator()
+        clock.add_iterator(data_iterator)
+        clock.add_iterator(other_iterator)
+
+        clock.backtest()
+
+        # All the iterators tick when any of them needs it, and at the end of the simulation
+        expected_ticks = [self.backtest_start_timestamp + offset for offset in (10, 11, 1800)]
+        expected_ticks.append(self.backtest_end_timestamp)
+        self.assertEqual(expected_ticks, data_iterator.tick_timestamps)
+        self.assertEqual(expected_ticks, other_iterator.tick_timestamps)
+        self.assertEqual(self.backtest_end_timestamp, clock.current_timestamp)
+
+    def test_event_time_backtest_advances_at_least_one_tick(self):
+        clock = Clock(ClockMode.BACKTEST_EVENT_TIME, 1, self.backtest_start_timestamp, self.backtest_end_timestamp)
+        data_iterator = DataReplayIterator([self.backtest_start_timestamp + 0.2, self.backtest_start_timestamp + 0.5])
+        clock.add_iterator(data_iterator)
+
+        clock.backtest_til(self.backtest_start_timestamp + 2)
+
+        self.assertEqual([self.backtest_start_timestamp + 1, self.backtest_start_timestamp + 2],
+                         data_iterator.tick_timestamps)
+
+    def test_event_time_backtest_til_does_not_go_past_the_requested_timestamp(self):
+        clock = Clock(ClockMode.BACKTEST_EVENT_TIME, 1, self.backtest_start_timestamp, self.backtest_end_timestamp)
+        data_iterator = DataReplayIterator([self.backtest_start_timestamp + 5])
+        clock.add_iterator(data_iterator)
+
+        clock.backtest_til(self.backtest_start_timestamp + 2)
+
+        self.assertEqual(self.backtest_start_timestamp + 2, clock.current_timestamp)
+        self.assertEqual([self.backtest_start_timestamp + 2], data_iterator.tick_timestamps)
+
+        clock.backtest_til(self.backtest_start_timestamp + 10)
+
+        self.assertEqual([self.backtest_start_timestamp + offset for offset in (2, 5, 10)],
+                         data_iterator.tick_timestamps)
+
+    def test_event_time_backtest_without_end_stops_when_no_timestamp_is_needed(self):
+        clock = Clock(ClockMode.BACKTEST_EVENT_TIME, 1, self.backtest_start_timestamp, float("nan"))
+        data_iterator = DataReplayIterator([self.backtest_start_timestamp + 5, self.backtest_start_timestamp + 50])
+        clock.add_iterator(data_iterator)
+
+        clock.backtest()
+
+        self.assertEqual([self.backtest_start_timestamp + 5, self.backtest_start_timestamp + 50],
+                         data_iterator.tick_timestamps)
@@ -3,6 +3,7 @@ import gc
 import weakref
 
 from hummingbot.core.pubsub import PubSub
+from hummingbot.core.event.event_forwarder import EventForwarder
 from hummingbot.core.event.event_logger import EventLogger
 
 from test.mock.mock_events import MockEventType, MockEvent
@@ -89,6 +90,40 @@ class PubSubTest(unittest.TestCase):
         listeners = self.pubsub.get_listeners(self.event_tag_zero)
         self.assertEqual(0, len(listeners))
 
+    def test_lapsed_listener_remove_on_trigger_event(self):
+        self.pubsub.add_listener(self.event_tag_zero, self.listener_zero)
+        self.pubsub.add_listener(self.event_tag_zero, self.listener_one)
+        self.listener_zero = None  # remove strong reference
+        gc.collect()
+
+        self.pubsub.trigger_event(self.event_tag_zero, self.event)
+
+        self.assertEqual(1, len(self.listener_one.event_log))
+        self.assertEqual([self.listener_one], self.pubsub.get_listeners(self.event_tag_zero))
+
+    def test_listener_removing_listeners_while_triggering(self):
+        received_events = []
+
+        def remove_listeners(event_object):
+            received_events.append(event_object)
+            self.pubsub.remove_listener(self.event_tag_zero, removing_listener)
+            self.pubsub.remove_listener(self.event_tag_zero, self.listener_one)
+
+        removing_listener = EventForwarder(to_function=remove_listeners)
+        self.pubsub.add_listener(self.event_tag_zero, removing_listener)
+        self.pubsub.add_listener(self.event_tag_zero, self.listener_one)
+
+        self.pubsub.trigger_event(self.event_tag_zero, self.event)
+
+        # The listeners removed while the event is dispatched still receive it
+        self.assertEqual([self.event], received_events)
+        self.assertEqual(1, len(self.listener_one.event_log))
+        self.assertEqual(0, len(self.pubsub.get_listeners(self.event_tag_zero)))
+
+        self.pubsub.trigger_event(self.event_tag_zero, self.event)
+        self.assertEqual(1, len(received_events))
+        self.assertEqual(1, len(self.listener_one.event_log))
+
 
 if __name__ == "__main__":
     unittest.main()
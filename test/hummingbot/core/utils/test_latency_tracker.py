@@ -0,0 +1,117 @@
+import logging
+import unittest
+from unittest.mock import patch
+
+from hummingbot.core.utils.latency_tracker import AUTH, RTT, THROTTLE_WAIT, LatencyHistogram, LatencyTracker
+from hummingbot.logger.struct_logger import METRICS_LOG_LEVEL
+
+
+class LatencyHistogramTest(unittest.TestCase):
+
+    def test_empty_histogram(self):
+        histogram = LatencyHistogram()
+
+        self.assertEqual(0, histogram.count)
+        self.assertEqual(0.0, histogram.mean_ms)
+        self.assertEqual(0.0, histogram.percentile(99))
+
+    def test_add_updates_aggregates(self):
+        histogram = LatencyHistogram()
+        for value in (2.0, 4.0, 30.0):
+            histogram.add(value)
+
+        self.assertEqual(3, histogram.count)
+        self.assertEqual(12.0, histogram.mean_ms)
+        self.assertEqual(2.0, histogram.min_ms)
+        self.assertEqual(30.0, histogram.max_ms)
+
+    def test_percentile_uses_bucket_upper_bounds(self):
+        histogram = LatencyHistogram()
+        for _ in range(98):
+            histogram.add(0.7)
+        histogram.add(40)
+        histogram.add(20000)
+
+        self.assertEqual(1.0, histogram.percentile(50))
+        self.assertEqual(50.0, histogram.percentile(99))
+        self.assertEqual(20000, histogram.percentile(100))
+
+    def test_percentile_capped_by_max_value(self):
+        histogram = LatencyHistogram()
+        histogram.add(3)
+
+        self.assertEqual(3, histogram.percentile(50))
+
+
+class LatencyTrackerTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.tracker = LatencyTracker()
+
+    def tearDown(self) -> None:
+        self.set_logger_level(logging.NOTSET)
+        super().tearDown()
+
+    @staticmethod
+    def set_logger_level(level: int):
+        LatencyTracker.logger().setLevel(level)
+
+    @patch("hummingbot.core.utils.latency_tracker.time.perf_counter")
+    def test_record_elapsed_time(self, perf_counter_mock):
+        perf_counter_mock.return_value = 10.25
+
+        self.tracker.record(key="limit_1", stage=RTT, started_at=10.0)
+
+        histogram = self.tracker.histogram(key="limit_1", stage=RTT)
+        self.assertEqual(1, histogram.count)
+        self.assertEqual(250.0, histogram.max_ms)
+
+    def test_record_ignored_when_disabled(self):
+        self.tracker.enabled = False
+
+        self.tracker.record_duration(key="limit_1", stage=AUTH, duration_ms=1)
+
+        self.assertIsNone(self.tracker.histogram(key="limit_1", stage=AUTH))
+
+    def test_stats_sorted_and_filtered(self):
+        self.tracker.record_duration(key="limit_2", stage=RTT, duration_ms=1)
+        self.tracker.record_duration(key="limit_1", stage=THROTTLE_WAIT, duration_ms=1)
+        self.tracker.record_duration(key="limit_1", stage=AUTH, duration_ms=1)
+
+        stats = self.tracker.stats()
+        self.assertEqual([("limit_1", AUTH), ("limit_1", THROTTLE_WAIT), ("limit_2", RTT)],
+                         [(entry["key"], entry["stage"]) for entry in stats])
+
+        stats = self.tracker.stats(key_filter="limit_2")
+        self.assertEqual(1, len(stats))
+        self.assertEqual(1, stats[0]["count"])
+
+    def test_reset(self):
+        self.tracker.record_duration(key="limit_1", stage=RTT, duration_ms=1)
+
+        self.tracker.reset()
+
+        self.assertEqual([], self.tracker.stats())
+
+    def test_log_stats(self):
+        self.tracker.record_duration(key="limit_1", stage=RTT, duration_ms=1)
+        self.tracker.record_duration(key="limit_1", stage=AUTH, duration_ms=1)
+
+        self.set_logger_level(METRICS_LOG_LEVEL)
+        with patch.object(LatencyTracker.logger(), "metric_log") as metric_log_mock:
+            lines = self.tracker.log_stats()
+
+        self.assertEqual(2, lines)
+        logged = metric_log_mock.call_args_list[0][0][0]
+        self.assertEqual("latency", logged["metric"])
+        self.assertEqual("limit_1", logged["key"])
+        self.assertEqual(AUTH, logged["stage"])
+
+    def test_log_stats_does_not_report_lines_when_metric_logs_are_disabled(self):
+        self.tracker.record_duration(key="limit_1", stage=RTT, duration_ms=1)
+
+        self.set_logger_level(logging.INFO)
+
+        self.assertFalse(self.tracker.is_metric_log_enabled())
+        self.assertEqual(0, self.tracker.log_stats())
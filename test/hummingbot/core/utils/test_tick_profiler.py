@@ -0,0 +1,112 @@
+import logging
+import unittest
+from unittest.mock import patch
+
+from hummingbot.core.utils.tick_profiler import CLOCK_TICK_KEY, TickProfiler
+from hummingbot.logger.struct_logger import METRICS_LOG_LEVEL
+
+
+class NamedIterator:
+    def __init__(self, display_name: str):
+        self.display_name = display_name
+
+
+class TickProfilerTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.profiler = TickProfiler(tick_size=1.0, log_interval=0)
+
+    def tearDown(self) -> None:
+        self.set_logger_level(logging.NOTSET)
+        super().tearDown()
+
+    @staticmethod
+    def set_logger_level(level: int):
+        TickProfiler.logger().setLevel(level)
+
+    @patch("hummingbot.core.utils.tick_profiler.time.perf_counter_ns")
+    def test_record_iterator_ticks(self, perf_counter_mock):
+        iterator = NamedIterator("binance")
+
+        perf_counter_mock.return_value = 2_000_000
+        self.profiler.record_iterator_tick(iterator, started_ns=0)
+        perf_counter_mock.return_value = 1_500_000_000
+        self.profiler.record_iterator_tick(iterator, started_ns=0)
+
+        stats = self.profiler.stats()
+        self.assertEqual("binance", stats[0]["iterator"])
+        self.assertEqual(2, stats[0]["count"])
+        self.assertEqual(1500.0, stats[0]["last_ms"])
+        self.assertEqual(751.0, stats[0]["mean_ms"])
+        self.assertEqual(1500.0, stats[0]["max_ms"])
+        self.assertEqual(1, stats[0]["overruns"])
+
+    @patch("hummingbot.core.utils.tick_profiler.time.perf_counter_ns")
+    def test_stats_sorted_by_mean_duration(self, perf_counter_mock):
+        perf_counter_mock.return_value = 1_000_000
+        self.profiler.record_iterator_tick(NamedIterator("fast"), started_ns=0)
+        perf_counter_mock.return_value = 5_000_000
+        self.profiler.record_iterator_tick(object(), started_ns=0)
+
+        stats = self.profiler.stats()
+        self.assertEqual(["object", "fast", CLOCK_TICK_KEY], [entry["iterator"] for entry in stats])
+
+    @patch("hummingbot.core.utils.tick_profiler.time.perf_counter_ns")
+    def test_record_tick_with_loop_lag(self, perf_counter_mock):
+        perf_counter_mock.return_value = 3_000_000
+
+        self.profiler.record_tick(started_ns=0, loop_lag_s=0.02)
+        self.profiler.record_tick(started_ns=0)
+
+        clock_entry = self.profiler.stats()[-1]
+        self.assertEqual(2, clock_entry["count"])
+        self.assertEqual(3.0, clock_entry["mean_ms"])
+        self.assertEqual(0, clock_entry["overruns"])
+        self.assertEqual(1, self.profiler.loop_lag.count)
+        self.assertAlmostEqual(20.0, clock_entry["loop_lag_max_ms"])
+
+    def test_reset(self):
+        self.profiler.record_iterator_tick(object(), started_ns=0)
+        self.profiler.record_tick(started_ns=0, loop_lag_s=0.1)
+
+        self.profiler.reset()
+
+        stats = self.profiler.stats()
+        self.assertEqual(1, len(stats))
+        self.assertEqual(0, stats[0]["count"])
+        self.assertEqual(0, self.profiler.loop_lag.count)
+
+    def test_periodic_stats_logs(self):
+        self.set_logger_level(METRICS_LOG_LEVEL)
+        profiler = TickProfiler(tick_size=1.0, log_interval=60)
+        profiler.record_iterator_tick(object(), started_ns=0)
+
+        with patch.object(TickProfiler.logger(), "metric_log") as metric_log_mock:
+            with patch("hummingbot.core.utils.tick_profiler.time.monotonic") as monotonic_mock:
+                monotonic_mock.return_value = profiler._last_log_time + 30
+                profiler.record_tick(started_ns=0)
+                self.assertEqual(0, metric_log_mock.call_count)
+
+                monotonic_mock.return_value = profiler._last_log_time + 60
+                profiler.record_tick(started_ns=0)
+
+        self.assertEqual(2, metric_log_mock.call_count)
+        logged = metric_log_mock.call_args_list[0][0][0]
+        self.assertEqual("clock_tick", logged["metric"])
+        self.assertEqual("object", logged["iterator"])
+
+    def test_no_stats_logs_when_metric_logs_are_disabled(self):
+        self.set_logger_level(logging.INFO)
+        profiler = TickProfiler(tick_size=1.0, log_interval=60)
+        profiler.record_iterator_tick(object(), started_ns=0)
+
+        with patch.object(TickProfiler.logger(), "metric_log") as metric_log_mock:
+            with patch("hummingbot.core.utils.tick_profiler.time.monotonic") as monotonic_mock:
+                monotonic_mock.return_value = profiler._last_log_time + 60
+                profiler.record_tick(started_ns=0)
+            exported_lines = profiler.log_stats()
+
+        self.assertFalse(profiler.is_metric_log_enabled())
+        self.assertEqual(0, exported_lines)
+        self.assertEqual(0, metric_log_mock.call_count)
@@ -8,6 +8,8 @@ import aiohttp
 from aioresponses import aioresponses
 
 from hummingbot.core.api_throttler.async_throttler import AsyncThrottler
+from hummingbot.core.api_throttler.data_types import RateLimit
+from hummingbot.core.utils.latency_tracker import DECODE, RTT, THROTTLE_WAIT, LatencyTracker
 from hummingbot.core.web_assistant.auth import AuthBase
 from hummingbot.core.web_assistant.connections.data_types import RESTMethod, RESTRequest, RESTResponse, WSRequest
 from hummingbot.core.web_assistant.connections.rest_connection import RESTConnection
@@ -100,3 +102,20 @@ class RESTAssistantTest(unittest.TestCase):
         self.assertIsNotNone(call_request)
         self.assertIsNotNone(call_request.headers)
         self.assertEqual(call_request.headers, auth_header)
+
+    @aioresponses()
+    def test_execute_request_records_latency_stats(self, mocked_api):
+        url = "https://www.test.com/url"
+        limit_id = "latencyTestLimitId"
+        mocked_api.get(url, body=json.dumps({"one": 1}).encode())
+        latency_tracker = LatencyTracker.get_instance()
+        latency_tracker.reset()
+
+        connection = RESTConnection(aiohttp.ClientSession())
+        throttler = AsyncThrottler(rate_limits=[RateLimit(limit_id=limit_id, limit=10, time_interval=1)])
+        assistant = RESTAssistant(connection=connection, throttler=throttler)
+
+        self.async_run_with_timeout(assistant.execute_request(url=url, throttler_limit_id=limit_id))
+
+        for stage in (THROTTLE_WAIT, RTT, DECODE):
+            self.assertEqual(1, latency_tracker.histogram(key=limit_id, stage=stage).count)
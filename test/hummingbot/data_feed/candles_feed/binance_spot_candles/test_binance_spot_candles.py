@@ -2,13 +2,18 @@ import asyncio
 import json
 import re
 import unittest
+from os.path import join
+from tempfile import TemporaryDirectory
 from typing import Awaitable
 from unittest.mock import AsyncMock, MagicMock, patch
 
+import numpy as np
 from aioresponses import aioresponses
 
 from hummingbot.connector.test_support.network_mocking_assistant import NetworkMockingAssistant
 from hummingbot.data_feed.candles_feed.binance_spot_candles import BinanceSpotCandles, constants as CONSTANTS
+from hummingbot.data_feed.candles_feed.candles_indicators import SMA
+from hummingbot.data_feed.candles_feed.candles_store import CandlesStore
 
 
 class TestBinanceSpotCandles(unittest.TestCase):
@@ -178,6 +183,126 @@ class TestBinanceSpotCandles(unittest.TestCase):
     def test_candles_empty(self):
         self.assertTrue(self.data_feed.candles_df.empty)
 
+    def test_candles_df_is_rebuilt_only_when_the_candles_change(self):
+        self.data_feed._candles.append([1672981200000] + [1] * 9)
+        candles_df = self.data_feed.candles_df
+        cached_candles_df = self.data_feed._candles_df
+        candles_df["close"] = 2
+        candles_df["indicator"] = 3
+
+        self.assertEqual(list(self.data_feed.columns), list(self.data_feed.candles_df.columns))
+        self.assertEqual(1, self.data_feed.candles_df["close"].iloc[-1])
+        self.assertIs(cached_candles_df, self.data_feed._candles_df)
+
+        self.data_feed._candles[-1] = [1672981200000] + [4] * 9
+
+        self.assertEqual(4, self.data_feed.candles_df["close"].iloc[-1])
+        self.assertEqual(4, self.data_feed.candles_array[-1, 4])
+
+    @staticmethod
+    async def fetch_candles_mock(start_time: int, end_time: int, limit: int):
+        timestamps = np.arange(start_time, end_time + 1, 3_600_000)[:limit]
+        candles = np.ones((len(timestamps), 10))
+        candles[:, 0] = timestamps
+        return candles
+
+    def test_fill_historical_candles_requests_pages_concurrently(self):
+        self.data_feed = BinanceSpotCandles(trading_pair=self.trading_pair, interval=self.interval, max_records=2500)
+        self.data_feed._candles.append([1672981200000] + [1] * 9)
+
+        with patch.object(self.data_feed, "fetch_candles", side_effect=self.fetch_candles_mock) as fetch_candles:
+            self.async_run_with_timeout(self.data_feed.fill_historical_candles())
+
+        self.assertTrue(self.data_feed.is_ready)
+        self.assertEqual(3, fetch_candles.call_count)
+        timestamps = self.data_feed.candles_array[:, 0]
+        self.assertEqual(1672981200000, timestamps[-1])
+        self.assertTrue(np.all(np.diff(timestamps) == 3_600_000))
+
+    def test_fill_historical_candles_only_requests_the_candles_missing_in_the_store(self):
+        with TemporaryDirectory() as temp_dir:
+            candles_store = CandlesStore(db_path=join(temp_dir, "candles.sqlite"))
+            self.data_feed = BinanceSpotCandles(trading_pair=self.trading_pair, interval=self.interval,
+                                                max_records=10, candles_store=candles_store)
+            end_time = 1672981200000
+            candles_store.save_candles(self.data_feed.name, self.interval, self.async_run_with_timeout(
+                self.fetch_candles_mock(end_time - 5 * 3_600_000, end_time - 3 * 3_600_000, 1000)))
+            self.data_feed._candles.append([end_time] + [1] * 9)
+
+            with patch.object(self.data_feed, "fetch_candles", side_effect=self.fetch_candles_mock) as fetch_candles:
+                self.async_run_with_timeout(self.data_feed.fill_historical_candles())
+
+            self.assertTrue(self.data_feed.is_ready)
+            requested_ranges = [(call.kwargs["start_time"], call.kwargs["end_time"])
+                                for call in fetch_candles.call_args_list]
+            self.assertEqual([(end_time - 9 * 3_600_000, end_time - 6 * 3_600_000),
+                              (end_time - 2 * 3_600_000, end_time - 3_600_000)], requested_ranges)
+            self.assertEqual(9, len(candles_store.load_candles(self.data_feed.name, self.interval)))
+
+            # Longer lookbacks than max_records are loaded from the store
+            fetch_candles.reset_mock()
+            candles = self.async_run_with_timeout(
+                self.data_feed.get_historical_candles(end_time - 9 * 3_600_000, end_time - 3_600_000))
+            self.assertEqual(9, len(candles))
+            fetch_candles.assert_not_called()
+            candles_store.close()
+
+    def test_get_historical_candles_does_not_use_the_store_for_calendar_months(self):
+        with TemporaryDirectory() as temp_dir:
+            candles_store = CandlesStore(db_path=join(temp_dir, "candles.sqlite"))
+            self.data_feed = BinanceSpotCandles(trading_pair=self.trading_pair, interval="1M", candles_store=candles_store)
+            start_time = 1672531200000
+
+            with patch.object(self.data_feed, "fetch_candles", new_callable=AsyncMock) as fetch_candles:
+                fetch_candles.return_value = np.array([[start_time] + [1] * 9])
+                candles = self.async_run_with_timeout(self.data_feed.get_historical_candles(start_time, start_time))
+
+            self.assertFalse(self.data_feed.is_interval_fixed)
+            self.assertEqual([start_time], candles[:, 0].tolist())
+            self.assertEqual((0, 10), candles_store.load_candles(self.data_feed.name, "1M").shape)
+            candles_store.close()
+
+    def test_indicators_are_reset_when_the_stream_is_interrupted(self):
+        sma = self.data_feed.add_indicator("SMA_2", SMA(length=2))
+        for timestamp in (1672981200000, 1672984800000):
+            self.data_feed._candles.append([timestamp] + [1] * 9)
+        self.data_feed._update_indicators()
+
+        self.async_run_with_timeout(self.data_feed._on_order_stream_interruption())
+
+        self.assertEqual(0, len(self.data_feed._candles))
+        self.assertIsNone(sma.timestamp)
+        self.assertTrue(np.isnan(sma.value))
+
+    def test_fill_historical_candles_logs_error_when_there_is_no_data(self):
+        self.data_feed._candles.append([1672981200000] + [1] * 9)
+
+        with patch.object(self.data_feed, "fetch_candles", new_callable=AsyncMock) as fetch_candles:
+            fetch_candles.return_value = np.empty((0, 10))
+            self.async_run_with_timeout(self.data_feed.fill_historical_candles())
+
+        self.assertTrue(self.is_logged("ERROR", f"There is no data available for the quantity of "
+                                                f"candles requested for {self.data_feed.name}."))
+
+    def test_indicators_are_updated_with_the_candles(self):
+        self.data_feed._candles.append([1672981200000] + [1] * 9)
+        sma = self.data_feed.add_indicator("SMA_2", SMA(length=2))
+
+        self.assertIs(sma, self.data_feed.indicators["SMA_2"])
+        self.assertTrue(np.isnan(sma.value))
+
+        self.data_feed._candles.append([1672984800000] + [3] * 9)
+        self.data_feed._update_indicators()
+        self.assertEqual(2, sma.value)
+
+        self.data_feed._candles[-1] = [1672984800000] + [5] * 9
+        self.data_feed._update_indicators()
+        self.assertEqual(3, sma.value)
+        self.assertEqual([1672981200000, 1672984800000], sma.history[:, 0].tolist())
+
+        self.data_feed.remove_indicator("SMA_2")
+        self.assertEqual({}, self.data_feed.indicators)
+
     @patch("aiohttp.ClientSession.ws_connect", new_callable=AsyncMock)
     def test_listen_for_subscriptions_subscribes_to_klines(self, ws_connect_mock):
         ws_connect_mock.return_value = self.mocking_assistant.create_websocket_mock()
@@ -304,6 +429,7 @@ class TestBinanceSpotCandles(unittest.TestCase):
         self.mocking_assistant.add_websocket_aiohttp_message(
             websocket_mock=ws_connect_mock.return_value,
             message=json.dumps(self.get_candles_ws_data_mock_2()))
+        sma = self.data_feed.add_indicator("SMA_1", SMA(length=1))
 
         self.listening_task = self.ev_loop.create_task(self.data_feed.listen_for_subscriptions())
 
@@ -311,6 +437,7 @@ class TestBinanceSpotCandles(unittest.TestCase):
 
         self.assertEqual(self.data_feed.candles_df.shape[0], 2)
         self.assertEqual(self.data_feed.candles_df.shape[1], 10)
+        self.assertEqual(self.data_feed.candles_df["close"].tolist(), sma.history[:, 1].tolist())
 
     def _create_exception_and_unlock_test_with_event(self, exception):
         self.resume_test_event.set()
@@ -0,0 +1,68 @@
+import unittest
+
+import numpy as np
+
+from hummingbot.data_feed.candles_feed.candles_buffer import CandlesBuffer
+
+
+class CandlesBufferTests(unittest.TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.buffer = CandlesBuffer(maxlen=3, columns_count=2)
+
+    def test_append_drops_the_oldest_candle_when_full(self):
+        for timestamp in range(5):
+            self.buffer.append([timestamp, timestamp * 10])
+
+        self.assertEqual(3, len(self.buffer))
+        self.assertEqual([[2, 20], [3, 30], [4, 40]], self.buffer.array.tolist())
+        self.assertEqual(2, self.buffer[0][0])
+        self.assertEqual(4, self.buffer[-1][0])
+
+    def test_array_is_a_read_only_view_of_the_buffer(self):
+        for timestamp in range(4):
+            self.buffer.append([timestamp, 0])
+
+        array = self.buffer.array
+
+        self.assertTrue(np.shares_memory(array, self.buffer.array))
+        self.assertFalse(array.flags.writeable)
+        with self.assertRaises(ValueError):
+            array[0, 0] = 10
+
+    def test_extendleft_adds_older_candles(self):
+        self.buffer.append([10, 1])
+
+        self.buffer.extendleft(np.array([[9, 1], [8, 1]]))
+
+        self.assertEqual([8, 9, 10], [candle[0] for candle in self.buffer])
+
+        # The newest candles are dropped if there is no room left, like with a deque
+        self.buffer.appendleft([7, 1])
+
+        self.assertEqual([7, 8, 9], self.buffer.array[:, 0].tolist())
+
+    def test_update_and_pop_the_last_candle(self):
+        self.buffer.append(["1", "0.5"])
+        self.buffer.append([2, 1])
+        version = self.buffer.version
+
+        self.buffer[-1] = np.array(["2", "1.5"])
+
+        self.assertEqual([2, 1.5], self.buffer[-1].tolist())
+        self.assertGreater(self.buffer.version, version)
+
+        self.assertEqual([2, 1.5], self.buffer.pop().tolist())
+        self.assertEqual(1, len(self.buffer))
+        with self.assertRaises(IndexError):
+            self.buffer[1] = [3, 3]
+
+    def test_clear(self):
+        self.buffer.append([1, 1])
+
+        self.buffer.clear()
+
+        self.assertEqual(0, len(self.buffer))
+        self.assertEqual((0, 2), self.buffer.array.shape)
+        with self.assertRaises(IndexError):
+            self.buffer.pop()
@@ -0,0 +1,121 @@
+import asyncio
+import json
+import unittest
+from typing import Awaitable
+from unittest.mock import AsyncMock, patch
+
+from hummingbot.connector.test_support.network_mocking_assistant import NetworkMockingAssistant
+from hummingbot.data_feed.candles_feed.binance_spot_candles import BinanceSpotCandles
+from hummingbot.data_feed.candles_feed.candles_hub import CandlesHub
+
+
+class CandlesHubTests(unittest.TestCase):
+    # the level is required to receive logs from the data source logger
+    level = 0
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        cls.ev_loop = asyncio.get_event_loop()
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.mocking_assistant = NetworkMockingAssistant()
+        self.hub = CandlesHub(connector="binance", max_streams_per_connection=2, max_streams_per_subscription=1)
+        self.log_records = []
+        self.hub.logger().setLevel(1)
+        self.hub.logger().addHandler(self)
+
+    def tearDown(self) -> None:
+        self.async_run_with_timeout(self.hub.stop_network())
+        super().tearDown()
+
+    def handle(self, record):
+        self.log_records.append(record)
+
+    def is_logged(self, log_level: str, message: str) -> bool:
+        return any(
+            record.levelname == log_level and record.getMessage() == message for
+            record in self.log_records)
+
+    def async_run_with_timeout(self, coroutine: Awaitable, timeout: int = 1):
+        ret = asyncio.get_event_loop().run_until_complete(asyncio.wait_for(coroutine, timeout))
+        return ret
+
+    @staticmethod
+    def kline_message(symbol: str, interval: str, timestamp: int, close: str):
+        return {
+            "e": "kline",
+            "E": timestamp + 1,
+            "s": symbol,
+            "k": {"t": timestamp, "T": timestamp + 59999, "s": symbol, "i": interval, "f": 100, "L": 200,
+                  "o": "1", "c": close, "h": "2", "l": "0.5", "v": "1000", "n": 100, "x": False, "q": "1",
+                  "V": "500", "Q": "0.5", "B": "0"}
+        }
+
+    def test_get_candle_returns_the_same_candles_for_the_same_pair_and_interval(self):
+        btc_1m = self.hub.get_candle("BTC-USDT", "1m")
+        btc_1h = self.hub.get_candle("BTC-USDT", "1h")
+
+        self.assertIsInstance(btc_1m, BinanceSpotCandles)
+        self.assertIs(btc_1m, self.hub.get_candle("BTC-USDT", "1m"))
+        self.assertIsNot(btc_1m, btc_1h)
+        self.assertIs(btc_1m.api_factory, btc_1h.api_factory)
+        self.assertEqual({("BTC-USDT", "1m"): btc_1m, ("BTC-USDT", "1h"): btc_1h}, self.hub.candles)
+        self.assertFalse(self.hub.is_ready)
+
+    @patch("hummingbot.data_feed.candles_feed.binance_spot_candles.BinanceSpotCandles.fill_historical_candles",
+           new_callable=AsyncMock)
+    @patch("aiohttp.ClientSession.ws_connect", new_callable=AsyncMock)
+    def test_streams_are_sharded_and_messages_routed_to_their_candles(self, ws_connect_mock, fill_historical_candles):
+        websockets = [self.mocking_assistant.create_websocket_mock(), self.mocking_assistant.create_websocket_mock()]
+        ws_connect_mock.side_effect = websockets
+        btc_1m = self.hub.get_candle("BTC-USDT", "1m")
+        btc_1h = self.hub.get_candle("BTC-USDT", "1h")
+        eth_1m = self.hub.get_candle("ETH-USDT", "1m")
+        messages = [self.kline_message("BTCUSDT", "1h", 3_600_000, "10"),
+                    self.kline_message("BTCUSDT", "1m", 60_000, "20"),
+                    self.kline_message("BTCUSDT", "1m", 120_000, "21"),
+                    self.kline_message("BTCUSDT", "1m", 120_000, "22"),
+                    self.kline_message("SOLUSDT", "1m", 60_000, "30")]
+        for message in messages:
+            self.mocking_assistant.add_websocket_aiohttp_message(websockets[0], json.dumps(message))
+        self.mocking_assistant.add_websocket_aiohttp_message(
+            websockets[1], json.dumps(self.kline_message("ETHUSDT", "1m", 60_000, "40")))
+
+        self.async_run_with_timeout(self.hub.start_network())
+        self.mocking_assistant.run_until_all_aiohttp_messages_delivered(websockets[0])
+        self.mocking_assistant.run_until_all_aiohttp_messages_delivered(websockets[1])
+
+        self.assertEqual(2, self.hub.connections_count)
+        self.assertEqual(
+            [{"method": "SUBSCRIBE", "params": ["btcusdt@kline_1m"], "id": 1},
+             {"method": "SUBSCRIBE", "params": ["btcusdt@kline_1h"], "id": 2}],
+            self.mocking_assistant.json_messages_sent_through_websocket(websockets[0]))
+        self.assertEqual(
+            [{"method": "SUBSCRIBE", "params": ["ethusdt@kline_1m"], "id": 3}],
+            self.mocking_assistant.json_messages_sent_through_websocket(websockets[1]))
+        self.assertEqual([20, 22], btc_1m.candles_df["close"].tolist())
+        self.assertEqual([10], btc_1h.candles_df["close"].tolist())
+        self.assertEqual([40], eth_1m.candles_df["close"].tolist())
+        # The historical candles are filled once per candles, when their first candle is received
+        self.assertEqual(3, fill_historical_candles.call_count)
+        self.assertTrue(self.is_logged("INFO", "Subscribed to 2 public klines streams..."))
+
+    @patch("aiohttp.ClientSession.ws_connect", new_callable=AsyncMock)
+    def test_candles_added_while_running_are_subscribed_through_the_open_connection(self, ws_connect_mock):
+        ws_connect_mock.return_value = self.mocking_assistant.create_websocket_mock()
+        self.hub.get_candle("BTC-USDT", "1m")
+        self.async_run_with_timeout(self.hub.start_network())
+        self.mocking_assistant.add_websocket_aiohttp_message(
+            ws_connect_mock.return_value, json.dumps({"result": None, "id": 1}))
+        self.mocking_assistant.run_until_all_aiohttp_messages_delivered(ws_connect_mock.return_value)
+
+        self.hub.get_candle("ETH-USDT", "1m")
+        self.async_run_with_timeout(asyncio.sleep(0.1))
+
+        self.assertEqual(1, self.hub.connections_count)
+        self.assertEqual(
+            [{"method": "SUBSCRIBE", "params": ["btcusdt@kline_1m"], "id": 1},
+             {"method": "SUBSCRIBE", "params": ["ethusdt@kline_1m"], "id": 2}],
+            self.mocking_assistant.json_messages_sent_through_websocket(ws_connect_mock.return_value))
@@ -0,0 +1,145 @@
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from hummingbot.data_feed.candles_feed.candles_indicators import ATR, EMA, MACD, RSI, SMA, VWAP, BollingerBands
+
+
+class CandlesIndicatorsTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        rng = np.random.default_rng(42)
+        size = 300
+        close = 16000 + np.cumsum(rng.normal(0, 5, size))
+        cls.candles = np.zeros((size, 10))
+        cls.candles[:, 0] = np.arange(size) * 3_600_000
+        cls.candles[:, 1] = close
+        cls.candles[:, 2] = close + rng.random(size) * 5
+        cls.candles[:, 3] = close - rng.random(size) * 5
+        cls.candles[:, 4] = close
+        cls.candles[:, 5] = rng.random(size) * 10
+        cls.close = pd.Series(close)
+
+    def run_indicator(self, indicator):
+        for candle in self.candles:
+            # The candle in progress is updated before being closed
+            candle_in_progress = candle.copy()
+            candle_in_progress[4] += 3
+            indicator.update(candle_in_progress)
+            indicator.update(candle)
+        return indicator
+
+    @staticmethod
+    def ema(series: pd.Series, length: int) -> pd.Series:
+        seeded = series.copy()
+        seeded.iloc[:length - 1] = np.nan
+        seeded.iloc[length - 1] = series.iloc[:length].mean()
+        return seeded.ewm(span=length, adjust=False).mean()
+
+    @staticmethod
+    def rma(series: pd.Series, length: int) -> pd.Series:
+        return series.ewm(alpha=1 / length, min_periods=length).mean()
+
+    def assert_series_equal(self, expected: pd.Series, values: np.ndarray):
+        self.assertEqual(expected.isna().tolist()[-len(values):], np.isnan(values).tolist())
+        np.testing.assert_allclose(expected.values[-len(values):], values, rtol=1e-9)
+
+    def test_sma_and_ema(self):
+        sma = self.run_indicator(SMA(length=10, history_length=300))
+        ema = self.run_indicator(EMA(length=10, history_length=300))
+
+        self.assert_series_equal(self.close.rolling(10).mean(), sma.history[:, 1])
+        self.assert_series_equal(self.ema(self.close, 10), ema.history[:, 1])
+        self.assertEqual(self.candles[-1, 0], ema.timestamp)
+        self.assertEqual(ema.history[-1, 1], ema.value)
+
+    def test_rsi(self):
+        rsi = self.run_indicator(RSI(length=14, history_length=50))
+        change = self.close.diff()
+        gains = self.rma(change.where(change.isna() | (change > 0), 0), 14)
+        losses = self.rma(-change.where(change.isna() | (change < 0), 0), 14)
+
+        self.assertEqual((50, 2), rsi.history.shape)
+        self.assert_series_equal(100 * gains / (gains + losses), rsi.history[:, 1])
+
+    def test_bollinger_bands(self):
+        bbands = self.run_indicator(BollingerBands(length=20, std=2, history_length=300))
+        middle = self.close.rolling(20).mean()
+        deviation = 2 * self.close.rolling(20).std(ddof=0)
+
+        self.assertEqual(("timestamp", "lower", "middle", "upper", "bandwidth", "percent"), bbands.columns)
+        self.assert_series_equal(middle - deviation, bbands.history[:, 1])
+        self.assert_series_equal(middle + deviation, bbands.history[:, 3])
+        self.assert_series_equal(100 * 2 * deviation / middle, bbands.history[:, 4])
+        self.assertAlmostEqual((self.close.iloc[-1] - bbands.values["lower"]) / (2 * deviation.iloc[-1]),
+                               bbands.values["percent"])
+
+    def test_atr(self):
+        atr = self.run_indicator(ATR(length=14, history_length=300))
+        high, low = pd.Series(self.candles[:, 2]), pd.Series(self.candles[:, 3])
+        previous_close = self.close.shift()
+        true_range = pd.concat([high - low, (high - previous_close).abs(), (low - previous_close).abs()],
+                               axis=1).max(axis=1, skipna=False)
+
+        self.assert_series_equal(self.rma(true_range, 14), atr.history[:, 1])
+
+    def test_macd(self):
+        macd = self.run_indicator(MACD(fast=12, slow=26, signal=9, history_length=300))
+        expected_macd = self.ema(self.close, 12) - self.ema(self.close, 26)
+        expected_signal = self.ema(expected_macd.dropna(), 9).reindex(self.close.index)
+
+        self.assert_series_equal(expected_macd, macd.history[:, 1])
+        self.assert_series_equal(expected_signal, macd.history[:, 3])
+        self.assert_series_equal(expected_macd - expected_signal, macd.history[:, 2])
+
+    def test_vwap_is_restarted_every_day(self):
+        vwap = self.run_indicator(VWAP(history_length=300))
+        typical_price = pd.Series(self.candles[:, 2:5].mean(axis=1))
+        volume = pd.Series(self.candles[:, 5])
+        day = self.candles[:, 0] // 86_400_000
+
+        expected = (typical_price * volume).groupby(day).cumsum() / volume.groupby(day).cumsum()
+
+        self.assert_series_equal(expected, vwap.history[:, 1])
+
+    def test_sync_recomputes_the_indicator_when_older_candles_are_added(self):
+        sma = SMA(length=3)
+        sma.sync(self.candles[10:20])
+        self.assertAlmostEqual(self.close.iloc[17:20].mean(), sma.value)
+
+        sma.sync(self.candles[5:21])
+
+        self.assertEqual(16, len(sma.history))
+        self.assertAlmostEqual(self.close.iloc[18:21].mean(), sma.value)
+        self.assertTrue(np.isnan(sma.history[1, 1]))
+
+    def test_sync_recomputes_the_indicator_when_the_candles_are_replaced(self):
+        sma = SMA(length=3)
+        sma.sync(self.candles[0:5])
+
+        # The feed was cleared on a disconnection, and receives a newer candle after reconnecting
+        sma.sync(self.candles[10:11])
+
+        self.assertEqual(1, len(sma.history))
+        self.assertTrue(np.isnan(sma.value))
+
+        # The missed candles are filled afterwards
+        sma.sync(self.candles[6:11])
+
+        self.assertEqual(5, len(sma.history))
+        self.assertAlmostEqual(self.close.iloc[8:11].mean(), sma.value)
+
+    def test_older_candles_are_ignored(self):
+        ema = EMA(length=1)
+        ema.update(self.candles[1])
+        ema.update(self.candles[0])
+
+        self.assertEqual(1, len(ema.history))
+        self.assertEqual({"value": self.close.iloc[1]}, ema.values)
+
+        ema.reset()
+
+        self.assertIsNone(ema.timestamp)
+        self.assertTrue(np.isnan(ema.value))
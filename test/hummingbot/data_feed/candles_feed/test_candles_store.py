@@ -0,0 +1,71 @@
+import unittest
+from os.path import join
+from tempfile import TemporaryDirectory
+
+import numpy as np
+
+from hummingbot.data_feed.candles_feed.candles_store import CandlesStore
+
+
+class CandlesStoreTests(unittest.TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.temp_dir = TemporaryDirectory()
+        self.store = CandlesStore(db_path=join(self.temp_dir.name, "candles.sqlite"))
+
+    def tearDown(self) -> None:
+        self.store.close()
+        self.temp_dir.cleanup()
+        super().tearDown()
+
+    @staticmethod
+    def candles(timestamps, close: float = 1.0) -> np.ndarray:
+        candles = np.full((len(timestamps), 10), close)
+        candles[:, 0] = timestamps
+        return candles
+
+    def test_save_and_load_candles(self):
+        self.store.save_candles("binance_BTC-USDT", "1m", self.candles([120_000, 0, 60_000]))
+        self.store.save_candles("binance_BTC-USDT", "1h", self.candles([0]))
+
+        candles = self.store.load_candles("binance_BTC-USDT", "1m")
+
+        self.assertEqual((3, 10), candles.shape)
+        self.assertEqual([0, 60_000, 120_000], candles[:, 0].tolist())
+        self.assertEqual([60_000], self.store.load_candles("binance_BTC-USDT", "1m", 60_000, 60_000)[:, 0].tolist())
+        self.assertEqual((0, 10), self.store.load_candles("binance_ETH-USDT", "1m").shape)
+
+    def test_save_candles_replaces_the_stored_ones(self):
+        self.store.save_candles("binance_BTC-USDT", "1m", self.candles([0, 60_000], close=1))
+        self.store.save_candles("binance_BTC-USDT", "1m", self.candles([60_000], close=2))
+
+        self.assertEqual([1, 2], self.store.load_candles("binance_BTC-USDT", "1m")[:, 4].tolist())
+
+    def test_missing_ranges(self):
+        self.assertEqual([(0, 300_000)], self.store.missing_ranges("binance_BTC-USDT", "1m", 60_000, 0, 300_000))
+
+        self.store.save_candles("binance_BTC-USDT", "1m", self.candles([60_000, 120_000, 240_000]))
+
+        self.assertEqual([(0, 0), (180_000, 180_000), (300_000, 360_000)],
+                         self.store.missing_ranges("binance_BTC-USDT", "1m", 60_000, 0, 360_000))
+        # There is no candle missing within an interval of the stored ones
+        self.assertEqual([], self.store.missing_ranges("binance_BTC-USDT", "1m", 60_000, 30_000, 150_000))
+        self.assertEqual([(300_000, 330_000)],
+                         self.store.missing_ranges("binance_BTC-USDT", "1m", 60_000, 200_000, 330_000))
+
+    def test_missing_ranges_of_candles_not_aligned_to_the_epoch(self):
+        week_ms = 7 * 24 * 60 * 60 * 1000
+        # Weekly candles open on Mondays, the epoch was a Thursday
+        mondays = [1696809600000 + week * week_ms for week in range(4)]
+        self.store.save_candles("binance_BTC-USDT", "1w", self.candles(mondays))
+
+        self.assertEqual([], self.store.missing_ranges("binance_BTC-USDT", "1w", week_ms, mondays[0], mondays[-1]))
+        self.assertEqual([], self.store.missing_ranges("binance_BTC-USDT", "1w", week_ms,
+                                                       mondays[0] - week_ms // 2, mondays[-1] + week_ms // 2))
+
+        self.store.save_candles("binance_BTC-USDT", "1w", self.candles([mondays[-1] + 2 * week_ms]))
+
+        self.assertEqual([(mondays[-1] + week_ms, mondays[-1] + week_ms)],
+                         self.store.missing_ranges("binance_BTC-USDT", "1w", week_ms, mondays[0], mondays[-1] + 2 * week_ms))
+        self.assertEqual([(mondays[0] - 2 * week_ms, mondays[0] - week_ms)],
+                         self.store.missing_ranges("binance_BTC-USDT", "1w", week_ms, mondays[0] - 2 * week_ms, mondays[0]))
@@ -0,0 +1,95 @@
+import asyncio
+import unittest
+from decimal import Decimal
+from typing import Awaitable
+from unittest.mock import MagicMock
+
+from hummingbot.core.data_type.common import TradeType
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.event.events import OrderBookTradeEvent
+from hummingbot.core.network_iterator import NetworkStatus
+from hummingbot.data_feed.candles_feed.candles_indicators import SMA
+from hummingbot.data_feed.candles_feed.trades_candles import TradesCandles, interval_to_seconds
+
+
+class TradesCandlesTests(unittest.TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.trading_pair = "COINALPHA-HBOT"
+        self.connector = MagicMock()
+        self.connector.name = "kucoin"
+        self.connector.order_books = {}
+        self.order_book = OrderBook()
+        self.candles = TradesCandles(connector=self.connector, trading_pair=self.trading_pair, interval="5s",
+                                     max_records=4)
+
+    def async_run_with_timeout(self, coroutine: Awaitable, timeout: int = 1):
+        ret = asyncio.get_event_loop().run_until_complete(asyncio.wait_for(coroutine, timeout))
+        return ret
+
+    def start_candles(self):
+        self.connector.order_books[self.trading_pair] = self.order_book
+        self.async_run_with_timeout(self.candles.start_network())
+
+    def apply_trade(self, timestamp: float, price: str, amount: str, trade_type: TradeType = TradeType.BUY):
+        self.order_book.apply_trade(OrderBookTradeEvent(trading_pair=self.trading_pair, timestamp=timestamp,
+                                                        type=trade_type, price=Decimal(price),
+                                                        amount=Decimal(amount)))
+
+    def test_interval_to_seconds(self):
+        self.assertEqual(5, interval_to_seconds("5s"))
+        self.assertEqual(900, interval_to_seconds("15m"))
+        self.assertEqual(604800, interval_to_seconds("1w"))
+        for interval in ["0s", "1M", "m", "1.5m"]:
+            with self.assertRaises(ValueError):
+                interval_to_seconds(interval)
+
+    def test_network_is_connected_when_the_order_book_is_tracked(self):
+        self.assertEqual(NetworkStatus.NOT_CONNECTED, self.async_run_with_timeout(self.candles.check_network()))
+
+        self.connector.order_books[self.trading_pair] = self.order_book
+
+        self.assertEqual(NetworkStatus.CONNECTED, self.async_run_with_timeout(self.candles.check_network()))
+        self.assertEqual("kucoin_trades_COINALPHA-HBOT", self.candles.name)
+        self.assertEqual(5, self.candles.interval_in_seconds)
+
+    def test_candles_are_built_from_the_trades(self):
+        sma = self.candles.add_indicator("SMA_2", SMA(length=2))
+        self.start_candles()
+
+        self.apply_trade(1000.5, "10", "1")
+        self.apply_trade(1002, "12", "2", TradeType.SELL)
+        self.apply_trade(1004.9, "9", "1")
+        self.apply_trade(1005, "11", "3")
+        # Trades of the previous candles are ignored
+        self.apply_trade(1004, "100", "1")
+
+        candles = self.candles.candles_array
+        self.assertEqual([1000000, 1005000], candles[:, 0].tolist())
+        self.assertEqual([10, 12, 9, 9, 4, 43, 3, 2, 19], candles[0, 1:].tolist())
+        self.assertEqual([11, 11, 11, 11, 3, 33, 1, 3, 33], candles[1, 1:].tolist())
+        self.assertEqual(10, sma.value)
+
+    def test_intervals_without_trades_get_empty_candles(self):
+        self.start_candles()
+
+        self.apply_trade(1000, "10", "1")
+        self.apply_trade(1016, "12", "1")
+
+        candles = self.candles.candles_array
+        self.assertEqual([1000000, 1005000, 1010000, 1015000], candles[:, 0].tolist())
+        self.assertEqual([10, 10, 10, 10, 0, 0, 0, 0, 0], candles[1, 1:].tolist())
+        self.assertTrue(self.candles.is_ready)
+
+        # Only the empty candles kept in the buffer are created
+        self.apply_trade(100000, "13", "1")
+
+        self.assertEqual([99985000, 99990000, 99995000, 100000000], self.candles.candles_array[:, 0].tolist())
+
+    def test_stop_network_removes_the_trades_listener(self):
+        self.start_candles()
+        self.async_run_with_timeout(self.candles.stop_network())
+
+        self.apply_trade(1000, "10", "1")
+
+        self.assertEqual(0, len(self.candles.candles_array))
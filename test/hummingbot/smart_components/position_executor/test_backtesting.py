@@ -0,0 +1,149 @@
+from decimal import Decimal
+from typing import List, Optional
+from unittest import TestCase
+
+import numpy as np
+import pandas as pd
+
+from hummingbot.core.data_type.common import OrderType, PositionSide
+from hummingbot.smart_components.position_executor.backtesting import PositionBacktester, backtest_signals
+from hummingbot.smart_components.position_executor.data_types import PositionConfig, PositionExecutorStatus
+
+
+class TestPositionBacktester(TestCase):
+    @staticmethod
+    def candles(close: List[float], high: Optional[List[float]] = None, low: Optional[List[float]] = None):
+        # One minute candles, timestamps in milliseconds like the candles feeds
+        return pd.DataFrame({
+            "timestamp": np.arange(len(close)) * 60_000,
+            "open": close,
+            "high": high if high is not None else close,
+            "low": low if low is not None else close,
+            "close": close,
+        })
+
+    def test_long_position_closed_by_take_profit(self):
+        backtester = PositionBacktester(self.candles(close=[100, 100, 101, 100], high=[100, 101, 103, 100]))
+
+        trades = backtester.run_signals(signals=[1, 0, 0, 0], order_amount_quote=100, stop_loss=0.01,
+                                        take_profit=0.02, time_limit=600)
+
+        self.assertEqual(1, len(trades))
+        trade = trades.iloc[0]
+        self.assertEqual(PositionSide.LONG, trade["side"])
+        self.assertEqual(PositionExecutorStatus.CLOSED_BY_TAKE_PROFIT, trade["status"])
+        self.assertEqual(100, trade["entry_price"])
+        self.assertAlmostEqual(102, trade["close_price"])
+        self.assertEqual(120, trade["close_timestamp"])
+        self.assertAlmostEqual(0.02, trade["pnl"])
+        self.assertAlmostEqual(2, trade["net_pnl_quote"])
+
+    def test_short_position_closed_by_stop_loss(self):
+        backtester = PositionBacktester(self.candles(close=[100, 100, 100], high=[100, 101.5, 100]))
+
+        trades = backtester.run_signals(signals=[-0.7, 0, 0], order_amount_quote=100, stop_loss=0.01,
+                                        take_profit=0.02, time_limit=600)
+
+        trade = trades.iloc[0]
+        self.assertEqual(PositionSide.SHORT, trade["side"])
+        self.assertEqual(PositionExecutorStatus.CLOSED_BY_STOP_LOSS, trade["status"])
+        self.assertAlmostEqual(101, trade["close_price"])
+        self.assertAlmostEqual(-0.01, trade["pnl"])
+
+    def test_stop_loss_is_hit_first_when_both_barriers_are_crossed_in_the_same_candle(self):
+        backtester = PositionBacktester(self.candles(close=[100, 100], high=[100, 105], low=[100, 95]))
+
+        trades = backtester.run_signals(signals=[1, 0], order_amount_quote=100, stop_loss=0.01,
+                                        take_profit=0.02, time_limit=600)
+
+        self.assertEqual(PositionExecutorStatus.CLOSED_BY_STOP_LOSS, trades.iloc[0]["status"])
+
+    def test_position_closed_by_time_limit(self):
+        backtester = PositionBacktester(self.candles(close=[100, 100.5, 100.2, 99, 90]))
+
+        trades = backtester.run_signals(signals=[1, 0, 0, 0, 0], order_amount_quote=100, stop_loss=0.05,
+                                        take_profit=0.05, time_limit=150)
+
+        trade = trades.iloc[0]
+        self.assertEqual(PositionExecutorStatus.CLOSED_BY_TIME_LIMIT, trade["status"])
+        self.assertEqual(100.2, trade["close_price"])
+        self.assertEqual(150, trade["close_timestamp"])
+
+    def test_position_not_expired_at_the_last_candle_stays_active(self):
+        backtester = PositionBacktester(self.candles(close=[100, 101]))
+
+        trades = backtester.run_signals(signals=[1, 0], order_amount_quote=100, stop_loss=0.05,
+                                        take_profit=0.05, time_limit=600)
+
+        trade = trades.iloc[0]
+        self.assertEqual(PositionExecutorStatus.ACTIVE_POSITION, trade["status"])
+        self.assertEqual(101, trade["close_price"])
+        self.assertTrue(np.isnan(trade["close_timestamp"]))
+
+    def test_signals_are_ignored_while_max_executors_are_open(self):
+        close = [100, 100, 100, 100, 100, 100]
+        high = [100, 100, 103, 100, 100, 103]
+        backtester = PositionBacktester(self.candles(close=close, high=high))
+        signals = [1, 1, 1, 1, 0, 0]
+
+        trades = backtester.run_signals(signals=signals, order_amount_quote=100, stop_loss=0.05,
+                                        take_profit=0.02, time_limit=600, max_executors=1)
+
+        # The first position closes during the third candle, so the signal at the close of the candle opens the next one
+        self.assertEqual([0, 120], list(trades["timestamp"]))
+        self.assertEqual([120, 300], list(trades["close_timestamp"]))
+
+        trades = backtester.run_signals(signals=signals, order_amount_quote=100, stop_loss=0.05,
+                                        take_profit=0.02, time_limit=600, max_executors=2)
+
+        self.assertEqual([0, 60, 120, 180], list(trades["timestamp"]))
+
+    def test_position_configs(self):
+        backtester = PositionBacktester(self.candles(close=[100, 100, 100, 100], low=[100, 100, 97, 100]))
+        position_configs = [
+            PositionConfig(timestamp=70, trading_pair="ETH-USDT", exchange="binance_perpetual",
+                           order_type=OrderType.MARKET, side=PositionSide.SHORT, entry_price=Decimal("99"),
+                           amount=Decimal("2"), stop_loss=Decimal("0.05"), take_profit=Decimal("0.01"),
+                           time_limit=300),
+            PositionConfig(timestamp=0, trading_pair="ETH-USDT", exchange="binance_perpetual",
+                           order_type=OrderType.MARKET, side=PositionSide.LONG, amount=Decimal("1"),
+                           stop_loss=Decimal("0.02"), take_profit=Decimal("0.05"), time_limit=60),
+        ]
+
+        trades = backtester.run_position_configs(position_configs)
+
+        self.assertEqual(PositionExecutorStatus.CLOSED_BY_TAKE_PROFIT, trades.iloc[0]["status"])
+        self.assertAlmostEqual(98.01, trades.iloc[0]["close_price"])
+        self.assertAlmostEqual(0.99 * 2, trades.iloc[0]["net_pnl_quote"])
+        self.assertEqual(PositionExecutorStatus.CLOSED_BY_TIME_LIMIT, trades.iloc[1]["status"])
+        self.assertEqual(60, trades.iloc[1]["close_timestamp"])
+
+    def test_backtest_signals_summary(self):
+        candles = self.candles(close=[100, 100, 100, 100, 100], high=[100, 103, 100, 100, 100],
+                               low=[100, 100, 100, 100, 90])
+
+        trades, summary = backtest_signals(candles, signals=[1, 0, 1, 0, 0], trade_cost=0.001,
+                                           order_amount_quote=100, stop_loss=0.05, take_profit=0.02,
+                                           time_limit=600)
+
+        self.assertEqual(2, summary["positions"])
+        self.assertEqual(1, summary["take_profits"])
+        self.assertEqual(1, summary["stop_losses"])
+        self.assertAlmostEqual(0.5, summary["accuracy"])
+        self.assertAlmostEqual(2 - 0.2 - 5 - 0.2, summary["net_pnl_quote"])
+        self.assertAlmostEqual(5.2, summary["max_drawdown_quote"])
+
+    def test_no_signals(self):
+        trades, summary = backtest_signals(self.candles(close=[100, 100]), signals=[0, np.nan],
+                                           order_amount_quote=100, stop_loss=0.05, take_profit=0.02,
+                                           time_limit=600)
+
+        self.assertEqual(0, len(trades))
+        self.assertEqual(0, summary["positions"])
+
+    def test_signals_length_must_match_the_candles(self):
+        backtester = PositionBacktester(self.candles(close=[100, 100]))
+
+        with self.assertRaises(ValueError):
+            backtester.run_signals(signals=[1], order_amount_quote=100, stop_loss=0.05, take_profit=0.02,
+                                   time_limit=600)
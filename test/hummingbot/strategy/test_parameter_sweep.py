@@ -0,0 +1,90 @@
+import json
+import os
+import tempfile
+import unittest
+from decimal import Decimal
+
+from hummingbot.client.hummingbot_application import HummingbotApplication
+from hummingbot.core.data_type.common import TradeType
+from hummingbot.core.utils.trading_pair_fetcher import TradingPairFetcher
+from hummingbot.strategy.parameter_sweep import ParameterSweep, parameter_grid
+from hummingbot.strategy.pure_market_making.pure_market_making_config_map import pure_market_making_config_map
+
+
+class ParameterSweepTests(unittest.TestCase):
+    trading_pair = "COINALPHA-HBOT"
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.strategy_file_path = os.path.join(self.temp_dir.name, "conf_pure_mm_1.yml")
+        with open(self.strategy_file_path, "w") as strategy_file:
+            strategy_file.write("strategy: pure_market_making\n"
+                                "exchange: binance_paper_trade\n"
+                                f"market: {self.trading_pair}\n"
+                                "bid_spread: 1\n"
+                                "ask_spread: 1\n"
+                                "order_amount: 1\n"
+                                "order_refresh_time: 30\n")
+        records = [
+            {"type": "snapshot", "timestamp": 1.0,
+             "content": {"update_id": 1, "bids": [[99, 10]], "asks": [[101, 10]]}},
+            {"type": "trade", "timestamp": 20.0,
+             "content": {"trade_id": 1, "price": 98, "amount": 5, "trade_type": float(TradeType.SELL.value)}},
+        ]
+        with open(os.path.join(self.temp_dir.name, f"{self.trading_pair}.jsonl"), "w") as data_file:
+            data_file.writelines(json.dumps(record) + "\n" for record in records)
+
+    def tearDown(self) -> None:
+        self.temp_dir.cleanup()
+        for config_var in pure_market_making_config_map.values():
+            config_var.value = None
+        super().tearDown()
+
+    def create_sweep(self, grid) -> ParameterSweep:
+        return ParameterSweep(strategy_file_path=self.strategy_file_path,
+                              parameter_grid=grid,
+                              data_dir=self.temp_dir.name,
+                              start_time=0,
+                              end_time=60,
+                              initial_balances={"COINALPHA": Decimal("10"), "HBOT": Decimal("1000")},
+                              max_workers=1)
+
+    def test_parameter_grid_contains_every_combination(self):
+        combinations = parameter_grid({"bid_spread": [1, 2], "ask_spread": [3], "order_amount": [4, 5]})
+
+        self.assertEqual([
+            {"bid_spread": 1, "ask_spread": 3, "order_amount": 4},
+            {"bid_spread": 1, "ask_spread": 3, "order_amount": 5},
+            {"bid_spread": 2, "ask_spread": 3, "order_amount": 4},
+            {"bid_spread": 2, "ask_spread": 3, "order_amount": 5},
+        ], combinations)
+
+    def test_sweep_jobs(self):
+        jobs = self.create_sweep({"bid_spread": ["0.5", "5"]}).jobs
+
+        self.assertEqual([0, 1], [job.job_id for job in jobs])
+        self.assertEqual([{"bid_spread": "0.5"}, {"bid_spread": "5"}], [job.parameters for job in jobs])
+        self.assertEqual(self.strategy_file_path, jobs[0].strategy_file_path)
+
+    def test_sweep_aggregates_the_performance_of_each_combination(self):
+        main_app = HummingbotApplication._main_app
+        trading_pair_fetcher = TradingPairFetcher._sf_shared_instance
+
+        results = self.create_sweep({"bid_spread": ["0.5", "5"], "order_amount": ["1", "2"]}).run()
+
+        self.assertEqual(4, len(results))
+        self.assertTrue(results["error"].isna().all())
+        self.assertEqual([self.trading_pair] * 4, list(results["trading_pair"]))
+        # Only the bids close enough to the mid price are filled by the recorded sell trade
+        self.assertEqual([1, 1, 0, 0], list(results["num_trades"]))
+        self.assertEqual([Decimal("10.999"), Decimal("11.998")], list(results["cur_base_bal"][:2]))
+        self.assertTrue((results["total_pnl"][:2] > 0).all())
+        self.assertIs(main_app, HummingbotApplication._main_app)
+        self.assertIs(trading_pair_fetcher, TradingPairFetcher._sf_shared_instance)
+
+    def test_failing_combination_is_reported_in_the_results(self):
+        results = self.create_sweep({"not_a_parameter": ["1"]}).run()
+
+        self.assertEqual(1, len(results))
+        self.assertIn("not_a_parameter", results["error"][0])
@@ -107,3 +107,56 @@ class RingBufferTest(unittest.TestCase):
         self.assertTrue(np.array_equal(buffer.get_as_numpy_array(), np.array([0, 1, 2, 3])))
         buffer.add_value(4)
         self.assertTrue(np.array_equal(buffer.get_as_numpy_array(), np.array([1, 2, 3, 4])))
+
+    def test_numpy_array_longer_than_int16_indexes(self):
+        length = 40000
+        buffer = RingBuffer(length)
+
+        for i in range(length + 5):
+            buffer.add_value(i)
+
+        self.assertTrue(np.array_equal(buffer.get_as_numpy_array(), np.arange(5, length + 5)))
+
+    def test_segments_are_views_of_the_buffer(self):
+        buffer = RingBuffer(4)
+        for i in range(3):
+            buffer.add_value(i)
+
+        older, newer = buffer.get_segments()
+        self.assertEqual([0, 1, 2], older.tolist())
+        self.assertEqual(0, newer.size)
+        self.assertEqual(3, buffer.size)
+
+        for i in range(3, 6):
+            buffer.add_value(i)
+
+        older, newer = buffer.get_segments()
+        self.assertEqual([2, 3], older.tolist())
+        self.assertEqual([4, 5], newer.tolist())
+        self.assertFalse(older.flags.writeable)
+        buffer.add_value(6)
+        # The views share the memory of the buffer
+        self.assertEqual([6, 3], older.tolist())
+
+    def test_running_statistics_match_the_buffer_values(self):
+        buffer = RingBuffer(50)
+        values = np.random.default_rng(7).normal(1000, 3, 500).astype(np.float32)
+
+        for value in values:
+            buffer.add_value(value)
+            if buffer.is_full:
+                window = buffer.get_as_numpy_array()
+                self.assertAlmostEqual(np.mean(window), buffer.mean_value, delta=1e-9)
+                self.assertAlmostEqual(np.var(window), buffer.variance, delta=1e-9)
+                self.assertAlmostEqual(np.std(window), buffer.std_dev, delta=1e-9)
+
+    def test_statistics_recover_after_nan_values(self):
+        buffer = RingBuffer(3)
+        for value in [1, np.nan, 2, 3]:
+            buffer.add_value(value)
+        self.assertTrue(np.isnan(buffer.mean_value))
+
+        buffer.add_value(4)
+
+        self.assertEqual(3, buffer.mean_value)
+        self.assertAlmostEqual(2 / 3, buffer.variance)
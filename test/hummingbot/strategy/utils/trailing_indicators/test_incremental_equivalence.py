@@ -0,0 +1,88 @@
+import unittest
+import warnings
+
+import numpy as np
+import pandas as pd
+
+from hummingbot.strategy.__utils__.trailing_indicators.exponential_moving_average import (
+    ExponentialMovingAverageIndicator,
+)
+from hummingbot.strategy.__utils__.trailing_indicators.historical_volatility import HistoricalVolatilityIndicator
+from hummingbot.strategy.__utils__.trailing_indicators.instant_volatility import InstantVolatilityIndicator
+
+
+def instant_volatility(samples: np.ndarray, sampling_length: int) -> float:
+    return np.sqrt(np.sum(np.square(np.diff(samples))) / samples.size)
+
+
+def historical_volatility(samples: np.ndarray, sampling_length: int) -> float:
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", RuntimeWarning)
+        return np.var(np.diff(np.log(samples)))
+
+
+def exponential_moving_average(samples: np.ndarray, sampling_length: int) -> float:
+    return pd.Series(samples).ewm(span=sampling_length, adjust=True).mean().iloc[-1]
+
+
+class IncrementalTrailingIndicatorsEquivalenceTest(unittest.TestCase):
+    """
+    Checks that the indicators updated incrementally give the same values as computing their formula over the whole
+    sampling buffer after each sample, on random series.
+    """
+    SEEDS = [1, 2, 3]
+
+    @staticmethod
+    def random_prices(seed: int, size: int) -> np.ndarray:
+        rng = np.random.default_rng(seed)
+        return 100 * np.exp(np.cumsum(rng.normal(0, 0.01, size)))
+
+    def assert_equivalent(self, indicator, reference, prices: np.ndarray, resize_to: int = None):
+        for i, price in enumerate(prices):
+            if resize_to is not None and i == len(prices) // 2:
+                indicator.sampling_length = resize_to
+            indicator.add_sample(price)
+            expected = reference(indicator._sampling_buffer.get_as_numpy_array(), indicator.sampling_length)
+            actual = indicator._processing_buffer.get_last_value()
+            if np.isnan(expected):
+                self.assertTrue(np.isnan(actual))
+            else:
+                # The ring buffers store the values as single precision floats, the outputs can only differ when
+                # the value is rounded at the boundary between two floats
+                expected = np.float32(expected)
+                self.assertLessEqual(abs(actual - expected), max(np.spacing(expected), 1e-15))
+
+    def test_instant_volatility(self):
+        for seed in self.SEEDS:
+            for sampling_length in [1, 2, 30, 200]:
+                self.assert_equivalent(InstantVolatilityIndicator(sampling_length, 1), instant_volatility,
+                                       self.random_prices(seed, 1000))
+
+    def test_historical_volatility(self):
+        for seed in self.SEEDS:
+            for sampling_length in [2, 30, 200]:
+                self.assert_equivalent(HistoricalVolatilityIndicator(sampling_length, 1), historical_volatility,
+                                       self.random_prices(seed, 1000))
+
+    def test_exponential_moving_average(self):
+        for seed in self.SEEDS:
+            for sampling_length in [1, 2, 30, 200]:
+                self.assert_equivalent(ExponentialMovingAverageIndicator(sampling_length, 1),
+                                       exponential_moving_average, self.random_prices(seed, 1000))
+
+    def test_equivalence_after_resizing_the_sampling_buffer(self):
+        prices = self.random_prices(4, 600)
+        self.assert_equivalent(InstantVolatilityIndicator(50, 1), instant_volatility, prices, resize_to=20)
+        self.assert_equivalent(HistoricalVolatilityIndicator(50, 1), historical_volatility, prices, resize_to=80)
+        self.assert_equivalent(ExponentialMovingAverageIndicator(50, 1), exponential_moving_average, prices,
+                               resize_to=20)
+
+    def test_current_value_with_processing_buffer(self):
+        prices = self.random_prices(5, 300)
+        indicator = HistoricalVolatilityIndicator(30, 10)
+        values = []
+        for price in prices:
+            indicator.add_sample(price)
+            values.append(historical_volatility(indicator._sampling_buffer.get_as_numpy_array(), 30))
+
+        self.assertAlmostEqual(np.sqrt(np.mean(np.nan_to_num(values[-10:]))), indicator.current_value)
@@ -259,3 +259,64 @@ class TradingIntensityTest(unittest.TestCase):
 
         self.assertAlmostEqual(a, alpha, 10)
         self.assertAlmostEqual(b, kappa, 10)
+
+    def test_calculate_trading_intensity_only_uses_the_samples_in_the_window(self):
+        def curve_fn(t_, a_, b_):
+            return a_ * np.exp(-b_ * t_)
+
+        last_price = 1
+        trade_price_levels = [2, 3, 4, 5]
+        timestamp = self.start_timestamp
+
+        trading_intensity_indicator = TradingIntensityIndicator(OrderBook(), self.price_delegate, 1)
+
+        for a, b in [(2, 0.1), (3, 0.2)]:
+            trading_intensity_indicator.last_quotes = [{"timestamp": timestamp, "price": last_price}]
+            timestamp += 1
+            for p in trade_price_levels:
+                trading_intensity_indicator.register_trade(OrderBookTradeEvent(
+                    trading_pair="COINALPHAHBOT",
+                    timestamp=timestamp,
+                    price=p,
+                    amount=curve_fn(p - last_price, a, b),
+                    type=TradeType.SELL,
+                ))
+            trading_intensity_indicator.calculate(timestamp)
+
+        alpha, kappa = trading_intensity_indicator.current_value
+
+        # The trades of the first sample left the window, the fit only uses the trades of the second one
+        self.assertAlmostEqual(3, alpha, 6)
+        self.assertAlmostEqual(0.2, kappa, 6)
+
+    def test_calculate_trading_intensity_in_background(self):
+        def curve_fn(t_, a_, b_):
+            return a_ * np.exp(-b_ * t_)
+
+        last_price = 1
+        timestamp = self.start_timestamp
+
+        trading_intensity_indicator = TradingIntensityIndicator(OrderBook(), self.price_delegate, 1,
+                                                                fit_in_background=True)
+        trading_intensity_indicator.last_quotes = [{"timestamp": timestamp, "price": last_price}]
+        timestamp += 1
+        for p in [2, 3, 4, 5]:
+            trading_intensity_indicator.register_trade(OrderBookTradeEvent(
+                trading_pair="COINALPHAHBOT",
+                timestamp=timestamp,
+                price=p,
+                amount=curve_fn(p - last_price, 2, 0.1),
+                type=TradeType.SELL,
+            ))
+        trading_intensity_indicator.calculate(timestamp)
+
+        # The log-linear estimate is available before the nonlinear fit is done
+        alpha, kappa = trading_intensity_indicator.current_value
+        self.assertAlmostEqual(2, alpha, 10)
+        self.assertAlmostEqual(0.1, kappa, 10)
+
+        trading_intensity_indicator.wait_for_fit()
+
+        alpha, kappa = trading_intensity_indicator.current_value
+        self.assertAlmostEqual(2, alpha, 6)
+        self.assertAlmostEqual(0.1, kappa, 6)